@@ -15,6 +15,7 @@ import requests
 import logging
 
 from path_utils import get_app_data_dir
+from http_client import http_get, http_post
 
 logger = logging.getLogger(__name__)
 
@@ -368,7 +369,7 @@ class APIUploader:
                     time.sleep(delay)
             
             logger.info(f"Uploading session to {endpoint}")
-            response = requests.post(
+            response = http_post(
                 endpoint,
                 json=session_data,
                 headers=headers,
@@ -490,7 +491,7 @@ class APIUploader:
             }
             
             # Send a test GET request (or OPTIONS)
-            response = requests.get(endpoint, headers=headers, timeout=5)
+            response = http_get(endpoint, headers=headers, timeout=5, retries=0)
             
             if response.status_code == 401:
                 return False, "Authentication failed (invalid API key)"
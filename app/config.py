@@ -650,6 +650,30 @@ def save_api_upload_settings(settings: Dict[str, Any]) -> None:
     _save_cfg(cfg)
 
 
+# EDSM Ring Metadata Backfill Configuration
+def load_edsm_backfill_enabled() -> bool:
+    """Load whether missing ring metadata is filled from EDSM in the background"""
+    cfg = _load_cfg()
+    return cfg.get("edsm_backfill_enabled", False)
+
+def save_edsm_backfill_enabled(enabled: bool) -> None:
+    """Save EDSM background backfill enabled state to config"""
+    cfg = _load_cfg()
+    cfg["edsm_backfill_enabled"] = enabled
+    _save_cfg(cfg)
+
+def load_edsm_backfill_last_run() -> float:
+    """Load when the EDSM background backfill last ran to completion (epoch seconds)"""
+    cfg = _load_cfg()
+    return cfg.get("edsm_backfill_last_run", 0.0)
+
+def save_edsm_backfill_last_run(timestamp: float) -> None:
+    """Save when the EDSM background backfill last ran to completion"""
+    cfg = _load_cfg()
+    cfg["edsm_backfill_last_run"] = timestamp
+    _save_cfg(cfg)
+
+
 # Distance Calculator Configuration
 def load_home_system() -> str:
     """Load home system from config"""
@@ -0,0 +1,343 @@
+"""
+System Coordinate Resolver for EliteMining
+One place to turn system names into (x, y, z): user database, galaxy database,
+EDDN system_coords, then EDSM - with a bounded LRU, a persistent negative cache
+and in-flight de-duplication shared by every caller
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from app_utils import get_app_data_dir
+from http_client import http_get
+
+log = logging.getLogger("EliteMining.CoordsResolver")
+
+Coords = Tuple[float, float, float]
+
+EDSM_SYSTEMS_URL = "https://www.edsm.net/api-v1/systems"
+EDSM_BATCH_SIZE = 50          # systemName[] values per EDSM request
+
+# Names per IN (...) lookup - stays under SQLite's 999 variable limit on older builds
+LOOKUP_CHUNK = 500
+
+# A system EDSM doesn't know may be discovered later, so "not found" is only
+# remembered for a day
+NEGATIVE_TTL = 24 * 3600
+
+LRU_ENTRIES = 5000
+
+# Most names the galaxy lookup retries case-insensitively
+NOCASE_RETRY_MAX = 8
+
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class SystemCoordsResolver:
+    """Resolves system coordinates through an ordered chain of sources
+
+    Local sources (user DB, galaxy DB, EDDN cache) are queried in batches;
+    only names none of them know reach EDSM. Results found on EDSM and names
+    EDSM doesn't know are persisted, so they survive restarts. Thread-safe:
+    when several threads ask for the same system at once, one fetches and the
+    others wait for its answer.
+    """
+
+    def __init__(self, user_db=None, eddn_cache_path: Optional[str] = None,
+                 cache_path: Optional[str] = None, max_entries: int = LRU_ENTRIES,
+                 use_edsm: bool = True):
+        """Initialize the resolver
+
+        Args:
+            user_db: UserDatabase for visited_systems (default: opened on first use)
+            eddn_cache_path: marketplace_cache.db with the EDDN system_coords table
+            cache_path: SQLite file for remote lookups (default: app data dir)
+            max_entries: Entries kept in the in-memory LRU
+            use_edsm: Query EDSM for systems no local source knows
+        """
+        self.user_db = user_db
+        self.eddn_cache_path = eddn_cache_path
+        self.cache_path = cache_path or os.path.join(get_app_data_dir(), "data", "coords_cache.db")
+        self.max_entries = max_entries
+        self.use_edsm = use_edsm
+        self._galaxy_db = None
+        self._lru: "OrderedDict[str, Coords]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Tuple[str, bool], threading.Event] = {}
+        self.stats = {'lru_hits': 0, 'user_db': 0, 'galaxy_db': 0, 'eddn': 0, 'persistent': 0,
+                      'edsm': 0, 'negative_hits': 0, 'not_found': 0, 'waited': 0}
+        self._init_cache_db()
+
+    def _init_cache_db(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with sqlite3.connect(self.cache_path) as conn:
+                # x is NULL for names EDSM didn't know when checked_at was recorded
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS remote_coords (
+                        name_key TEXT PRIMARY KEY,
+                        x REAL,
+                        y REAL,
+                        z REAL,
+                        checked_at REAL NOT NULL
+                    )
+                ''')
+                conn.execute('DELETE FROM remote_coords WHERE x IS NULL AND checked_at < ?',
+                             (time.time() - NEGATIVE_TTL,))
+        except (OSError, sqlite3.Error) as e:
+            log.warning(f"Coordinate cache disabled on disk: {e}")
+            self.cache_path = None
+
+    # ------------------------------------------------------------------
+    # Public API
+
+    def resolve(self, system_name: str, remote: bool = True) -> Optional[Coords]:
+        """Coordinates for one system, or None if no source knows it"""
+        if not system_name:
+            return None
+        return self.resolve_many([system_name], remote).get(system_name.strip())
+
+    def resolve_many(self, system_names: Iterable[str], remote: bool = True) -> Dict[str, Coords]:
+        """Coordinates for many systems at once
+
+        Args:
+            system_names: Names to resolve (case-insensitive)
+            remote: Fall back to EDSM for names no local source knows
+
+        Returns:
+            Dict of requested name -> (x, y, z) for the systems found
+        """
+        names = list(dict.fromkeys(name.strip() for name in system_names if name and name.strip()))
+        found: Dict[str, Coords] = {}
+        to_fetch: List[str] = []
+        to_wait: List[Tuple[str, threading.Event]] = []
+
+        with self._lock:
+            for name in names:
+                key = name.lower()
+                coords = self._lru.get(key)
+                if coords is not None:
+                    self._lru.move_to_end(key)
+                    self.stats['lru_hits'] += 1
+                    found[name] = coords
+                elif (key, remote) in self._in_flight:
+                    to_wait.append((name, self._in_flight[(key, remote)]))
+                else:
+                    self._in_flight[(key, remote)] = threading.Event()
+                    to_fetch.append(name)
+
+        if to_fetch:
+            try:
+                fetched = self._fetch(to_fetch, remote and self.use_edsm)
+                found.update(fetched)
+                with self._lock:
+                    for name, coords in fetched.items():
+                        self._remember(name.lower(), coords)
+            finally:
+                with self._lock:
+                    for name in to_fetch:
+                        event = self._in_flight.pop((name.lower(), remote), None)
+                        if event:
+                            event.set()
+
+        for name, event in to_wait:
+            event.wait(timeout=30)
+            with self._lock:
+                self.stats['waited'] += 1
+                coords = self._lru.get(name.lower())
+            if coords is not None:
+                found[name] = coords
+        return found
+
+    def add(self, system_name: str, x: float, y: float, z: float) -> None:
+        """Seed the cache with known coordinates (e.g. from a journal StarPos)"""
+        if system_name and x is not None and y is not None and z is not None:
+            with self._lock:
+                self._remember(system_name.lower(), (x, y, z))
+
+    def clear(self) -> None:
+        """Empty the in-memory LRU"""
+        with self._lock:
+            self._lru.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get counters per source plus LRU size"""
+        with self._lock:
+            return dict(self.stats, lru_entries=len(self._lru))
+
+    def _remember(self, key: str, coords: Coords) -> None:
+        self._lru[key] = coords
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Source chain
+
+    def _fetch(self, names: List[str], remote: bool) -> Dict[str, Coords]:
+        """Run names through each source in order until all are found"""
+        found: Dict[str, Coords] = {}
+        remaining = list(names)
+        for source, lookup in (('user_db', self._from_user_db),
+                               ('galaxy_db', self._from_galaxy_db),
+                               ('eddn', self._from_eddn_cache)):
+            if not remaining:
+                break
+            try:
+                hits = lookup(remaining)
+            except Exception as e:
+                log.debug(f"Coordinate source {source} failed: {e}")
+                continue
+            if hits:
+                found.update(hits)
+                with self._lock:
+                    self.stats[source] += len(hits)
+                remaining = [name for name in remaining if name not in hits]
+
+        if remaining and remote:
+            hits, negative = self._from_persistent(remaining)
+            found.update(hits)
+            with self._lock:
+                self.stats['persistent'] += len(hits)
+                self.stats['negative_hits'] += len(negative)
+            remaining = [name for name in remaining if name not in hits and name not in negative]
+            if remaining:
+                found.update(self._from_edsm(remaining))
+        return found
+
+    def _from_user_db(self, names: List[str]) -> Dict[str, Coords]:
+        if self.user_db is None:
+            from user_database import UserDatabase
+            self.user_db = UserDatabase()
+        found = {}
+        with self.user_db._connect() as conn:
+            for chunk in _chunks(names, LOOKUP_CHUNK):
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f'''
+                    SELECT system_name, x_coord, y_coord, z_coord FROM visited_systems
+                    WHERE system_name IN ({placeholders}) AND x_coord IS NOT NULL
+                ''', chunk)
+                for name, x, y, z in cursor.fetchall():
+                    found[name] = (x, y, z)
+        return found
+
+    def _from_galaxy_db(self, names: List[str]) -> Dict[str, Coords]:
+        if self._galaxy_db is None:
+            from local_database import LocalSystemsDatabase
+            self._galaxy_db = LocalSystemsDatabase()
+        if not self._galaxy_db.is_database_available():
+            return {}
+        # Case-insensitive retries can't use the name index, so only small
+        # lookups (typed reference systems) get them
+        return self._galaxy_db.get_systems_coordinates(names, ignore_case=len(names) <= NOCASE_RETRY_MAX)
+
+    def _from_eddn_cache(self, names: List[str]) -> Dict[str, Coords]:
+        if not self.eddn_cache_path or not os.path.exists(self.eddn_cache_path):
+            return {}
+        found = {}
+        with sqlite3.connect(self.eddn_cache_path) as conn:
+            for chunk in _chunks(names, LOOKUP_CHUNK):
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f'''
+                    SELECT name, x, y, z FROM system_coords
+                    WHERE name IN ({placeholders}) AND x IS NOT NULL
+                ''', chunk)
+                for name, x, y, z in cursor.fetchall():
+                    found[name] = (x, y, z)
+        return found
+
+    def _from_persistent(self, names: List[str]) -> Tuple[Dict[str, Coords], set]:
+        """Earlier EDSM answers, plus the names EDSM recently didn't know"""
+        found = {}
+        negative = set()
+        if not self.cache_path:
+            return found, negative
+        by_key = {name.lower(): name for name in names}
+        with sqlite3.connect(self.cache_path) as conn:
+            for chunk in _chunks(list(by_key), LOOKUP_CHUNK):
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f'''
+                    SELECT name_key, x, y, z, checked_at FROM remote_coords
+                    WHERE name_key IN ({placeholders})
+                ''', chunk)
+                for key, x, y, z, checked_at in cursor.fetchall():
+                    if x is not None:
+                        found[by_key[key]] = (x, y, z)
+                    elif time.time() - checked_at < NEGATIVE_TTL:
+                        negative.add(by_key[key])
+        return found, negative
+
+    def _from_edsm(self, names: List[str]) -> Dict[str, Coords]:
+        found: Dict[str, Coords] = {}
+        for chunk in _chunks(names, EDSM_BATCH_SIZE):
+            try:
+                response = http_get(EDSM_SYSTEMS_URL, params={'systemName[]': chunk, 'showCoordinates': 1},
+                                    timeout=15)
+                response.raise_for_status()
+                data = response.json() if response.text.strip() else None
+            except (requests.RequestException, ValueError) as e:
+                # Unknown outcome - don't record anything as missing
+                log.debug(f"EDSM coordinate lookup failed: {e}")
+                continue
+            if not isinstance(data, list):
+                continue  # EDSM answers {} or an empty body when overloaded
+
+            by_key = {name.lower(): name for name in chunk}
+            answered = {}
+            for system in data:
+                coords = system.get('coords')
+                name = by_key.get(str(system.get('name', '')).lower())
+                if name and coords:
+                    answered[name] = (coords['x'], coords['y'], coords['z'])
+            found.update(answered)
+            missing = [name for name in chunk if name not in answered]
+            with self._lock:
+                self.stats['edsm'] += len(answered)
+                self.stats['not_found'] += len(missing)
+            self._persist(answered, missing)
+        return found
+
+    def _persist(self, found: Dict[str, Coords], missing: List[str]) -> None:
+        if not self.cache_path or not (found or missing):
+            return
+        now = time.time()
+        rows = [(name.lower(), x, y, z, now) for name, (x, y, z) in found.items()]
+        rows += [(name.lower(), None, None, None, now) for name in missing]
+        try:
+            with sqlite3.connect(self.cache_path) as conn:
+                conn.executemany('INSERT OR REPLACE INTO remote_coords VALUES (?, ?, ?, ?, ?)', rows)
+        except sqlite3.Error as e:
+            log.debug(f"Coordinate cache write failed: {e}")
+
+
+_resolver: Optional[SystemCoordsResolver] = None
+_resolver_lock = threading.Lock()
+
+
+def get_coords_resolver() -> SystemCoordsResolver:
+    """Get the shared resolver, creating it with defaults on first use"""
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = SystemCoordsResolver()
+        return _resolver
+
+
+def configure_coords_resolver(user_db=None, eddn_cache_path: Optional[str] = None) -> SystemCoordsResolver:
+    """Point the shared resolver at the app's user database and EDDN cache"""
+    resolver = get_coords_resolver()
+    if user_db is not None:
+        resolver.user_db = user_db
+    if eddn_cache_path:
+        resolver.eddn_cache_path = eddn_cache_path
+    return resolver
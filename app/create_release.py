@@ -185,7 +185,7 @@ class ReleaseBuilder:
                             for file_path in item_path.rglob('*'):
                                 if file_path.is_file():
                                     # Skip test data and version flag files from Reports directory
-                                    if item == "Reports" and file_path.name in ["sessions_index.csv", ".v430_wipe_done"]:
+                                    if item == "Reports" and file_path.name in ["sessions_index.csv", "sessions_index.db", "sessions_index.db-wal", "sessions_index.db-shm", ".v430_wipe_done"]:
                                         print(f"⏩ Skipped: {file_path.name} (development/test file)")
                                         continue
                                     arc_name = f"EliteMining/app/{item}/{file_path.relative_to(item_path)}"
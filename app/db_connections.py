@@ -0,0 +1,331 @@
+"""
+Pooled SQLite Connections for EliteMining
+Keeps one long-lived connection per thread for each database file, with WAL
+and tuned pragmas applied once when the connection is opened
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+log = logging.getLogger("EliteMining.DBConnections")
+
+# Size of sqlite3's per-connection prepared statement cache (module default is 128).
+# Only pays off because connections now live for the whole thread.
+STATEMENT_CACHE_SIZE = 256
+
+# Applied once per connection when it is opened
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',   # Safe with WAL, avoids an fsync per commit
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-8000',     # 8 MB page cache
+)
+
+
+class _TimedCursor:
+    """Cursor wrapper that counts and times executed statements"""
+
+    __slots__ = ('_cursor', '_manager')
+
+    def __init__(self, cursor: sqlite3.Cursor, manager: 'ConnectionManager'):
+        object.__setattr__(self, '_cursor', cursor)
+        object.__setattr__(self, '_manager', manager)
+
+    def execute(self, sql: str, parameters=()) -> '_TimedCursor':
+        start = time.perf_counter()
+        try:
+            self._cursor.execute(sql, parameters)
+        finally:
+            self._manager._record_statement(start)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters) -> '_TimedCursor':
+        start = time.perf_counter()
+        try:
+            self._cursor.executemany(sql, seq_of_parameters)
+        finally:
+            self._manager._record_statement(start)
+        return self
+
+    def executescript(self, sql_script: str) -> '_TimedCursor':
+        start = time.perf_counter()
+        try:
+            self._cursor.executescript(sql_script)
+        finally:
+            self._manager._record_statement(start)
+        return self
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._cursor, name, value)
+
+
+class PooledConnection:
+    """A thread's long-lived connection
+
+    Behaves like sqlite3.Connection for existing `with ... as conn:` code:
+    leaving the block commits (or rolls back on error), but the connection
+    stays open. Inside ConnectionManager.transaction() commits are deferred
+    to the end of the transaction so batch writes land as one.
+    """
+
+    def __init__(self, manager: 'ConnectionManager', conn: sqlite3.Connection, generation: int):
+        object.__setattr__(self, '_manager', manager)
+        object.__setattr__(self, '_conn', conn)
+        object.__setattr__(self, '_generation', generation)
+
+    def __enter__(self) -> 'PooledConnection':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if not self._manager.in_transaction():
+            if exc_type is None:
+                self._conn.commit()
+            else:
+                self._conn.rollback()
+        return False
+
+    def cursor(self) -> _TimedCursor:
+        return _TimedCursor(self._conn.cursor(), self._manager)
+
+    def execute(self, sql: str, parameters=()) -> _TimedCursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters) -> _TimedCursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script: str) -> _TimedCursor:
+        return self.cursor().executescript(sql_script)
+
+    def commit(self) -> None:
+        if not self._manager.in_transaction():
+            self._conn.commit()
+
+    def close(self) -> None:
+        """No-op - the connection belongs to the pool (see ConnectionManager.close_all)"""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._conn, name, value)
+
+
+class ConnectionManager:
+    """One long-lived SQLite connection per thread for a single database file
+
+    Use get_connection_manager() so every UserDatabase instance for the same
+    file shares the pool.
+    """
+
+    def __init__(self, db_path: str, timeout: float = 5.0):
+        """Initialize the manager
+
+        Args:
+            db_path: Path to the SQLite database file
+            timeout: Seconds to wait on a locked database before failing
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Notified when the last transaction() in progress on any thread ends
+        self._idle = threading.Condition(self._lock)
+        self._open = weakref.WeakSet()
+        self._generation = 0
+        self._active_transactions = 0
+
+        self.connections_opened = 0
+        self.statements_executed = 0
+        self.statement_time = 0.0
+        self.transactions = 0
+
+    def _open_connection(self) -> PooledConnection:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        for pragma in CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error as e:
+                log.warning(f"Could not apply '{pragma}' to {os.path.basename(self.db_path)}: {e}")
+
+        with self._lock:
+            pooled = PooledConnection(self, conn, self._generation)
+            self._open.add(pooled)
+            self.connections_opened += 1
+        return pooled
+
+    def connect(self) -> PooledConnection:
+        """Get this thread's connection, opening it on first use"""
+        pooled = getattr(self._local, 'conn', None)
+        if pooled is None or pooled._generation != self._generation:
+            if pooled is not None:
+                self._discard(pooled)
+            pooled = self._open_connection()
+            self._local.conn = pooled
+            self._local.depth = 0
+        elif pooled._conn.row_factory is not None:
+            # Some callers set row_factory for one query - don't leak it to the next
+            pooled._conn.row_factory = None
+        return pooled
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        with self._lock:
+            self._open.discard(pooled)
+        try:
+            pooled._conn.close()
+        except sqlite3.Error:
+            pass
+
+    def in_transaction(self) -> bool:
+        """Whether the current thread is inside transaction()"""
+        return getattr(self._local, 'depth', 0) > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[PooledConnection]:
+        """Group writes into one transaction on this thread's connection
+
+        Commits made by code running inside the block (including `with conn:`
+        exits in UserDatabase methods) are deferred until the outermost block
+        ends. Rolls back everything if the block raises.
+        """
+        pooled = self.connect()
+        outermost = self._local.depth == 0
+        if outermost:
+            if pooled._conn.in_transaction:
+                pooled._conn.commit()
+            pooled._conn.execute('BEGIN IMMEDIATE')
+            with self._lock:
+                self.transactions += 1
+                self._active_transactions += 1
+        self._local.depth += 1
+        try:
+            try:
+                yield pooled
+            except BaseException:
+                self._local.depth -= 1
+                if self._local.depth == 0 and pooled._conn.in_transaction:
+                    pooled._conn.rollback()
+                raise
+            else:
+                self._local.depth -= 1
+                if self._local.depth == 0:
+                    pooled._conn.commit()
+        finally:
+            if outermost:
+                with self._idle:
+                    self._active_transactions -= 1
+                    self._idle.notify_all()
+
+    def _record_statement(self, start: float) -> None:
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.statements_executed += 1
+            self.statement_time += elapsed
+
+    def close(self) -> None:
+        """Close the current thread's connection"""
+        pooled = getattr(self._local, 'conn', None)
+        if pooled is not None:
+            self._local.conn = None
+            self._discard(pooled)
+
+    def close_all(self, timeout: float = 5.0) -> bool:
+        """Retire every pooled connection (e.g. before the database file is replaced)
+
+        Other threads' connections aren't closed from here, since one may be in
+        use. Their generation goes stale instead, so each thread closes its own
+        connection and opens a fresh one on its next connect(). The calling
+        thread's connection is closed once transactions on other threads have
+        finished and the WAL has been checkpointed into the main file (unless
+        the caller is itself inside transaction()).
+
+        Args:
+            timeout: Seconds to wait for other threads' transactions
+
+        Returns:
+            True if no other thread was still inside transaction()
+        """
+        own = 1 if self.in_transaction() else 0
+        with self._idle:
+            self._generation += 1
+            idle = self._idle.wait_for(lambda: self._active_transactions <= own, timeout)
+        if idle:
+            # Empty the WAL so a stale connection can't replay it over a replaced file
+            try:
+                conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+                try:
+                    conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                finally:
+                    conn.close()
+            except sqlite3.Error as e:
+                log.warning(f"Could not checkpoint {os.path.basename(self.db_path)}: {e}")
+        if not own:
+            # Inside its own transaction the caller's connection is left to go stale too
+            self.close()
+        return idle
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool counters
+
+        Returns:
+            Dictionary with connections_opened, open_connections, statements_executed,
+            statement_time_ms and transactions
+        """
+        with self._lock:
+            return {
+                'connections_opened': self.connections_opened,
+                'open_connections': len(self._open),
+                'statements_executed': self.statements_executed,
+                'statement_time_ms': round(self.statement_time * 1000, 1),
+                'transactions': self.transactions,
+            }
+
+
+_managers: Dict[str, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def _manager_key(db_path: str) -> str:
+    return os.path.normcase(os.path.abspath(db_path))
+
+
+def get_connection_manager(db_path: str) -> ConnectionManager:
+    """Get the shared connection manager for a database file"""
+    key = _manager_key(db_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = ConnectionManager(db_path)
+            _managers[key] = manager
+        return manager
+
+
+def close_all_connections(db_path: Optional[str] = None) -> bool:
+    """Retire pooled connections for one database file, or for all of them
+
+    Returns:
+        False if a transaction was still running on another thread (see
+        ConnectionManager.close_all)
+    """
+    with _managers_lock:
+        if db_path is None:
+            managers = list(_managers.values())
+        else:
+            manager = _managers.get(_manager_key(db_path))
+            managers = [manager] if manager else []
+    idle = True
+    for manager in managers:
+        idle = manager.close_all() and idle
+    return idle
@@ -8,6 +8,7 @@ import re
 import requests
 from datetime import datetime
 from config import _load_cfg
+from http_client import http_post
 
 # Import webhook URL from separate secrets file (not committed to git)
 try:
@@ -439,7 +440,7 @@ def send_discord_report(session_data: dict) -> tuple[bool, str]:
         }
         
         # Send to Discord
-        response = requests.post(
+        response = http_post(
             webhook_url,
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -483,7 +484,7 @@ def test_discord_webhook(webhook_url: str) -> tuple[bool, str]:
             "avatar_url": "https://raw.githubusercontent.com/Viper-Dude/EliteMining/main/app/Images/EliteMining_Icon_64.png"
         }
         
-        response = requests.post(
+        response = http_post(
             webhook_url,
             json=test_payload,
             headers={"Content-Type": "application/json"},
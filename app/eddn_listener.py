@@ -8,15 +8,53 @@ Connects to EDDN ZeroMQ stream and updates local commodity database
 import zmq
 import zlib
 import json
+import re
+import queue
 import sqlite3
 import threading
 import time
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from journal_decoder import extract_event_name
+
 log = logging.getLogger('EliteMining.EDDN')
 
+_SCHEMA_REF = re.compile(rb'"\$schemaRef"\s*:\s*"([^"]+)"')
+
+# Journal events the listener stores anything from
+JOURNAL_EVENTS = frozenset({'Docked', 'Location', 'FSDJump'})
+
+
+class _DropOldestQueue(queue.Queue):
+    """Bounded queue that discards its oldest item instead of blocking when full
+
+    Keeps a slow stage from stalling the one feeding it - the freshest market
+    data is the most useful, so the stalest message is the one to lose.
+    """
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.dropped = 0
+
+    def put_latest(self, item) -> bool:
+        """Add an item, dropping the oldest one if the queue is full
+
+        Returns:
+            True if an item was dropped to make room
+        """
+        with self.mutex:
+            dropped = False
+            if 0 < self.maxsize <= self._qsize():
+                self._get()
+                self.dropped += 1
+                dropped = True
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+            return dropped
+
 
 class EDDNListener:
     """
@@ -26,9 +64,52 @@ class EDDNListener:
 
     EDDN_RELAY = "tcp://eddn.edcd.io:9500"
     RECONNECT_DELAY = 30  # Seconds between reconnection attempts
-    CLEANUP_INTERVAL = 3600  # Clean up old data every hour
+    CLEANUP_INTERVAL = 600  # Run retention every 10 minutes (small, chunked passes)
     MAX_DATA_AGE_HOURS = 24  # Keep data for 24 hours
-    MAX_DB_SIZE_BYTES = 100 * 1024 * 1024  # 100MB size cap safety net
+
+    # Retention deletes in chunks through the updated_at indexes, committing after
+    # each one so the writer never waits long for the lock
+    RETENTION_CHUNK_ROWS = 500
+    RETENTION_CHUNK_PAUSE = 0.05      # Seconds between chunks
+    VACUUM_CHUNK_PAGES = 256          # Pages released per incremental_vacuum step
+
+    # Row budget per table (replaces the old 100MB file size cap). Over budget, the
+    # oldest rows are trimmed down to 90% of it.
+    TABLE_ROW_BUDGETS = {
+        'commodity_prices_data': 250000,
+        'station_metadata': 100000,
+        'system_coords': 200000,
+        'system_powerplay': 100000,
+    }
+    # Unique key of each budgeted table. The writer checks which incoming keys are
+    # new so the row counts can be kept up to date without a COUNT(*) per pass.
+    TABLE_KEYS = {
+        'commodity_prices_data': ('system_name', 'station_name', 'commodity_name'),
+        'station_metadata': ('market_id',),
+        'system_coords': ('name',),
+        'system_powerplay': ('system_name',),
+    }
+    ROW_COUNT_RESYNC = 6 * 3600  # Re-count the tables with COUNT(*) this often to correct any drift
+
+    # Age-based retention: table -> whether updated_at is an EDDN ISO timestamp
+    # ('2026-01-01T12:00:00Z') or SQLite CURRENT_TIMESTAMP ('2026-01-01 12:00:00').
+    # system_powerplay is excluded - PowerPlay control/state only changes on the
+    # weekly tick, and often persists across many ticks, so a fixed age cutoff would
+    # discard still-accurate data. It's bounded by its row budget instead.
+    AGE_RETENTION_TABLES = {
+        'commodity_prices_data': True,
+        'station_metadata': True,
+        'system_coords': False,
+    }
+
+    # Pipeline: receive thread -> raw_queue -> decode workers -> write_queue -> writer.
+    # Both queues drop their oldest entry when full so the socket is never stalled.
+    RAW_QUEUE_SIZE = 2000         # Max compressed messages waiting for a decode worker
+    DECODE_WORKERS = 2
+    WRITE_QUEUE_SIZE = 5000       # Max parsed messages waiting for the writer
+    WRITE_BATCH_MAX = 500         # Max messages per transaction
+    WRITE_BATCH_WAIT = 1.0        # Max seconds a message waits before its batch is written
+    COORDS_LOOKUP_CHUNK = 500     # system_coords names per IN (...) lookup
 
     # Only store these commodities — everything else is discarded at ingestion
     TRACKED_COMMODITIES = frozenset({
@@ -66,24 +147,64 @@ class EDDNListener:
         "lithium",
     })
     
-    def __init__(self, database_path: str):
+    # Matches a tracked commodity name anywhere in a raw commodity message, so
+    # messages with nothing we store are discarded before the JSON decode
+    _TRACKED_NAME = re.compile(
+        rb'"name"\s*:\s*"(?:' + b'|'.join(sorted(name.encode() for name in TRACKED_COMMODITIES)) + rb')"',
+        re.IGNORECASE)
+    
+    def __init__(self, database_path: str, relay: Optional[str] = None):
         """
         Initialize EDDN listener
         
         Args:
             database_path: Path to marketplace_cache.db
+            relay: ZeroMQ endpoint to subscribe to (defaults to EDDN_RELAY; point it at
+                   a local PUB socket to replay recorded traffic)
         """
         self.database_path = database_path
+        self.relay = relay or self.EDDN_RELAY
         self.running = False
         self.thread = None
+        self.decode_threads = []
         self.cleanup_thread = None
         self.messages_received = 0
         self.last_message_time = None
         self.last_cleanup_time = time.time()
+
+        # Compressed frames waiting for a decode worker
+        self.raw_queue: "_DropOldestQueue" = _DropOldestQueue(self.RAW_QUEUE_SIZE)
+        # Parsed writes waiting for the writer thread: (kind, row) tuples
+        self.write_queue: "_DropOldestQueue" = _DropOldestQueue(self.WRITE_QUEUE_SIZE)
+        self.writer_thread = None
+        self._stats_lock = threading.Lock()
+        self.messages_decoded = 0
+        self.messages_filtered = 0
+        self.decode_errors = 0
+        self.batches_written = 0
+        self.rows_written = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.last_write_ms = 0.0
+        self.total_write_ms = 0.0
+        self._commodity_ids: Dict[str, int] = {}  # canonical name -> commodities.id (writer thread)
+        self._galaxy_db = None  # LocalSystemsDatabase, opened by the writer on first use
+        self.has_spatial_index = False
+        self.coords_from_galaxy = 0
+        self.coords_unresolved = 0
+        # table -> row count, loaded by the first cleanup pass and then kept current by
+        # the writer's inserts and the retention deletes
+        self._row_counts: Dict[str, int] = {}
+        self._row_counts_lock = threading.Lock()
+        self._row_counts_synced: Optional[float] = None  # time.monotonic() of the last full count
+        # Set once the cleanup thread's startup maintenance is done; the writer waits for it
+        self._db_ready = threading.Event()
+        self._needs_vacuum_conversion = False
         self._init_database()
 
     def _init_database(self):
         """Create tables if they don't exist"""
+        self._needs_vacuum_conversion = self._enable_incremental_vacuum()
         try:
             with sqlite3.connect(self.database_path) as conn:
                 cursor = conn.cursor()
@@ -113,12 +234,17 @@ class EDDNListener:
                         distance_to_arrival INTEGER,
                         market_id INTEGER,
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        commodity_id INTEGER,
+                        max_landing_pad_size INTEGER,
                         UNIQUE(system_name, station_name, commodity_name)
                     )
                 ''')
+                # Canonical lowercase commodity names, assigned an id at ingest
                 cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_commodity_name
-                    ON commodity_prices_data(commodity_name)
+                    CREATE TABLE IF NOT EXISTS commodities (
+                        id INTEGER PRIMARY KEY,
+                        name TEXT UNIQUE NOT NULL
+                    )
                 ''')
                 cursor.execute('''
                     CREATE INDEX IF NOT EXISTS idx_market_id
@@ -153,23 +279,153 @@ class EDDNListener:
                 ''')
                 # Drop FTS5 table if it exists from older versions (unused, wastes space)
                 cursor.execute('DROP TABLE IF EXISTS commodity_prices_fts')
+                self._migrate_commodity_ids(cursor)
+                self._init_spatial_index(cursor)
+                for table in self.TABLE_ROW_BUDGETS:
+                    cursor.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_updated ON {table}(updated_at)')
                 conn.commit()
                 log.info("EDDN database initialized")
         except Exception as e:
             log.error(f"EDDN database init error: {e}")
         
+    def _enable_incremental_vacuum(self) -> bool:
+        """Switch the cache to auto_vacuum=INCREMENTAL so retention can give space back
+
+        New files pick the mode up before their first table; existing files need
+        one full VACUUM to convert, which can take a while on a large cache and
+        is left to the cleanup thread (_convert_to_incremental_vacuum).
+
+        Returns:
+            True if the file still needs that conversion
+        """
+        try:
+            conn = sqlite3.connect(self.database_path, isolation_level=None)
+            try:
+                if conn.execute('PRAGMA auto_vacuum').fetchone()[0] == 2:
+                    return False
+                conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                return conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone() is not None
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            log.warning(f"EDDN: Could not enable incremental vacuum: {e}")
+            return False
+
+    def _convert_to_incremental_vacuum(self):
+        """One-time full VACUUM that converts an existing cache to incremental auto-vacuum"""
+        try:
+            conn = sqlite3.connect(self.database_path, timeout=10.0, isolation_level=None)
+            try:
+                conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+                log.info("EDDN: Converting cache to incremental auto-vacuum (one-time)...")
+                conn.execute('VACUUM')
+                self._needs_vacuum_conversion = False
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            log.warning(f"EDDN: Could not convert cache to incremental vacuum: {e}")
+
+    def _migrate_commodity_ids(self, cursor: sqlite3.Cursor):
+        """Add commodity ids and denormalized station columns to older databases
+
+        Market searches read commodity_prices_data through idx_prices_commodity_time
+        alone: it leads with (commodity_id, updated_at) and carries every column the
+        search returns, so a search is an index-only range scan with no table lookups
+        and no join against station_metadata.
+        """
+        cursor.execute('PRAGMA table_info(commodity_prices_data)')
+        columns = {row[1] for row in cursor.fetchall()}
+        for column in ('commodity_id', 'max_landing_pad_size'):
+            if column not in columns:
+                cursor.execute(f'ALTER TABLE commodity_prices_data ADD COLUMN {column} INTEGER')
+
+        # Backfill rows written before ids and denormalized station data existed
+        cursor.execute('''
+            INSERT OR IGNORE INTO commodities (name)
+            SELECT DISTINCT LOWER(commodity_name) FROM commodity_prices_data
+            WHERE commodity_id IS NULL AND commodity_name IS NOT NULL
+        ''')
+        cursor.execute('''
+            UPDATE commodity_prices_data
+            SET commodity_id = (SELECT id FROM commodities WHERE name = LOWER(commodity_prices_data.commodity_name))
+            WHERE commodity_id IS NULL
+        ''')
+        if cursor.rowcount > 0:
+            cursor.execute('''
+                UPDATE commodity_prices_data
+                SET station_type = COALESCE(
+                        (SELECT m.station_type FROM station_metadata m WHERE m.market_id = commodity_prices_data.market_id),
+                        station_type),
+                    distance_to_arrival = COALESCE(distance_to_arrival,
+                        (SELECT m.distance_to_arrival FROM station_metadata m WHERE m.market_id = commodity_prices_data.market_id)),
+                    max_landing_pad_size = (SELECT m.max_landing_pad_size FROM station_metadata m
+                                            WHERE m.market_id = commodity_prices_data.market_id)
+                WHERE station_type IS NULL OR station_type = 'Unknown'
+            ''')
+
+        # Superseded by idx_prices_commodity_time (searches no longer filter on the name)
+        cursor.execute('DROP INDEX IF EXISTS idx_commodity_name')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_prices_commodity_time
+            ON commodity_prices_data(commodity_id, updated_at,
+                                     sell_price, buy_price, demand, stock,
+                                     system_name, system_x, system_y, system_z,
+                                     station_name, station_type, max_landing_pad_size,
+                                     distance_to_arrival, market_id)
+        ''')
+
+    def _init_spatial_index(self, cursor: sqlite3.Cursor):
+        """Create the R-Tree of market positions used for radius searches
+
+        One point per market_id at its system's coordinates, so "buyers within
+        N LY" only reads price rows for markets inside the search box.
+        """
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'market_spatial'")
+        if cursor.fetchone():
+            self.has_spatial_index = True
+            return
+        try:
+            cursor.execute('''
+                CREATE VIRTUAL TABLE market_spatial USING rtree(
+                    id,
+                    x_min, x_max,
+                    y_min, y_max,
+                    z_min, z_max
+                )
+            ''')
+        except sqlite3.OperationalError as e:
+            # SQLite built without R-Tree - searches fall back to the commodity index
+            log.warning(f"EDDN: R-Tree not available, market searches won't be spatially indexed: {e}")
+            return
+        self.has_spatial_index = True
+        # Position from each market's newest rows only - a fleet carrier keeps rows
+        # from systems it has since left under the same market_id
+        cursor.execute('''
+            INSERT OR REPLACE INTO market_spatial
+            SELECT p.market_id, p.system_x, p.system_x, p.system_y, p.system_y, p.system_z, p.system_z
+            FROM commodity_prices_data p
+            WHERE p.market_id AND p.system_x IS NOT NULL
+              AND p.updated_at = (SELECT MAX(updated_at) FROM commodity_prices_data
+                                  WHERE market_id = p.market_id)
+            GROUP BY p.market_id
+        ''')
+
     def start(self):
         """Start the EDDN listener in background thread"""
         if self.running:
             log.warning("EDDN listener already running")
             return
         
-        # Purge stale data on startup (no point keeping >8h old prices)
-        deleted = self._cleanup_old_data()
-        if deleted > 0:
-            log.info(f"🧹 Startup cleanup: removed {deleted:,} stale records")
-            
+        # The vacuum conversion and startup purge run on the cleanup thread, not the
+        # caller's (UI) thread; the writer holds its first batch until they're done
+        self._db_ready.clear()
         self.running = True
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+        self.decode_threads = [threading.Thread(target=self._decode_loop, daemon=True)
+                               for _ in range(self.DECODE_WORKERS)]
+        for decode_thread in self.decode_threads:
+            decode_thread.start()
         self.thread = threading.Thread(target=self._listen_loop, daemon=True)
         self.thread.start()
         
@@ -177,19 +433,34 @@ class EDDNListener:
         self.cleanup_thread = threading.Thread(target=self._cleanup_loop, daemon=True)
         self.cleanup_thread.start()
         
-        log.info("EDDN listener started (with auto-cleanup every hour)")
+        log.info(f"EDDN listener started (with auto-cleanup every {self.CLEANUP_INTERVAL // 60} minutes)")
         
     def stop(self):
         """Stop the EDDN listener"""
         self.running = False
         if self.thread:
             self.thread.join(timeout=5)
+        for decode_thread in self.decode_threads:
+            decode_thread.join(timeout=5)
+        if self.writer_thread:
+            # Writer flushes whatever is still queued before exiting
+            self.writer_thread.join(timeout=5)
         if self.cleanup_thread:
             self.cleanup_thread.join(timeout=5)
         log.info("EDDN listener stopped")
     
     def _cleanup_loop(self):
-        """Periodic cleanup of old data (runs in background thread)"""
+        """Startup maintenance, then periodic cleanup of old data (runs in background thread)"""
+        try:
+            if self._needs_vacuum_conversion:
+                self._convert_to_incremental_vacuum()
+            # Purge stale data on startup (no point keeping >24h old prices)
+            deleted = self._cleanup_old_data()
+            if deleted > 0:
+                log.info(f"🧹 Startup cleanup: removed {deleted:,} stale records")
+        finally:
+            self._db_ready.set()
+
         while self.running:
             try:
                 # Wait for cleanup interval
@@ -199,65 +470,153 @@ class EDDNListener:
                     break
                 
                 # Perform cleanup
-                log.info("🧹 Running database cleanup (24h for market data; PowerPlay kept until size cap)...")
                 deleted_count = self._cleanup_old_data()
-                log.info(f"🧹 Cleanup complete: Removed {deleted_count:,} old records")
+                if deleted_count:
+                    log.info(f"🧹 Cleanup complete: Removed {deleted_count:,} old records")
                 
             except Exception as e:
                 log.error(f"Cleanup loop error: {e}")
     
     def _cleanup_old_data(self) -> int:
         """
-        Remove data older than MAX_DATA_AGE_HOURS
+        Remove data older than MAX_DATA_AGE_HOURS, trim tables over their row
+        budget and release the freed pages
         
         Returns:
             Number of records deleted
         """
         try:
-            with sqlite3.connect(self.database_path) as conn:
+            conn = sqlite3.connect(self.database_path, timeout=10.0, isolation_level=None)
+            try:
                 cursor = conn.cursor()
+                deleted_data = 0
 
-                # Delete data older than MAX_DATA_AGE_HOURS from most tables.
-                # system_powerplay is excluded - PowerPlay control/state only changes on the
-                # weekly tick, and often persists across many ticks, so a fixed age cutoff would
-                # discard still-accurate data. It's bounded instead by the size cap below.
-                cutoff_expr = f"datetime('now', '-{self.MAX_DATA_AGE_HOURS} hours')"
-                total_deleted = 0
-                for table in ('commodity_prices_data', 'station_metadata', 'system_coords'):
-                    cursor.execute(f'DELETE FROM {table} WHERE updated_at < {cutoff_expr}')
-                    total_deleted += cursor.rowcount
-                deleted_data = total_deleted
-                conn.commit()
+                # Age retention (24h for market data)
+                cutoff = datetime.now(timezone.utc) - timedelta(hours=self.MAX_DATA_AGE_HOURS)
+                for table, iso_timestamps in self.AGE_RETENTION_TABLES.items():
+                    cutoff_str = cutoff.strftime('%Y-%m-%dT%H:%M:%S' if iso_timestamps else '%Y-%m-%d %H:%M:%S')
+                    deleted = self._delete_in_chunks(cursor, table, 'updated_at < ?', (cutoff_str,))
+                    self._adjust_row_counts({table: -deleted})
+                    deleted_data += deleted
+
+                # Row budgets - trim the oldest rows of any table over its budget. The
+                # running counts are checked first; a table is only re-counted when
+                # it looks over budget
+                if (self._row_counts_synced is None
+                        or time.monotonic() - self._row_counts_synced >= self.ROW_COUNT_RESYNC):
+                    for table in self.TABLE_ROW_BUDGETS:
+                        self._count_rows(cursor, table)
+                    self._row_counts_synced = time.monotonic()
+                for table, budget in self.TABLE_ROW_BUDGETS.items():
+                    if self._row_counts.get(table, 0) <= budget:
+                        continue
+                    count = self._count_rows(cursor, table)
+                    if count <= budget:
+                        continue
+                    excess = count - int(budget * 0.9)
+                    log.warning(f"⚠️ {table} has {count:,} rows (budget {budget:,}) — trimming {excess:,} oldest...")
+                    deleted = self._delete_in_chunks(cursor, table, '1', (), limit=excess)
+                    self._adjust_row_counts({table: -deleted})
+                    deleted_data += deleted
 
-            # Size cap: if DB exceeds 100MB, delete oldest rows until under limit
-            import os
-            db_size = os.path.getsize(self.database_path)
-            if db_size > self.MAX_DB_SIZE_BYTES:
-                log.warning(f"⚠️ DB size {db_size / 1024 / 1024:.1f}MB exceeds cap — trimming oldest rows...")
-                with sqlite3.connect(self.database_path) as conn:
-                    cursor = conn.cursor()
-                    # Delete oldest 20% of rows in each table to avoid repeatedly hitting the cap
-                    trimmed = 0
-                    for table, pk in (('commodity_prices_data', 'id'), ('system_powerplay', 'system_name')):
-                        cursor.execute(f'''
-                            DELETE FROM {table}
-                            WHERE {pk} IN (
-                                SELECT {pk} FROM {table}
-                                ORDER BY updated_at ASC
-                                LIMIT (SELECT COUNT(*) / 5 FROM {table})
-                            )
-                        ''')
-                        trimmed += cursor.rowcount
-                    conn.commit()
-                log.warning(f"⚠️ Size trim complete: removed {trimmed:,} oldest rows")
-                deleted_data += trimmed
+                if deleted_data:
+                    cursor.execute('BEGIN IMMEDIATE')
+                    self._delete_orphan_markets(cursor)
+                    cursor.execute('COMMIT')
+                self._incremental_vacuum(cursor)
+            finally:
+                conn.close()
 
             return deleted_data
 
         except Exception as e:
             log.error(f"Error cleaning up old data: {e}")
             return 0
-        
+
+    def _count_rows(self, cursor: sqlite3.Cursor, table: str) -> int:
+        """Count a table's rows with COUNT(*) and reset its running count"""
+        cursor.execute(f'SELECT COUNT(*) FROM {table}')
+        count = cursor.fetchone()[0]
+        with self._row_counts_lock:
+            self._row_counts[table] = count
+        return count
+
+    def _adjust_row_counts(self, deltas: Dict[str, int]):
+        """Apply inserted (+) / deleted (-) rows to the running counts of tables already counted"""
+        with self._row_counts_lock:
+            for table, delta in deltas.items():
+                if table in self._row_counts:
+                    self._row_counts[table] = max(0, self._row_counts[table] + delta)
+
+    def _count_new_keys(self, cursor: sqlite3.Cursor, table: str, keys) -> int:
+        """How many of these unique keys aren't in the table yet, i.e. rows an insert will add"""
+        keys = list(set(keys))
+        columns = self.TABLE_KEYS[table]
+        match = ' AND '.join(f't.{column} = k.column{i + 1}' for i, column in enumerate(columns))
+        chunk_size = self.COORDS_LOOKUP_CHUNK // len(columns)
+        existing = 0
+        for i in range(0, len(keys), chunk_size):
+            chunk = keys[i:i + chunk_size]
+            values = ','.join(['(' + ','.join('?' * len(columns)) + ')'] * len(chunk))
+            cursor.execute(f'SELECT COUNT(*) FROM (VALUES {values}) AS k JOIN {table} t ON {match}',
+                           [value for key in chunk for value in key])
+            existing += cursor.fetchone()[0]
+        return len(keys) - existing
+
+    def _delete_in_chunks(self, cursor: sqlite3.Cursor, table: str, where: str, params: tuple,
+                          limit: Optional[int] = None) -> int:
+        """Delete matching rows oldest first, one short transaction per chunk
+
+        Args:
+            where: Extra filter on the table (e.g. 'updated_at < ?')
+            limit: Stop after this many rows (None = every matching row)
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+        while limit is None or deleted < limit:
+            chunk = self.RETENTION_CHUNK_ROWS if limit is None else min(self.RETENTION_CHUNK_ROWS, limit - deleted)
+            cursor.execute('BEGIN IMMEDIATE')
+            try:
+                cursor.execute(f'''
+                    DELETE FROM {table} WHERE rowid IN (
+                        SELECT rowid FROM {table} WHERE {where}
+                        ORDER BY updated_at LIMIT ?
+                    )
+                ''', params + (chunk,))
+                removed = cursor.rowcount
+                cursor.execute('COMMIT')
+            except Exception:
+                cursor.execute('ROLLBACK')
+                raise
+            deleted += removed
+            if removed < chunk:
+                break
+            time.sleep(self.RETENTION_CHUNK_PAUSE)
+        return deleted
+
+    def _incremental_vacuum(self, cursor: sqlite3.Cursor):
+        """Return free pages to the filesystem a few at a time"""
+        cursor.execute('PRAGMA auto_vacuum')
+        if cursor.fetchone()[0] != 2:
+            return
+        while True:
+            cursor.execute('PRAGMA freelist_count')
+            if cursor.fetchone()[0] == 0:
+                break
+            cursor.execute(f'PRAGMA incremental_vacuum({self.VACUUM_CHUNK_PAGES})')
+            cursor.fetchall()
+            time.sleep(self.RETENTION_CHUNK_PAUSE)
+
+    def _delete_orphan_markets(self, cursor: sqlite3.Cursor):
+        """Drop market_spatial points whose price rows have all been deleted"""
+        if self.has_spatial_index:
+            cursor.execute('''
+                DELETE FROM market_spatial
+                WHERE id NOT IN (SELECT market_id FROM commodity_prices_data WHERE market_id IS NOT NULL)
+            ''')
+
     def _listen_loop(self):
         """Main listening loop (runs in background thread)"""
         context = zmq.Context()
@@ -265,26 +624,21 @@ class EDDNListener:
         while self.running:
             try:
                 # Create socket and connect
-                log.info(f"Connecting to EDDN: {self.EDDN_RELAY}")
+                log.info(f"Connecting to EDDN: {self.relay}")
                 subscriber = context.socket(zmq.SUB)
-                subscriber.connect(self.EDDN_RELAY)
+                subscriber.connect(self.relay)
                 subscriber.subscribe(b'')  # Subscribe to all messages
                 subscriber.setsockopt(zmq.RCVTIMEO, 60000)  # 60 second timeout
                 
                 log.info("Connected to EDDN stream")
                 
-                # Listen for messages
+                # Listen for messages - only receive here, decoding happens in the
+                # decode workers so a slow message never holds up the socket
                 while self.running:
                     try:
                         # Receive compressed message
                         raw_message = subscriber.recv()
-                        
-                        # Decompress
-                        message_json = zlib.decompress(raw_message).decode('utf-8')
-                        message = json.loads(message_json)
-                        
-                        # Process message
-                        self._process_message(message)
+                        self.raw_queue.put_latest(raw_message)
                         
                         # Update stats
                         self.messages_received += 1
@@ -292,7 +646,7 @@ class EDDNListener:
                         
                         # Log every 50 messages
                         if self.messages_received % 50 == 0:
-                            log.info(f"📡 EDDN: Processed {self.messages_received} messages")
+                            log.info(f"📡 EDDN: Received {self.messages_received} messages")
                         
                         # Log first few messages to show it's working
                         if self.messages_received <= 5:
@@ -317,6 +671,54 @@ class EDDNListener:
         
         context.term()
         log.info("EDDN listener loop exited")
+
+    def _decode_loop(self):
+        """Decode worker: decompress, prefilter and parse queued frames (runs in background thread)"""
+        while self.running or not self.raw_queue.empty():
+            try:
+                raw_message = self.raw_queue.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            self._decode_raw_message(raw_message)
+
+    def _decode_raw_message(self, raw_message: bytes):
+        """Decompress one frame and hand it to _process_message if we store anything from it"""
+        try:
+            payload = zlib.decompress(raw_message)
+        except zlib.error as e:
+            log.debug(f"EDDN: Could not decompress message: {e}")
+            with self._stats_lock:
+                self.decode_errors += 1
+            return
+
+        if not self._wants_payload(payload):
+            with self._stats_lock:
+                self.messages_filtered += 1
+            return
+
+        try:
+            message = json.loads(payload)
+        except ValueError as e:
+            log.debug(f"EDDN: Invalid message JSON: {e}")
+            with self._stats_lock:
+                self.decode_errors += 1
+            return
+
+        with self._stats_lock:
+            self.messages_decoded += 1
+        self._process_message(message)
+
+    def _wants_payload(self, payload: bytes) -> bool:
+        """Cheap check on the raw JSON for a schema/event/commodity we store"""
+        match = _SCHEMA_REF.search(payload)
+        if not match:
+            return False
+        schema_ref = match.group(1).lower()
+        if b'commodity' in schema_ref:
+            return self._TRACKED_NAME.search(payload) is not None
+        if b'journal' in schema_ref:
+            return extract_event_name(payload) in JOURNAL_EVENTS
+        return False
         
     def _process_message(self, message: dict):
         """
@@ -374,7 +776,7 @@ class EDDNListener:
             msg_data = message.get('message', {})
             event = msg_data.get('event', '')
 
-            if event not in ('Docked', 'Location', 'FSDJump'):
+            if event not in JOURNAL_EVENTS:
                 return
 
             timestamp = msg_data.get('timestamp') or message.get('header', {}).get('gatewayTimestamp', '')
@@ -388,22 +790,16 @@ class EDDNListener:
                     system_name = msg_data.get('StarSystem', '')
                     distance_to_arrival = msg_data.get('DistFromStarLS') or msg_data.get('DistanceFromArrivalLS')
                     max_pad = self._infer_max_pad(station_type)
-                    try:
-                        with sqlite3.connect(self.database_path) as conn:
-                            conn.execute('''
-                                INSERT OR REPLACE INTO station_metadata
-                                (market_id, station_name, system_name, station_type,
-                                 max_landing_pad_size, distance_to_arrival, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?)
-                            ''', (market_id, station_name, system_name, station_type,
-                                  max_pad, distance_to_arrival, timestamp))
-                            conn.commit()
-                    except Exception as e:
-                        log.debug(f"EDDN: station_metadata write error: {e}")
+                    self._enqueue_write('station', (market_id, station_name, system_name, station_type,
+                                                    max_pad, distance_to_arrival, timestamp))
 
-            # Powerplay data — FSDJump and Location carry system-level PP fields
+            # Powerplay data and system coordinates — FSDJump and Location carry system-level fields
             if event in ('FSDJump', 'Location'):
                 self._process_powerplay_from_event(msg_data, timestamp)
+                star_pos = msg_data.get('StarPos')
+                system_name = msg_data.get('StarSystem')
+                if system_name and star_pos and len(star_pos) == 3:
+                    self._enqueue_write('coords', (system_name, star_pos[0], star_pos[1], star_pos[2]))
 
         except Exception as e:
             log.error(f"EDDN: Error processing journal message: {e}")
@@ -423,17 +819,7 @@ class EDDNListener:
             return
 
         powers_json = json.dumps(powers) if powers else None
-
-        try:
-            with sqlite3.connect(self.database_path) as conn:
-                conn.execute('''
-                    INSERT OR REPLACE INTO system_powerplay
-                    (system_name, controlling_power, power_state, powers, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                ''', (system_name, controlling_power, power_state, powers_json, timestamp))
-                conn.commit()
-        except Exception as e:
-            log.debug(f"EDDN: system_powerplay write error: {e}")
+        self._enqueue_write('powerplay', (system_name, controlling_power, power_state, powers_json, timestamp))
 
     @staticmethod
     def _infer_max_pad(station_type: str) -> int:
@@ -459,7 +845,7 @@ class EDDNListener:
                                  station_type: str, market_id: int,
                                  commodities: list, timestamp: str):
         """
-        Update commodity prices in database
+        Queue tracked commodity prices for the writer thread
         
         Args:
             system_name: System name
@@ -469,55 +855,272 @@ class EDDNListener:
             commodities: List of commodity data
             timestamp: ISO timestamp of data
         """
-        try:
-            with sqlite3.connect(self.database_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get system coordinates (if we have them cached)
-                cursor.execute('''
-                    SELECT x, y, z FROM system_coords WHERE name = ?
-                ''', (system_name,))
-                coords_row = cursor.fetchone()
-                
-                system_x = coords_row[0] if coords_row else None
-                system_y = coords_row[1] if coords_row else None
-                system_z = coords_row[2] if coords_row else None
-                
-                # Update each commodity — only tracked ones
-                for commodity in commodities:
-                    commodity_name = commodity.get('name')
-                    if not commodity_name:
-                        continue
-                    # Discard irrelevant commodities to keep the DB small
-                    if commodity_name.lower() not in self.TRACKED_COMMODITIES:
-                        continue
-                    sell_price = commodity.get('sellPrice', 0)
-                    buy_price = commodity.get('buyPrice', 0)
-                    demand = commodity.get('demand', 0)
-                    stock = commodity.get('stock', 0)
-                    
-                    # Insert/update in data table
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO commodity_prices_data
-                        (system_name, system_x, system_y, system_z, station_name, station_type,
-                         commodity_name, sell_price, buy_price, demand, stock, distance_to_arrival,
-                         market_id, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (system_name, system_x, system_y, system_z, station_name, station_type,
-                          commodity_name, sell_price, buy_price, demand, stock, None,
-                          market_id, timestamp))
-                
-                conn.commit()
-                
-        except Exception as e:
-            log.error(f"EDDN: Database update error: {e}")
+        rows = []
+        for commodity in commodities:
+            commodity_name = commodity.get('name')
+            if not commodity_name:
+                continue
+            # Discard irrelevant commodities to keep the DB small
+            if commodity_name.lower() not in self.TRACKED_COMMODITIES:
+                continue
+            rows.append((commodity_name,
+                         commodity.get('sellPrice', 0),
+                         commodity.get('buyPrice', 0),
+                         commodity.get('demand', 0),
+                         commodity.get('stock', 0)))
+        if rows:
+            self._enqueue_write('commodity', (system_name, station_name, station_type,
+                                              market_id, timestamp, rows))
+
+    def _enqueue_write(self, kind: str, row: tuple):
+        """Hand a parsed write to the writer thread, dropping the oldest queued write if full"""
+        if self.write_queue.put_latest((kind, row)) and self.write_queue.dropped % 100 == 1:
+            log.warning(f"EDDN: Write queue full - dropped {self.write_queue.dropped} messages so far")
+
+    def _writer_loop(self):
+        """Single writer: drain the queue in size/time-bounded batches (runs in background thread)"""
+        conn = None
+        # Messages queue up meanwhile (oldest dropped if it fills)
+        self._db_ready.wait()
+        while self.running or not self.write_queue.empty():
+            try:
+                first = self.write_queue.get(timeout=self.WRITE_BATCH_WAIT)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            deadline = time.monotonic() + self.WRITE_BATCH_WAIT
+            while len(batch) < self.WRITE_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                if conn is None:
+                    conn = sqlite3.connect(self.database_path, timeout=10.0)
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.execute('PRAGMA synchronous=NORMAL')
+                self._write_batch(conn, batch)
+            except Exception as e:
+                log.error(f"EDDN: Database update error: {e}")
+                if conn is not None:
+                    conn.close()
+                    conn = None
+
+        if conn is not None:
+            conn.close()
+        log.info("EDDN writer loop exited")
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[Tuple[str, tuple]]):
+        """Write one batch of queued messages in a single transaction"""
+        start = time.perf_counter()
+        commodity_msgs = [row for kind, row in batch if kind == 'commodity']
+        station_rows = [row for kind, row in batch if kind == 'station']
+        powerplay_rows = [row for kind, row in batch if kind == 'powerplay']
+        coords_rows = [row for kind, row in batch if kind == 'coords']
+        # Rows each table gains, counted only once the cleanup pass has loaded the counts
+        added = {} if self._row_counts else None
+
+        with conn:
+            cursor = conn.cursor()
+            if station_rows:
+                if added is not None:
+                    added['station_metadata'] = self._count_new_keys(
+                        cursor, 'station_metadata', [(row[0],) for row in station_rows])
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO station_metadata
+                    (market_id, station_name, system_name, station_type,
+                     max_landing_pad_size, distance_to_arrival, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', station_rows)
+                # Keep the station columns denormalized onto existing price rows
+                cursor.executemany('''
+                    UPDATE commodity_prices_data
+                    SET station_type = CASE WHEN station_type IS NULL OR station_type = 'Unknown'
+                                            THEN ? ELSE station_type END,
+                        max_landing_pad_size = ?,
+                        distance_to_arrival = COALESCE(distance_to_arrival, ?)
+                    WHERE market_id = ?
+                ''', [(station_type, max_pad, distance, market_id)
+                      for market_id, _, _, station_type, max_pad, distance, _ in station_rows])
+
+            if coords_rows:
+                if added is not None:
+                    added['system_coords'] = self._count_new_keys(
+                        cursor, 'system_coords', [(row[0],) for row in coords_rows])
+                self._write_system_coords(cursor, coords_rows)
+
+            coords = self._lookup_coords(cursor, {msg[0] for msg in commodity_msgs}, added)
+            stations = self._lookup_stations(cursor, {msg[3] for msg in commodity_msgs if msg[3]})
+            commodity_ids = self._get_commodity_ids(
+                cursor, {row[0].lower() for msg in commodity_msgs for row in msg[5]})
+
+            price_rows = []
+            for system_name, station_name, station_type, market_id, timestamp, rows in commodity_msgs:
+                system_x, system_y, system_z = coords.get(system_name, (None, None, None))
+                meta_type, meta_pad, meta_distance = stations.get(market_id, (None, None, None))
+                if station_type == 'Unknown' and meta_type:
+                    station_type = meta_type
+                for commodity_name, sell_price, buy_price, demand, stock in rows:
+                    price_rows.append((system_name, system_x, system_y, system_z, station_name, station_type,
+                                       commodity_name, commodity_ids[commodity_name.lower()],
+                                       sell_price, buy_price, demand, stock, meta_distance, meta_pad,
+                                       market_id, timestamp))
+
+            if price_rows:
+                if added is not None:
+                    added['commodity_prices_data'] = self._count_new_keys(
+                        cursor, 'commodity_prices_data', [(row[0], row[4], row[6]) for row in price_rows])
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO commodity_prices_data
+                    (system_name, system_x, system_y, system_z, station_name, station_type,
+                     commodity_name, commodity_id, sell_price, buy_price, demand, stock,
+                     distance_to_arrival, max_landing_pad_size, market_id, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', price_rows)
+                if self.has_spatial_index:
+                    cursor.executemany('''
+                        INSERT OR REPLACE INTO market_spatial VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', [(market_id, *(v for c in coords[system_name] for v in (c, c)))
+                          for system_name, _, _, market_id, _, _ in commodity_msgs
+                          if market_id and system_name in coords])
+            if powerplay_rows:
+                if added is not None:
+                    added['system_powerplay'] = self._count_new_keys(
+                        cursor, 'system_powerplay', [(row[0],) for row in powerplay_rows])
+                cursor.executemany('''
+                    INSERT OR REPLACE INTO system_powerplay
+                    (system_name, controlling_power, power_state, powers, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', powerplay_rows)
+
+        if added:
+            self._adjust_row_counts(added)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.batches_written += 1
+        self.rows_written += len(price_rows) + len(station_rows) + len(powerplay_rows) + len(coords_rows)
+        self.last_batch_size = len(batch)
+        self.max_batch_size = max(self.max_batch_size, len(batch))
+        self.last_write_ms = elapsed_ms
+        self.total_write_ms += elapsed_ms
+
+    def _get_commodity_ids(self, cursor: sqlite3.Cursor, names) -> Dict[str, int]:
+        """Ids for canonical (lowercase) commodity names, adding any not seen before"""
+        missing = [name for name in names if name not in self._commodity_ids]
+        if missing:
+            cursor.executemany('INSERT OR IGNORE INTO commodities (name) VALUES (?)', [(name,) for name in missing])
+            placeholders = ','.join('?' * len(missing))
+            cursor.execute(f'SELECT name, id FROM commodities WHERE name IN ({placeholders})', missing)
+            self._commodity_ids.update(cursor.fetchall())
+        return self._commodity_ids
+
+    def _lookup_stations(self, cursor: sqlite3.Cursor, market_ids) -> Dict[int, Tuple[str, int, float]]:
+        """station_metadata (type, pad size, distance to arrival) for a set of markets"""
+        ids = list(market_ids)
+        stations = {}
+        for i in range(0, len(ids), self.COORDS_LOOKUP_CHUNK):
+            chunk = ids[i:i + self.COORDS_LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'''
+                SELECT market_id, station_type, max_landing_pad_size, distance_to_arrival
+                FROM station_metadata WHERE market_id IN ({placeholders})
+            ''', chunk)
+            for market_id, station_type, max_pad, distance in cursor.fetchall():
+                stations[market_id] = (station_type, max_pad, distance)
+        return stations
+
+    def _write_system_coords(self, cursor: sqlite3.Cursor, coords_rows: List[tuple]):
+        """Store coordinates from FSDJump/Location and fill them into rows that lacked them"""
+        cursor.executemany('INSERT OR REPLACE INTO system_coords (name, x, y, z) VALUES (?, ?, ?, ?)',
+                           coords_rows)
+        cursor.executemany('''
+            UPDATE commodity_prices_data SET system_x = ?, system_y = ?, system_z = ?
+            WHERE system_name = ? AND system_x IS NULL
+        ''', [(x, y, z, name) for name, x, y, z in coords_rows])
+        if self.has_spatial_index:
+            # Only markets whose newest rows are in this system - a carrier's older
+            # rows from a system it jumped away from mustn't move its point back
+            cursor.executemany('''
+                INSERT OR REPLACE INTO market_spatial
+                SELECT DISTINCT p.market_id, ?, ?, ?, ?, ?, ?
+                FROM commodity_prices_data p
+                WHERE p.system_name = ? AND p.market_id
+                  AND p.updated_at = (SELECT MAX(updated_at) FROM commodity_prices_data
+                                      WHERE market_id = p.market_id)
+            ''', [(x, x, y, y, z, z, name) for name, x, y, z in coords_rows])
+
+    def _lookup_coords(self, cursor: sqlite3.Cursor, system_names,
+                       added: Optional[Dict[str, int]] = None) -> Dict[str, Tuple[float, float, float]]:
+        """Resolve coordinates for a set of systems at ingest
+
+        Reads system_coords first (chunked IN (...) queries), then the galaxy
+        database for the rest. Galaxy hits are saved to system_coords so the
+        next message from the same system doesn't need the second lookup; the
+        rows that adds are counted into added when it's given.
+        """
+        names = list(system_names)
+        coords = {}
+        for i in range(0, len(names), self.COORDS_LOOKUP_CHUNK):
+            chunk = names[i:i + self.COORDS_LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            cursor.execute(f'SELECT name, x, y, z FROM system_coords WHERE name IN ({placeholders})', chunk)
+            for name, x, y, z in cursor.fetchall():
+                if x is not None:
+                    coords[name] = (x, y, z)
+
+        missing = [name for name in names if name not in coords]
+        if missing:
+            galaxy_coords = self._galaxy_coords(missing)
+            if galaxy_coords:
+                if added is not None:
+                    added['system_coords'] = added.get('system_coords', 0) + self._count_new_keys(
+                        cursor, 'system_coords', [(name,) for name in galaxy_coords])
+                cursor.executemany('INSERT OR REPLACE INTO system_coords (name, x, y, z) VALUES (?, ?, ?, ?)',
+                                   [(name, *xyz) for name, xyz in galaxy_coords.items()])
+                coords.update(galaxy_coords)
+            self.coords_from_galaxy += len(galaxy_coords)
+            self.coords_unresolved += len(missing) - len(galaxy_coords)
+        return coords
+
+    def _galaxy_coords(self, system_names: List[str]) -> Dict[str, Tuple[float, float, float]]:
+        """Coordinates from the local galaxy database, or {} if it isn't available"""
+        if self._galaxy_db is None:
+            try:
+                from local_database import LocalSystemsDatabase
+                self._galaxy_db = LocalSystemsDatabase()
+            except Exception as e:
+                log.debug(f"EDDN: Galaxy database unavailable: {e}")
+                self._galaxy_db = False
+        if not self._galaxy_db or not self._galaxy_db.is_database_available():
+            return {}
+        return self._galaxy_db.get_systems_coordinates(system_names)
     
     def get_stats(self) -> dict:
         """Get listener statistics"""
         return {
             'running': self.running,
             'messages_received': self.messages_received,
-            'last_message_time': self.last_message_time
+            'last_message_time': self.last_message_time,
+            'raw_queue_depth': self.raw_queue.qsize(),
+            'raw_dropped': self.raw_queue.dropped,
+            'messages_decoded': self.messages_decoded,
+            'messages_filtered': self.messages_filtered,
+            'decode_errors': self.decode_errors,
+            'queue_depth': self.write_queue.qsize(),
+            'write_dropped': self.write_queue.dropped,
+            'messages_dropped': self.raw_queue.dropped + self.write_queue.dropped,
+            'batches_written': self.batches_written,
+            'rows_written': self.rows_written,
+            'last_batch_size': self.last_batch_size,
+            'max_batch_size': self.max_batch_size,
+            'last_write_ms': round(self.last_write_ms, 1),
+            'avg_write_ms': round(self.total_write_ms / self.batches_written, 1) if self.batches_written else 0.0,
+            'coords_from_galaxy': self.coords_from_galaxy,
+            'coords_unresolved': self.coords_unresolved
         }
     
     def get_database_stats(self) -> dict:
@@ -558,16 +1161,55 @@ class EDDNListener:
             }
 
 
+def replay_capture(capture_path: str, endpoint: str = "tcp://127.0.0.1:9500",
+                   interval: float = 0.0, settle: float = 1.0) -> int:
+    """Publish recorded EDDN traffic on a local ZeroMQ PUB socket
+
+    Stand-in for the EDDN relay when exercising the pipeline: start a listener
+    with relay=endpoint, then replay a capture into it.
+
+    Args:
+        capture_path: File with one EDDN message (JSON) per line
+        endpoint: Address to bind the PUB socket to
+        interval: Seconds to wait between messages (0 = as fast as possible)
+        settle: Seconds to wait after binding so subscribers can connect
+
+    Returns:
+        Number of messages published
+    """
+    context = zmq.Context()
+    publisher = context.socket(zmq.PUB)
+    publisher.bind(endpoint)
+    time.sleep(settle)
+    sent = 0
+    try:
+        with open(capture_path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                publisher.send(zlib.compress(line))
+                sent += 1
+                if interval:
+                    time.sleep(interval)
+    finally:
+        publisher.close(linger=1000)
+        context.term()
+    return sent
+
+
 # Example usage
 if __name__ == "__main__":
+    import sys
+
     # Setup logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s [%(levelname)s] %(message)s'
     )
     
-    # Start listener
-    listener = EDDNListener("app/data/marketplace_cache.db")
+    # Start listener (optionally against a local relay, e.g. one fed by replay_capture)
+    listener = EDDNListener("app/data/marketplace_cache.db", relay=sys.argv[1] if len(sys.argv) > 1 else None)
     listener.start()
     
     try:
@@ -576,7 +1218,8 @@ if __name__ == "__main__":
         while True:
             time.sleep(10)
             stats = listener.get_stats()
-            print(f"Stats: {stats['messages_received']} messages, "
+            print(f"Stats: {stats['messages_received']} received, {stats['messages_decoded']} decoded, "
+                  f"{stats['messages_filtered']} filtered, {stats['messages_dropped']} dropped, "
                   f"Last: {stats['last_message_time']}")
     except KeyboardInterrupt:
         print("\nStopping...")
@@ -5,7 +5,6 @@ Sends market data to EDDN for community sharing
 Follows EDDN schema specifications
 """
 
-import requests
 import json
 import gzip
 import os
@@ -13,6 +12,8 @@ from datetime import datetime, timezone
 from typing import Optional, Dict, List
 import logging
 
+from http_client import http_post
+
 log = logging.getLogger('EliteMining.EDDN_Sender')
 
 
@@ -251,7 +252,7 @@ class EDDNSender:
             compressed_data = gzip.compress(json_data.encode('utf-8'))
             
             # Send to EDDN
-            response = requests.post(
+            response = http_post(
                 self.EDDN_UPLOAD_URL,
                 data=compressed_data,
                 headers={
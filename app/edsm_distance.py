@@ -3,48 +3,25 @@ EDSM Distance Calculator Module
 Integrates with EDSM API to calculate distances between Elite Dangerous systems
 """
 
-import requests
 import math
-import time
 from typing import Dict, Optional, Tuple
 import logging
+from coords_resolver import get_coords_resolver
 
 logger = logging.getLogger(__name__)
 
 
 class EDSMDistanceCalculator:
-    """Calculates distances between Elite Dangerous systems using EDSM API"""
-    
-    def __init__(self):
-        self.api_base_url = "https://www.edsm.net/api-v1/system"
-        self.timeout = 15  # seconds - allow more time when EDSM is slow
-        self.cache = {}  # Cache system coordinates
-        self.cache_expiry = 300  # 5 minutes
-        self.last_request_time = 0
-        self.min_request_interval = 0.5  # Rate limiting: 500ms between requests
-        # EDSM's Cloudflare blocks default python-requests UA with 403
-        self.headers = {"User-Agent": "EliteMining/5.1.3 (+https://github.com/Viper-Dude/EliteMining)"}
-        
-    def _rate_limit(self):
-        """Ensure we don't make requests too quickly"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            time.sleep(self.min_request_interval - time_since_last)
-        self.last_request_time = time.time()
-    
-    def _is_cache_valid(self, system_name: str) -> bool:
-        """Check if cached data is still valid"""
-        if system_name not in self.cache:
-            return False
-        
-        cache_entry = self.cache[system_name]
-        age = time.time() - cache_entry.get("timestamp", 0)
-        return age < self.cache_expiry
+    """Calculates distances between Elite Dangerous systems using EDSM API
+
+    Coordinates come from the shared coordinate resolver (local databases
+    first, then EDSM), so its cache, negative cache and in-flight
+    de-duplication cover these lookups too.
+    """
     
     def get_system_coordinates(self, system_name: str) -> Optional[Dict]:
         """
-        Get system coordinates from EDSM API with retry logic
+        Get system coordinates from local sources, falling back to EDSM API
         
         Args:
             system_name: Name of the system
@@ -59,111 +36,22 @@ class EDSMDistanceCalculator:
         
         system_name = system_name.strip()
         
-        # Check cache first
-        if self._is_cache_valid(system_name):
-            logger.debug(f"Cache hit for system: {system_name}")
-            return self.cache[system_name]["data"]
-        
-        # Retry logic: up to 3 attempts with increasing delays
-        max_retries = 3
-        retry_delays = [0, 2, 4]  # seconds to wait before each retry
+        try:
+            coords = get_coords_resolver().resolve(system_name)
+        except Exception as e:
+            logger.error(f"Unexpected error resolving coordinates for {system_name}: {e}")
+            return None
         
-        for attempt in range(max_retries):
-            try:
-                # Rate limiting
-                self._rate_limit()
-                
-                # Add retry delay if not first attempt
-                if attempt > 0:
-                    logger.info(f"Retry attempt {attempt + 1}/{max_retries} for {system_name}")
-                    time.sleep(retry_delays[attempt])
-                
-                # Query EDSM API
-                params = {
-                    "systemName": system_name,
-                    "showCoordinates": 1
-                }
-                
-                logger.info(f"Querying EDSM for system: {system_name}")
-                response = requests.get(self.api_base_url, params=params, timeout=self.timeout, headers=self.headers)
-                
-                # Retry on server errors (5xx) - EDSM is likely slow/overloaded
-                if response.status_code >= 500:
-                    logger.warning(f"EDSM server error {response.status_code} for {system_name} (attempt {attempt + 1}/{max_retries})")
-                    if attempt == max_retries - 1:
-                        logger.error(f"All retry attempts failed for {system_name} due to server errors")
-                        return None
-                    continue
-                
-                response.raise_for_status()
-
-                # Empty body from EDSM = overloaded, not "not found" - retry
-                if not response.text or not response.text.strip():
-                    logger.warning(f"EDSM returned empty body for {system_name} (attempt {attempt + 1}/{max_retries})")
-                    if attempt == max_retries - 1:
-                        return None
-                    continue
-
-                try:
-                    data = response.json()
-                except ValueError:
-                    logger.warning(f"EDSM returned invalid JSON for {system_name} (attempt {attempt + 1}/{max_retries})")
-                    if attempt == max_retries - 1:
-                        return None
-                    continue
-
-                if not data or "coords" not in data:
-                    # System genuinely not found in EDSM
-                    logger.warning(f"System '{system_name}' not found in EDSM or has no coordinates")
-                    return None
-                
-                result = {
-                    "name": data["name"],
-                    "x": float(data["coords"]["x"]),
-                    "y": float(data["coords"]["y"]),
-                    "z": float(data["coords"]["z"])
-                }
-                
-                # Cache the result
-                self.cache[system_name] = {
-                    "data": result,
-                    "timestamp": time.time()
-                }
-                
-                logger.info(f"Successfully retrieved coordinates for {result['name']}")
-                return result
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout querying EDSM for {system_name} (attempt {attempt + 1}/{max_retries})")
-                if attempt == max_retries - 1:
-                    logger.error(f"All retry attempts failed for {system_name} due to timeout")
-                    return None
-                continue
-                
-            except requests.exceptions.ConnectionError:
-                logger.warning(f"Connection error querying EDSM for {system_name} (attempt {attempt + 1}/{max_retries})")
-                if attempt == max_retries - 1:
-                    logger.error(f"All retry attempts failed for {system_name} due to connection error")
-                    return None
-                continue
-                
-            except requests.exceptions.HTTPError as e:
-                # Don't retry on 4xx errors (client errors)
-                if 400 <= e.response.status_code < 500:
-                    logger.error(f"HTTP client error for {system_name}: {e}")
-                    return None
-                # Retry on 5xx errors (server errors)
-                logger.warning(f"HTTP error querying EDSM for {system_name} (attempt {attempt + 1}/{max_retries}): {e}")
-                if attempt == max_retries - 1:
-                    logger.error(f"All retry attempts failed for {system_name} due to HTTP error")
-                    return None
-                continue
-                
-            except Exception as e:
-                logger.error(f"Unexpected error querying EDSM for {system_name}: {e}")
-                return None
+        if not coords:
+            logger.warning(f"System '{system_name}' not found in EDSM or has no coordinates")
+            return None
         
-        return None
+        return {
+            "name": system_name,
+            "x": float(coords[0]),
+            "y": float(coords[1]),
+            "z": float(coords[2])
+        }
     
     def calculate_distance(self, system1: Dict, system2: Dict) -> Optional[float]:
         """
@@ -233,17 +121,12 @@ class EDSMDistanceCalculator:
     
     def clear_cache(self):
         """Clear the coordinate cache"""
-        self.cache.clear()
-        logger.info("EDSM coordinate cache cleared")
+        get_coords_resolver().clear()
+        logger.info("Coordinate cache cleared")
     
     def get_cache_stats(self) -> Dict:
-        """Get cache statistics"""
-        valid_entries = sum(1 for name in self.cache if self._is_cache_valid(name))
-        return {
-            "total_entries": len(self.cache),
-            "valid_entries": valid_entries,
-            "expired_entries": len(self.cache) - valid_entries
-        }
+        """Get cache statistics (the shared resolver's counters)"""
+        return get_coords_resolver().get_stats()
 
 
 # Global instance
@@ -13,14 +13,45 @@ Flow:
 
 Use case: When users DSS a ring without FSS scanning first, journal only
 provides hotspot data but not ring metadata. EDSM fills the gap.
+
+Systems are fetched a few at a time on a thread pool (the shared HTTP client
+paces EDSM), ring updates land in one transaction per batch, and systems EDSM
+has no data for are remembered in edsm_ring_lookups so a backfill of thousands
+of rings can be stopped and resumed without repeating requests.
 """
 
-import requests
 import time
-import sqlite3
-from typing import Dict, List, Optional, Tuple
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 import urllib.parse
 
+from db_connections import get_connection_manager
+from http_client import http_get
+
+# Systems fetched from EDSM at once (the EDSM rate limit still applies)
+FETCH_WORKERS = 4
+
+# Bodies fetched within this many seconds are reused instead of fetched again
+RECENT_FETCH_SECONDS = 600
+
+# How long a lookup outcome is trusted. 'no_data' (EDSM doesn't know the system's
+# bodies) is skipped by every fill; 'unmatched' (bodies known, ring not) only
+# by the background backfill, since a fresh scan may add rings EDSM does know.
+# Several times BACKFILL_INTERVAL_SECONDS, so a daily backfill doesn't ask EDSM
+# about the same unknown systems again on every run.
+LOOKUP_RETRY_SECONDS = 7 * 24 * 3600
+
+# Systems per backfill batch - each batch is committed before the next starts
+BACKFILL_BATCH_SYSTEMS = 25
+
+# A completed background backfill isn't started again automatically within this long
+BACKFILL_INTERVAL_SECONDS = 24 * 3600
+
+# Names per IN (...) lookup - stays under SQLite's 999 variable limit on older builds
+LOOKUP_CHUNK = 500
+
 
 class EDSMIntegration:
     """
@@ -28,7 +59,6 @@ class EDSMIntegration:
     """
     
     EDSM_API_BASE = "https://www.edsm.net/api-system-v1"
-    REQUEST_DELAY = 0.5  # Seconds between requests (be nice to EDSM)
     TIMEOUT = 15  # Request timeout in seconds
     
     def __init__(self, user_db_path: str):
@@ -39,14 +69,59 @@ class EDSMIntegration:
             user_db_path: Path to user_data.db database
         """
         self.user_db_path = user_db_path
-        self.last_request_time = 0
-        
-    def _rate_limit(self):
-        """Ensure we don't spam EDSM with too many requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.REQUEST_DELAY:
-            time.sleep(self.REQUEST_DELAY - elapsed)
-        self.last_request_time = time.time()
+        self._connections = get_connection_manager(user_db_path)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._recent: Dict[str, Tuple[float, Optional[Dict]]] = {}
+        self._backfill_thread: Optional[threading.Thread] = None
+        self._backfill_stop = threading.Event()
+        self._init_lookup_table()
+    
+    def _init_lookup_table(self):
+        """Create the table of per-system EDSM lookup outcomes"""
+        try:
+            with self._connections.connect() as conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS edsm_ring_lookups (
+                        system_name TEXT PRIMARY KEY,
+                        status TEXT NOT NULL,
+                        checked_at REAL NOT NULL
+                    )
+                """)
+        except Exception as e:
+            print(f"[EDSM] ✗ Could not create lookup table: {e}")
+    
+    def _record_lookups(self, system_names: List[str], status: str):
+        """Remember that EDSM had no data ('no_data') or no matching ring ('unmatched')"""
+        if not system_names:
+            return
+        now = time.time()
+        try:
+            with self._connections.connect() as conn:
+                conn.executemany("INSERT OR REPLACE INTO edsm_ring_lookups VALUES (?, ?, ?)",
+                                 [(name, status, now) for name in system_names])
+        except Exception as e:
+            print(f"[EDSM] ✗ Could not record lookups: {e}")
+    
+    def _recently_checked(self, system_names: List[str], statuses: Tuple[str, ...]) -> set:
+        """Systems with one of the given lookup outcomes within LOOKUP_RETRY_SECONDS"""
+        checked = set()
+        cutoff = time.time() - LOOKUP_RETRY_SECONDS
+        status_placeholders = ','.join('?' * len(statuses))
+        try:
+            with self._connections.connect() as conn:
+                for i in range(0, len(system_names), LOOKUP_CHUNK):
+                    chunk = system_names[i:i + LOOKUP_CHUNK]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(f"""
+                        SELECT system_name FROM edsm_ring_lookups
+                        WHERE system_name IN ({placeholders})
+                          AND status IN ({status_placeholders}) AND checked_at > ?
+                    """, (*chunk, *statuses, cutoff))
+                    checked.update(row[0] for row in cursor.fetchall())
+        except Exception as e:
+            print(f"[EDSM] ✗ Could not read lookups: {e}")
+        return checked
     
     def _query_edsm_system(self, system_name: str) -> Optional[Dict]:
         """
@@ -58,38 +133,93 @@ class EDSMIntegration:
         Returns:
             JSON response dict or None if request failed
         """
+        return self._fetch_system_bodies(system_name)[0]
+    
+    def _fetch_system_bodies(self, system_name: str) -> Tuple[Optional[Dict], bool]:
+        """
+        Query EDSM API for system body data.
+        
+        Returns:
+            (JSON response dict or None, whether the answer is definitive -
+            False for timeouts and errors, which are worth retrying later)
+        """
         try:
-            self._rate_limit()
-            
             # URL encode system name (handles spaces, special chars)
             encoded_name = urllib.parse.quote(system_name)
             url = f"{self.EDSM_API_BASE}/bodies?systemName={encoded_name}"
             
             print(f"[EDSM] Querying: {system_name}")
             
-            response = requests.get(url, timeout=self.TIMEOUT, headers={"User-Agent": "EliteMining/5.1.3 (+https://github.com/Viper-Dude/EliteMining)"})
+            # Shared client spaces EDSM requests (be nice to EDSM) and retries timeouts
+            response = http_get(url, timeout=self.TIMEOUT)
             
             if response.status_code == 200:
+                if not response.text.strip():
+                    # Empty body = EDSM overloaded, not "no data"
+                    print(f"[EDSM] ✗ Empty response for {system_name}")
+                    return None, False
                 data = response.json()
-                if data and "bodies" in data:
+                if data and data.get("bodies"):
                     print(f"[EDSM] ✓ Found {len(data['bodies'])} bodies in {system_name}")
-                    return data
+                    return data, True
                 else:
                     print(f"[EDSM] ✗ No body data for {system_name}")
-                    return None
+                    return None, True
             else:
                 print(f"[EDSM] ✗ HTTP {response.status_code} for {system_name}")
-                return None
+                return None, False
                 
         except requests.exceptions.Timeout:
             print(f"[EDSM] ✗ Timeout querying {system_name}")
-            return None
+            return None, False
         except requests.exceptions.RequestException as e:
             print(f"[EDSM] ✗ Error querying {system_name}: {e}")
-            return None
+            return None, False
         except Exception as e:
             print(f"[EDSM] ✗ Unexpected error: {e}")
-            return None
+            return None, False
+    
+    def _fetch_one(self, system_name: str) -> Optional[Dict]:
+        """Fetch one system's bodies, sharing in-flight and recent fetches"""
+        while True:
+            with self._lock:
+                recent = self._recent.get(system_name)
+                if recent and time.time() - recent[0] < RECENT_FETCH_SECONDS:
+                    return recent[1]
+                event = self._in_flight.get(system_name)
+                if event is None:
+                    event = threading.Event()
+                    self._in_flight[system_name] = event
+                    break
+            # Another thread is fetching it - wait and re-check the recent cache
+            event.wait(timeout=60)
+            with self._lock:
+                recent = self._recent.get(system_name)
+            return recent[1] if recent else None
+        
+        try:
+            data, definitive = self._fetch_system_bodies(system_name)
+            with self._lock:
+                if definitive:
+                    self._recent[system_name] = (time.time(), data)
+            if definitive and data is None:
+                self._record_lookups([system_name], 'no_data')
+            return data
+        finally:
+            with self._lock:
+                self._in_flight.pop(system_name, None)
+                # Drop expired entries so the cache doesn't grow with every system ever fetched
+                cutoff = time.time() - RECENT_FETCH_SECONDS
+                for name in [name for name, (fetched_at, _) in self._recent.items() if fetched_at < cutoff]:
+                    del self._recent[name]
+            event.set()
+    
+    def _fetch_bodies_many(self, system_names: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch bodies for many systems with at most FETCH_WORKERS requests in flight"""
+        if len(system_names) == 1:
+            return {system_names[0]: self._fetch_one(system_names[0])}
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="EDSMBodies") as pool:
+            return dict(zip(system_names, pool.map(self._fetch_one, system_names)))
     
     def _extract_ring_data(self, edsm_data: Dict, ring_name: str) -> Optional[Dict]:
         """
@@ -196,6 +326,13 @@ class EDSMIntegration:
         except:
             return None
     
+    @staticmethod
+    def _short_ring_name(system_name: str, body_name: str) -> str:
+        """DB has "1 A Ring", EDSM has "Macua 1 A Ring" - strip the system prefix"""
+        if system_name in body_name:
+            return body_name.replace(system_name, "").strip()
+        return body_name
+    
     def _update_ring_metadata(self, system_name: str, body_name: str, 
                              metadata: Dict) -> int:
         """
@@ -209,62 +346,61 @@ class EDSMIntegration:
         Returns:
             Number of rows updated
         """
-        try:
-            conn = sqlite3.connect(self.user_db_path)
-            cursor = conn.cursor()
-            
-            # Calculate density if we have the data
-            density = self._calculate_density(
-                metadata.get("inner_radius"),
-                metadata.get("outer_radius"),
-                metadata.get("ring_mass")
-            )
-            
-            # Try to match ring names flexibly:
-            # DB has: "1 A Ring", EDSM has: "Macua 1 A Ring"
-            # Extract the short form (body number + ring letter)
-            # E.g., "Macua 1 A Ring" -> "1 A Ring"
-            short_ring_name = body_name
-            if system_name in body_name:
-                # Remove system name prefix to get short form
-                short_ring_name = body_name.replace(system_name, "").strip()
-            
-            # Update using exact match on the short ring name
-            cursor.execute("""
-                UPDATE hotspot_data
-                SET ring_type = ?,
-                    ls_distance = ?,
-                    inner_radius = ?,
-                    outer_radius = ?,
-                    ring_mass = ?,
-                    density = ?
-                WHERE system_name = ?
-                  AND body_name = ?
-                  AND (ring_type IS NULL OR ls_distance IS NULL)
-            """, (
-                metadata.get("ring_type"),
-                metadata.get("ls_distance"),
-                metadata.get("inner_radius"),
-                metadata.get("outer_radius"),
-                metadata.get("ring_mass"),
-                density,
-                system_name,
-                short_ring_name
-            ))
-            
-            rows_updated = cursor.rowcount
-            conn.commit()
-            conn.close()
-            
-            if rows_updated > 0:
-                print(f"[EDSM] ✓ Updated {rows_updated} materials in {short_ring_name}")
-                print(f"       Type: {metadata.get('ring_type')}, LS: {metadata.get('ls_distance')}")
-            
-            return rows_updated
+        return self._update_rings_batch([(system_name, body_name, metadata)])[0]
+    
+    def _update_rings_batch(self, updates: List[Tuple[str, str, Dict]]) -> Tuple[int, int]:
+        """
+        Write metadata for many rings in one transaction.
+        
+        Args:
+            updates: (system_name, ring name, metadata) per ring
             
+        Returns:
+            (materials updated, rings updated)
+        """
+        if not updates:
+            return 0, 0
+        rows_updated = 0
+        rings_updated = 0
+        try:
+            with self._connections.transaction() as conn:
+                for system_name, body_name, metadata in updates:
+                    short_ring_name = self._short_ring_name(system_name, body_name)
+                    density = self._calculate_density(
+                        metadata.get("inner_radius"),
+                        metadata.get("outer_radius"),
+                        metadata.get("ring_mass")
+                    )
+                    cursor = conn.execute("""
+                        UPDATE hotspot_data
+                        SET ring_type = ?,
+                            ls_distance = ?,
+                            inner_radius = ?,
+                            outer_radius = ?,
+                            ring_mass = ?,
+                            density = ?
+                        WHERE system_name = ?
+                          AND body_name = ?
+                          AND (ring_type IS NULL OR ls_distance IS NULL)
+                    """, (
+                        metadata.get("ring_type"),
+                        metadata.get("ls_distance"),
+                        metadata.get("inner_radius"),
+                        metadata.get("outer_radius"),
+                        metadata.get("ring_mass"),
+                        density,
+                        system_name,
+                        short_ring_name
+                    ))
+                    if cursor.rowcount > 0:
+                        rows_updated += cursor.rowcount
+                        rings_updated += 1
+                        print(f"[EDSM] ✓ Updated {cursor.rowcount} materials in {short_ring_name}")
+                        print(f"       Type: {metadata.get('ring_type')}, LS: {metadata.get('ls_distance')}")
         except Exception as e:
             print(f"[EDSM] ✗ Database update error: {e}")
-            return 0
+            return 0, 0
+        return rows_updated, rings_updated
     
     def get_incomplete_rings(self) -> List[Tuple[str, str]]:
         """
@@ -274,37 +410,89 @@ class EDSMIntegration:
             List of (system_name, body_name) tuples for incomplete rings
         """
         try:
-            conn = sqlite3.connect(self.user_db_path)
-            cursor = conn.cursor()
-            
-            # Find unique rings with hotspots but missing metadata
-            cursor.execute("""
-                SELECT DISTINCT system_name, body_name
-                FROM hotspot_data
-                WHERE material_name IS NOT NULL
-                  AND (ring_type IS NULL OR ls_distance IS NULL)
-                ORDER BY system_name, body_name
-            """)
-            
-            results = cursor.fetchall()
-            conn.close()
-            
-            return results
+            with self._connections.connect() as conn:
+                # Find unique rings with hotspots but missing metadata
+                cursor = conn.execute("""
+                    SELECT DISTINCT system_name, body_name
+                    FROM hotspot_data
+                    WHERE material_name IS NOT NULL
+                      AND (ring_type IS NULL OR ls_distance IS NULL)
+                    ORDER BY system_name, body_name
+                """)
+                return cursor.fetchall()
             
         except Exception as e:
             print(f"[EDSM] ✗ Error querying incomplete rings: {e}")
             return []
     
-    def fill_missing_metadata(self) -> Dict[str, int]:
+    def _fill_rings(self, rings_by_system: Dict[str, List[str]], skip_statuses: Tuple[str, ...]) -> Dict[str, int]:
+        """
+        Fetch the given systems concurrently and write every matched ring in one transaction.
+        
+        Args:
+            rings_by_system: system name -> ring names needing metadata
+            skip_statuses: Lookup outcomes that skip a system (see LOOKUP_RETRY_SECONDS)
+        """
+        stats = {
+            "rings_checked": sum(len(rings) for rings in rings_by_system.values()),
+            "systems_queried": 0,
+            "systems_skipped": 0,
+            "rings_updated": 0,
+            "materials_updated": 0
+        }
+        skipped = self._recently_checked(list(rings_by_system), skip_statuses)
+        stats["systems_skipped"] = len(skipped)
+        to_query = [name for name in rings_by_system if name not in skipped]
+        stats["systems_queried"] = len(to_query)
+        if not to_query:
+            return stats
+        
+        updates = []
+        unmatched = []
+        for system_name, edsm_data in self._fetch_bodies_many(to_query).items():
+            if not edsm_data:
+                continue
+            all_matched = True
+            for ring_name in rings_by_system[system_name]:
+                ring_metadata = self._extract_ring_data(edsm_data, ring_name)
+                if ring_metadata:
+                    updates.append((system_name, ring_name, ring_metadata))
+                else:
+                    all_matched = False
+            # Also when only some rings matched - the rest would be fetched again every run
+            if not all_matched:
+                unmatched.append(system_name)
+        
+        stats["materials_updated"], stats["rings_updated"] = self._update_rings_batch(updates)
+        self._record_lookups(unmatched, 'unmatched')
+        return stats
+    
+    @staticmethod
+    def _group_by_system(rings: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+        rings_by_system: Dict[str, List[str]] = {}
+        for system_name, body_name in rings:
+            rings_by_system.setdefault(system_name, []).append(body_name)
+        return rings_by_system
+    
+    def fill_missing_metadata(self, progress_callback: Optional[Callable[[int, int, Dict[str, int]], None]] = None,
+                              stop_event: Optional[threading.Event] = None) -> Dict[str, int]:
         """
         Automatically fill missing ring metadata using EDSM fallback.
         
         This is the main entry point - call this to fix all missing data.
+        Systems are processed in batches of BACKFILL_BATCH_SYSTEMS, each committed
+        before the next, so a stopped run resumes where it left off: filled rings
+        are no longer incomplete and unproductive systems are in edsm_ring_lookups.
+        
+        Args:
+            progress_callback: Called after each batch with (systems done, systems total, stats)
+            stop_event: Set to stop after the current batch
         
         Returns:
             Dict with stats: {
                 "rings_checked": int,
                 "systems_queried": int,
+                "systems_skipped": int,
                 "rings_updated": int,
                 "materials_updated": int
             }
@@ -312,6 +500,7 @@ class EDSMIntegration:
         stats = {
             "rings_checked": 0,
             "systems_queried": 0,
+            "systems_skipped": 0,
             "rings_updated": 0,
             "materials_updated": 0
         }
@@ -327,46 +516,60 @@ class EDSMIntegration:
         print(f"[EDSM] Found {len(incomplete_rings)} rings with missing metadata")
         
         # Group by system to minimize API calls
-        systems_to_query = {}
-        for system_name, body_name in incomplete_rings:
-            if system_name not in systems_to_query:
-                systems_to_query[system_name] = []
-            systems_to_query[system_name].append(body_name)
-        
-        # Query each system once
-        for system_name, ring_names in systems_to_query.items():
-            stats["systems_queried"] += 1
-            
-            # Query EDSM for this system
-            edsm_data = self._query_edsm_system(system_name)
-            
-            if not edsm_data:
-                continue
-            
-            # Try to fill metadata for each ring in this system
-            for ring_name in ring_names:
-                ring_metadata = self._extract_ring_data(edsm_data, ring_name)
-                
-                if ring_metadata:
-                    rows_updated = self._update_ring_metadata(
-                        system_name, 
-                        ring_name, 
-                        ring_metadata
-                    )
-                    
-                    if rows_updated > 0:
-                        stats["rings_updated"] += 1
-                        stats["materials_updated"] += rows_updated
+        rings_by_system = self._group_by_system(incomplete_rings)
+        systems = list(rings_by_system)
+        
+        for i in range(0, len(systems), BACKFILL_BATCH_SYSTEMS):
+            if stop_event is not None and stop_event.is_set():
+                print("[EDSM] Metadata fill stopped - will resume from here next time")
+                break
+            batch = {name: rings_by_system[name] for name in systems[i:i + BACKFILL_BATCH_SYSTEMS]}
+            batch_stats = self._fill_rings(batch, ('no_data', 'unmatched'))
+            for key in ("systems_queried", "systems_skipped", "rings_updated", "materials_updated"):
+                stats[key] += batch_stats[key]
+            if progress_callback:
+                progress_callback(min(i + BACKFILL_BATCH_SYSTEMS, len(systems)), len(systems), stats)
         
         # Summary
         print(f"\n[EDSM] Metadata fill complete:")
         print(f"       Rings checked: {stats['rings_checked']}")
-        print(f"       Systems queried: {stats['systems_queried']}")
+        print(f"       Systems queried: {stats['systems_queried']} ({stats['systems_skipped']} skipped)")
         print(f"       Rings updated: {stats['rings_updated']}")
         print(f"       Total materials updated: {stats['materials_updated']}")
         
         return stats
     
+    def start_background_fill(self, progress_callback: Optional[Callable[[int, int, Dict[str, int]], None]] = None,
+                              on_complete: Optional[Callable[[Dict[str, int]], None]] = None) -> bool:
+        """
+        Run fill_missing_metadata() on a background thread.
+        
+        Returns:
+            False if a background fill is already running
+        """
+        with self._lock:
+            if self._backfill_thread is not None and self._backfill_thread.is_alive():
+                return False
+            self._backfill_stop.clear()
+            
+            def run():
+                stats = self.fill_missing_metadata(progress_callback, self._backfill_stop)
+                if on_complete:
+                    on_complete(stats)
+            
+            self._backfill_thread = threading.Thread(target=run, daemon=True, name="EDSMBackfill")
+            self._backfill_thread.start()
+            return True
+    
+    def stop_background_fill(self):
+        """Ask a running background fill to stop after its current batch"""
+        self._backfill_stop.set()
+    
+    @property
+    def background_fill_stopped(self) -> bool:
+        """True if the last background fill was stopped before it finished"""
+        return self._backfill_stop.is_set()
+    
     def fill_missing_metadata_for_systems(self, system_names: List[str]) -> Dict[str, int]:
         """
         Fill missing ring metadata for specific systems only (optimized for result sets).
@@ -377,66 +580,17 @@ class EDSMIntegration:
         Returns:
             Stats dict with results
         """
-        stats = {
-            "rings_checked": 0,
-            "systems_queried": 0,
-            "rings_updated": 0,
-            "materials_updated": 0
-        }
-        
-        # Get incomplete rings only for specified systems
-        all_incomplete = self.get_incomplete_rings()
-        print(f"[EDSM DEBUG] get_incomplete_rings() returned {len(all_incomplete)} total incomplete rings")
-        print(f"[EDSM DEBUG] All incomplete rings: {all_incomplete[:10]}...")  # Show first 10
-        
         systems_set = set(system_names)
-        print(f"[EDSM DEBUG] Systems requested for query: {systems_set}")
-        
-        incomplete_rings = [(sys, ring) for sys, ring in all_incomplete if sys in systems_set]
+        incomplete_rings = [(sys, ring) for sys, ring in self.get_incomplete_rings() if sys in systems_set]
         print(f"[EDSM DEBUG] Filtered incomplete rings for requested systems: {incomplete_rings}")
         
-        stats["rings_checked"] = len(incomplete_rings)
-        
-        if not incomplete_rings:
-            return stats
-        
-        # Group by system
-        systems_to_query = {}
-        for system_name, body_name in incomplete_rings:
-            if system_name not in systems_to_query:
-                systems_to_query[system_name] = []
-            systems_to_query[system_name].append(body_name)
-        
-        # Query each system once
-        for system_name, ring_names in systems_to_query.items():
-            stats["systems_queried"] += 1
-            
-            edsm_data = self._query_edsm_system(system_name)
-            
-            if not edsm_data:
-                continue
-            
-            for ring_name in ring_names:
-                ring_metadata = self._extract_ring_data(edsm_data, ring_name)
-                
-                if ring_metadata:
-                    rows_updated = self._update_ring_metadata(
-                        system_name, 
-                        ring_name, 
-                        ring_metadata
-                    )
-                    
-                    if rows_updated > 0:
-                        stats["rings_updated"] += 1
-                        stats["materials_updated"] += rows_updated
-        
-        return stats
+        return self._fill_rings(self._group_by_system(incomplete_rings), ('no_data',))
 
     def fill_missing_metadata_for_systems_direct(self, system_names: List[str]) -> Dict[str, int]:
         """
         Fill missing ring metadata for specific systems - DIRECT VERSION.
         
-        This version bypasses get_incomplete_rings() filtering and queries all requested systems,
+        This version bypasses get_incomplete_rings() filtering and checks all requested systems,
         updating any rings found in those systems that have missing metadata.
         
         Args:
@@ -445,79 +599,38 @@ class EDSMIntegration:
         Returns:
             Stats dict with results
         """
-        stats = {
-            "rings_checked": 0,
-            "systems_queried": 0,
-            "rings_updated": 0,
-            "materials_updated": 0
-        }
-        
         print(f"[EDSM DEBUG] fill_missing_metadata_for_systems_direct called with: {system_names}")
         
-        # Query each system directly
-        for system_name in system_names:
-            stats["systems_queried"] += 1
-            print(f"[EDSM] Querying: {system_name}")
-            
-            try:
-                edsm_data = self._query_edsm_system(system_name)
-                
-                if not edsm_data:
-                    print(f"[EDSM DEBUG] No EDSM data for {system_name}")
-                    continue
-                
-                # Get all rings in this system that need metadata (regardless of get_incomplete_rings filter)
-                rings_in_system = self._get_rings_needing_metadata_in_system(system_name)
-                print(f"[EDSM DEBUG] Found {len(rings_in_system)} rings needing metadata in {system_name}: {rings_in_system}")
-                
-                stats["rings_checked"] += len(rings_in_system)
-                
-                for ring_name in rings_in_system:
-                    ring_metadata = self._extract_ring_data(edsm_data, ring_name)
-                    
-                    if ring_metadata:
-                        rows_updated = self._update_ring_metadata(
-                            system_name, 
-                            ring_name, 
-                            ring_metadata
-                        )
-                        
-                        if rows_updated > 0:
-                            stats["rings_updated"] += 1
-                            stats["materials_updated"] += rows_updated
-                            print(f"[EDSM] ✓ Updated {rows_updated} materials in {ring_name}")
-                            print(f"       Type: {ring_metadata.get('ring_class', 'Unknown')}, LS: {ring_metadata.get('ls_distance', 'Unknown')}")
-                    else:
-                        print(f"[EDSM DEBUG] No ring metadata found for {ring_name} in {system_name}")
-                        
-            except Exception as e:
-                print(f"[EDSM DEBUG] Error processing {system_name}: {e}")
+        # Systems without rings needing metadata aren't worth a request
+        rings_by_system = self._get_rings_needing_metadata(system_names)
+        print(f"[EDSM DEBUG] Rings needing metadata: {rings_by_system}")
         
-        return stats
+        return self._fill_rings(rings_by_system, ('no_data',))
     
-    def _get_rings_needing_metadata_in_system(self, system_name: str) -> List[str]:
-        """Get list of ring names in a system that need metadata (ls_distance or ring_type missing)"""
+    def _get_rings_needing_metadata(self, system_names: List[str]) -> Dict[str, List[str]]:
+        """Get ring names per system that need metadata (ls_distance or ring_type missing)"""
+        names = list(dict.fromkeys(system_names))
+        rings = []
         try:
-            conn = sqlite3.connect(self.user_db_path)
-            cursor = conn.cursor()
-            
-            # Find unique rings in this system with missing metadata
-            cursor.execute("""
-                SELECT DISTINCT body_name
-                FROM hotspot_data
-                WHERE system_name = ?
-                  AND (ring_type IS NULL OR ls_distance IS NULL)
-                ORDER BY body_name
-            """, (system_name,))
-            
-            results = [row[0] for row in cursor.fetchall()]
-            conn.close()
-            
-            return results
-            
+            with self._connections.connect() as conn:
+                for i in range(0, len(names), LOOKUP_CHUNK):
+                    chunk = names[i:i + LOOKUP_CHUNK]
+                    placeholders = ','.join('?' * len(chunk))
+                    cursor = conn.execute(f"""
+                        SELECT DISTINCT system_name, body_name
+                        FROM hotspot_data
+                        WHERE system_name IN ({placeholders})
+                          AND (ring_type IS NULL OR ls_distance IS NULL)
+                        ORDER BY system_name, body_name
+                    """, chunk)
+                    rings.extend(cursor.fetchall())
         except Exception as e:
-            print(f"[EDSM DEBUG] Error getting rings for {system_name}: {e}")
-            return []
+            print(f"[EDSM DEBUG] Error getting rings needing metadata: {e}")
+        return self._group_by_system(rings)
+    
+    def _get_rings_needing_metadata_in_system(self, system_name: str) -> List[str]:
+        """Get list of ring names in a system that need metadata (ls_distance or ring_type missing)"""
+        return self._get_rings_needing_metadata([system_name]).get(system_name, [])
 
 
 def fill_missing_ring_metadata(user_db_path: str) -> Dict[str, int]:
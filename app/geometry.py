@@ -0,0 +1,71 @@
+"""
+Geometry Helpers for EliteMining
+Batch 3D distance and radius filter over system coordinates.
+Uses NumPy arrays when available, otherwise math.dist in a single pass.
+"""
+
+import math
+from operator import itemgetter
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+Coords = Tuple[float, float, float]
+
+# Below this many points the array setup costs more than it saves
+_NUMPY_MIN_POINTS = 256
+
+
+def distance(a: Sequence[float], b: Sequence[float]) -> float:
+    """Distance in light years between two (x, y, z) points"""
+    return math.dist(a, b)
+
+
+def _has_coords(point) -> bool:
+    return point is not None and point[0] is not None and point[1] is not None and point[2] is not None
+
+
+def batch_distances(origin: Sequence[float], points: Sequence[Optional[Sequence[float]]]) -> List[Optional[float]]:
+    """Distances from origin to every point
+
+    Args:
+        origin: Reference (x, y, z)
+        points: (x, y, z) per item; None (or a None component) where coordinates are unknown
+
+    Returns:
+        Distance per point, in input order, with None for points without coordinates
+    """
+    if not points:
+        return []
+    if NUMPY_AVAILABLE and len(points) >= _NUMPY_MIN_POINTS:
+        mask = [_has_coords(p) for p in points]
+        coords = np.array([p if ok else (0.0, 0.0, 0.0) for p, ok in zip(points, mask)], dtype=float)
+        dists = np.sqrt(((coords - np.asarray(origin, dtype=float)) ** 2).sum(axis=1)).tolist()
+        return [d if ok else None for d, ok in zip(dists, mask)]
+    origin = tuple(origin)
+    dist = math.dist
+    return [dist(origin, p) if _has_coords(p) else None for p in points]
+
+
+def within_radius(origin: Sequence[float], points: Sequence[Optional[Sequence[float]]],
+                  radius: float, sort: bool = False) -> List[Tuple[int, float]]:
+    """Points within radius of origin
+
+    Args:
+        origin: Reference (x, y, z)
+        points: (x, y, z) per item; points without coordinates are never included
+        radius: Maximum distance in light years
+        sort: Sort by distance (closest first) instead of keeping input order
+
+    Returns:
+        List of (index into points, distance)
+    """
+    matches = [(i, d) for i, d in enumerate(batch_distances(origin, points))
+               if d is not None and d <= radius]
+    if sort:
+        matches.sort(key=itemgetter(1))
+    return matches
@@ -0,0 +1,338 @@
+"""
+Shared HTTP Client for EliteMining
+Pooled requests.Session per host with token-bucket rate limits, jittered
+retries, conditional GETs (ETag / If-Modified-Since) and per-endpoint latency
+histograms, used by every module that talks to a web API
+"""
+
+import time
+import random
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger("EliteMining.HttpClient")
+
+# EDSM's Cloudflare blocks default python-requests UA with 403
+USER_AGENT = "EliteMining/5.1.3 (+https://github.com/Viper-Dude/EliteMining)"
+
+# Connections kept open per host - marketplace searches fire 4-5 requests in parallel
+POOL_SIZE = 10
+
+# Per-host limits as (requests per second, burst). Hosts not listed are unlimited.
+HOST_RATE_LIMITS = {
+    'www.edsm.net': (2.0, 1),             # Be nice to EDSM - one request per 0.5 s
+    'spansh.co.uk': (4.0, 4),
+    'api.ardent-insight.com': (5.0, 8),
+    'inara.cz': (0.5, 2),
+    'discord.com': (2.5, 5),              # Webhooks allow 5 requests per 2 s
+}
+
+# Retries for GET/HEAD unless the caller passes retries=. Other methods aren't
+# retried unless asked, since they may not be safe to repeat.
+DEFAULT_RETRIES = 2
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+BACKOFF_BASE = 0.5        # Seconds before the first retry (doubles each attempt)
+BACKOFF_MAX = 10.0
+
+# Conditional GET validators remembered (one per URL + params)
+CONDITIONAL_ENTRIES = 256
+
+# Latency histogram bucket upper bounds in milliseconds (plus one overflow bucket)
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Endpoints tracked individually; more (e.g. names in URL paths) share one per host
+MAX_ENDPOINTS = 200
+
+
+class TokenBucket:
+    """Blocking token bucket: rate tokens per second, up to burst saved up"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance is this caller's place in the queue
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _EndpointStats:
+    """Counters and latency histogram for one endpoint"""
+
+    __slots__ = ('requests', 'errors', 'retries', 'not_modified', 'total_ms', 'max_ms', 'buckets')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.not_modified = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, elapsed_ms: float) -> None:
+        self.requests += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def percentile(self, fraction: float) -> Optional[int]:
+        """Upper bound of the bucket holding the given fraction of requests"""
+        if not self.requests:
+            return None
+        target = fraction * self.requests
+        seen = 0
+        for i, count in enumerate(self.buckets[:-1]):
+            seen += count
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i]
+        return round(self.max_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'not_modified': self.not_modified,
+            'avg_ms': round(self.total_ms / self.requests, 1) if self.requests else 0.0,
+            'max_ms': round(self.max_ms, 1),
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'histogram': dict(zip(labels, self.buckets)),
+        }
+
+
+class HttpClient:
+    """Thread-safe HTTP client shared by all outbound API calls
+
+    Responses are plain requests.Response objects and errors are the usual
+    requests exceptions, so callers keep their existing status-code checks.
+    """
+
+    def __init__(self, rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+                 retries: int = DEFAULT_RETRIES, backoff: float = BACKOFF_BASE,
+                 user_agent: str = USER_AGENT):
+        """Initialize the client
+
+        Args:
+            rate_limits: host -> (requests per second, burst); default HOST_RATE_LIMITS
+            retries: Retries for GET/HEAD requests
+            backoff: Seconds before the first retry
+            user_agent: Default User-Agent header
+        """
+        self.rate_limits = dict(HOST_RATE_LIMITS if rate_limits is None else rate_limits)
+        self.retries = retries
+        self.backoff = backoff
+        self.user_agent = user_agent
+        self._sessions: Dict[str, requests.Session] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._validators: "OrderedDict[Tuple, Tuple[Optional[str], Optional[str], requests.Response]]" = OrderedDict()
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def session(self, host: str) -> requests.Session:
+        """Get the pooled session for a host (cookies persist across calls)"""
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                session.headers['User-Agent'] = self.user_agent
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, max_retries=0)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self._sessions[host] = session
+            return session
+
+    def _bucket(self, host: str) -> Optional[TokenBucket]:
+        limit = self.rate_limits.get(host)
+        if not limit:
+            return None
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(*limit)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _stats(self, host: str, path: str) -> _EndpointStats:
+        key = f"{host}{path}"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                if len(self._endpoints) >= MAX_ENDPOINTS:
+                    key = f"{host}/*"
+                    stats = self._endpoints.get(key)
+                if stats is None:
+                    stats = _EndpointStats()
+                    self._endpoints[key] = stats
+            return stats
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                return min(float(retry_after), BACKOFF_MAX)
+        # Equal jitter: half the exponential delay plus a random half, so
+        # parallel callers that failed together don't retry together
+        delay = min(BACKOFF_MAX, self.backoff * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def request(self, method: str, url: str, retries: Optional[int] = None,
+                conditional: bool = False, **kwargs) -> requests.Response:
+        """Send a request through the host's pooled session
+
+        Args:
+            method: HTTP method
+            url: Full URL
+            retries: Retries on connection errors, timeouts and 429/502/503/504
+                     (default: DEFAULT_RETRIES for GET/HEAD, 0 otherwise)
+            conditional: Send If-None-Match / If-Modified-Since from the last
+                         response to this URL; a 304 returns that response again
+            **kwargs: Passed to requests.Session.request (params, json, headers, timeout, ...)
+
+        Returns:
+            The final response (after retries, a retryable status is returned as is)
+
+        Raises:
+            requests.RequestException if the last attempt failed to connect or timed out
+        """
+        method = method.upper()
+        parts = urlsplit(url)
+        host = parts.hostname or ''
+        if retries is None:
+            retries = self.retries if method in ('GET', 'HEAD') else 0
+        session = self.session(host)
+        bucket = self._bucket(host)
+        stats = self._stats(host, parts.path or '/')
+
+        cache_key = None
+        cached = None
+        if conditional and method == 'GET' and not kwargs.get('stream'):
+            cache_key = (url, tuple(sorted((kwargs.get('params') or {}).items())))
+            with self._lock:
+                cached = self._validators.get(cache_key)
+            if cached:
+                headers = dict(kwargs.get('headers') or {})
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+                kwargs['headers'] = headers
+
+        attempt = 0
+        while True:
+            if bucket:
+                bucket.acquire()
+            start = time.perf_counter()
+            try:
+                response = session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                with self._lock:
+                    stats.record((time.perf_counter() - start) * 1000)
+                    stats.errors += 1
+                if attempt >= retries:
+                    raise
+                delay = self._retry_delay(attempt, None)
+                log.debug(f"{method} {host}{parts.path} failed ({e}), retrying in {delay:.2f}s")
+            else:
+                with self._lock:
+                    stats.record((time.perf_counter() - start) * 1000)
+                    if response.status_code >= 400:
+                        stats.errors += 1
+                if response.status_code not in RETRY_STATUSES or attempt >= retries:
+                    break
+                delay = self._retry_delay(attempt, response)
+                log.debug(f"{method} {host}{parts.path} returned {response.status_code}, retrying in {delay:.2f}s")
+                response.close()
+            with self._lock:
+                stats.retries += 1
+            time.sleep(delay)
+            attempt += 1
+
+        if cache_key is not None:
+            if response.status_code == 304 and cached:
+                with self._lock:
+                    stats.not_modified += 1
+                    self._validators.move_to_end(cache_key)
+                return cached[2]
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if response.status_code == 200 and (etag or last_modified):
+                response.content  # Read the body now so the stored copy can be served again
+                with self._lock:
+                    self._validators[cache_key] = (etag, last_modified, response)
+                    self._validators.move_to_end(cache_key)
+                    while len(self._validators) > CONDITIONAL_ENTRIES:
+                        self._validators.popitem(last=False)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET request - see request()"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST request - see request()"""
+        return self.request('POST', url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-endpoint counters and latency histograms, keyed by host + path"""
+        with self._lock:
+            return {endpoint: stats.snapshot() for endpoint, stats in self._endpoints.items()}
+
+    def close(self) -> None:
+        """Close every pooled session"""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Get the shared client, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared client"""
+    return get_http_client().get(url, **kwargs)
+
+
+def http_post(url: str, **kwargs) -> requests.Response:
+    """POST through the shared client"""
+    return get_http_client().post(url, **kwargs)
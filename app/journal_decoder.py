@@ -0,0 +1,129 @@
+"""
+Prefiltered Journal Line Decoder for EliteMining
+Reads the event name straight from a raw journal line and only JSON-decodes
+the events a consumer has registered for
+"""
+
+import json
+import re
+import logging
+from typing import Dict, Any, Iterable, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = logging.getLogger("EliteMining.JournalDecoder")
+
+# Frontier writes '"event":"Name"' as the second key of every journal line
+_EVENT_NAME_BYTES = re.compile(rb'"event"\s*:\s*"([^"]+)"')
+_EVENT_NAME_STR = re.compile(r'"event"\s*:\s*"([^"]+)"')
+_TIMESTAMP_BYTES = re.compile(rb'"timestamp"\s*:\s*"([^"]+)"')
+
+
+def extract_event_name(line: Union[bytes, str]) -> Optional[str]:
+    """Extract the event name from a raw journal line without decoding it
+
+    Args:
+        line: Raw journal line (bytes or str)
+
+    Returns:
+        Event name, or None if the line has no event field
+    """
+    if isinstance(line, bytes):
+        match = _EVENT_NAME_BYTES.search(line)
+        return match.group(1).decode('ascii', 'replace') if match else None
+    match = _EVENT_NAME_STR.search(line)
+    return match.group(1) if match else None
+
+
+def extract_timestamp(line: bytes) -> Optional[str]:
+    """Extract the timestamp from a raw journal line without decoding it"""
+    match = _TIMESTAMP_BYTES.search(line)
+    return match.group(1).decode('ascii', 'replace') if match else None
+
+
+class JournalDecoder:
+    """Decodes journal lines, skipping events no registered handler wants
+
+    Counters are kept so callers can see how many lines were skipped
+    by the event-name prefilter versus fully decoded.
+    """
+
+    def __init__(self, event_types: Optional[Iterable[str]] = None, event_prefixes: Iterable[str] = ()):
+        """Initialize the decoder
+
+        Args:
+            event_types: Event names to decode. None decodes every event.
+            event_prefixes: Event name prefixes to decode (e.g. 'Carrier')
+        """
+        self.event_types = set(event_types) if event_types is not None else None
+        self.event_prefixes = tuple(event_prefixes)
+        self.lines_seen = 0
+        self.lines_skipped = 0
+        self.lines_decoded = 0
+        self.decode_errors = 0
+
+    def register(self, *event_types: str) -> None:
+        """Add event names to decode"""
+        if self.event_types is not None:
+            self.event_types.update(event_types)
+
+    def wants(self, event_name: Optional[str]) -> bool:
+        """Whether a line with this event name should be decoded"""
+        if self.event_types is None:
+            return True
+        if not event_name:
+            return False
+        return event_name in self.event_types or event_name.startswith(self.event_prefixes)
+
+    def decode(self, line: Union[bytes, str], source: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Decode a journal line if its event is wanted
+
+        Args:
+            line: Raw journal line (bytes or str), with or without trailing newline
+            source: Journal file name, used when logging an invalid line
+
+        Returns:
+            Event dict, or None if the line is blank, filtered out or invalid
+        """
+        line = line.strip()
+        if not line:
+            return None
+        self.lines_seen += 1
+
+        if not self.wants(extract_event_name(line)):
+            self.lines_skipped += 1
+            return None
+
+        try:
+            event = orjson.loads(line) if ORJSON_AVAILABLE else json.loads(line)
+        except ValueError as e:
+            # json.JSONDecodeError, orjson.JSONDecodeError and UnicodeDecodeError are all ValueErrors
+            self.decode_errors += 1
+            log.warning(f"Invalid JSON in {source or 'journal'}: {e}")
+            return None
+        self.lines_decoded += 1
+        return event
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get decoder counters
+
+        Returns:
+            Dictionary with lines_seen, lines_skipped, lines_decoded and decode_errors
+        """
+        return {
+            'lines_seen': self.lines_seen,
+            'lines_skipped': self.lines_skipped,
+            'lines_decoded': self.lines_decoded,
+            'decode_errors': self.decode_errors,
+        }
+
+    def reset_stats(self) -> None:
+        """Zero all counters"""
+        self.lines_seen = 0
+        self.lines_skipped = 0
+        self.lines_decoded = 0
+        self.decode_errors = 0
@@ -6,17 +6,128 @@ Extracts hotspot and visited system data from journal files
 import os
 import json
 import glob
+import hashlib
+import heapq
 import logging
 import sqlite3
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Generator, Tuple
 from datetime import datetime, timezone, timedelta
 import re
 
 from user_database import UserDatabase
+from journal_decoder import JournalDecoder, extract_timestamp
 
 log = logging.getLogger("EliteMining.JournalParser")
 
+# Events the historical backfill applies - everything else is dropped inside the
+# worker process so it never crosses the process boundary
+BACKFILL_EVENTS = frozenset({
+    'LoadGame', 'FSDJump', 'CarrierJump', 'Location', 'Docked', 'Scan', 'SAASignalsFound',
+})
+BACKFILL_EVENT_PREFIXES = ('Carrier',)
+
+# Below this many files the process pool start-up costs more than it saves
+PARALLEL_BACKFILL_MIN_FILES = 20
+
+
+def iter_journal_file(file_path: str, start_offset: int = 0,
+                      decoder: Optional[JournalDecoder] = None) -> Generator[Tuple[Dict[str, Any], int], None, None]:
+    """Parse a journal file from a byte offset and yield events with their end offsets
+    
+    A trailing line without a newline is still being written by the game, so it
+    is left unread - the offset after the last yielded event is always the start
+    of a complete line and can be checkpointed safely.
+    
+    Args:
+        file_path: Path to journal file
+        start_offset: Byte offset to resume reading from (0 = start of file)
+        decoder: Prefiltering decoder - lines for events it doesn't want are
+                 skipped without a JSON decode. None decodes every line.
+        
+    Yields:
+        Tuple of (event dict, byte offset just past the event's line)
+        
+    Returns:
+        (via StopIteration.value) Tuple of (byte offset after the last complete
+        line read, raw bytes of that line) - includes lines the decoder skipped
+    """
+    if decoder is None:
+        decoder = JournalDecoder()
+    offset = start_offset
+    last_line = b''
+    file_name = os.path.basename(file_path)
+    try:
+        with open(file_path, 'rb') as f:
+            if start_offset:
+                f.seek(start_offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break
+                offset += len(raw)
+                if raw.strip():
+                    last_line = raw
+                event = decoder.decode(raw, file_name)
+                if event is not None:
+                    yield event, offset
+                    
+    except Exception as e:
+        log.error(f"Error reading journal file {os.path.basename(file_path)}: {e}")
+    return offset, last_line
+
+
+def _is_backfill_event(event: Dict[str, Any], event_types: frozenset) -> bool:
+    """Whether the backfill writer needs this event"""
+    event_type = event.get('event', '')
+    if event_type == 'Scan':
+        # Only ring-bearing bodies and ring bodies themselves feed process_scan
+        return 'Scan' in event_types and bool(
+            event.get('Rings') or (event.get('BodyName') or '').endswith(' Ring'))
+    if event_type == 'SAASignalsFound':
+        return 'SAASignalsFound' in event_types and (event.get('BodyName') or '').endswith(' Ring')
+    return event_type in event_types or event_type.startswith(BACKFILL_EVENT_PREFIXES)
+
+
+def decode_journal_for_backfill(file_path: str, start_offset: int = 0,
+                                event_types: frozenset = BACKFILL_EVENTS) -> Dict[str, Any]:
+    """Decode one journal file and keep only the events the backfill writer applies
+    
+    Runs inside a ProcessPoolExecutor worker, so it must stay a module-level
+    function with picklable arguments and results.
+    
+    Args:
+        file_path: Path to journal file
+        start_offset: Byte offset to resume reading from
+        event_types: Event names to keep (Carrier* events are always kept)
+        
+    Returns:
+        Dictionary with file_path, events, end_offset, last_timestamp and the
+        decoder's line counters (lines_seen, lines_skipped, lines_decoded, decode_errors)
+    """
+    decoder = JournalDecoder(event_types, BACKFILL_EVENT_PREFIXES)
+    events = []
+    reader = iter_journal_file(file_path, start_offset, decoder)
+    while True:
+        try:
+            event, _ = next(reader)
+        except StopIteration as done:
+            # Skipped lines still move the checkpoint forward
+            end_offset, last_line = done.value
+            break
+        if _is_backfill_event(event, event_types):
+            events.append(event)
+    
+    result = {
+        'file_path': file_path,
+        'events': events,
+        'end_offset': end_offset,
+        'last_timestamp': extract_timestamp(last_line),
+    }
+    result.update(decoder.get_stats())
+    return result
+
 
 class JournalParser:
     """Parses Elite Dangerous journal files to extract mining-relevant data"""
@@ -194,6 +305,9 @@ class JournalParser:
         'Осмий': 'Osmium',  # Russian
     }
     
+    # Bytes before a checkpoint's offset that are hashed to detect a rewritten journal
+    CHECKPOINT_TAIL_BYTES = 4096
+    
     def __init__(self, journal_dir: str, user_db: Optional[UserDatabase] = None, on_hotspot_added: Optional[callable] = None, on_game_start: Optional[callable] = None, on_reserve_updated: Optional[callable] = None, eddn_cache_path: Optional[str] = None):
         """Initialize the journal parser
 
@@ -340,31 +454,130 @@ class JournalParser:
         log.info(f"Found {len(files)} journal files")
         return files
     
-    def parse_journal_file(self, file_path: str) -> Generator[Dict[str, Any], None, None]:
+    def parse_journal_file(self, file_path: str, start_offset: int = 0) -> Generator[Dict[str, Any], None, None]:
         """Parse a single journal file and yield events
         
         Args:
             file_path: Path to journal file
+            start_offset: Byte offset to resume reading from (0 = start of file)
             
         Yields:
             Dictionary containing parsed journal event
         """
+        for event, _ in self.iter_journal_events(file_path, start_offset):
+            yield event
+    
+    def iter_journal_events(self, file_path: str, start_offset: int = 0) -> Generator[Tuple[Dict[str, Any], int], None, None]:
+        """Yield (event, end_offset) pairs for a journal file - see iter_journal_file"""
+        return iter_journal_file(file_path, start_offset)
+    
+    def _hash_journal_tail(self, file_path: str, end_offset: int) -> Optional[str]:
+        """Hash the last CHECKPOINT_TAIL_BYTES before end_offset to detect rewritten files"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    try:
-                        event = json.loads(line)
-                        yield event
-                    except json.JSONDecodeError as e:
-                        log.warning(f"Invalid JSON in {os.path.basename(file_path)}:{line_num}: {e}")
-                        continue
-                        
-        except Exception as e:
-            log.error(f"Error reading journal file {os.path.basename(file_path)}: {e}")
+            with open(file_path, 'rb') as f:
+                start = max(0, end_offset - self.CHECKPOINT_TAIL_BYTES)
+                f.seek(start)
+                return hashlib.sha1(f.read(end_offset - start)).hexdigest()
+        except OSError:
+            return None
+    
+    def _complete_line_offset(self, file_path: str, file_size: int) -> int:
+        """Byte offset just past the last newline, i.e. excluding a partially written line"""
+        try:
+            with open(file_path, 'rb') as f:
+                pos = file_size
+                while pos > 0:
+                    start = max(0, pos - self.CHECKPOINT_TAIL_BYTES)
+                    f.seek(start)
+                    idx = f.read(pos - start).rfind(b'\n')
+                    if idx >= 0:
+                        return start + idx + 1
+                    pos = start
+        except OSError:
+            pass
+        return 0
+    
+    def _build_checkpoint(self, file_path: str, byte_offset: int,
+                          last_event_timestamp: Optional[str] = None,
+                          last_system: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Build a journal_checkpoints row for a file read up to byte_offset"""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return None
+        return {
+            'file_path': file_path,
+            'file_size': st.st_size,
+            'mtime': st.st_mtime,
+            'byte_offset': byte_offset,
+            'last_event_timestamp': last_event_timestamp,
+            'last_system': last_system,
+            'tail_hash': self._hash_journal_tail(file_path, byte_offset)
+        }
+    
+    def plan_incremental_scan(self, journal_files: List[str], verify: bool = False) -> List[Tuple[str, int, Optional[str]]]:
+        """Work out which journal files need reading, and from which byte offset
+        
+        Files whose size and mtime match their checkpoint are skipped. Files that
+        grew are resumed at the checkpointed offset, and files that shrank are
+        re-read from byte 0. In verify mode the checkpointed tail is rehashed too,
+        so a file rewritten in place (same or larger size) is also re-read.
+        
+        Args:
+            journal_files: Journal file paths in chronological order
+            verify: Rehash the tail of each checkpointed file to detect truncation
+            
+        Returns:
+            List of (file_path, start_offset, last_system) tuples in input order.
+            last_system is the system the player was in at start_offset, if known.
+        """
+        checkpoints = self.user_db.get_journal_checkpoints()
+        plan = []
+        for file_path in journal_files:
+            cp = checkpoints.get(file_path)
+            if not cp:
+                plan.append((file_path, 0, None))
+                continue
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            
+            offset = cp['byte_offset']
+            if st.st_size < offset:
+                log.info(f"Journal {os.path.basename(file_path)} truncated - rescanning from start")
+                plan.append((file_path, 0, None))
+            elif verify and cp.get('tail_hash') and self._hash_journal_tail(file_path, offset) != cp['tail_hash']:
+                log.info(f"Journal {os.path.basename(file_path)} tail changed - rescanning from start")
+                plan.append((file_path, 0, None))
+            elif st.st_size == cp['file_size'] and st.st_mtime == cp['mtime']:
+                continue
+            elif st.st_size > offset:
+                plan.append((file_path, offset, cp.get('last_system')))
+        return plan
+    
+    def record_journal_checkpoints(self, journal_files: List[str]) -> int:
+        """Checkpoint journal files as fully ingested up to their last complete line
+        
+        Used by scans that read journals outside parse_all_journals (e.g. the
+        startup catch-up in main.py) so the next rescan can skip these files.
+        
+        Args:
+            journal_files: Journal file paths that were just read to the end
+            
+        Returns:
+            Number of checkpoints written
+        """
+        rows = []
+        for file_path in journal_files:
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                continue
+            cp = self._build_checkpoint(file_path, self._complete_line_offset(file_path, size))
+            if cp:
+                rows.append(cp)
+        return self.user_db.save_journal_checkpoints(rows)
     
     def is_ring_body(self, body_name: str) -> bool:
         """Check if a body name represents a ring
@@ -400,7 +613,7 @@ class JournalParser:
         
         # Check if this exact system exists in visited_systems with coordinates
         try:
-            with sqlite3.connect(self.user_db.db_path) as conn:
+            with self.user_db._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT system_name FROM visited_systems 
@@ -1040,10 +1253,8 @@ class JournalParser:
                             log.debug(f"Ring metadata not available for {system_name} - {body_name}")
                             self._warned_rings.add(warn_key)
             
-            # Track if we're adding truly NEW hotspots (not previously scanned)
-            hotspots_are_new = False
-            
-            # Process each signal (material hotspot)
+            # Collect every material hotspot for one batched write
+            hotspot_rows = []
             for signal in signals:
                 signal_type = signal.get('Type', '')
                 count = signal.get('Count', 0)
@@ -1058,36 +1269,25 @@ class JournalParser:
                     # Normalize material name to prevent duplicates (e.g., "tritium" -> "Tritium")
                     material_name = self.normalize_material_name(raw_material_name)
                     
-                    # Check if this hotspot already exists (using normalized body name from above)
-                    import sqlite3
-                    with sqlite3.connect(self.user_db.db_path) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute('''
-                            SELECT id FROM hotspot_data 
-                            WHERE system_name = ? AND body_name = ? AND material_name = ?
-                        ''', (system_name, normalized_body_name, material_name))
-                        existing = cursor.fetchone()
-                    
-                    # If hotspot doesn't exist, it's a new discovery
-                    if not existing:
-                        hotspots_are_new = True
-                    
-                    self.user_db.add_hotspot_data(
-                        system_name=system_name,
-                        body_name=normalized_body_name,  # Use normalized name (without system prefix)
-                        material_name=material_name,
-                        hotspot_count=count,
-                        scan_date=timestamp,
-                        system_address=system_address,
-                        body_id=body_id,
-                        ring_type=ring_class,
-                        ls_distance=ls_distance,
-                        inner_radius=inner_radius,
-                        outer_radius=outer_radius,
-                        ring_mass=ring_mass
-                    )
-                    
-                    log.debug(f"Added hotspot: {system_name} - {normalized_body_name} - {material_name} ({count})")
+                    hotspot_rows.append({
+                        'system_name': system_name,
+                        'body_name': normalized_body_name,  # Use normalized name (without system prefix)
+                        'material_name': material_name,
+                        'hotspot_count': count,
+                        'scan_date': timestamp,
+                        'system_address': system_address,
+                        'body_id': body_id,
+                        'ring_type': ring_class,
+                        'ls_distance': ls_distance,
+                        'inner_radius': inner_radius,
+                        'outer_radius': outer_radius,
+                        'ring_mass': ring_mass,
+                    })
+            
+            # Track if we're adding truly NEW hotspots (not previously scanned)
+            new_count, updated_count = self.user_db.bulk_add_hotspots(hotspot_rows)
+            hotspots_are_new = new_count > 0
+            log.debug(f"Saved hotspots: {system_name} - {normalized_body_name} ({new_count} new, {updated_count} updated)")
             
             # Update reserve level from cache if available
             if self.system_reserve_levels:
@@ -1118,6 +1318,9 @@ class JournalParser:
                     
         except Exception as e:
             log.error(f"Error processing SAASignalsFound event: {e}")
+            if self.user_db.in_transaction():
+                # Backfill window - roll it back so its checkpoint isn't saved either
+                raise
     
     def process_fsd_jump(self, event: Dict[str, Any]) -> Optional[str]:
         """Process FSDJump event to track visited systems
@@ -1354,11 +1557,159 @@ class JournalParser:
             log.error(f"Error processing FSDTarget event: {e}")
             return None
     
-    def parse_all_journals(self, progress_callback: Optional[callable] = None) -> Dict[str, int]:
+    def iter_backfill_windows(self, scan_plan: List[Tuple[str, int, Optional[str]]],
+                              event_types: frozenset = BACKFILL_EVENTS,
+                              workers: Optional[int] = None) -> Generator[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]], None, None]:
+        """Decode journal files in a process pool and yield their events in timestamp order
+        
+        Files are decoded and filtered in parallel, then handed back in windows of a
+        few files each. Each window's events are merged by timestamp, so a single
+        caller can apply them in order while the pool keeps decoding the next window.
+        
+        Args:
+            scan_plan: (file_path, start_offset, last_system) tuples from plan_incremental_scan
+            event_types: Event names to keep (Carrier* events are always kept)
+            workers: Process count. None = one per core, 1 = decode on this thread.
+            
+        Yields:
+            Tuple of (file results from decode_journal_for_backfill, merged events)
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        window_size = max(1, workers * 2)
+        
+        executor = None
+        if workers > 1 and len(scan_plan) >= PARALLEL_BACKFILL_MIN_FILES:
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers)
+            except Exception as e:
+                log.warning(f"Process pool unavailable, backfilling on one core: {e}")
+        
+        def merged(window):
+            if len(window) == 1:
+                return window[0]['events']
+            return list(heapq.merge(*(r['events'] for r in window), key=lambda e: e.get('timestamp', '')))
+        
+        if executor is None:
+            window = []
+            for file_path, start_offset, _ in scan_plan:
+                window.append(decode_journal_for_backfill(file_path, start_offset, event_types))
+                if len(window) >= window_size:
+                    yield window, merged(window)
+                    window = []
+            if window:
+                yield window, merged(window)
+            return
+        
+        log.info(f"Backfilling {len(scan_plan)} journal files with {workers} worker processes")
+        pending = deque()
+        plan_iter = iter(scan_plan)
+        try:
+            # Keep two windows in flight so workers never wait on the writer
+            for file_path, start_offset, _ in plan_iter:
+                pending.append(executor.submit(decode_journal_for_backfill, file_path, start_offset, event_types))
+                if len(pending) >= window_size * 2:
+                    break
+            while pending:
+                window = []
+                while pending and len(window) < window_size:
+                    window.append(pending.popleft().result())
+                    for file_path, start_offset, _ in plan_iter:
+                        pending.append(executor.submit(decode_journal_for_backfill, file_path, start_offset, event_types))
+                        break
+                yield window, merged(window)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _apply_journal_event(self, event: Dict[str, Any], current_system: Optional[str],
+                             stats: Dict[str, int]) -> Optional[str]:
+        """Apply one historical journal event to the database and carrier state
+        
+        Args:
+            event: Journal event data
+            current_system: System the player was in before this event
+            stats: Running statistics dict (systems_visited, hotspots_found) to update
+            
+        Returns:
+            System the player is in after this event
+        """
+        event_type = event.get('event', '')
+        
+        if event_type == 'LoadGame':
+            # Game started - force re-read of current location
+            print("[JOURNAL] LoadGame detected - refreshing current location")
+            if self.on_game_start_callback:
+                self.on_game_start_callback()
+        
+        elif event_type == 'FSDJump':
+            current_system = self.process_fsd_jump(event)
+            if current_system:
+                stats['systems_visited'] += 1
+        elif event_type == 'Location':
+            # Location just tracks current system, doesn't count as a visit
+            current_system = self.process_location(event)
+            # Don't increment visit counters for Location events
+            self.process_carrier_docked_via_location(event)
+        elif event_type == 'Docked':
+            self.process_carrier_docked(event)
+        elif event_type == 'CarrierJump':
+            # Fleet carrier jumps are real arrivals - count as visits
+            current_system = self.process_fsd_jump(event)  # Same structure as FSDJump
+            if current_system:
+                stats['systems_visited'] += 1
+            self.process_carrier_jump_completed(event)
+
+        elif event_type == 'CarrierLocation':
+            self.process_carrier_location(event)
+
+        elif event_type == 'CarrierStats':
+            self.process_carrier_stats(event)
+
+        elif event_type == 'CarrierFinance':
+            self.process_carrier_finance(event)
+
+        elif event_type == 'CarrierJumpRequest':
+            self.process_carrier_jump_request(event)
+
+        elif event_type == 'CarrierJumpCancelled':
+            self.process_carrier_jump_cancelled(event)
+
+        elif event_type == 'CarrierDepositFuel':
+            self.process_carrier_deposit_fuel(event)
+
+        elif event_type == 'CarrierBankTransfer':
+            self.process_carrier_bank_transfer(event)
+
+        elif event_type == 'Scan':
+            # Process Scan events to extract ring class information
+            self.process_scan(event)
+                
+        elif event_type == 'SAASignalsFound':
+            self.process_saa_signals_found(event, current_system)
+            # Count how many hotspots were added (all signals for rings are materials)
+            signals = event.get('Signals', [])
+            if signals and self.is_ring_body(event.get('BodyName', '')):
+                stats['hotspots_found'] += len(signals)
+        
+        return current_system
+    
+    def parse_all_journals(self, progress_callback: Optional[callable] = None,
+                           incremental: bool = True, verify: bool = False,
+                           workers: Optional[int] = None) -> Dict[str, int]:
         """Parse all journal files to populate the user database
         
+        Each file's read position is checkpointed in user_data.db, so by default
+        only bytes appended since the last scan and brand-new files are read.
+        Decoding runs in a process pool (see iter_backfill_windows) while this
+        thread stays the only database writer.
+        
         Args:
             progress_callback: Optional callback function(current_file, total_files, stats)
+            incremental: Resume from stored checkpoints. False re-reads every file from byte 0.
+            verify: Rehash the tail of each checkpointed file to detect truncation/rewrites
+            workers: Decoder process count. None = one per core, 1 = no process pool.
             
         Returns:
             Dictionary with parsing statistics
@@ -1367,96 +1718,44 @@ class JournalParser:
         if not journal_files:
             return {'files_processed': 0, 'hotspots_found': 0, 'systems_visited': 0}
         
+        if incremental:
+            scan_plan = self.plan_incremental_scan(journal_files, verify=verify)
+        else:
+            scan_plan = [(file_path, 0, None) for file_path in journal_files]
+        resume_systems = {file_path: last_system for file_path, _, last_system in scan_plan if last_system}
+        
         stats = {
             'files_processed': 0,
+            'files_skipped': len(journal_files) - len(scan_plan),
             'hotspots_found': 0,
             'systems_visited': 0,
-            'events_processed': 0
+            'events_processed': 0,
+            'lines_skipped': 0,
+            'lines_decoded': 0,
+            'files_failed': 0
         }
         
         current_system = None
         
-        for i, file_path in enumerate(journal_files):
-            log.info(f"Processing journal file {i+1}/{len(journal_files)}: {os.path.basename(file_path)}")
-            
-            file_stats = {'hotspots': 0, 'visits': 0, 'events': 0}
-            
-            for event in self.parse_journal_file(file_path):
-                stats['events_processed'] += 1
-                file_stats['events'] += 1
-                
-                event_type = event.get('event', '')
-                
-                if event_type == 'LoadGame':
-                    # Game started - force re-read of current location
-                    print("[JOURNAL] LoadGame detected - refreshing current location")
-                    if self.on_game_start_callback:
-                        self.on_game_start_callback()
-                
-                elif event_type == 'FSDJump':
-                    current_system = self.process_fsd_jump(event)
-                    if current_system:
-                        stats['systems_visited'] += 1
-                        file_stats['visits'] += 1
-                elif event_type == 'Location':
-                    # Location just tracks current system, doesn't count as a visit
-                    current_system = self.process_location(event)
-                    # Don't increment visit counters for Location events
-                    self.process_carrier_docked_via_location(event)
-                elif event_type == 'Docked':
-                    self.process_carrier_docked(event)
-                elif event_type == 'CarrierJump':
-                    # Fleet carrier jumps are real arrivals - count as visits
-                    current_system = self.process_fsd_jump(event)  # Same structure as FSDJump
-                    if current_system:
-                        stats['systems_visited'] += 1
-                        file_stats['visits'] += 1
-                    self.process_carrier_jump_completed(event)
-
-                elif event_type == 'CarrierLocation':
-                    self.process_carrier_location(event)
-
-                elif event_type == 'CarrierStats':
-                    self.process_carrier_stats(event)
-
-                elif event_type == 'CarrierFinance':
-                    self.process_carrier_finance(event)
-
-                elif event_type == 'CarrierJumpRequest':
-                    self.process_carrier_jump_request(event)
-
-                elif event_type == 'CarrierJumpCancelled':
-                    self.process_carrier_jump_cancelled(event)
-
-                elif event_type == 'CarrierDepositFuel':
-                    self.process_carrier_deposit_fuel(event)
-
-                elif event_type == 'CarrierBankTransfer':
-                    self.process_carrier_bank_transfer(event)
-
-                elif event_type == 'Scan':
-                    # Process Scan events to extract ring class information
-                    self.process_scan(event)
-                        
-                elif event_type == 'SAASignalsFound':
-                    initial_hotspots = stats['hotspots_found']
-                    self.process_saa_signals_found(event, current_system)
-                    # Count how many hotspots were added (all signals for rings are materials)
-                    signals = event.get('Signals', [])
-                    if signals and self.is_ring_body(event.get('BodyName', '')):
-                        stats['hotspots_found'] += len(signals)
-                        file_stats['hotspots'] += len(signals)
-            
-            stats['files_processed'] += 1
-            
-            log.info(f"File {os.path.basename(file_path)}: {file_stats['events']} events, "
-                    f"{file_stats['hotspots']} hotspots, {file_stats['visits']} visits")
+        for file_results, events in self.iter_backfill_windows(scan_plan, workers=workers):
+            window_stats = dict(stats)
+            try:
+                current_system = self._apply_backfill_window(file_results, events, current_system,
+                                                             resume_systems, window_stats)
+            except Exception as e:
+                # Rolled back together with its checkpoints, so these files are read again next scan
+                log.error(f"Journal window of {len(file_results)} files rolled back: {e}")
+                stats['files_failed'] += len(file_results)
+            else:
+                stats = window_stats
             
             if progress_callback:
-                progress_callback(i + 1, len(journal_files), stats)
+                progress_callback(stats['files_processed'], len(scan_plan), stats)
         
-        log.info(f"Journal parsing complete: {stats['files_processed']} files, "
-                f"{stats['events_processed']} events, {stats['hotspots_found']} hotspots, "
+        log.info(f"Journal parsing complete: {stats['files_processed']} files "
+                f"({stats['files_skipped']} unchanged), "
+                f"{stats['events_processed']} events ({stats['lines_decoded']} lines decoded, "
+                f"{stats['lines_skipped']} skipped), {stats['hotspots_found']} hotspots, "
                 f"{stats['systems_visited']} systems visited")
         
         # Fix missing coordinates for rings in the same system
@@ -1466,6 +1765,62 @@ class JournalParser:
         
         return stats
     
+    def _apply_backfill_window(self, file_results: List[Dict[str, Any]], events: List[Dict[str, Any]],
+                               current_system: Optional[str], resume_systems: Dict[str, str],
+                               stats: Dict[str, int]) -> Optional[str]:
+        """Apply one decode window's events and save its files' checkpoints in one transaction
+        
+        Raises if any write fails - the whole window is rolled back, checkpoints included.
+        
+        Returns:
+            The current system after the window's events
+        """
+        if current_system is None:
+            current_system = resume_systems.get(file_results[0]['file_path'])
+        window_start_system = current_system
+        
+        # Each file's checkpoint gets the system in effect after its own last event,
+        # not the window's final system (a later file's jumps aren't its history)
+        last_event_of = {id(result['events'][-1]): result['file_path']
+                         for result in file_results if result['events']}
+        file_systems = {}
+        system_changes = []  # (timestamp, system) whenever current_system changes
+        
+        # One transaction per window: the window's writes and its checkpoints land together
+        with self.user_db.transaction():
+            for event in events:
+                stats['events_processed'] += 1
+                previous_system = current_system
+                current_system = self._apply_journal_event(event, current_system, stats)
+                if current_system != previous_system:
+                    system_changes.append((event.get('timestamp', ''), current_system))
+                file_path = last_event_of.get(id(event))
+                if file_path is not None:
+                    file_systems[file_path] = current_system
+            
+            checkpoints = []
+            for result in file_results:
+                stats['files_processed'] += 1
+                stats['lines_skipped'] += result['lines_skipped']
+                stats['lines_decoded'] += result['lines_decoded']
+                log.info(f"File {os.path.basename(result['file_path'])}: {result['lines_seen']} lines, "
+                         f"{result['lines_skipped']} skipped undecoded, {len(result['events'])} applied")
+                if result['file_path'] in file_systems:
+                    last_system = file_systems[result['file_path']]
+                else:
+                    # No events of its own - the system in effect at its last timestamp
+                    last_system = resume_systems.get(result['file_path'], window_start_system)
+                    for timestamp, system in system_changes:
+                        if not result['last_timestamp'] or timestamp > result['last_timestamp']:
+                            break
+                        last_system = system
+                checkpoint = self._build_checkpoint(result['file_path'], result['end_offset'],
+                                                    result['last_timestamp'], last_system)
+                if checkpoint:
+                    checkpoints.append(checkpoint)
+            self.user_db.save_journal_checkpoints(checkpoints)
+        return current_system
+    
     def _fix_missing_ring_coordinates(self) -> int:
         """Fix missing coordinates for rings in the same system by copying from other rings
         
@@ -1476,12 +1831,10 @@ class JournalParser:
             Number of hotspot entries updated with coordinates
         """
         try:
-            import sqlite3
-            
             total_updated = 0
             
             # Find systems with mixed coordinate data
-            with sqlite3.connect(self.user_db.db_path) as conn:
+            with self.user_db._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get systems that have BOTH rings with coords AND rings without coords
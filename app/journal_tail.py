@@ -0,0 +1,267 @@
+"""
+Live Journal Tail for EliteMining
+Single reader for the active Journal*.log that decodes each new line once
+and fans the events out to subscribers
+"""
+
+import os
+import glob
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from journal_decoder import JournalDecoder
+
+log = logging.getLogger("EliteMining.JournalTail")
+
+# Events after which the game moves on to a new journal file
+ROTATION_EVENTS = frozenset({'Shutdown', 'Continued'})
+
+
+class _Subscription:
+    """One subscriber's callback, event filter and dispatcher"""
+
+    def __init__(self, callback: Callable[[Dict[str, Any]], None],
+                 event_types: Optional[Iterable[str]], event_prefixes: Iterable[str],
+                 dispatch: Optional[Callable[..., Any]]):
+        self.callback = callback
+        self.event_types = frozenset(event_types) if event_types is not None else None
+        self.event_prefixes = tuple(event_prefixes)
+        self.dispatch = dispatch
+
+    def wants(self, event_name: str) -> bool:
+        if self.event_types is None:
+            return True
+        return event_name in self.event_types or event_name.startswith(self.event_prefixes)
+
+
+class JournalTail:
+    """Tails the newest journal file and dispatches decoded events to subscribers
+
+    Owns the file offset, partial-line buffer and rotation detection that each
+    consumer used to keep for itself. poll() can be called from any thread;
+    subscribers that touch Tk widgets should pass a dispatch function that
+    marshals onto the main thread (e.g. lambda fn, evt: widget.after(0, fn, evt)).
+    """
+
+    # Seconds between directory globs looking for a newer journal file
+    ROTATION_CHECK_INTERVAL = 5.0
+
+    def __init__(self, journal_dir: str = "", start_at_end: bool = True):
+        """Initialize the tail
+
+        Args:
+            journal_dir: Elite Dangerous journal directory
+            start_at_end: Skip existing content of the first file found, so only
+                          events written after startup are dispatched
+        """
+        self.journal_dir = journal_dir
+        self.start_at_end = start_at_end
+        self._lock = threading.RLock()
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._next_token = 1
+        self._decoder = JournalDecoder(())
+        self._path: Optional[str] = None
+        self._offset = 0
+        self._partial = b''
+        self._last_rotation_check = 0.0
+        self._rotation_pending = False
+        self.polls = 0
+        self.events_dispatched = 0
+
+    # ------------------------------------------------------------------
+    # Subscriptions
+
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None],
+                  event_types: Optional[Iterable[str]] = None, event_prefixes: Iterable[str] = (),
+                  dispatch: Optional[Callable[..., Any]] = None) -> int:
+        """Register a callback for journal events
+
+        Args:
+            callback: Called with each matching event dict
+            event_types: Event names to receive. None receives every event.
+            event_prefixes: Event name prefixes to receive (e.g. 'Carrier')
+            dispatch: Optional function(callback, event) used instead of calling
+                      the callback directly on the polling thread
+
+        Returns:
+            Token for unsubscribe()
+        """
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscriptions[token] = _Subscription(callback, event_types, event_prefixes, dispatch)
+            self._rebuild_decoder()
+            return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Remove a subscription returned by subscribe()"""
+        with self._lock:
+            if self._subscriptions.pop(token, None) is not None:
+                self._rebuild_decoder()
+
+    def _rebuild_decoder(self) -> None:
+        """Decode only the union of what subscribers want"""
+        subs = list(self._subscriptions.values())
+        if any(sub.event_types is None for sub in subs):
+            event_types = None
+        else:
+            event_types = set(ROTATION_EVENTS)
+            for sub in subs:
+                event_types.update(sub.event_types)
+        prefixes = tuple({prefix for sub in subs for prefix in sub.event_prefixes})
+        decoder = JournalDecoder(event_types, prefixes)
+        decoder.lines_seen = self._decoder.lines_seen
+        decoder.lines_skipped = self._decoder.lines_skipped
+        decoder.lines_decoded = self._decoder.lines_decoded
+        decoder.decode_errors = self._decoder.decode_errors
+        self._decoder = decoder
+
+    # ------------------------------------------------------------------
+    # File tracking
+
+    @property
+    def current_file(self) -> Optional[str]:
+        """Path of the journal file being tailed"""
+        return self._path
+
+    @property
+    def offset(self) -> int:
+        """Byte offset of the next unread complete line"""
+        return self._offset - len(self._partial)
+
+    def set_journal_dir(self, journal_dir: str) -> None:
+        """Switch to a different journal directory, starting at the end of its newest file"""
+        with self._lock:
+            self.journal_dir = journal_dir
+            self._path = None
+            self._offset = 0
+            self._partial = b''
+            self._last_rotation_check = 0.0
+            self.start_at_end = True
+
+    def follow(self, file_path: str, offset: int) -> None:
+        """Tail a specific file from a byte offset (used when a caller already scanned it)"""
+        with self._lock:
+            if file_path == self._path:
+                return
+            self._path = file_path
+            self._offset = offset
+            self._partial = b''
+            self.start_at_end = False
+            self._last_rotation_check = time.time()
+
+    def _find_latest_journal(self) -> Optional[str]:
+        if not self.journal_dir:
+            return None
+        try:
+            candidates = glob.glob(os.path.join(self.journal_dir, "Journal.*.log"))
+            return max(candidates, key=os.path.getmtime) if candidates else None
+        except (OSError, ValueError):
+            return None
+
+    def _check_rotation(self, force: bool = False) -> None:
+        """Switch to a newer journal file if one appeared"""
+        now = time.time()
+        if not force and self._path and now - self._last_rotation_check < self.ROTATION_CHECK_INTERVAL:
+            return
+        self._last_rotation_check = now
+        latest = self._find_latest_journal()
+        if not latest or latest == self._path:
+            return
+
+        self._path = latest
+        self._partial = b''
+        self._offset = 0
+        if self.start_at_end:
+            # Only the file open at startup is skipped - later files are new sessions
+            self.start_at_end = False
+            try:
+                self._offset = os.path.getsize(latest)
+            except OSError:
+                pass
+        else:
+            log.info(f"[JOURNAL_ROTATION] Detected new journal file: {os.path.basename(latest)}")
+
+    # ------------------------------------------------------------------
+    # Polling
+
+    def poll(self) -> int:
+        """Read newly appended journal lines and dispatch their events
+
+        Returns:
+            Number of events dispatched
+        """
+        with self._lock:
+            self.polls += 1
+            self._check_rotation(force=self._rotation_pending)
+            self._rotation_pending = False
+            if not self._path:
+                return 0
+
+            try:
+                size = os.path.getsize(self._path)
+            except OSError:
+                # File rotated away or deleted - look for the new one next poll
+                self._path = None
+                return 0
+            if size < self._offset:
+                # File was truncated/replaced - start over
+                self._offset = 0
+                self._partial = b''
+            if size == self._offset:
+                return 0
+
+            try:
+                with open(self._path, 'rb') as f:
+                    f.seek(self._offset)
+                    data = f.read(size - self._offset)
+            except PermissionError:
+                # Locked by another app scanning journals - retry next poll
+                return 0
+            except OSError as e:
+                log.debug(f"Journal read error: {e}")
+                return 0
+            self._offset += len(data)
+
+            lines = (self._partial + data).split(b'\n')
+            self._partial = lines.pop()
+
+            # Dispatch under the lock so events reach subscribers in file order
+            # even when two threads poll at once
+            dispatched = 0
+            subscriptions = list(self._subscriptions.values())
+            file_name = os.path.basename(self._path)
+            for line in lines:
+                event = self._decoder.decode(line, file_name)
+                if event is None:
+                    continue
+                event_name = event.get('event', '')
+                if event_name in ROTATION_EVENTS:
+                    self._rotation_pending = True
+                for sub in subscriptions:
+                    if not sub.wants(event_name):
+                        continue
+                    try:
+                        if sub.dispatch:
+                            sub.dispatch(sub.callback, event)
+                        else:
+                            sub.callback(event)
+                        dispatched += 1
+                    except Exception as e:
+                        log.error(f"Journal subscriber error on {event_name}: {e}")
+            self.events_dispatched += dispatched
+            return dispatched
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tail counters (polls, dispatches and decoder line counts)"""
+        stats = {
+            'current_file': self._path,
+            'offset': self.offset,
+            'subscribers': len(self._subscriptions),
+            'polls': self.polls,
+            'events_dispatched': self.events_dispatched,
+        }
+        stats.update(self._decoder.get_stats())
+        return stats
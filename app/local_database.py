@@ -5,6 +5,7 @@ This module handles downloading, caching, and querying EDSM bulk data locally
 to provide comprehensive spatial system searches without relying on broken APIs.
 """
 
+import io
 import os
 import sqlite3
 import gzip
@@ -12,10 +13,56 @@ import json
 import math
 import requests
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, Iterator, List, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 import threading
 import time
+from collections import OrderedDict
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Rows per executemany() and per committed transaction when building the database
+BUILD_BATCH_SIZE = 20000
+BUILD_COMMIT_ROWS = 200000
+
+# Characters read per chunk by the fallback dump parser
+DUMP_READ_CHUNK = 1 << 20
+
+# Pragmas for the shared read-only query connection
+QUERY_MMAP_SIZE = 256 * 1024 * 1024   # Map up to 256 MB of the file instead of read() into the page cache
+QUERY_CACHE_PAGES = -16000            # 16 MB page cache
+
+# Names per IN (...) lookup - stays under SQLite's 999 variable limit on older builds
+NAME_LOOKUP_CHUNK = 500
+
+NEARBY_RTREE_QUERY = '''
+    SELECT s.name, s.x, s.y, s.z, s.population, s.allegiance,
+           ((s.x - ?) * (s.x - ?) + (s.y - ?) * (s.y - ?) + (s.z - ?) * (s.z - ?)) as dist_squared
+    FROM systems s
+    JOIN systems_spatial ss ON s.id = ss.id
+    WHERE ss.x_min <= ? AND ss.x_max >= ?
+      AND ss.y_min <= ? AND ss.y_max >= ?
+      AND ss.z_min <= ? AND ss.z_max >= ?
+      AND ((s.x - ?) * (s.x - ?) + (s.y - ?) * (s.y - ?) + (s.z - ?) * (s.z - ?)) <= ?
+    ORDER BY dist_squared
+    LIMIT ?
+'''
+
+NEARBY_PLAIN_QUERY = '''
+    SELECT name, x, y, z, population, allegiance,
+           ((x - ?) * (x - ?) + (y - ?) * (y - ?) + (z - ?) * (z - ?)) as dist_squared
+    FROM systems
+    WHERE x BETWEEN ? AND ?
+      AND y BETWEEN ? AND ?
+      AND z BETWEEN ? AND ?
+      AND ((x - ?) * (x - ?) + (y - ?) * (y - ?) + (z - ?) * (z - ?)) <= ?
+    ORDER BY dist_squared
+    LIMIT ?
+'''
 
 class LocalSystemsDatabase:
     """Manages local systems database for spatial searches"""
@@ -61,14 +108,65 @@ class LocalSystemsDatabase:
         self.download_status = "Ready"
         self.download_error = None
         
-        # Query cache for performance
-        self.query_cache = {}
+        # Query cache for performance (LRU - most recently used at the end)
+        self.query_cache: "OrderedDict[str, Dict]" = OrderedDict()
         self.cache_max_size = 100  # Maximum cached queries
         self.cache_timeout = 3600  # Cache timeout in seconds (1 hour)
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache_lock = threading.Lock()
+
+        # Shared read-only connection, opened on first query
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.RLock()
+        self._has_rtree = False
+        self._verified = False
         
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the shared read-only query connection, opening it on first use
+
+        Pragmas and the R-Tree check run once here instead of on every query.
+        Callers must hold _conn_lock while using the connection.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                try:
+                    conn = sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True,
+                                           check_same_thread=False)
+                except sqlite3.OperationalError:
+                    # Some locations can't be opened by URI - fall back to a plain connection
+                    conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                    conn.execute("PRAGMA query_only=ON")
+                conn.execute(f"PRAGMA mmap_size={QUERY_MMAP_SIZE}")
+                conn.execute(f"PRAGMA cache_size={QUERY_CACHE_PAGES}")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                self._has_rtree = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='systems_spatial'"
+                ).fetchone() is not None
+                self._conn = conn
+            return self._conn
+
+    def close(self):
+        """Close the shared query connection (reopened on next query)"""
+        with self._conn_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+            self._has_rtree = False
+            self._verified = False
+
+
     def is_database_available(self) -> bool:
         """Check if local database exists and is usable"""
-        return self.db_path.exists() and self._verify_database()
+        if not self.db_path.exists():
+            return False
+        # Only a positive check is remembered - a missing database may be built later
+        if not self._verified:
+            self._verified = self._verify_database()
+        return self._verified
         
     def get_database_info(self) -> Dict:
         """Get information about the current database"""
@@ -192,18 +290,69 @@ class LocalSystemsDatabase:
         finally:
             self.is_downloading = False
             
+    def _iter_dump_systems(self, stream) -> Iterator[Dict]:
+        """Yield system dicts one at a time from an EDSM JSON array dump
+
+        Uses ijson when installed, otherwise decodes the array element by element
+        from fixed-size chunks, so memory stays bounded whatever the dump size.
+        """
+        if IJSON_AVAILABLE:
+            yield from ijson.items(stream, 'item', use_float=True)
+            return
+
+        text_stream = io.TextIOWrapper(stream, encoding='utf-8')
+        decoder = json.JSONDecoder()
+        buffer = ''
+        pos = 0
+        started = False
+        while True:
+            chunk = text_stream.read(DUMP_READ_CHUNK)
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            while True:
+                # Skip whitespace and the array's '[' / ',' separators
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,[':
+                    if buffer[pos] == '[':
+                        started = True
+                    pos += 1
+                if pos >= len(buffer) or buffer[pos] == ']':
+                    break
+                if not started:
+                    raise ValueError("Systems dump is not a JSON array")
+                try:
+                    system, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if not chunk:
+                        raise
+                    break  # Object continues in the next chunk
+                yield system
+            if not chunk or (pos < len(buffer) and buffer[pos] == ']'):
+                return
+
     def _build_database_from_file(self, progress_callback: Callable[[float, str], None] = None) -> bool:
-        """Build SQLite database from downloaded JSON file"""
+        """Build SQLite database from downloaded JSON file
+
+        The dump is streamed and bulk-loaded in large transactions; secondary
+        indexes are only built once all rows are in.
+        """
+        conn = None
         try:
             if progress_callback:
                 progress_callback(85.0, "Creating database...")
                 
             # Remove existing database
+            self.close()
+            self.clear_cache()
             if self.db_path.exists():
                 self.db_path.unlink()
                 
-            # Create new database
-            conn = sqlite3.connect(str(self.db_path))
+            # Create new database. The file is rebuilt from scratch on failure,
+            # so skip the rollback journal and fsyncs while loading.
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA cache_size=-65536")  # 64 MB while loading
             cursor = conn.cursor()
             
             # Create systems table with spatial indexing support
@@ -233,85 +382,81 @@ class LocalSystemsDatabase:
                     )
                 ''')
                 has_rtree = True
-            except:
-                # Fallback to regular index if R-Tree not available
-                cursor.execute('CREATE INDEX idx_systems_coords ON systems (x, y, z)')
+            except sqlite3.Error:
+                # Fallback to regular index (built after the load) if R-Tree not available
                 has_rtree = False
                 
             if progress_callback:
                 progress_callback(90.0, "Loading systems data...")
                 
-            # Load and parse JSON data
+            # Stream and bulk-load. Ids are assigned here so systems and
+            # systems_spatial rows share the same key.
             systems_count = 0
-            batch_size = 1000
             batch = []
-            
-            with gzip.open(self.download_path, 'rt', encoding='utf-8') as f:
-                systems = json.load(f)
-                total_systems = len(systems)
-                
-                for i, system in enumerate(systems):
-                    if 'coords' not in system:
+            spatial_batch = []
+            total_bytes = max(self.download_path.stat().st_size, 1)
+
+            def flush():
+                cursor.executemany('''
+                    INSERT INTO systems (id, name, x, y, z, population, allegiance, government, economy, security)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', batch)
+                if has_rtree:
+                    cursor.executemany('''
+                        INSERT INTO systems_spatial VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ''', spatial_batch)
+                batch.clear()
+                spatial_batch.clear()
+
+            with open(self.download_path, 'rb') as raw, gzip.GzipFile(fileobj=raw) as gz:
+                cursor.execute("BEGIN")
+                for system in self._iter_dump_systems(gz):
+                    coords = system.get('coords')
+                    if not coords:
                         continue
-                        
-                    coords = system['coords']
-                    
-                    # Prepare system data
-                    system_data = (
+
+                    x, y, z = coords['x'], coords['y'], coords['z']
+                    systems_count += 1
+                    batch.append((
+                        systems_count,
                         system.get('name', ''),
-                        coords['x'],
-                        coords['y'], 
-                        coords['z'],
+                        x, y, z,
                         system.get('population', 0),
                         system.get('allegiance', ''),
                         system.get('government', ''),
                         system.get('primaryEconomy', ''),
                         system.get('security', '')
-                    )
-                    
-                    batch.append(system_data)
-                    
-                    # Insert batch
-                    if len(batch) >= batch_size:
-                        cursor.executemany('''
-                            INSERT INTO systems (name, x, y, z, population, allegiance, government, economy, security)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', batch)
-                        
-                        # Insert into spatial index if available
-                        if has_rtree:
-                            for j, (name, x, y, z, *_) in enumerate(batch):
-                                row_id = systems_count + j + 1
-                                cursor.execute('''
-                                    INSERT INTO systems_spatial VALUES (?, ?, ?, ?, ?, ?, ?)
-                                ''', (row_id, x, x, y, y, z, z))
-                        
-                        systems_count += len(batch)
-                        batch = []
-                        
-                        # Update progress
-                        progress = 90.0 + ((i / total_systems) * 8.0)
+                    ))
+                    if has_rtree:
+                        spatial_batch.append((systems_count, x, x, y, y, z, z))
+
+                    if len(batch) >= BUILD_BATCH_SIZE:
+                        flush()
+                        if systems_count % BUILD_COMMIT_ROWS == 0:
+                            cursor.execute("COMMIT")
+                            cursor.execute("BEGIN")
+
+                        # Progress from position in the compressed file
+                        progress = 90.0 + (raw.tell() / total_bytes) * 6.0
                         if progress_callback:
                             progress_callback(progress, f"Processed {systems_count:,} systems...")
-                            
-                # Insert remaining batch
+
                 if batch:
-                    cursor.executemany('''
-                        INSERT INTO systems (name, x, y, z, population, allegiance, government, economy, security)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', batch)
-                    
-                    if has_rtree:
-                        for j, (name, x, y, z, *_) in enumerate(batch):
-                            row_id = systems_count + j + 1
-                            cursor.execute('''
-                                INSERT INTO systems_spatial VALUES (?, ?, ?, ?, ?, ?, ?)
-                            ''', (row_id, x, x, y, y, z, z))
-                    
-                    systems_count += len(batch)
-                    
-            conn.commit()
+                    flush()
+                cursor.execute("COMMIT")
+
+            if progress_callback:
+                progress_callback(96.0, "Building indexes...")
+
+            # Secondary indexes are far cheaper to build once over sorted data
+            # than to maintain row by row during the load
+            cursor.execute('CREATE INDEX idx_systems_name ON systems (name)')
+            if not has_rtree:
+                cursor.execute('CREATE INDEX idx_systems_coords ON systems (x, y, z)')
+            cursor.execute('ANALYZE')
+            cursor.execute("PRAGMA journal_mode=DELETE")
             conn.close()
+            conn = None
             
             if progress_callback:
                 progress_callback(98.0, f"Database created with {systems_count:,} systems")
@@ -326,6 +471,8 @@ class LocalSystemsDatabase:
             
         except Exception as e:
             print(f"❌ Database creation failed: {e}")
+            if conn is not None:
+                conn.close()
             if progress_callback:
                 progress_callback(0.0, f"Database creation failed: {str(e)}")
             return False
@@ -344,13 +491,11 @@ class LocalSystemsDatabase:
     def _verify_database(self) -> bool:
         """Verify database is valid and accessible"""
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM systems")
-            count = cursor.fetchone()[0]
-            conn.close()
-            return count > 0
-        except:
+            with self._conn_lock:
+                row = self._get_connection().execute("SELECT 1 FROM systems LIMIT 1").fetchone()
+            return row is not None
+        except sqlite3.Error:
+            self.close()
             return False
             
     def get_system_coordinates(self, system_name: str) -> Optional[Dict]:
@@ -360,17 +505,107 @@ class LocalSystemsDatabase:
             Dict with 'x', 'y', 'z' keys, or None if not found.
         """
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-            cursor.execute("SELECT x, y, z FROM systems WHERE name = ?", (system_name,))
-            row = cursor.fetchone()
-            conn.close()
+            with self._conn_lock:
+                row = self._get_connection().execute(
+                    "SELECT x, y, z FROM systems WHERE name = ?", (system_name,)
+                ).fetchone()
             if row:
                 return {'x': row[0], 'y': row[1], 'z': row[2]}
             return None
         except Exception:
             return None
 
+    def get_systems_coordinates(self, system_names, ignore_case: bool = False) -> Dict[str, Tuple[float, float, float]]:
+        """Look up coordinates for many systems at once
+
+        Args:
+            system_names: Names to look up
+            ignore_case: Retry names without an exact match case-insensitively
+                         (one unindexed query each - keep to a handful of names)
+
+        Returns:
+            Dict of requested system name -> (x, y, z) for the systems found
+        """
+        names = list(system_names)
+        coords = {}
+        if not names:
+            return coords
+        try:
+            with self._conn_lock:
+                conn = self._get_connection()
+                for i in range(0, len(names), NAME_LOOKUP_CHUNK):
+                    chunk = names[i:i + NAME_LOOKUP_CHUNK]
+                    placeholders = ','.join('?' * len(chunk))
+                    for name, x, y, z in conn.execute(
+                            f"SELECT name, x, y, z FROM systems WHERE name IN ({placeholders})", chunk):
+                        coords[name] = (x, y, z)
+                if ignore_case:
+                    for name in names:
+                        if name not in coords:
+                            row = conn.execute("SELECT x, y, z FROM systems WHERE name = ? COLLATE NOCASE LIMIT 1",
+                                               (name,)).fetchone()
+                            if row:
+                                coords[name] = row
+        except sqlite3.Error as e:
+            print(f"❌ Local database coordinate lookup failed: {e}")
+        return coords
+
+    def _nearby_query(self, has_rtree: bool, center_x: float, center_y: float, center_z: float,
+                      max_distance: float, limit: int) -> Tuple[str, Tuple]:
+        """SQL and parameters for a radius query
+
+        The SQL text is constant per index type, so sqlite3's statement cache
+        reuses the prepared statement across calls.
+        """
+        max_distance_squared = max_distance * max_distance
+        if has_rtree:
+            # Use R-Tree for efficient spatial query with optimized bounds
+            bounds = max_distance + max_distance * 0.1  # Small buffer for edge cases
+            params = (
+                center_x, center_x, center_y, center_y, center_z, center_z,  # For distance calculation
+                center_x + bounds, center_x - bounds,
+                center_y + bounds, center_y - bounds,
+                center_z + bounds, center_z - bounds,
+                center_x, center_x, center_y, center_y, center_z, center_z,  # For WHERE distance filter
+                max_distance_squared,
+                limit
+            )
+            return NEARBY_RTREE_QUERY, params
+
+        # Fallback to regular query with coordinate bounds and distance calculation
+        params = (
+            center_x, center_x, center_y, center_y, center_z, center_z,  # For distance calculation
+            center_x - max_distance, center_x + max_distance,
+            center_y - max_distance, center_y + max_distance,
+            center_z - max_distance, center_z + max_distance,
+            center_x, center_x, center_y, center_y, center_z, center_z,  # For WHERE distance filter
+            max_distance_squared,
+            limit
+        )
+        return NEARBY_PLAIN_QUERY, params
+
+    def _cache_get(self, cache_key: str, now: float) -> Optional[List[Dict]]:
+        """Cached results for a query, or None on a miss or expired entry"""
+        with self._cache_lock:
+            entry = self.query_cache.get(cache_key)
+            if entry is not None and now - entry['timestamp'] < self.cache_timeout:
+                self.query_cache.move_to_end(cache_key)
+                self.cache_hits += 1
+                return entry['results']
+            if entry is not None:
+                # Remove expired cache entry
+                del self.query_cache[cache_key]
+            self.cache_misses += 1
+            return None
+
+    def _cache_put(self, cache_key: str, results: List[Dict], now: float):
+        """Store query results, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self.query_cache[cache_key] = {'results': results, 'timestamp': now}
+            self.query_cache.move_to_end(cache_key)
+            while len(self.query_cache) > self.cache_max_size:
+                self.query_cache.popitem(last=False)
+
     def find_nearby_systems(self, center_x: float, center_y: float, center_z: float,
                            max_distance: float, limit: int = 100, cache_context: str = None) -> List[Dict]:
         """Find systems within radius of center point
@@ -395,85 +630,17 @@ class LocalSystemsDatabase:
         current_time = time.time()
         
         # Check cache first
-        if cache_key in self.query_cache:
-            cached_data = self.query_cache[cache_key]
-            if current_time - cached_data['timestamp'] < self.cache_timeout:
-                print(f"🗄️ Cache hit for spatial query: {len(cached_data['results'])} systems (context: {cache_context or 'none'})")
-                return cached_data['results']
-            else:
-                # Remove expired cache entry
-                del self.query_cache[cache_key]
+        cached_results = self._cache_get(cache_key, current_time)
+        if cached_results is not None:
+            print(f"🗄️ Cache hit for spatial query: {len(cached_results)} systems (context: {cache_context or 'none'})")
+            return cached_results
         
         try:
-            # Use connection pooling for better performance
-            conn = sqlite3.connect(str(self.db_path))
-            # Enable Write-Ahead Logging for better read performance
-            conn.execute("PRAGMA journal_mode=WAL")
-            # Optimize for read performance
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.execute("PRAGMA cache_size=10000")  # 10MB cache
-            conn.execute("PRAGMA temp_store=MEMORY")
-            
-            cursor = conn.cursor()
-            
-            # Check if R-Tree spatial index is available
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='systems_spatial'")
-            has_rtree = cursor.fetchone() is not None
-            
-            if has_rtree:
-                # Use R-Tree for efficient spatial query with optimized bounds
-                bounds_buffer = max_distance * 0.1  # Small buffer for edge cases
-                query = '''
-                    SELECT s.name, s.x, s.y, s.z, s.population, s.allegiance,
-                           ((s.x - ?) * (s.x - ?) + (s.y - ?) * (s.y - ?) + (s.z - ?) * (s.z - ?)) as dist_squared
-                    FROM systems s
-                    JOIN systems_spatial ss ON s.id = ss.id
-                    WHERE ss.x_min <= ? AND ss.x_max >= ?
-                      AND ss.y_min <= ? AND ss.y_max >= ?
-                      AND ss.z_min <= ? AND ss.z_max >= ?
-                      AND ((s.x - ?) * (s.x - ?) + (s.y - ?) * (s.y - ?) + (s.z - ?) * (s.z - ?)) <= ?
-                    ORDER BY dist_squared
-                    LIMIT ?
-                '''
-                
-                max_distance_squared = max_distance * max_distance
-                params = (
-                    center_x, center_x, center_y, center_y, center_z, center_z,  # For distance calculation
-                    center_x + max_distance + bounds_buffer, center_x - max_distance - bounds_buffer,
-                    center_y + max_distance + bounds_buffer, center_y - max_distance - bounds_buffer, 
-                    center_z + max_distance + bounds_buffer, center_z - max_distance - bounds_buffer,
-                    center_x, center_x, center_y, center_y, center_z, center_z,  # For WHERE distance filter
-                    max_distance_squared,
-                    limit
-                )
-            else:
-                # Fallback to regular query with coordinate bounds and distance calculation
-                query = '''
-                    SELECT name, x, y, z, population, allegiance,
-                           ((x - ?) * (x - ?) + (y - ?) * (y - ?) + (z - ?) * (z - ?)) as dist_squared
-                    FROM systems
-                    WHERE x BETWEEN ? AND ?
-                      AND y BETWEEN ? AND ?
-                      AND z BETWEEN ? AND ?
-                      AND ((x - ?) * (x - ?) + (y - ?) * (y - ?) + (z - ?) * (z - ?)) <= ?
-                    ORDER BY dist_squared
-                    LIMIT ?
-                '''
-                
-                max_distance_squared = max_distance * max_distance
-                params = (
-                    center_x, center_x, center_y, center_y, center_z, center_z,  # For distance calculation
-                    center_x - max_distance, center_x + max_distance,
-                    center_y - max_distance, center_y + max_distance,
-                    center_z - max_distance, center_z + max_distance,
-                    center_x, center_x, center_y, center_y, center_z, center_z,  # For WHERE distance filter
-                    max_distance_squared,
-                    limit
-                )
-            
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            conn.close()
+            with self._conn_lock:
+                conn = self._get_connection()
+                has_rtree = self._has_rtree
+                results = conn.execute(*self._nearby_query(has_rtree, center_x, center_y, center_z,
+                                                           max_distance, limit)).fetchall()
             
             # Convert results to expected format
             nearby_systems = []
@@ -491,18 +658,7 @@ class LocalSystemsDatabase:
             
             # Cache results if we have data
             if nearby_systems:
-                # Manage cache size
-                if len(self.query_cache) >= self.cache_max_size:
-                    # Remove oldest entries
-                    oldest_key = min(self.query_cache.keys(), 
-                                   key=lambda k: self.query_cache[k]['timestamp'])
-                    del self.query_cache[oldest_key]
-                
-                # Add to cache
-                self.query_cache[cache_key] = {
-                    'results': nearby_systems,
-                    'timestamp': current_time
-                }
+                self._cache_put(cache_key, nearby_systems, current_time)
                 
             print(f"🗄️ Found {len(nearby_systems)} systems within {max_distance} LY using {'R-Tree' if has_rtree else 'regular'} index")
             return nearby_systems
@@ -528,9 +684,10 @@ class LocalSystemsDatabase:
         """
         if context_filter:
             # Clear only matching cache entries
-            keys_to_remove = [key for key in self.query_cache.keys() if context_filter in key]
-            for key in keys_to_remove:
-                del self.query_cache[key]
+            with self._cache_lock:
+                keys_to_remove = [key for key in self.query_cache.keys() if context_filter in key]
+                for key in keys_to_remove:
+                    del self.query_cache[key]
             import logging
             logging.getLogger(__name__).debug(
                 "Query cache cleared for context '%s' (%d entries)",
@@ -539,14 +696,19 @@ class LocalSystemsDatabase:
             )
         else:
             # Clear all cache
-            self.query_cache.clear()
+            with self._cache_lock:
+                self.query_cache.clear()
             import logging
             logging.getLogger(__name__).debug("Query cache cleared (all entries)")
         
     def get_cache_stats(self) -> Dict:
         """Get cache performance statistics"""
+        lookups = self.cache_hits + self.cache_misses
         return {
             'cached_queries': len(self.query_cache),
             'max_cache_size': self.cache_max_size,
-            'cache_timeout_hours': self.cache_timeout / 3600
+            'cache_timeout_hours': self.cache_timeout / 3600,
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'hit_rate': round(self.cache_hits / lookups, 3) if lookups else 0.0
         }
\ No newline at end of file
@@ -90,11 +90,12 @@ except Exception as e:
 # Now import modules that depend on localization
 from ring_finder import RingFinder
 from marketplace_api import MarketplaceAPI
-from config import _load_cfg, _save_cfg, flush_config, load_saved_va_folder, save_va_folder, load_window_geometry, save_window_geometry, load_cargo_window_position, save_cargo_window_position
+from config import _load_cfg, _save_cfg, flush_config, load_saved_va_folder, save_va_folder, load_window_geometry, save_window_geometry, load_cargo_window_position, save_cargo_window_position, load_edsm_backfill_enabled, save_edsm_backfill_enabled
 from version import get_version, UPDATE_CHECK_URL, UPDATE_CHECK_INTERVAL
 from update_checker import UpdateChecker
 from user_database import UserDatabase
 from journal_parser import JournalParser
+from journal_tail import JournalTail
 from app_utils import get_app_icon_path, set_window_icon, get_app_data_dir, get_variables_dir, get_ship_presets_dir
 
 # Import UI components from ui module
@@ -1449,7 +1450,7 @@ class RefineryDialog:
         # Rebuild CSV after materials are applied
         if hasattr(self.cargo_monitor, 'main_app_ref') and hasattr(self.cargo_monitor.main_app_ref, 'prospector_panel'):
             prospector_panel = self.cargo_monitor.main_app_ref.prospector_panel
-            csv_path = os.path.join(prospector_panel.reports_dir, "sessions_index.csv")
+            csv_path = prospector_panel._get_csv_path()
             prospector_panel.after(100, lambda: prospector_panel._rebuild_csv_from_files_tab(csv_path))
         self.dialog.destroy()
     
@@ -1673,6 +1674,11 @@ class CargoMonitor:
             # Fallback to English path
             self.journal_dir = os.path.expanduser("~\\Saved Games\\Frontier Developments\\Elite Dangerous")
         
+        # Single tail of the live journal - other panels subscribe to it instead
+        # of re-reading the file themselves
+        self.journal_tail = JournalTail(self.journal_dir)
+        self.journal_tail.subscribe(self.process_journal_event)
+        
         # Cargo.json file path for detailed cargo data
         self.cargo_json_path = os.path.join(self.journal_dir, "Cargo.json")
         self.last_cargo_mtime = 0
@@ -2937,26 +2943,8 @@ cargo panel forces Elite to write detailed inventory data.
                     # Check for Cargo.json updates (most accurate)
                     self.read_cargo_json()
                     
-                    # Check if journal file has grown (new entries) OR if a newer journal file exists
-                    if self.last_journal_file and os.path.exists(self.last_journal_file):
-                        current_size = os.path.getsize(self.last_journal_file)
-                        
-                        # Also check if there's a NEWER journal file (daily rotation)
-                        journal_files = glob.glob(os.path.join(self.journal_dir, "Journal.*.log"))
-                        if journal_files:
-                            latest_file = max(journal_files, key=os.path.getmtime)
-                            if latest_file != self.last_journal_file:
-                                logging.info(f"[JOURNAL_ROTATION] Detected new journal file: {os.path.basename(latest_file)}")
-                                self.last_journal_file = latest_file
-                                self.last_file_size = 0  # Start reading from beginning of new file
-                                continue  # Skip to next iteration to process new file
-                        
-                        if current_size > self.last_file_size:
-                            self.read_new_journal_entries()
-                            self.last_file_size = current_size
-                    else:
-                        # Check for new journal file
-                        self.find_latest_journal()
+                    # Read new journal entries (the tail handles daily rotation)
+                    self.read_new_journal_entries()
                         
                 except Exception as e:
                     logging.error(f"[BACKGROUND_MONITOR] ERROR: {e}")
@@ -3086,6 +3074,7 @@ cargo panel forces Elite to write detailed inventory data.
             latest_file = max(journal_files, key=os.path.getmtime)
             self.last_journal_file = latest_file
             self.last_file_size = os.path.getsize(latest_file)
+            self.journal_tail.follow(latest_file, self.last_file_size)
             
             if hasattr(self, 'status_label'):
                 filename = os.path.basename(latest_file)
@@ -3231,15 +3220,8 @@ cargo panel forces Elite to write detailed inventory data.
             # First priority: Check for Cargo.json updates (most accurate)
             self.read_cargo_json()
             
-            # Check if journal file has grown (new entries)
-            if self.last_journal_file and os.path.exists(self.last_journal_file):
-                current_size = os.path.getsize(self.last_journal_file)
-                if current_size > self.last_file_size:
-                    self.read_new_journal_entries()
-                    self.last_file_size = current_size
-            else:
-                # Check for new journal file
-                self.find_latest_journal()
+            # Read new journal entries
+            self.read_new_journal_entries()
                 
         except Exception as e:
             print(f"Error checking updates: {e}")
@@ -3439,42 +3421,16 @@ cargo panel forces Elite to write detailed inventory data.
             print(f"Error prompting for refinery contents: {e}")
     
     def read_new_journal_entries(self):
-        """Read new entries from the journal file with retry logic for file locking issues"""
-        max_retries = 3
-        retry_delay = 0.1  # 100ms delay between retries
-        
-        for attempt in range(max_retries):
-            try:
-                with open(self.last_journal_file, 'r', encoding='utf-8') as f:
-                    f.seek(self.last_file_size)  # Start from where we left off
-                    new_lines = f.readlines()
-
-                for line in new_lines:
-                    line = line.strip()
-                    if line:
-                        self.process_journal_event(line)
-
-                # Success - exit retry loop
-                return
-                        
-            except PermissionError as e:
-                # File is locked by another application - retry
-                if attempt < max_retries - 1:
-                    import time
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    print(f"Journal file locked by another application after {max_retries} retries (other apps scanning journals?)")
-            except FileNotFoundError:
-                # Journal file was deleted/rotated - this is normal, find new journal
-                print(f"Journal file not found (rotated to new file): {self.last_journal_file}")
-                self.find_latest_journal()
-                return
-            except Exception as e:
-                print(f"Error reading journal entries: {e}")
-                return
+        """Read new entries from the journal file via the shared journal tail"""
+        try:
+            self.journal_tail.poll()
+        except Exception as e:
+            print(f"Error reading journal entries: {e}")
+            return
+        self.last_journal_file = self.journal_tail.current_file
+        self.last_file_size = self.journal_tail.offset
     
-    def process_journal_event(self, line: str):
+    def process_journal_event(self, line):
         """Process a single journal event.
 
         Dispatches to the main thread when called from the background monitor
@@ -3488,9 +3444,10 @@ cargo panel forces Elite to write detailed inventory data.
             return
         self._process_journal_event_impl(line)
 
-    def _process_journal_event_impl(self, line: str):
+    def _process_journal_event_impl(self, line):
         try:
-            event = json.loads(line)
+            # Events from the journal tail arrive already decoded
+            event = json.loads(line) if isinstance(line, str) else line
             event_type = event.get("event", "")
             
             # Track ship information from LoadGame and Loadout events
@@ -5437,6 +5394,10 @@ class App(tk.Tk, ColumnVisibilityMixin):
         self._load_auto_switch_tabs_preference()
         self.auto_switch_tabs.trace('w', self._on_auto_switch_tabs_toggle)
         
+        # Fill missing ring metadata from EDSM in the background (opt-in)
+        self.edsm_backfill_enabled = tk.IntVar(value=1 if load_edsm_backfill_enabled() else 0)
+        self.edsm_backfill_enabled.trace('w', self._on_edsm_backfill_toggle)
+        
         # Auto-start session on first prospector launch
         self.auto_start_session = tk.IntVar(value=1)  # Default enabled
         self._load_auto_start_preference()
@@ -5550,6 +5511,9 @@ class App(tk.Tk, ColumnVisibilityMixin):
         MarketplaceAPI.EDDN_CACHE_PATH = eddn_cache_path
         from system_finder_api import SystemFinderAPI
         SystemFinderAPI.EDDN_CACHE_PATH = eddn_cache_path
+        from coords_resolver import configure_coords_resolver
+        configure_coords_resolver(user_db=getattr(getattr(self, 'cargo_monitor', None), 'user_db', None),
+                                  eddn_cache_path=eddn_cache_path)
 
         # Wire the EDDN cache path into the live journal parser so every FSDJump the player
         # makes is also written directly to system_powerplay (no EDDN round-trip needed).
@@ -5591,6 +5555,14 @@ class App(tk.Tk, ColumnVisibilityMixin):
         self._set_splash_status("Building interface...")
         self._build_ui()
 
+        # Route tracking and EDDN location state come from the shared journal tail
+        if hasattr(self, 'cargo_monitor'):
+            journal_tail = self.cargo_monitor.journal_tail
+            journal_tail.subscribe(self._on_route_journal_event,
+                                   event_types=('FSDTarget', 'NavRouteClear', 'Docked', 'Touchdown'))
+            journal_tail.subscribe(self.market_handler.process_journal_event,
+                                   event_types=('LoadGame', 'Location', 'FSDJump', 'CarrierJump', 'Docked'))
+
         # Watch for Market.json changes to send to EDDN
         # Must be AFTER _build_ui() so prospector_panel.journal_dir is available
         from file_watcher import get_file_watcher
@@ -8880,6 +8852,17 @@ class App(tk.Tk, ColumnVisibilityMixin):
                  font=self._scaled_font(8, "italic")).grid(row=r, column=0, sticky="w", pady=(0, 12))
         r += 1
 
+        # EDSM ring metadata backfill checkbox
+        tk.Checkbutton(scrollable_frame, text=t('settings.edsm_backfill'), variable=self.edsm_backfill_enabled, 
+                      bg=_gs_bg, fg="#ffffff", selectcolor="#1e1e1e", activebackground="#1e1e1e", 
+                      activeforeground="#ffffff", highlightthickness=0, bd=0, font=self._scaled_font(9), 
+                      padx=4, pady=2, anchor="w", relief="flat", highlightbackground="#1e1e1e", 
+                      highlightcolor="#1e1e1e", takefocus=False).grid(row=r, column=0, sticky="w")
+        r += 1
+        tk.Label(scrollable_frame, text=t('settings.edsm_backfill_desc'), wraplength=760, justify="left", fg="gray", bg=_gs_bg,
+                 font=self._scaled_font(8, "italic")).grid(row=r, column=0, sticky="w", pady=(0, 12))
+        r += 1
+
         # ========== SCREENSHOTS FOLDER SECTION ==========
         ttk.Label(scrollable_frame, text=t('settings.screenshots_folder_title'), font=self._scaled_font(10, "bold")).grid(row=r, column=0, sticky="w", pady=(5, 8))
         r += 1
@@ -13853,6 +13836,18 @@ class App(tk.Tk, ColumnVisibilityMixin):
             if hasattr(self.ring_finder, 'auto_switch_tabs_var'):
                 self.ring_finder.auto_switch_tabs_var.set(enabled)
     
+    def _on_edsm_backfill_toggle(self, *args) -> None:
+        """Called when the EDSM ring metadata backfill checkbox is toggled"""
+        enabled = bool(self.edsm_backfill_enabled.get())
+        save_edsm_backfill_enabled(enabled)
+        self._set_status(f"EDSM ring metadata backfill {'enabled' if enabled else 'disabled'}")
+        
+        if hasattr(self, 'ring_finder') and self.ring_finder:
+            if enabled:
+                self.ring_finder.start_edsm_backfill(force=True)
+            else:
+                self.ring_finder.edsm.stop_background_fill()
+    
     def switch_to_tab(self, tab_name: str) -> None:
         """Switch to a specific tab by name
         
@@ -14058,55 +14053,28 @@ class App(tk.Tk, ColumnVisibilityMixin):
         if file_name == 'market.json' and hasattr(self, 'market_handler'):
             self.market_handler.process_market_file(file_path)
         
-        # Process journal files for LoadGame and location tracking
-        elif file_name.startswith('journal.') and file_name.endswith('.log') and hasattr(self, 'market_handler'):
+        # Journal grew - read it through the shared tail, which dispatches
+        # route and EDDN events to _on_route_journal_event / market_handler
+        elif file_name.startswith('journal.') and file_name.endswith('.log') and hasattr(self, 'cargo_monitor'):
             try:
-                # Read last line of journal to get latest event
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    # Seek to end and read backwards to get last complete line
-                    f.seek(0, 2)  # Go to end
-                    file_size = f.tell()
-                    if file_size > 0:
-                        # Read last 2KB to get recent events
-                        f.seek(max(0, file_size - 2048))
-                        lines = f.readlines()
-                        
-                        # Get the very last event first for immediate response
-                        last_event = None
-                        for line in reversed(lines):
-                            if line.strip():
-                                try:
-                                    last_event = json.loads(line)
-                                    break
-                                except json.JSONDecodeError:
-                                    continue
-                        
-                        # Process the most recent event immediately for route tracking
-                        if last_event:
-                            event_type = last_event.get('event')
-                            log.debug(f"Latest journal event: {event_type}")
-                            if event_type == 'FSDTarget':
-                                jumps_remaining = last_event.get('RemainingJumpsInRoute')
-                                if jumps_remaining is not None:
-                                    self._write_jumps_left(jumps_remaining)
-                                    log.info(f"Route update: {jumps_remaining} jumps remaining")
-                                    print(f"[jumpsleft] Updated to {jumps_remaining}")
-                            elif event_type in ['NavRouteClear', 'Docked', 'Touchdown']:
-                                self._write_jumps_left(0)
-                                log.info(f"Route cleared/completed: {event_type}")
-                                print(f"[jumpsleft] Reset to 0 ({event_type})")
-                        
-                        # Process last few events for EDDN
-                        for line in lines[-10:]:  # Last 10 events
-                            if line.strip():
-                                try:
-                                    event = json.loads(line)
-                                    self.market_handler.process_journal_event(event)
-                                except json.JSONDecodeError:
-                                    pass
+                self.cargo_monitor.journal_tail.poll()
             except Exception as e:
                 log.error(f"Error processing journal for EDDN: {e}")
 
+    def _on_route_journal_event(self, event: dict) -> None:
+        """Update jumpsleft from route-related journal events"""
+        event_type = event.get('event')
+        if event_type == 'FSDTarget':
+            jumps_remaining = event.get('RemainingJumpsInRoute')
+            if jumps_remaining is not None:
+                self._write_jumps_left(jumps_remaining)
+                log.info(f"Route update: {jumps_remaining} jumps remaining")
+                print(f"[jumpsleft] Updated to {jumps_remaining}")
+        elif event_type in ['NavRouteClear', 'Docked', 'Touchdown']:
+            self._write_jumps_left(0)
+            log.info(f"Route cleared/completed: {event_type}")
+            print(f"[jumpsleft] Reset to 0 ({event_type})")
+
     # ---------- Journal folder preference handling ----------
     def _import_journal_history(self):
         """Import journal history from existing journal files"""
@@ -14197,6 +14165,7 @@ class App(tk.Tk, ColumnVisibilityMixin):
             # Update cargo_monitor to keep them synchronized
             if hasattr(self, 'cargo_monitor'):
                 self.cargo_monitor.journal_dir = sel
+                self.cargo_monitor.journal_tail.set_journal_dir(sel)
                 # Update dependent paths in cargo_monitor
                 self.cargo_monitor.cargo_json_path = os.path.join(sel, "Cargo.json")
                 self.cargo_monitor.status_json_path = os.path.join(sel, "Status.json")
@@ -14398,6 +14367,7 @@ class App(tk.Tk, ColumnVisibilityMixin):
                         # Also update cargo_monitor if it exists
                         if hasattr(self, 'cargo_monitor'):
                             self.cargo_monitor.journal_dir = default_dir
+                            self.cargo_monitor.journal_tail.set_journal_dir(default_dir)
                             self.cargo_monitor.cargo_json_path = os.path.join(default_dir, "Cargo.json")
                             self.cargo_monitor.status_json_path = os.path.join(default_dir, "Status.json")
                         
@@ -16278,12 +16248,26 @@ class App(tk.Tk, ColumnVisibilityMixin):
         
         # EDDN listener removed - no longer needed
 
+        # Stop the EDSM ring metadata backfill (it resumes from its last batch next time)
+        if hasattr(self, 'ring_finder') and self.ring_finder:
+            try:
+                self.ring_finder.edsm.stop_background_fill()
+            except Exception:
+                pass
+
         # Flush any config changes still only in the in-memory cache (throttle window)
         try:
             flush_config()
         except Exception:
             pass
 
+        # Write session index edits still waiting for their CSV export
+        if hasattr(self, 'prospector_panel') and self.prospector_panel:
+            try:
+                self.prospector_panel._get_csv_path()
+            except Exception:
+                pass
+
         self.destroy()
 
     def _setup_announcement_tracing(self):
@@ -17124,9 +17108,16 @@ class App(tk.Tk, ColumnVisibilityMixin):
                     userdb_dir = os.path.join(app_data_dir, "data")
                     os.makedirs(userdb_dir, exist_ok=True)
                     target_path = os.path.join(userdb_dir, "user_data.db")
-                    with open(target_path, 'wb') as f:
-                        f.write(zipf.read("data/user_data.db"))
-                    restored_items.append("User Database")
+                    # Retire pooled connections (waits for writes in progress) before overwriting
+                    from db_connections import close_all_connections
+                    if close_all_connections(target_path):
+                        with open(target_path, 'wb') as f:
+                            f.write(zipf.read("data/user_data.db"))
+                        restored_items.append("User Database")
+                    else:
+                        messagebox.showwarning("User Database Busy",
+                                               "The user database is still being written to (journal import or "
+                                               "hotspot save), so it was not restored. Try again once that finishes.")
                 
                 # Restore journal files
                 if restore_journals:
@@ -21944,14 +21935,15 @@ Your keybinds will need to be reconfigured manually."""
                     # Subsequent runs: only scan journal content written since the last
                     # successful scan. The 180-day window is kept purely as a safety net
                     # for when no checkpoint exists yet or the checkpointed file is gone.
-                    checkpoint = self._load_journal_scan_checkpoint()
-                    journals_to_scan, resume_offsets = self._get_new_journals_since_checkpoint(all_journals, checkpoint)
+                    journals_to_scan, resume_offsets = self._get_new_journals_since_checkpoint(all_journals)
+                    checkpoint_all = journals_to_scan is None
                     if journals_to_scan is not None and not self._fc_carrier_data_has_history():
                         # Checkpoint exists but the Fleet Carrier location/jump history
                         # cache is empty (missing/deleted last_carrier_data.json) - the
                         # incremental scan alone would never backfill it, so fall back
                         # to the 180-day scan once to rebuild it from journal content.
                         journals_to_scan = None
+                        checkpoint_all = True
                     if journals_to_scan is None:
                         cutoff_date = datetime.now() - timedelta(days=180)
                         journals_to_scan = self._filter_journals_by_date(all_journals, cutoff_date)
@@ -21965,13 +21957,14 @@ Your keybinds will need to be reconfigured manually."""
 
                 self._process_journals_for_catchup(journals_to_scan, is_full_sync=False, resume_offsets=resume_offsets)
 
-                if all_journals:
-                    newest_file = all_journals[-1]
-                    try:
-                        newest_offset = os.path.getsize(newest_file)
-                        self._save_journal_scan_checkpoint(os.path.basename(newest_file), newest_offset)
-                    except OSError:
-                        pass
+                # Without per-file checkpoints, files older than the 180-day window were
+                # covered by the earlier full scan - checkpoint everything so the next
+                # startup only reads appended bytes
+                try:
+                    self.cargo_monitor.journal_parser.record_journal_checkpoints(
+                        all_journals if checkpoint_all else journals_to_scan)
+                except Exception as e:
+                    print(f"[JOURNAL] Failed to save scan checkpoints: {e}")
 
                 # Historical catch-up is done — from here on, FSDJump/Location events reaching
                 # the live journal watcher are genuinely live (current PP2.0-era session), so it's
@@ -22008,35 +22001,26 @@ Your keybinds will need to be reconfigured manually."""
                         print("[STARTUP] No visits in database - first install")
                         return 'first_install'
                     
-                    # Check if full scan was done for this version using JSON file
+                    # Per-file journal checkpoints in user_data.db record that a full scan ran
+                    if user_db.has_journal_checkpoints():
+                        print("[STARTUP] Journal checkpoints found, no migration needed")
+                        return 'none'
+                    
+                    # Installs that predate journal checkpoints marked the full scan with
+                    # last_full_scan.json - honour it, the catch-up scan then writes checkpoints
                     try:
                         from path_utils import get_app_data_dir
-                        from version import get_version
                         import json
                         
                         scan_status_file = os.path.join(get_app_data_dir(), "last_full_scan.json")
-                        current_version = get_version()
-                        print(f"[STARTUP] Checking scan status file: {scan_status_file}")
-                        
                         if os.path.exists(scan_status_file):
                             with open(scan_status_file, 'r') as f:
-                                scan_data = json.load(f)
-                                last_scan_version = scan_data.get('version', '')
-                                
-                                # Full scan already done for some version - no need to rescan
-                                # The v4.7.2 migration features (CSV imports, hotspot merge) 
-                                # are handled separately in user_database.py with their own tracking.
-                                # Only the first full scan matters, subsequent updates don't need full rescan.
-                                if last_scan_version:
-                                    print(f"[STARTUP] Full scan already done (v{last_scan_version}), no migration needed")
-                                    return 'none'
-                                else:
-                                    print(f"[STARTUP] Empty scan version, needs migration")
-                                    return 'migration'
-                        else:
-                            # No scan status file = needs full scan (update from pre-v4.7.2)
-                            print(f"[STARTUP] No scan status file found, needs migration for v{current_version}")
-                            return 'migration'
+                                last_scan_version = json.load(f).get('version', '')
+                            if last_scan_version:
+                                print(f"[STARTUP] Full scan already done (v{last_scan_version}), no migration needed")
+                                return 'none'
+                        print("[STARTUP] No journal checkpoints found, needs migration")
+                        return 'migration'
                             
                     except Exception as e:
                         print(f"[STARTUP] Scan status check error: {e}")
@@ -22048,38 +22032,11 @@ Your keybinds will need to be reconfigured manually."""
             print(f"[STARTUP] _is_first_install exception: {e}")
         return 'first_install'  # Assume first install if we can't determine
 
-    def _get_journal_scan_state_path(self) -> str:
-        """Path to the incremental journal catch-up checkpoint file"""
-        from path_utils import get_app_data_dir
-        return os.path.join(get_app_data_dir(), "journal_scan_state.json")
-
-    def _load_journal_scan_checkpoint(self) -> dict:
-        """Load the last-processed journal filename/byte-offset checkpoint"""
-        import json
-        path = self._get_journal_scan_state_path()
-        try:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"[JOURNAL] Failed to read scan checkpoint: {e}")
-        return {}
-
-    def _save_journal_scan_checkpoint(self, last_file: str, last_offset: int) -> None:
-        """Persist the newest journal filename and its byte size after a scan"""
-        import json
-        path = self._get_journal_scan_state_path()
-        try:
-            with open(path, 'w') as f:
-                json.dump({"last_file": last_file, "last_offset": last_offset}, f)
-        except Exception as e:
-            print(f"[JOURNAL] Failed to save scan checkpoint: {e}")
-
     def _fc_carrier_data_has_history(self) -> bool:
         """Whether the persisted Fleet Carrier cache already has a location or jump history.
 
-        Used to detect a desync between journal_scan_state.json (incremental scan
-        checkpoint) and last_carrier_data.json (FC cache) - e.g. the FC cache was
+        Used to detect a desync between the journal checkpoints in user_data.db
+        (incremental scan) and last_carrier_data.json (FC cache) - e.g. the FC cache was
         deleted/never written even though a scan checkpoint already exists.
         """
         try:
@@ -22090,38 +22047,20 @@ Your keybinds will need to be reconfigured manually."""
             return True
         return bool(cd.get('system') or cd.get('jump_history'))
 
-    def _get_new_journals_since_checkpoint(self, all_journals: list, checkpoint: dict):
-        """Return (journals_to_scan, resume_offsets) for files newer than the checkpoint.
+    def _get_new_journals_since_checkpoint(self, all_journals: list):
+        """Return (journals_to_scan, resume_offsets) for journal content not yet ingested.
 
-        Returns (None, {}) if the checkpoint is missing or its file is no longer
-        on disk, signaling the caller to fall back to the 180-day safety net scan.
+        Uses the per-file checkpoints in user_data.db, so only appended bytes and
+        new files are read. Returns (None, {}) if no checkpoints exist yet,
+        signaling the caller to fall back to the 180-day safety net scan.
         """
-        last_file = checkpoint.get('last_file')
-        if not last_file:
-            return None, {}
-
-        last_path = None
-        for p in all_journals:
-            if os.path.basename(p) == last_file:
-                last_path = p
-                break
-        if last_path is None:
+        parser = self.cargo_monitor.journal_parser
+        if not parser or not parser.user_db.has_journal_checkpoints():
             return None, {}
 
-        idx = all_journals.index(last_path)
-        last_offset = checkpoint.get('last_offset', 0)
-        resume_offsets = {}
-        journals_to_scan = []
-
-        try:
-            current_size = os.path.getsize(last_path)
-        except OSError:
-            current_size = 0
-        if current_size > last_offset:
-            journals_to_scan.append(last_path)
-            resume_offsets[last_path] = last_offset
-
-        journals_to_scan.extend(all_journals[idx + 1:])
+        scan_plan = parser.plan_incremental_scan(all_journals)
+        journals_to_scan = [path for path, _, _ in scan_plan]
+        resume_offsets = {path: offset for path, offset, _ in scan_plan if offset}
         return journals_to_scan, resume_offsets
 
     def _run_full_scan_with_dialog(self, journals, scan_type='first_install'):
@@ -22318,8 +22257,8 @@ Your keybinds will need to be reconfigured manually."""
             is_migration: If True, RESET visit counts before scanning (fixes wrong counts)
             progress_callback: Optional callback(current, message) for progress
         """
-        import json
         from localization import t
+        from journal_parser import BACKFILL_EVENTS
         import sqlite3
         
         visits_added = 0
@@ -22360,132 +22299,128 @@ Your keybinds will need to be reconfigured manually."""
         except:
             pass
         
+        parser = self.cargo_monitor.journal_parser
+        event_types = BACKFILL_EVENTS | {'MissionAccepted', 'MissionCompleted', 'MissionAbandoned', 'CargoDepot'}
+        scan_plan = [(journal_path, 0, None) for journal_path in journals]
         total = len(journals)
-        for idx, journal_path in enumerate(journals):
-            # Update progress with localized message
-            if progress_callback and idx % 10 == 0:
-                msg = t('dialogs.processing_journal', current=idx + 1, total=total)
-                progress_callback(idx, msg)
+        files_done = 0
+        current_system = None
+        
+        # Journals are decoded and filtered in worker processes; this thread applies
+        # the surviving events in timestamp order so visit counting stays correct
+        for file_results, events in parser.iter_backfill_windows(scan_plan, event_types):
+            if progress_callback:
+                msg = t('dialogs.processing_journal', current=files_done + 1, total=total)
+                progress_callback(files_done, msg)
+            files_done += len(file_results)
+            
+            for event in events:
+                try:
+                    event_type = event.get('event', '')
             
-            try:
-                with open(journal_path, 'r', encoding='utf-8') as f:
-                    current_system = None
+                    # Process visits - ONLY FSDJump counts as a player visit
+                    # CarrierJump is for FC location tracking, not visit counting
+                    if event_type == 'FSDJump':
+                        system_name = event.get('StarSystem', '')
+                        if system_name:
+                            timestamp = event.get('timestamp', '')
+                            system_address = event.get('SystemAddress')
+                            star_pos = event.get('StarPos', [])
+                            coordinates = tuple(star_pos) if len(star_pos) >= 3 else None
                     
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
+                            # Use single source of truth for visit recording
+                            if self.record_system_visit(system_name, timestamp, coordinates, system_address):
+                                visits_added += 1
+                            current_system = system_name
+            
+                    elif event_type == 'CarrierJump':
+                        # CarrierJump just tracks current system context, not visits
+                        system_name = event.get('StarSystem', '')
+                        if system_name:
+                            current_system = system_name
                         try:
-                            event = json.loads(line)
-                            event_type = event.get('event', '')
-                            
-                            # Process visits - ONLY FSDJump counts as a player visit
-                            # CarrierJump is for FC location tracking, not visit counting
-                            if event_type == 'FSDJump':
-                                system_name = event.get('StarSystem', '')
-                                if system_name:
-                                    timestamp = event.get('timestamp', '')
-                                    system_address = event.get('SystemAddress')
-                                    star_pos = event.get('StarPos', [])
-                                    coordinates = tuple(star_pos) if len(star_pos) >= 3 else None
-                                    
-                                    # Use single source of truth for visit recording
-                                    if self.record_system_visit(system_name, timestamp, coordinates, system_address):
-                                        visits_added += 1
-                                    current_system = system_name
-                            
-                            elif event_type == 'CarrierJump':
-                                # CarrierJump just tracks current system context, not visits
-                                system_name = event.get('StarSystem', '')
-                                if system_name:
-                                    current_system = system_name
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_jump_completed(event)
-                                except Exception:
-                                    pass
+                            self.cargo_monitor.journal_parser.process_carrier_jump_completed(event)
+                        except Exception:
+                            pass
 
-                            elif event_type == 'Location':
-                                system_name = event.get('StarSystem', '')
-                                if system_name:
-                                    current_system = system_name
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_docked_via_location(event)
-                                except Exception:
-                                    pass
+                    elif event_type == 'Location':
+                        system_name = event.get('StarSystem', '')
+                        if system_name:
+                            current_system = system_name
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_docked_via_location(event)
+                        except Exception:
+                            pass
 
-                            elif event_type == 'Docked':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_docked(event)
-                                except Exception:
-                                    pass
+                    elif event_type == 'Docked':
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_docked(event)
+                        except Exception:
+                            pass
+
+                    # Fleet carrier events - populate carrier_data
+                    elif event_type == 'CarrierLocation':
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_location(event)
+                        except Exception:
+                            pass
+                    elif event_type == 'CarrierStats':
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_stats(event)
+                        except Exception:
+                            pass
+                    elif event_type == 'CarrierFinance':
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_finance(event)
+                        except Exception:
+                            pass
+                    elif event_type == 'CarrierJumpRequest':
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_jump_request(event)
+                        except Exception:
+                            pass
+                    elif event_type == 'CarrierJumpCancelled':
+                        try:
+                            self.cargo_monitor.journal_parser.process_carrier_jump_cancelled(event)
+                        except Exception:
+                            pass
+            
+                    elif event_type == 'Scan':
+                        try:
+                            self.cargo_monitor.journal_parser.process_scan(event)
+                            hotspots_added += 1
+                        except:
+                            pass
+            
+                    elif event_type == 'SAASignalsFound':
+                        try:
+                            self.cargo_monitor.journal_parser.process_saa_signals_found(event, current_system)
+                            hotspots_added += 1
+                        except:
+                            pass
+            
+                    elif event_type == 'MissionAccepted':
+                        try:
+                            from mining_missions import get_mission_tracker, MISSIONS_AVAILABLE
+                            if MISSIONS_AVAILABLE:
+                                tracker = get_mission_tracker()
+                                if tracker and tracker.process_event(event):
+                                    missions_found += 1
+                        except:
+                            pass
+            
+                    elif event_type in ['MissionCompleted', 'MissionAbandoned', 'CargoDepot']:
+                        try:
+                            from mining_missions import get_mission_tracker, MISSIONS_AVAILABLE
+                            if MISSIONS_AVAILABLE:
+                                tracker = get_mission_tracker()
+                                if tracker:
+                                    tracker.process_event(event)
+                        except:
+                            pass
+                except Exception:
+                    continue
 
-                            # Fleet carrier events - populate carrier_data
-                            elif event_type == 'CarrierLocation':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_location(event)
-                                except Exception:
-                                    pass
-                            elif event_type == 'CarrierStats':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_stats(event)
-                                except Exception:
-                                    pass
-                            elif event_type == 'CarrierFinance':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_finance(event)
-                                except Exception:
-                                    pass
-                            elif event_type == 'CarrierJumpRequest':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_jump_request(event)
-                                except Exception:
-                                    pass
-                            elif event_type == 'CarrierJumpCancelled':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_carrier_jump_cancelled(event)
-                                except Exception:
-                                    pass
-                            
-                            elif event_type == 'Scan':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_scan(event)
-                                    hotspots_added += 1
-                                except:
-                                    pass
-                            
-                            elif event_type == 'SAASignalsFound':
-                                try:
-                                    self.cargo_monitor.journal_parser.process_saa_signals_found(event, current_system)
-                                    hotspots_added += 1
-                                except:
-                                    pass
-                            
-                            elif event_type == 'MissionAccepted':
-                                try:
-                                    from mining_missions import get_mission_tracker, MISSIONS_AVAILABLE
-                                    if MISSIONS_AVAILABLE:
-                                        tracker = get_mission_tracker()
-                                        if tracker and tracker.process_event(event):
-                                            missions_found += 1
-                                except:
-                                    pass
-                            
-                            elif event_type in ['MissionCompleted', 'MissionAbandoned', 'CargoDepot']:
-                                try:
-                                    from mining_missions import get_mission_tracker, MISSIONS_AVAILABLE
-                                    if MISSIONS_AVAILABLE:
-                                        tracker = get_mission_tracker()
-                                        if tracker:
-                                            tracker.process_event(event)
-                                except:
-                                    pass
-                                    
-                        except json.JSONDecodeError:
-                            continue
-            except Exception:
-                continue
-        
         # End batch mode
         if mission_tracker:
             try:
@@ -22521,30 +22456,12 @@ Your keybinds will need to be reconfigured manually."""
                 pass
         self.after(0, _sync_fc_location)
         
-        # Mark full scan as complete using JSON file
+        # Mark full scan as complete by checkpointing every scanned journal
         try:
-            from path_utils import get_app_data_dir
-            from version import get_version
-            from datetime import datetime
-            import json
-            
-            app_dir = get_app_data_dir()
-            scan_status_file = os.path.join(app_dir, "last_full_scan.json")
-            
-            scan_data = {
-                "version": get_version(),
-                "scan_date": datetime.now().isoformat(),
-                "journals_scanned": total,
-                "visits_added": visits_added,
-                "hotspots_added": hotspots_added
-            }
-            
-            with open(scan_status_file, 'w') as f:
-                json.dump(scan_data, f, indent=2)
-            
-            print(f"[FIRST INSTALL] Full scan status saved: {scan_status_file}")
+            saved = self.cargo_monitor.journal_parser.record_journal_checkpoints(journals)
+            print(f"[FIRST INSTALL] Saved {saved} journal checkpoints")
         except Exception as e:
-            print(f"[FIRST INSTALL] Failed to save scan status: {e}")
+            print(f"[FIRST INSTALL] Failed to save journal checkpoints: {e}")
         
         # Update UI components
         if hasattr(self, 'ring_finder') and self.ring_finder:
@@ -23130,6 +23047,11 @@ Your keybinds will need to be reconfigured manually."""
 
 
 if __name__ == "__main__":
+    # Journal backfill decodes in a process pool - frozen builds must not
+    # re-run the app when a worker process starts
+    import multiprocessing
+    multiprocessing.freeze_support()
+    
     # Single instance check - TEMPORARILY DISABLED FOR TESTING
     # import win32event
     # import win32api
@@ -0,0 +1,207 @@
+"""
+Market Response Cache for EliteMining
+Two-tier (memory LRU + SQLite) cache of per-source marketplace search results,
+so re-sorting, flipping a filter or switching the buyers/sellers tab doesn't
+repeat every remote request
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+log = logging.getLogger("EliteMining.MarketCache")
+
+# Seconds a source's results count as fresh. EDDN is a local database that the
+# listener updates continuously, so it goes stale quickly; the remote APIs are
+# only refreshed by their own ingest every few minutes.
+SOURCE_TTLS = {
+    'ardent': 300,
+    'ardent_local': 300,
+    'spansh': 300,
+    'spansh_carriers': 300,
+    'eddn': 30,
+}
+DEFAULT_TTL = 300
+
+# How long past its TTL an entry may still be served while a refresh runs
+STALE_WINDOW = 3600
+
+MEMORY_ENTRIES = 128
+
+
+class MarketResponseCache:
+    """Per-source result cache with stale-while-revalidate
+
+    Lookups check the in-memory LRU first, then the SQLite table. A fresh entry
+    is returned as is; a stale one (within STALE_WINDOW past its TTL) is returned
+    immediately while a background thread fetches a replacement. Empty results
+    are never cached - the fetchers return [] on errors too.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = MEMORY_ENTRIES):
+        """Initialize the cache
+
+        Args:
+            db_path: SQLite file for the persistent tier (None = memory only)
+            max_entries: Entries kept in the memory tier
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[float, List[Dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        if db_path:
+            self._init_database()
+
+    def _init_database(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS market_response_cache (
+                        source TEXT NOT NULL,
+                        cache_key TEXT NOT NULL,
+                        fetched_at REAL NOT NULL,
+                        payload TEXT NOT NULL,
+                        PRIMARY KEY (source, cache_key)
+                    )
+                ''')
+                # Entries past any TTL plus the stale window can never be served again
+                oldest = time.time() - max(SOURCE_TTLS.values()) - STALE_WINDOW
+                conn.execute('DELETE FROM market_response_cache WHERE fetched_at < ?', (oldest,))
+        except sqlite3.Error as e:
+            log.warning(f"Market response cache disabled on disk: {e}")
+            self.db_path = None
+
+    @staticmethod
+    def _key(parts: Tuple[Hashable, ...]) -> str:
+        return json.dumps(parts, separators=(',', ':'))
+
+    def _count(self, source: str, counter: str) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(source, {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0})
+            stats[counter] += 1
+
+    def _load(self, source: str, cache_key: str) -> Optional[Tuple[float, List[Dict]]]:
+        """Entry from memory, falling back to (and promoting from) the SQLite tier"""
+        with self._lock:
+            entry = self._memory.get((source, cache_key))
+            if entry is not None:
+                self._memory.move_to_end((source, cache_key))
+                return entry
+        if not self.db_path:
+            return None
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    'SELECT fetched_at, payload FROM market_response_cache WHERE source = ? AND cache_key = ?',
+                    (source, cache_key)).fetchone()
+        except sqlite3.Error as e:
+            log.debug(f"Market response cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        entry = (row[0], json.loads(row[1]))
+        self._remember(source, cache_key, entry)
+        return entry
+
+    def _remember(self, source: str, cache_key: str, entry: Tuple[float, List[Dict]]) -> None:
+        with self._lock:
+            self._memory[(source, cache_key)] = entry
+            self._memory.move_to_end((source, cache_key))
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _store(self, source: str, cache_key: str, rows: List[Dict]) -> None:
+        entry = (time.time(), [dict(row) for row in rows])
+        self._remember(source, cache_key, entry)
+        if not self.db_path:
+            return
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO market_response_cache (source, cache_key, fetched_at, payload)
+                    VALUES (?, ?, ?, ?)
+                ''', (source, cache_key, entry[0], json.dumps(entry[1])))
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            log.debug(f"Market response cache write failed: {e}")
+
+    def _refresh(self, source: str, cache_key: str, fetch: Callable[[], List[Dict]]) -> None:
+        try:
+            rows = fetch()
+            if rows:
+                self._store(source, cache_key, rows)
+        except Exception as e:
+            log.debug(f"Background refresh of {source} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard((source, cache_key))
+
+    def get_or_fetch(self, source: str, key_parts: Tuple[Hashable, ...],
+                     fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """Cached results for one source's query, fetching them if needed
+
+        Args:
+            source: Source name (selects the TTL, e.g. 'ardent', 'eddn')
+            key_parts: Query identity, e.g. (commodity, reference system, mode,
+                       max_days_ago, exclude_carriers)
+            fetch: Returns fresh rows for the query
+
+        Returns:
+            A copy of the rows - callers may modify them freely
+        """
+        cache_key = self._key(key_parts)
+        ttl = SOURCE_TTLS.get(source, DEFAULT_TTL)
+        entry = self._load(source, cache_key)
+        if entry is not None:
+            age = time.time() - entry[0]
+            if age < ttl:
+                self._count(source, 'hits')
+                return [dict(row) for row in entry[1]]
+            if age < ttl + STALE_WINDOW:
+                self._count(source, 'stale_hits')
+                with self._lock:
+                    start_refresh = (source, cache_key) not in self._refreshing
+                    if start_refresh:
+                        self._refreshing.add((source, cache_key))
+                if start_refresh:
+                    self._count(source, 'refreshes')
+                    threading.Thread(target=self._refresh, args=(source, cache_key, fetch), daemon=True).start()
+                return [dict(row) for row in entry[1]]
+
+        self._count(source, 'misses')
+        rows = fetch()
+        if rows:
+            self._store(source, cache_key, rows)
+        return rows
+
+    def clear(self) -> None:
+        """Drop every cached response from both tiers"""
+        with self._lock:
+            self._memory.clear()
+        if self.db_path:
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute('DELETE FROM market_response_cache')
+            except sqlite3.Error as e:
+                log.debug(f"Market response cache clear failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-source counters and hit rates
+
+        Returns:
+            Dictionary of source -> hits, stale_hits, misses, refreshes and hit_rate,
+            plus memory_entries
+        """
+        with self._lock:
+            stats: Dict[str, Any] = {}
+            for source, counts in self._stats.items():
+                lookups = counts['hits'] + counts['stale_hits'] + counts['misses']
+                stats[source] = dict(counts, hit_rate=round((counts['hits'] + counts['stale_hits']) / lookups, 3)
+                                     if lookups else 0.0)
+            stats['memory_entries'] = len(self._memory)
+            return stats
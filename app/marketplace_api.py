@@ -4,12 +4,19 @@ Marketplace API for commodity price lookups using Ardent Insight + Spansh APIs.
 All sources are queried in parallel. Results are merged by marketId, keeping the
 record with the newer updatedAt timestamp so the freshest price always wins.
 """
+import os
 import requests
 import functools
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+from geometry import batch_distances
+from market_cache import MarketResponseCache
+from coords_resolver import get_coords_resolver
+from http_client import http_get, http_post
 
-_system_coords_cache: Dict[str, object] = {}  # module-level coord cache
+_response_cache: Optional[MarketResponseCache] = None
+_response_cache_lock = threading.Lock()
 
 
 class MarketplaceAPI:
@@ -21,6 +28,24 @@ class MarketplaceAPI:
     # Set by main.py on boot when EDDN listener is started
     EDDN_CACHE_PATH = None
 
+    @staticmethod
+    def get_response_cache() -> MarketResponseCache:
+        """Shared per-source search result cache, stored next to the EDDN cache when known"""
+        global _response_cache
+        with _response_cache_lock:
+            if _response_cache is None:
+                db_path = None
+                if MarketplaceAPI.EDDN_CACHE_PATH:
+                    db_path = os.path.join(os.path.dirname(MarketplaceAPI.EDDN_CACHE_PATH),
+                                           "market_response_cache.db")
+                _response_cache = MarketResponseCache(db_path)
+            return _response_cache
+
+    @staticmethod
+    def _cached(source: str, key: tuple, fetch: Callable[..., List[Dict]], *args) -> List[Dict]:
+        """Run fetch(*args) through the response cache"""
+        return MarketplaceAPI.get_response_cache().get_or_fetch(source, key, lambda: fetch(*args))
+
     # Keep BASE_URL for any legacy callers
     PRIMARY_URL  = ARDENT_URL
     FALLBACK_URL = ARDENT_URL
@@ -111,7 +136,7 @@ class MarketplaceAPI:
                     }
                     if reference_system and max_distance:
                         body["reference_system"] = reference_system
-                    resp = requests.post(
+                    resp = http_post(
                         f"{MarketplaceAPI.SPANSH_URL}/api/stations/search",
                         json=body, timeout=15)
                     resp.raise_for_status()
@@ -266,7 +291,7 @@ class MarketplaceAPI:
                         "size": 100,
                         "page": page_num,
                     }
-                    resp = requests.post(
+                    resp = http_post(
                         f"{MarketplaceAPI.SPANSH_URL}/api/stations/search",
                         json=body, timeout=15)
                     resp.raise_for_status()
@@ -380,7 +405,7 @@ class MarketplaceAPI:
             return []
 
         try:
-            import sqlite3, math, os
+            import sqlite3, os
             from datetime import datetime, timedelta, timezone
 
             if not os.path.exists(MarketplaceAPI.EDDN_CACHE_PATH):
@@ -401,71 +426,76 @@ class MarketplaceAPI:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
 
-                # Query commodity data, LEFT JOIN station_metadata to fill in missing
-                # station types (commodity messages don't carry stationType).
-                cursor.execute('''
-                    SELECT c.system_name, c.system_x, c.system_y, c.system_z,
-                           c.station_name, c.commodity_name,
-                           c.sell_price, c.buy_price, c.demand, c.stock,
-                           c.market_id, c.updated_at,
-                           COALESCE(NULLIF(c.station_type, 'Unknown'), m.station_type, 'Unknown') AS station_type,
-                           COALESCE(c.distance_to_arrival, m.distance_to_arrival)             AS distance_to_arrival,
-                           COALESCE(m.max_landing_pad_size, 0)                                AS meta_pad_size
-                    FROM commodity_prices_data c
-                    LEFT JOIN station_metadata m ON c.market_id = m.market_id
-                    WHERE (LOWER(c.commodity_name) = LOWER(?) OR LOWER(c.commodity_name) = LOWER(?))
-                      AND c.updated_at > ?
-                ''', (commodity_normalized, spansh_name, cutoff))
+                # Station type, pad size and distance to arrival are denormalized by the
+                # EDDN listener (commodity messages don't carry stationType).
+                columns = '''
+                    c.system_name, c.system_x, c.system_y, c.system_z,
+                    c.station_name,
+                    c.sell_price, c.buy_price, c.demand, c.stock,
+                    c.market_id, c.updated_at,
+                    COALESCE(c.station_type, 'Unknown')  AS station_type,
+                    c.distance_to_arrival                AS distance_to_arrival,
+                    COALESCE(c.max_landing_pad_size, 0)  AS meta_pad_size
+                '''
+                commodity_filter = '''
+                    c.commodity_id IN (SELECT id FROM commodities WHERE name IN (?, ?))
+                    AND c.updated_at > ?
+                '''
+                params = (commodity_normalized.lower(), spansh_name.lower(), cutoff)
+
+                cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'market_spatial'")
+                if ref_coords and max_distance and cursor.fetchone():
+                    # Markets inside the search box from the R-Tree, then their price rows
+                    # for this commodity via idx_market_id. Exact distance is checked below.
+                    cursor.execute(f'''
+                        SELECT {columns}
+                        FROM market_spatial s
+                        CROSS JOIN commodity_prices_data c ON c.market_id = s.id
+                        WHERE s.x_min <= ? AND s.x_max >= ?
+                          AND s.y_min <= ? AND s.y_max >= ?
+                          AND s.z_min <= ? AND s.z_max >= ?
+                          AND {commodity_filter}
+                    ''', (rx + max_distance, rx - max_distance,
+                          ry + max_distance, ry - max_distance,
+                          rz + max_distance, rz - max_distance) + params)
+                else:
+                    # Index-only range scan on idx_prices_commodity_time
+                    cursor.execute(f'''
+                        SELECT {columns}
+                        FROM commodity_prices_data c
+                        WHERE {commodity_filter}
+                    ''', params)
 
                 rows = cursor.fetchall()
 
-            # Batch-resolve coordinates for all systems missing them, chunked to stay
-            # under SQLite's max-variable limit (can be as low as 999 on some builds).
+            # Batch-resolve coordinates for systems still missing them (the listener resolves
+            # most at ingest) from the user DB, galaxy DB and system_coords
             coords_cache = {}
             missing_systems = [row["system_name"] for row in rows
                                if row["system_x"] is None and row["system_name"]]
             if missing_systems:
-                _CHUNK = 500
                 try:
-                    from local_database import LocalSystemsDatabase
-                    galaxy_db = LocalSystemsDatabase()
-                    if galaxy_db.is_database_available():
-                        import sqlite3 as _sqlite3
-                        with _sqlite3.connect(str(galaxy_db.db_path)) as _gconn:
-                            _gconn.row_factory = _sqlite3.Row
-                            _gcur = _gconn.cursor()
-                            unique_missing = list(set(missing_systems))
-                            for i in range(0, len(unique_missing), _CHUNK):
-                                chunk = unique_missing[i:i + _CHUNK]
-                                placeholders = ",".join("?" for _ in chunk)
-                                _gcur.execute(
-                                    f"SELECT name, x, y, z FROM systems WHERE name IN ({placeholders})",
-                                    chunk
-                                )
-                                for gr in _gcur.fetchall():
-                                    coords_cache[gr["name"]] = (gr["x"], gr["y"], gr["z"])
+                    coords_cache = get_coords_resolver().resolve_many(missing_systems, remote=False)
                 except Exception as _ce:
                     print(f"[EDDN CACHE] Batch coord lookup failed: {_ce}")
 
-            normalized: List[Dict] = []
+            # Fill in resolved coords, then measure every row in one batch
+            row_coords = []
             for row in rows:
-                sx = row["system_x"]
-                sy = row["system_y"]
-                sz = row["system_z"]
-
-                # Resolve missing coords from galaxy DB
-                if sx is None and row["system_name"] in coords_cache:
-                    sx, sy, sz = coords_cache[row["system_name"]]
+                if row["system_x"] is None and row["system_name"] in coords_cache:
+                    row_coords.append(coords_cache[row["system_name"]])
+                else:
+                    row_coords.append((row["system_x"], row["system_y"], row["system_z"]))
+            row_dists = batch_distances((rx, ry, rz), row_coords) if ref_coords else [None] * len(rows)
 
+            normalized: List[Dict] = []
+            for row, (sx, sy, sz), dist in zip(rows, row_coords, row_dists):
                 # Distance filter
-                if ref_coords and sx is not None and sy is not None and sz is not None:
-                    dist = math.sqrt((sx - rx) ** 2 + (sy - ry) ** 2 + (sz - rz) ** 2)
+                if dist is not None:
                     if max_distance and dist > max_distance:
                         continue
                 elif max_distance and ref_coords:
                     continue  # No coords even after lookup, skip
-                else:
-                    dist = None
 
                 stype = row["station_type"] or "Unknown"
                 # Detect carriers by market_id range (3.7 billion+)
@@ -554,41 +584,13 @@ class MarketplaceAPI:
             print(f"[EDDN CACHE] Error: {e}")
             return []
 
-    @staticmethod
     @staticmethod
     def _get_system_coords(system_name: str):
         """Return (x, y, z) for system_name, or None on failure. Results are cached."""
-        return MarketplaceAPI._get_system_coords_cached(system_name)
-
-    @staticmethod
-    def _get_system_coords_cached(system_name: str):  # type: ignore[override]
-        """Cached implementation — avoid repeated DB opens for the same system."""
-        if system_name in _system_coords_cache:
-            return _system_coords_cache[system_name]
-        result = None
         try:
-            from local_database import LocalSystemsDatabase
-            db = LocalSystemsDatabase()
-            if db.is_database_available():
-                c = db.get_system_coordinates(system_name)
-                if c:
-                    result = c['x'], c['y'], c['z']
+            return get_coords_resolver().resolve(system_name)
         except Exception:
-            pass
-        if result is None:
-            try:
-                import urllib.parse
-                url = "https://www.edsm.net/api-v1/system?systemName={}&showCoordinates=1".format(
-                    urllib.parse.quote(system_name))
-                r = requests.get(url, timeout=15, headers={"User-Agent": "EliteMining/5.1.3"})
-                r.raise_for_status()
-                coords = r.json().get('coords', {})
-                if coords:
-                    result = coords['x'], coords['y'], coords['z']
-            except Exception:
-                pass
-        _system_coords_cache[system_name] = result
-        return result
+            return None
 
     @staticmethod
     def _fetch_spansh_nearby(
@@ -627,7 +629,7 @@ class MarketplaceAPI:
                         "size": 100,
                         "page": page_num,
                     }
-                    resp = requests.post(
+                    resp = http_post(
                         f"{MarketplaceAPI.SPANSH_URL}/api/stations/search",
                         json=body, timeout=15)
                     resp.raise_for_status()
@@ -753,7 +755,7 @@ class MarketplaceAPI:
     @staticmethod
     def _make_api_request(url: str, params: dict, timeout: int = 10) -> requests.Response:
         """Single GET request (kept for compatibility). Raises on failure."""
-        response = requests.get(url, params=params, timeout=timeout)
+        response = http_get(url, params=params, timeout=timeout)
         response.raise_for_status()
         return response
 
@@ -764,7 +766,7 @@ class MarketplaceAPI:
         """
         try:
             url = f"{MarketplaceAPI.ARDENT_URL}{path}"
-            r = requests.get(url, params=params, timeout=timeout)
+            r = http_get(url, params=params, timeout=timeout)
             r.raise_for_status()
             data = r.json()
             if isinstance(data, list):
@@ -906,21 +908,25 @@ class MarketplaceAPI:
 
             print(f"[BUYERS] nearby path: {nearby_path} params: {nearby_params}")
 
+            # Same search within each source's TTL (re-sort, filter flip, tab switch) is served from cache
+            cache_key = (commodity_normalized, reference_system, "buyers", max_days_ago, exclude_carriers)
+
             # Run Ardent, Spansh stations, Spansh carriers, and EDDN cache in parallel
             with ThreadPoolExecutor(max_workers=4) as _pool:
-                _fut_both   = _pool.submit(MarketplaceAPI._fetch_ardent, nearby_path, nearby_params)
+                _fut_both   = _pool.submit(MarketplaceAPI._cached, 'ardent', cache_key,
+                                           MarketplaceAPI._fetch_ardent, nearby_path, nearby_params)
                 _fut_spansh = _pool.submit(
-                    MarketplaceAPI._fetch_spansh_nearby,
+                    MarketplaceAPI._cached, 'spansh', cache_key, MarketplaceAPI._fetch_spansh_nearby,
                     commodity_normalized, reference_system, "buying_commodities",
                     500, max_days_ago, exclude_carriers, 500
                 )
                 _fut_carriers = _pool.submit(
-                    MarketplaceAPI._fetch_spansh_carriers,
+                    MarketplaceAPI._cached, 'spansh_carriers', cache_key, MarketplaceAPI._fetch_spansh_carriers,
                     commodity_normalized, reference_system, "buying_commodities",
                     500, max_days_ago, exclude_carriers
                 )
                 _fut_eddn = _pool.submit(
-                    MarketplaceAPI._fetch_eddn_cache,
+                    MarketplaceAPI._cached, 'eddn', cache_key, MarketplaceAPI._fetch_eddn_cache,
                     commodity_normalized, reference_system, "buying_commodities",
                     500, max_days_ago, exclude_carriers
                 )
@@ -935,7 +941,8 @@ class MarketplaceAPI:
             local_params = {"minVolume": 1, "maxDaysAgo": max_days_ago}
 
             print(f"[BUYERS] local path: {local_path}")
-            local_rows_raw = MarketplaceAPI._fetch_ardent(local_path, local_params)
+            local_rows_raw = MarketplaceAPI._cached('ardent_local', cache_key, MarketplaceAPI._fetch_ardent,
+                                                    local_path, local_params)
             local_rows = [r for r in local_rows_raw if r.get("commodityName", "").lower() == commodity_normalized]
             for r in local_rows:
                 r["distance"] = 0
@@ -987,21 +994,24 @@ class MarketplaceAPI:
 
             print(f"[SELLERS] nearby path: {nearby_path} params: {nearby_params}")
 
+            cache_key = (commodity_normalized, reference_system, "sellers", max_days_ago, exclude_carriers)
+
             # Run Ardent, Spansh stations, Spansh carriers, and EDDN cache in parallel
             with ThreadPoolExecutor(max_workers=4) as _pool:
-                _fut_both   = _pool.submit(MarketplaceAPI._fetch_ardent, nearby_path, nearby_params)
+                _fut_both   = _pool.submit(MarketplaceAPI._cached, 'ardent', cache_key,
+                                           MarketplaceAPI._fetch_ardent, nearby_path, nearby_params)
                 _fut_spansh = _pool.submit(
-                    MarketplaceAPI._fetch_spansh_nearby,
+                    MarketplaceAPI._cached, 'spansh', cache_key, MarketplaceAPI._fetch_spansh_nearby,
                     commodity_normalized, reference_system, "selling_commodities",
                     500, max_days_ago, exclude_carriers, 500
                 )
                 _fut_carriers = _pool.submit(
-                    MarketplaceAPI._fetch_spansh_carriers,
+                    MarketplaceAPI._cached, 'spansh_carriers', cache_key, MarketplaceAPI._fetch_spansh_carriers,
                     commodity_normalized, reference_system, "selling_commodities",
                     500, max_days_ago, exclude_carriers
                 )
                 _fut_eddn = _pool.submit(
-                    MarketplaceAPI._fetch_eddn_cache,
+                    MarketplaceAPI._cached, 'eddn', cache_key, MarketplaceAPI._fetch_eddn_cache,
                     commodity_normalized, reference_system, "selling_commodities",
                     500, max_days_ago, exclude_carriers
                 )
@@ -1016,7 +1026,8 @@ class MarketplaceAPI:
             local_params = {"minVolume": 1, "maxDaysAgo": max_days_ago}
 
             print(f"[SELLERS] local path: {local_path}")
-            local_rows_raw = MarketplaceAPI._fetch_ardent(local_path, local_params)
+            local_rows_raw = MarketplaceAPI._cached('ardent_local', cache_key, MarketplaceAPI._fetch_ardent,
+                                                    local_path, local_params)
             local_rows = [r for r in local_rows_raw if r.get("commodityName", "").lower() == commodity_normalized]
             for r in local_rows:
                 r["distance"] = 0
@@ -1060,20 +1071,23 @@ class MarketplaceAPI:
 
             print(f"[GALAXY BUYERS] path: {path} params: {params}")
 
+            cache_key = (commodity_normalized, None, "galaxy_buyers", max_days_ago, exclude_carriers)
+
             with ThreadPoolExecutor(max_workers=4) as _pool:
-                _fut_both   = _pool.submit(MarketplaceAPI._fetch_ardent, path, params)
+                _fut_both   = _pool.submit(MarketplaceAPI._cached, 'ardent', cache_key,
+                                           MarketplaceAPI._fetch_ardent, path, params)
                 _fut_spansh = _pool.submit(
-                    MarketplaceAPI._fetch_spansh,
+                    MarketplaceAPI._cached, 'spansh', cache_key, MarketplaceAPI._fetch_spansh,
                     commodity_normalized, "Sol", "buying_commodities",
                     0, max_days_ago, exclude_carriers, 1000
                 )
                 _fut_carriers = _pool.submit(
-                    MarketplaceAPI._fetch_spansh_carriers,
+                    MarketplaceAPI._cached, 'spansh_carriers', cache_key, MarketplaceAPI._fetch_spansh_carriers,
                     commodity_normalized, None, "buying_commodities",
                     0, max_days_ago, exclude_carriers
                 )
                 _fut_eddn = _pool.submit(
-                    MarketplaceAPI._fetch_eddn_cache,
+                    MarketplaceAPI._cached, 'eddn', cache_key, MarketplaceAPI._fetch_eddn_cache,
                     commodity_normalized, None, "buying_commodities",
                     0, max_days_ago, exclude_carriers
                 )
@@ -1117,20 +1131,23 @@ class MarketplaceAPI:
 
             print(f"[GALAXY SELLERS] path: {path} params: {params}")
 
+            cache_key = (commodity_normalized, None, "galaxy_sellers", max_days_ago, exclude_carriers)
+
             with ThreadPoolExecutor(max_workers=4) as _pool:
-                _fut_both   = _pool.submit(MarketplaceAPI._fetch_ardent, path, params)
+                _fut_both   = _pool.submit(MarketplaceAPI._cached, 'ardent', cache_key,
+                                           MarketplaceAPI._fetch_ardent, path, params)
                 _fut_spansh = _pool.submit(
-                    MarketplaceAPI._fetch_spansh,
+                    MarketplaceAPI._cached, 'spansh', cache_key, MarketplaceAPI._fetch_spansh,
                     commodity_normalized, "Sol", "selling_commodities",
                     0, max_days_ago, exclude_carriers, 1000
                 )
                 _fut_carriers = _pool.submit(
-                    MarketplaceAPI._fetch_spansh_carriers,
+                    MarketplaceAPI._cached, 'spansh_carriers', cache_key, MarketplaceAPI._fetch_spansh_carriers,
                     commodity_normalized, None, "selling_commodities",
                     0, max_days_ago, exclude_carriers
                 )
                 _fut_eddn = _pool.submit(
-                    MarketplaceAPI._fetch_eddn_cache,
+                    MarketplaceAPI._cached, 'eddn', cache_key, MarketplaceAPI._fetch_eddn_cache,
                     commodity_normalized, None, "selling_commodities",
                     0, max_days_ago, exclude_carriers
                 )
@@ -1163,79 +1180,43 @@ class MarketplaceAPI:
             Same list with 'distance' key added to each result
         """
         try:
-            ref_x, ref_y, ref_z = None, None, None
+            # Local sources first (instant!), EDSM only if none of them know it
+            ref_coords = get_coords_resolver().resolve(reference_system)
+            if not ref_coords:
+                print(f"[DISTANCE CALC] Could not get coordinates for {reference_system}")
+                return results
+            ref_x, ref_y, ref_z = ref_coords
             
-            # Try local database first (instant!)
-            try:
-                from local_database import LocalSystemsDatabase
-                local_db = LocalSystemsDatabase()
-                if local_db.is_database_available():
-                    ref_coords = local_db.get_system_coordinates(reference_system)
-                    if ref_coords:
-                        ref_x, ref_y, ref_z = ref_coords['x'], ref_coords['y'], ref_coords['z']
-                        print(f"[DISTANCE CALC] Using local database for {reference_system}")
-            except Exception as e:
-                print(f"[DISTANCE CALC] Local DB failed: {e}")
-            
-            # Fallback to EDSM if local DB didn't work
-            if ref_x is None:
-                import urllib.parse
-                system_encoded = urllib.parse.quote(reference_system)
-                edsm_url = f"https://www.edsm.net/api-v1/system?systemName={system_encoded}&showCoordinates=1"
-                
-                response = requests.get(edsm_url, timeout=15, headers={"User-Agent": "EliteMining/5.1.3 (+https://github.com/Viper-Dude/EliteMining)"})
-                response.raise_for_status()
-                ref_data = response.json()
-                
-                if not ref_data or 'coords' not in ref_data:
-                    print(f"[DISTANCE CALC] Could not get coordinates for {reference_system}")
-                    return results
-                
-                ref_coords = ref_data['coords']
-                ref_x, ref_y, ref_z = ref_coords['x'], ref_coords['y'], ref_coords['z']
-                print(f"[DISTANCE CALC] Using EDSM fallback for {reference_system}")
-            
-            # Batch-resolve missing coords from galaxy DB for results without systemX/Y/Z
+            # Batch-resolve missing coords locally for results without systemX/Y/Z
             missing_coord_results = [r for r in results
                                      if r.get('systemX') is None and r.get('systemName')]
             if missing_coord_results:
                 try:
-                    from local_database import LocalSystemsDatabase
-                    import sqlite3 as _sqlite3
-                    galaxy_db = LocalSystemsDatabase()
-                    if galaxy_db.is_database_available():
-                        missing_names = list({r['systemName'] for r in missing_coord_results})
-                        placeholders = ",".join("?" for _ in missing_names)
-                        with _sqlite3.connect(str(galaxy_db.db_path)) as _conn:
-                            _conn.row_factory = _sqlite3.Row
-                            _cur = _conn.cursor()
-                            _cur.execute(
-                                f"SELECT name, x, y, z FROM systems WHERE name IN ({placeholders})",
-                                missing_names
-                            )
-                            coord_lookup = {row['name']: (row['x'], row['y'], row['z'])
-                                            for row in _cur.fetchall()}
-                        for result in missing_coord_results:
-                            coords = coord_lookup.get(result['systemName'])
-                            if coords:
-                                result['systemX'], result['systemY'], result['systemZ'] = coords
+                    coord_lookup = get_coords_resolver().resolve_many(
+                        (r['systemName'] for r in missing_coord_results), remote=False)
+                    for result in missing_coord_results:
+                        coords = coord_lookup.get(result['systemName'])
+                        if coords:
+                            result['systemX'], result['systemY'], result['systemZ'] = coords
                 except Exception as _ce:
                     print(f"[DISTANCE CALC] Batch coord lookup failed: {_ce}")
 
-            # Calculate distance for each result
+            # Calculate distance for all results in one batch
+            result_coords = []
             for result in results:
-                sys_x = result.get('systemX')
-                sys_y = result.get('systemY')
-                sys_z = result.get('systemZ')
-
-                if sys_x is not None and sys_y is not None and sys_z is not None:
-                    try:
-                        dx = float(sys_x) - ref_x
-                        dy = float(sys_y) - ref_y
-                        dz = float(sys_z) - ref_z
-                        result['distance'] = (dx**2 + dy**2 + dz**2) ** 0.5
-                    except (TypeError, ValueError) as e:
+                try:
+                    coords = (float(result['systemX']), float(result['systemY']), float(result['systemZ']))
+                except KeyError:
+                    coords = None
+                except (TypeError, ValueError) as e:
+                    if result.get('systemX') is not None and result.get('systemY') is not None and result.get('systemZ') is not None:
                         print(f"[DISTANCE CALC] Bad coords for {result.get('systemName')}: {e}")
+                    coords = None
+                result_coords.append(coords)
+
+            for result, dist in zip(results, batch_distances((ref_x, ref_y, ref_z), result_coords)):
+                if dist is not None:
+                    result['distance'] = dist
 
             return results
             
@@ -73,12 +73,22 @@ def get_app_icon_path() -> str:
     
     return None
 from mining_statistics import SessionAnalytics
+from session_index import get_session_index
 
 from config import _load_cfg, _save_cfg, _atomic_write_text, VA_TTS_ANNOUNCEMENT, CONFIG_FILE, scaled_font, scaled_px
 import announcer
 
 # Import normalization from journal_parser for consistent material name handling
 from journal_parser import JournalParser
+from journal_decoder import JournalDecoder
+
+# Journal events _watch_once reacts to - every other line is skipped before JSON decoding
+WATCHED_JOURNAL_EVENTS = (
+    "LaunchDrone", "Location", "FSDJump", "CarrierLocation", "CarrierJump",
+    "ApproachBody", "SupercruiseEntry", "SupercruiseExit", "Docked", "Touchdown",
+    "Liftoff", "Undocked", "ProspectedAsteroid", "MiningRefined",
+    "MissionAccepted", "MissionCompleted", "MissionAbandoned", "MissionFailed", "CargoDepot",
+)
 
 # Import mining missions tracker
 try:
@@ -776,6 +786,8 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         # Watcher state
         self._jrnl_path: Optional[str] = None
         self._jrnl_pos: int = 0
+        self._journal_decoder = JournalDecoder(WATCHED_JOURNAL_EVENTS)
+        self._journal_tail = None  # Shared JournalTail from cargo monitor, when available
 
         # Last known system/body and location context
         self.last_system: str = ""
@@ -906,6 +918,15 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         # Link cargo monitor back to this prospector panel for multi-session mode detection
         if self.main_app and hasattr(self.main_app, 'cargo_monitor'):
             self.main_app.cargo_monitor.prospector_panel = self
+            
+            # Receive journal events from the cargo monitor's tail instead of
+            # reading the journal a second time (only when both watch the same folder)
+            journal_tail = getattr(self.main_app.cargo_monitor, 'journal_tail', None)
+            if journal_tail and os.path.normcase(journal_tail.journal_dir) == os.path.normcase(self.journal_dir):
+                self._journal_tail = journal_tail
+                journal_tail.subscribe(self._handle_journal_event,
+                                       event_types=WATCHED_JOURNAL_EVENTS,
+                                       dispatch=lambda fn, evt: self.after(0, fn, evt))
         
         # Switch to real-time mode after startup processing is complete
         self.after(2000, self._enable_realtime_mode)
@@ -1567,8 +1588,17 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         return None
 
     def _get_csv_path(self) -> str:
-        """Get the consistent path to sessions_index.csv"""
-        return os.path.join(self.reports_dir, "sessions_index.csv")
+        """Get the consistent path to sessions_index.csv, writing pending index edits to it first"""
+        csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+        try:
+            get_session_index(csv_path).flush()
+        except Exception as e:
+            log.error(f"Session index flush failed: {e}")
+        return csv_path
+
+    def _get_session_index(self):
+        """Get the SQLite session index backing sessions_index.csv"""
+        return get_session_index(os.path.join(self.reports_dir, "sessions_index.csv"))
 
     def get_last_mined_lookup(self, system_names: list) -> dict:
         """Bulk lookup of the most recent mining report per (system, body) ring.
@@ -1581,34 +1611,18 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         result = {}
         if not system_names:
             return result
-        wanted = {s.lower() for s in system_names if s}
-        csv_path = self._get_csv_path()
-        if not os.path.exists(csv_path):
-            return result
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    system = row.get('system', '')
-                    if not system or system.lower() not in wanted:
-                        continue
-                    body = row.get('body', '')
-                    timestamp_raw = row.get('timestamp_utc', '')
-                    if not timestamp_raw:
-                        continue
-                    key = (system, body)
-                    existing = result.get(key)
-                    if existing is None or timestamp_raw > existing[1]:
-                        try:
-                            if timestamp_raw.endswith('Z'):
-                                timestamp = dt.datetime.fromisoformat(timestamp_raw.replace('Z', '+00:00'))
-                                timestamp = timestamp.replace(tzinfo=dt.timezone.utc).astimezone()
-                            else:
-                                timestamp = dt.datetime.fromisoformat(timestamp_raw)
-                            display_date = timestamp.strftime("%m/%d/%y %H:%M")
-                        except Exception:
-                            display_date = timestamp_raw
-                        result[key] = (display_date, timestamp_raw)
+            for key, timestamp_raw in self._get_session_index().last_mined(system_names).items():
+                try:
+                    if timestamp_raw.endswith('Z'):
+                        timestamp = dt.datetime.fromisoformat(timestamp_raw.replace('Z', '+00:00'))
+                        timestamp = timestamp.replace(tzinfo=dt.timezone.utc).astimezone()
+                    else:
+                        timestamp = dt.datetime.fromisoformat(timestamp_raw)
+                    display_date = timestamp.strftime("%m/%d/%y %H:%M")
+                except Exception:
+                    display_date = timestamp_raw
+                result[key] = (display_date, timestamp_raw)
         except Exception as e:
             log.error(f"Error building last-mined lookup: {e}")
         return result
@@ -3113,7 +3127,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
 
 
         # Read data from CSV
-        csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+        csv_path = self._get_csv_path()
         sessions_data = []
         
         try:
@@ -3549,7 +3563,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             # Find timestamp by reading CSV directly
             try:
                 import csv
-                csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                csv_path = self._get_csv_path()
                 with open(csv_path, 'r', encoding='utf-8') as f:
                     reader = csv.DictReader(f)
                     for row in reader:
@@ -3820,7 +3834,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                     # Find timestamp by reading CSV directly
                     try:
                         import csv
-                        csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                        csv_path = self._get_csv_path()
                         with open(csv_path, 'r', encoding='utf-8') as f:
                             reader = csv.DictReader(f)
                             for row in reader:
@@ -4013,34 +4027,12 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                     except Exception as e:
                         errors.append(f"  • {session['system']}/{session['body']} ({session['date']}): {str(e)}")
                 
-                # Update CSV file - remove all deleted sessions at once
+                # Update session index - remove all deleted sessions at once
                 if success_count > 0:
                     try:
-                        import csv
-                        
                         # Get timestamps of sessions to delete
                         timestamps_to_delete = {session['timestamp_raw'] for _, session in sessions_to_delete}
-                        
-                        # Read all sessions except the ones to delete
-                        remaining_sessions = []
-                        with open(csv_path, 'r', encoding='utf-8') as f:
-                            reader = csv.DictReader(f)
-                            for row in reader:
-                                if row['timestamp_utc'] not in timestamps_to_delete:
-                                    remaining_sessions.append(row)
-                        
-                        # Write back the remaining sessions
-                        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                            if remaining_sessions:
-                                # Build a complete fieldname list that includes any keys present in any remaining row
-                                fieldnames = list(remaining_sessions[0].keys())
-                                for r in remaining_sessions:
-                                    for k in r.keys():
-                                        if k not in fieldnames:
-                                            fieldnames.append(k)
-                                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                                writer.writeheader()
-                                writer.writerows(remaining_sessions)
+                        self._get_session_index().delete(timestamps_to_delete)
                         
                         # Remove from tree
                         for item_id, _ in sessions_to_delete:
@@ -4173,274 +4165,46 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         close_btn.grid(row=0, column=6, sticky="e", padx=(20, 0))
         self.ToolTip(close_btn, t('tooltips.close_reports'))
 
-    def _is_summary_entry(self, material_name: str) -> bool:
-        """Check if material name is a summary entry that should be filtered out"""
-        return material_name.lower() in ['total cargo collected', 'total', 'cargo collected', 'total refined']
-
-    def _normalize_material_key(self, material_name: str) -> str:
-        """Collapse known name variants (e.g. "Low Temp. Diamonds") to their canonical
-        form so CSV rebuild doesn't split the same material into two entries."""
-        if material_name.lower() in ('low temp. diamonds', 'low temp diamonds'):
-            return 'Low Temperature Diamonds'
-        return material_name
-
     def _rebuild_csv_from_files(self, csv_path: str, parent_window) -> None:
         """Rebuild the CSV index from existing text files - PARSES TPH FROM TEXT"""
         print("[REBUILD] === STARTING CSV REBUILD (popup version) ===")
         try:
-            import csv
-            import re
-            from tkinter import messagebox
+            from session_reports import parse_reports
             
-            # First, try to read existing Material Analysis data from current CSV
-            existing_analysis_data = {}
-            if os.path.exists(csv_path):
-                try:
-                    with open(csv_path, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            # Use timestamp as key to preserve Material Analysis data
-                            timestamp = row.get('timestamp_utc', '')
-                            if timestamp:
-                                print(f"[REBUILD CSV READ] Timestamp from CSV: '{timestamp}'")
-                                existing_analysis_data[timestamp] = {
-                                    'asteroids_prospected': row.get('asteroids_prospected', ''),
-                                    'materials_tracked': row.get('materials_tracked', ''),
-                                    'hit_rate_percent': row.get('hit_rate_percent', ''),
-                                    'avg_quality_percent': row.get('avg_quality_percent', ''),
-                                    'best_material': row.get('best_material', ''),
-                                    'materials_breakdown': row.get('materials_breakdown', ''),
-                                    'material_tph_breakdown': row.get('material_tph_breakdown', ''),  # Preserve TPH
-                                    'prospectors_used': row.get('prospectors_used', ''),
-                                    'engineering_materials': row.get('engineering_materials', ''),  # Preserve engineering materials
-                                    'comment': row.get('comment', '')
-                                }
-                except Exception as e:
-                    print(f"Warning: Could not read existing analysis data: {e}")
+            index = self._get_session_index()
+            # Preserve Material Analysis data and comments already in the index
+            existing_analysis_data = {row['timestamp_utc']: row for row in index.rows() if row.get('timestamp_utc')}
             
-            # Parse all text files
+            # Parse all text files (unchanged ones come from the parse cache)
             sessions = []
+            for report in parse_reports(self.reports_dir, index.db_path):
+                # Get preserved data for this timestamp (fallback if parsing fails)
+                existing_data = existing_analysis_data.get(report['timestamp_utc'], {})
+                sessions.append({
+                    'timestamp_utc': report['timestamp_utc'],
+                    'system': report['system'],
+                    'body': report['body'],
+                    'elapsed': report['elapsed'],
+                    'total_tons': report['total_tons'],
+                    'overall_tph': report['overall_tph'],
+                    'asteroids_prospected': report['asteroids_prospected'] or existing_data.get('asteroids_prospected', ''),
+                    'materials_tracked': report['materials_tracked'] or existing_data.get('materials_tracked', ''),
+                    'hit_rate_percent': report['hit_rate_percent'] or existing_data.get('hit_rate_percent', ''),
+                    'avg_quality_percent': report['avg_quality_percent'] or existing_data.get('avg_quality_percent', ''),
+                    'best_material': report['best_material'] or existing_data.get('best_material', ''),
+                    'materials_breakdown': existing_data.get('materials_breakdown', '') or report['materials_breakdown'],  # Prefer CSV data (has yields)
+                    'material_tph_breakdown': existing_data.get('material_tph_breakdown', '') or report['material_tph_breakdown'],  # Preserve TPH from CSV or parse from text
+                    'prospectors_used': existing_data.get('prospectors_used', '') or report['prospectors_used'],  # Prefer CSV data
+                    'engineering_materials': existing_data.get('engineering_materials', ''),  # Preserve engineering materials
+                    'comment': existing_data.get('comment', '')  # Preserve existing comments
+                })
             
-            for fn in os.listdir(self.reports_dir):
-                if not (fn.lower().endswith(".txt") and fn.startswith("Session")):
-                    continue
-                    
-                try:
-                    file_path = os.path.join(self.reports_dir, fn)
-                    
-                    # Extract timestamp from filename: Session_YYYY-MM-DD_HH-MM-SS_...
-                    timestamp_match = re.search(r'Session_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})', fn)
-                    if not timestamp_match:
-                        continue
-                        
-                    date_part = timestamp_match.group(1)
-                    time_part_raw = timestamp_match.group(2)
-                    time_part = time_part_raw.replace('-', ':')  # Convert HH-MM-SS to HH:MM:SS
-                    timestamp_local = f"{date_part}T{time_part}"
-                    
-                    # Read file content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                    
-                    # Parse header line: "Session: System — Body — Duration — Total XYt"
-                    first_line = content.split('\n')[0]
-                    if not first_line.startswith("Session:"):
-                        continue
-                    
-                    parts = first_line.split("—")
-                    if len(parts) < 4:
-                        continue
-                    
-                    system = parts[0].replace("Session:", "").strip()
-                    body = parts[1].strip()
-                    duration = parts[2].strip()
-                    total_part = parts[3].strip()
-                    
-                    # Extract total tons from "Total XXt"
-                    total_match = re.search(r'Total (\d+(?:\.\d+)?)t', total_part)
-                    total_tons = float(total_match.group(1)) if total_match else 0.0
-                    
-                    # Calculate TPH from duration and total
-                    duration_seconds = 0
-                    try:
-                        # Parse duration HH:MM:SS
-                        time_parts = duration.split(':')
-                        if len(time_parts) == 3:
-                            duration_seconds = int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(time_parts[2])
-                    except:
-                        duration_seconds = 0
-                    
-                    # For manual entries with zero duration, set TPH to 0 instead of calculating
-                    if duration_seconds == 0:
-                        overall_tph = 0.0
-                    else:
-                        duration_hours = duration_seconds / 3600.0
-                        overall_tph = total_tons / duration_hours
-                    
-                    # Parse additional data from session content
-                    asteroids_prospected = ''
-                    materials_tracked = ''
-                    hit_rate_percent = ''
-                    avg_quality_percent = ''
-                    best_material = ''
-                    materials_breakdown = ''
-                    prospectors_used = ''
-                    
-                    # Extract asteroids prospected
-                    asteroids_match = re.search(r'Asteroids Prospected:\s*(\d+)', content)
-                    if asteroids_match:
-                        asteroids_prospected = asteroids_match.group(1)
-                    
-                    # Extract Minerals tracked  
-                    materials_match = re.search(r'Minerals Tracked:\s*(\d+)', content)
-                    if materials_match:
-                        materials_tracked = materials_match.group(1)
-                    
-                    # Extract hit rate
-                    hit_rate_match = re.search(r'Hit Rate:\s*([\d.]+)%', content)
-                    if hit_rate_match:
-                        hit_rate_percent = hit_rate_match.group(1)
-                    
-                    # Extract overall quality
-                    quality_match = re.search(r'Overall Quality:\s*([\d.]+)%', content)
-                    if quality_match:
-                        avg_quality_percent = quality_match.group(1)
-                    
-                    # Extract best performer
-                    best_match = re.search(r'Best Performer:\s*([^\(]+)', content)
-                    if best_match:
-                        best_material = best_match.group(1).strip()
-                    
-                    # Extract prospector limpets used
-                    prospector_match = re.search(r'Prospector Limpets Used:\s*(\d+)', content)
-                    if prospector_match:
-                        prospectors_used = prospector_match.group(1)
-                    
-                    # Extract materials breakdown AND TPH - merge from multiple sources for complete data
-                    materials_dict = {}
-                    material_tph_breakdown = ""  # Will be parsed from CARGO section
-                    
-                    if not materials_breakdown:
-                        # First, get data from CARGO MATERIAL BREAKDOWN (WITH TPH if available)
-                        cargo_section = re.search(r'=== CARGO MATERIAL BREAKDOWN ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                        if cargo_section:
-                            cargo_text = cargo_section.group(1)
-                            # Try to parse WITH TPH: "Platinum: 1.0t (80.3 t/hr)"
-                            material_lines_with_tph = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*\(([\d.]+)\s*t/hr\)', cargo_text, re.MULTILINE)
-                            if material_lines_with_tph:
-                                # Successfully parsed TPH from text file
-                                tph_pairs = []
-                                for mat, tons, tph in material_lines_with_tph:
-                                    mat_clean = self._normalize_material_key(mat.strip())
-                                    if not self._is_summary_entry(mat_clean):
-                                        is_new = mat_clean not in materials_dict
-                                        materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
-                                        if is_new:
-                                            tph_pairs.append(f"{mat_clean}: {tph}")
-                                if tph_pairs:
-                                    material_tph_breakdown = ", ".join(tph_pairs)
-                                    print(f"[REBUILD] ✓ Parsed TPH from text: {material_tph_breakdown}")
-                            else:
-                                # No TPH in text, parse basic format
-                                material_lines = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*$', cargo_text, re.MULTILINE)
-                                for mat, tons in material_lines:
-                                    mat_clean = self._normalize_material_key(mat.strip())
-                                    if not self._is_summary_entry(mat_clean):
-                                        materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
-
-                        # Then, merge with REFINED CARGO TRACKING (manually added materials during session)
-                        refined_cargo_section = re.search(r'=== REFINED CARGO TRACKING ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                        if refined_cargo_section:
-                            refined_cargo_text = refined_cargo_section.group(1)
-                            refined_material_lines = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*$', refined_cargo_text, re.MULTILINE)
-                            for mat, tons in refined_material_lines:
-                                mat_clean = self._normalize_material_key(mat.strip())
-                                if not self._is_summary_entry(mat_clean):
-                                    if mat_clean in materials_dict:
-                                        # Add to existing quantity
-                                        materials_dict[mat_clean] += float(tons)
-                                    else:
-                                        # New material from refinery
-                                        materials_dict[mat_clean] = float(tons)
-
-                        # Fallback to REFINED MINERALS section if no cargo data found
-                        if not materials_dict:
-                            refined_section = re.search(r'=== REFINED MINERALS ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                            if refined_section:
-                                refined_text = refined_section.group(1)
-                                material_lines = re.findall(r'- ([A-Za-z.\s]+) ([\d.]+)t', refined_text)
-                                for mat, tons in material_lines:
-                                    mat_clean = self._normalize_material_key(mat.strip())
-                                    if not self._is_summary_entry(mat_clean):
-                                        materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
-
-                        # Convert dictionary to string format
-                        if materials_dict:
-                            materials_breakdown = ', '.join([f"{mat}: {tons:.1f}t" for mat, tons in materials_dict.items()])
-                    
-                    # If materials_tracked is empty but we have materials_breakdown, count the materials
-                    if not materials_tracked and materials_breakdown:
-                        # Count comma-separated materials in breakdown
-                        material_count = len([m.strip() for m in materials_breakdown.split(',') if m.strip()])
-                        materials_tracked = str(material_count) if material_count > 0 else ''
-                    
-                    # Get preserved data for this timestamp (fallback if parsing fails)
-                    existing_data = existing_analysis_data.get(timestamp_local, {})
-                    if not existing_data:
-                        print(f"[REBUILD DEBUG] No CSV match for timestamp: {timestamp_local}")
-                        print(f"[REBUILD DEBUG] Filename: {fn}")
-                        print(f"[REBUILD DEBUG] Available CSV keys sample: {list(existing_analysis_data.keys())[:3]}")
-                        print(f"[REBUILD DEBUG] Total CSV entries: {len(existing_analysis_data)}")
-                    else:
-                        print(f"[REBUILD DEBUG] ✓ MATCH FOUND for: {timestamp_local}")
-                        print(f"[REBUILD DEBUG] TPH data: {existing_data.get('material_tph_breakdown', 'EMPTY')}")
-                    
-                    # Determine total hits/founds for this session from the TXT content
-                    try:
-                        tf_match = re.search(r'Total Material Hits:\s*(\d+)', content)
-                        if not tf_match:
-                            tf_match = re.search(r'Total Material Finds:\s*(\d+)', content)
-                        if tf_match:
-                            total_finds_val = int(tf_match.group(1))
-                        else:
-                            # Fallback: sum any per-material hit lines (supports both 'Hits:' and legacy 'Finds: 12x')
-                            per_hits = re.findall(r'•\s*(?:Hits|Finds):\s*(\d+)', content)
-                            if per_hits:
-                                total_finds_val = sum(int(x) for x in per_hits)
-                            else:
-                                total_finds_val = 0
-                    except Exception:
-                        total_finds_val = 0
-
-                    sessions.append({
-                        'timestamp_utc': timestamp_local,
-                        'system': system,
-                        'body': body,
-                        'elapsed': duration,
-                        'total_tons': total_tons,
-                        'overall_tph': overall_tph,
-                        'asteroids_prospected': asteroids_prospected or existing_data.get('asteroids_prospected', ''),
-                        'materials_tracked': materials_tracked or existing_data.get('materials_tracked', ''),
-                        'hit_rate_percent': hit_rate_percent or existing_data.get('hit_rate_percent', ''),
-                        'avg_quality_percent': avg_quality_percent or existing_data.get('avg_quality_percent', ''),
-                        'total_finds': total_finds_val,
-                        'best_material': best_material or existing_data.get('best_material', ''),
-                        'materials_breakdown': existing_data.get('materials_breakdown', '') or materials_breakdown,  # Prefer CSV data (has yields)
-                        'material_tph_breakdown': existing_data.get('material_tph_breakdown', '') or material_tph_breakdown,  # Preserve TPH from CSV or parse from text
-                        'prospectors_used': existing_data.get('prospectors_used', '') or prospectors_used,  # Prefer CSV data
-                        'engineering_materials': existing_data.get('engineering_materials', ''),  # Preserve engineering materials
-                        'comment': existing_data.get('comment', '')  # Preserve existing comments
-                    })
-                    
-                except Exception as e:
-                    print(f"Error parsing {fn}: {e}")
-                    continue
+            # Replace the index in one transaction (also rewrites the CSV)
+            if not index.replace_rows(sessions):
+                raise RuntimeError("could not write the session index")
             
             if not sessions:
-                # If no session files exist, create empty CSV with headers
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph', 'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment'])
-                    writer.writeheader()
+                # No session files - the CSV was written with headers only
                 from main import center_window
                 import tkinter as tk
                 main_parent = self.winfo_toplevel()
@@ -4477,19 +4241,6 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                 parent_window.destroy()
                 return
             
-            # Sort by timestamp
-            sessions.sort(key=lambda x: x['timestamp_utc'])
-            
-            # Write new CSV (include total_finds)
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph', 'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment'])
-                writer.writeheader()
-                # Remove any keys not present in CSV schema (avoid DictWriter errors)
-                for _r in sessions:
-                    if 'total_finds' in _r:
-                        _r.pop('total_finds', None)
-                writer.writerows(sessions)
-            
             # Close and reopen the reports window to refresh data
             parent_window.destroy()
             self._open_reports_window()
@@ -4536,287 +4287,50 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         """Rebuild the CSV index from existing text files for Reports tab - PARSES TPH FROM TEXT"""
         print("[REBUILD] === STARTING CSV REBUILD (tab version) ===")
         try:
-            import csv
-            import re
+            from session_reports import parse_reports
             if not silent:
                 from app_utils import centered_askyesno
             
-            # First, try to read existing Material Analysis data from current CSV (excluding comments)
-            existing_analysis_data = {}
-            if os.path.exists(csv_path):
-                print(f"[REBUILD] CSV exists, reading timestamps and TPH data...")
-                try:
-                    with open(csv_path, 'r', encoding='utf-8') as f:
-                        reader = csv.DictReader(f)
-                        for row in reader:
-                            # Use timestamp as key to preserve Material Analysis data (but not comments)
-                            timestamp = row.get('timestamp_utc', '')
-                            if timestamp:
-                                print(f"[REBUILD CSV READ] Timestamp from CSV: '{timestamp}'")
-                                tph_data = row.get('material_tph_breakdown', '')
-                                print(f"[REBUILD CSV READ] TPH data: '{tph_data}'")
-                                existing_analysis_data[timestamp] = {
-                                    'asteroids_prospected': row.get('asteroids_prospected', ''),
-                                    'materials_tracked': row.get('materials_tracked', ''),
-                                    'hit_rate_percent': row.get('hit_rate_percent', ''),
-                                    'avg_quality_percent': row.get('avg_quality_percent', ''),
-                                    'best_material': row.get('best_material', ''),
-                                    'materials_breakdown': row.get('materials_breakdown', ''),  # Preserve tonnage
-                                    'material_tph_breakdown': row.get('material_tph_breakdown', ''),  # Preserve TPH
-                                    'prospectors_used': row.get('prospectors_used', ''),
-                                    'engineering_materials': row.get('engineering_materials', ''),  # Preserve engineering materials
-                                    'comment': row.get('comment', '')  # Preserve comments
-                                }
-                except Exception as e:
-                    print(f"Warning: Could not read existing analysis data: {e}")
-            else:
-                print(f"[REBUILD] CSV does not exist at: {csv_path}")
+            index = self._get_session_index()
+            # Preserve Material Analysis data already in the index
+            existing_analysis_data = {row['timestamp_utc']: row for row in index.rows() if row.get('timestamp_utc')}
             
-            # Parse all text files
+            # Parse all text files (unchanged ones come from the parse cache)
             sessions = []
             print(f"[REBUILD] Parsing text files from: {self.reports_dir}")
+            for report in parse_reports(self.reports_dir, index.db_path):
+                # Get preserved data for this timestamp (prioritize CSV data for analysis fields)
+                existing_data = existing_analysis_data.get(report['timestamp_utc'], {})
+                sessions.append({
+                    'timestamp_utc': report['timestamp_utc'],
+                    'system': report['system'],
+                    'body': report['body'],
+                    'elapsed': report['elapsed'],
+                    'total_tons': report['total_tons'],
+                    'overall_tph': report['overall_tph'],
+                    # Prioritize existing CSV data for analysis fields, fall back to parsed text
+                    'asteroids_prospected': existing_data.get('asteroids_prospected', '') or report['asteroids_prospected'],
+                    'materials_tracked': existing_data.get('materials_tracked', '') or report['materials_tracked'],
+                    'hit_rate_percent': existing_data.get('hit_rate_percent', '') or report['hit_rate_percent'],
+                    'avg_quality_percent': existing_data.get('avg_quality_percent', '') or report['avg_quality_percent'],
+                    'best_material': existing_data.get('best_material', '') or report['best_material'],
+                    'materials_breakdown': existing_data.get('materials_breakdown', '') or report['materials_breakdown'],
+                    'material_tph_breakdown': existing_data.get('material_tph_breakdown', '') or report['material_tph_breakdown'],  # Add TPH data
+                    'prospectors_used': existing_data.get('prospectors_used', '') or report['prospectors_used'],
+                    'engineering_materials': report['engineering_materials'],  # Add engineering materials
+                    'comment': report['comment']  # Extract comment from text file content
+                })
             
-            for fn in os.listdir(self.reports_dir):
-                if not (fn.lower().endswith(".txt") and fn.startswith("Session")):
-                    continue
-                    
-                try:
-                    file_path = os.path.join(self.reports_dir, fn)
-                    
-                    # Extract timestamp from filename: Session_YYYY-MM-DD_HH-MM-SS_...
-                    timestamp_match = re.search(r'Session_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})', fn)
-                    if not timestamp_match:
-                        continue
-                        
-                    date_part = timestamp_match.group(1)
-                    time_part_raw = timestamp_match.group(2)
-                    time_part = time_part_raw.replace('-', ':')  # Convert HH-MM-SS to HH:MM:SS
-                    timestamp_local = f"{date_part}T{time_part}"
-                    
-                    # Read file content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                    
-                    # Parse header line: "Session: System — Body — Duration — Total XYt"
-                    first_line = content.split('\n')[0]
-                    if not first_line.startswith("Session:"):
-                        continue
-                    
-                    parts = first_line.split("—")
-                    if len(parts) < 4:
-                        continue
-                    
-                    system = parts[0].replace("Session:", "").strip()
-                    body = parts[1].strip()
-                    duration = parts[2].strip()
-                    total_part = parts[3].strip()
-                    
-                    # Extract total tons from "Total XXt"
-                    total_match = re.search(r'Total (\d+(?:\.\d+)?)t', total_part)
-                    total_tons = float(total_match.group(1)) if total_match else 0.0
-                    
-                    # Calculate TPH from duration and total
-                    duration_seconds = 0
-                    try:
-                        # Parse duration HH:MM:SS
-                        time_parts = duration.split(':')
-                        if len(time_parts) == 3:
-                            duration_seconds = int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(time_parts[2])
-                    except:
-                        duration_seconds = 0
-                    
-                    # For manual entries with zero duration, set TPH to 0 instead of calculating
-                    if duration_seconds == 0:
-                        overall_tph = 0.0
-                    else:
-                        duration_hours = duration_seconds / 3600.0
-                        overall_tph = total_tons / duration_hours
-                    
-                    # Parse additional data from session content
-                    asteroids_prospected = ''
-                    materials_tracked = ''
-                    hit_rate_percent = ''
-                    avg_quality_percent = ''
-                    best_material = ''
-                    materials_breakdown = ''
-                    prospectors_used = ''
-                    
-                    # Extract asteroids prospected
-                    asteroids_match = re.search(r'Asteroids Prospected:\s*(\d+)', content)
-                    if asteroids_match:
-                        asteroids_prospected = asteroids_match.group(1)
-                    
-                    # Extract Minerals tracked  
-                    materials_match = re.search(r'Minerals Tracked:\s*(\d+)', content)
-                    if materials_match:
-                        materials_tracked = materials_match.group(1)
-                    
-                    # Extract hit rate
-                    hit_rate_match = re.search(r'Hit Rate:\s*([\d.]+)%', content)
-                    if hit_rate_match:
-                        hit_rate_percent = hit_rate_match.group(1)
-                    
-                    # Extract overall quality
-                    quality_match = re.search(r'Overall Quality:\s*([\d.]+)%', content)
-                    if quality_match:
-                        avg_quality_percent = quality_match.group(1)
-                    
-                    # Extract best performer
-                    best_match = re.search(r'Best Performer:\s*([^\(]+)', content)
-                    if best_match:
-                        best_material = best_match.group(1).strip()
-                    
-                    # Extract prospector limpets used
-                    prospector_match = re.search(r'Prospector Limpets Used:\s*(\d+)', content)
-                    if prospector_match:
-                        prospectors_used = prospector_match.group(1)
-                    
-                    # Extract materials breakdown AND TPH - merge from multiple sources for complete data
-                    materials_dict = {}
-                    material_tph_breakdown = ""  # Will be parsed from CARGO section
-                    
-                    if not materials_breakdown:
-                        # First, get data from CARGO MATERIAL BREAKDOWN (WITH TPH if available)
-                        cargo_section = re.search(r'=== CARGO MATERIAL BREAKDOWN ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                        if cargo_section:
-                            cargo_text = cargo_section.group(1)
-                            # Try to parse WITH TPH: "Platinum: 1.0t (80.3 t/hr)"
-                            material_lines_with_tph = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*\(([\d.]+)\s*t/hr\)', cargo_text, re.MULTILINE)
-                            if material_lines_with_tph:
-                                # Successfully parsed TPH from text file
-                                tph_pairs = []
-                                for mat, tons, tph in material_lines_with_tph:
-                                    mat_clean = self._normalize_material_key(mat.strip())
-                                    if not self._is_summary_entry(mat_clean):
-                                        is_new = mat_clean not in materials_dict
-                                        materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
-                                        if is_new:
-                                            tph_pairs.append(f"{mat_clean}: {tph}")
-                                if tph_pairs:
-                                    material_tph_breakdown = ", ".join(tph_pairs)
-                                    print(f"[REBUILD TAB] ✓ Parsed TPH from text: {material_tph_breakdown}")
-                            else:
-                                # No TPH in text, parse basic format
-                                material_lines = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*$', cargo_text, re.MULTILINE)
-                                for mat, tons in material_lines:
-                                    mat_clean = self._normalize_material_key(mat.strip())
-                                    if not self._is_summary_entry(mat_clean):
-                                        materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
-
-                        # Then, merge with REFINED CARGO TRACKING (manually added materials during session)
-                        refined_cargo_section = re.search(r'=== REFINED CARGO TRACKING ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                        if refined_cargo_section:
-                            refined_cargo_text = refined_cargo_section.group(1)
-                            refined_material_lines = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*$', refined_cargo_text, re.MULTILINE)
-                            for mat, tons in refined_material_lines:
-                                mat_clean = self._normalize_material_key(mat.strip())
-                                if not self._is_summary_entry(mat_clean):
-                                    if mat_clean in materials_dict:
-                                        # Add to existing quantity
-                                        materials_dict[mat_clean] += float(tons)
-                                    else:
-                                        # New material from refinery
-                                        materials_dict[mat_clean] = float(tons)
-
-                        # Fallback to REFINED MINERALS section if no cargo data found
-                        if not materials_dict:
-                            refined_section = re.search(r'=== REFINED MINERALS ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                            if refined_section:
-                                refined_text = refined_section.group(1)
-                                material_lines = re.findall(r'- ([A-Za-z.\s]+) ([\d.]+)t', refined_text)
-                                for mat, tons in material_lines:
-                                    mat_clean = self._normalize_material_key(mat.strip())
-                                    if not self._is_summary_entry(mat_clean):
-                                        materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
-
-                        # Convert dictionary to string format
-                        if materials_dict:
-                            materials_breakdown = ', '.join([f"{mat}: {tons:.1f}t" for mat, tons in materials_dict.items()])
-
-                    # If materials_tracked is empty but we have materials_breakdown, count the materials
-                    if not materials_tracked and materials_breakdown:
-                        # Count comma-separated materials in breakdown
-                        material_count = len([m.strip() for m in materials_breakdown.split(',') if m.strip()])
-                        materials_tracked = str(material_count) if material_count > 0 else ''
-                    
-                    # Extract session comment from text file content
-                    session_comment = ""
-                    comment_match = re.search(r'=== SESSION COMMENT ===\s*\n(.+?)(?:\n===|$)', content, re.DOTALL)
-                    if comment_match:
-                        session_comment = comment_match.group(1).strip()
-                    
-                    # Extract engineering materials from text file
-                    engineering_materials_str = ""
-                    eng_section = re.search(r'=== ENGINEERING MATERIALS COLLECTED ===(.*?)(?:===|\Z)', content, re.DOTALL)
-                    if eng_section:
-                        eng_text = eng_section.group(1)
-                        # Parse materials like "Iron: 45" and convert to "Iron:45" format
-                        material_lines = re.findall(r'^\s+([A-Za-z]+):\s*(\d+)\s*$', eng_text, re.MULTILINE)
-                        if material_lines:
-                            engineering_materials_str = ",".join([f"{mat}:{qty}" for mat, qty in material_lines])
-                    
-                    # Get preserved data for this timestamp (prioritize CSV data for analysis fields)
-                    existing_data = existing_analysis_data.get(timestamp_local, {})
-
-                    # Compute total finds/hits from the TXT (support both 'Total Material Hits' and legacy 'Total Material Finds')
-                    try:
-                        tf_match = re.search(r'Total Material Hits:\s*(\d+)', content)
-                        if not tf_match:
-                            tf_match = re.search(r'Total Material Finds:\s*(\d+)', content)
-                        if tf_match:
-                            total_finds_val = int(tf_match.group(1))
-                        else:
-                            per_hits = re.findall(r'•\s*(?:Hits|Finds):\s*(\d+)', content)
-                            total_finds_val = sum(int(x) for x in per_hits) if per_hits else 0
-                    except Exception:
-                        total_finds_val = 0
-
-                    sessions.append({
-                        'timestamp_utc': timestamp_local,
-                        'system': system,
-                        'body': body,
-                        'elapsed': duration,
-                        'total_tons': total_tons,
-                        'overall_tph': overall_tph,
-                        # Prioritize existing CSV data for analysis fields, fall back to parsed text
-                        'asteroids_prospected': existing_data.get('asteroids_prospected', '') or asteroids_prospected,
-                        'materials_tracked': existing_data.get('materials_tracked', '') or materials_tracked,
-                        'hit_rate_percent': existing_data.get('hit_rate_percent', '') or hit_rate_percent,
-                        'avg_quality_percent': existing_data.get('avg_quality_percent', '') or avg_quality_percent,
-                        'best_material': existing_data.get('best_material', '') or best_material,
-                        'total_finds': existing_data.get('total_finds', '') or total_finds_val,
-                        'materials_breakdown': existing_data.get('materials_breakdown', '') or materials_breakdown,
-                        'material_tph_breakdown': existing_data.get('material_tph_breakdown', '') or material_tph_breakdown,  # Add TPH data
-                        'prospectors_used': existing_data.get('prospectors_used', '') or prospectors_used,
-                        'engineering_materials': engineering_materials_str,  # Add engineering materials
-                        'comment': session_comment  # Extract comment from text file content
-                    })
-                    
-                except Exception as e:
-                    print(f"Error parsing {fn}: {e}")
-                    continue
+            # Replace the index in one transaction (also rewrites the CSV)
+            if not index.replace_rows(sessions):
+                raise RuntimeError("could not write the session index")
             
             if not sessions:
-                # If no session files exist, create empty CSV with headers
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph', 'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment'])
-                    writer.writeheader()
+                # No session files - the CSV was written with headers only
                 if not silent:
                     self._set_status("Created new CSV file - ready for first session")
                 return
             
-            # Sort by timestamp
-            sessions.sort(key=lambda x: x['timestamp_utc'])
-            
-            # Write new CSV
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph', 'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment'])
-                writer.writeheader()
-                for _r in sessions:
-                    if 'total_finds' in _r:
-                        _r.pop('total_finds', None)
-                writer.writerows(sessions)
-            
             # Refresh the Reports tab instead of opening new window
             self._refresh_reports_tab()
             
@@ -4868,7 +4382,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             print(f"[STARTUP ERROR] Auto rebuild failed: {e}")
 
     def _export_csv(self, csv_path: str) -> None:
-        """Copy the CSV file to a user-selected location"""
+        """Export the session index as CSV to a user-selected location"""
         try:
             # Prevent re-entrant exports which may cause duplicate files if called twice
             if getattr(self, '_export_in_progress', False):
@@ -4876,8 +4390,9 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                 self._set_status("Export already in progress")
                 return
             self._export_in_progress = True
-            # Check if CSV file exists
-            if not os.path.exists(csv_path):
+            # Check if there is anything to export
+            session_index = self._get_session_index()
+            if not os.path.exists(csv_path) and not len(session_index):
                 self._set_status("Export failed: CSV file not found. Try rebuilding the CSV first.")
                 return
                 
@@ -4890,9 +4405,10 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             )
             
             if dest_path:
-                import shutil
-                print(f"Exporting CSV from {csv_path} to {dest_path}")
-                shutil.copy2(csv_path, dest_path)
+                print(f"Exporting session index to {dest_path}")
+                if not session_index.export_csv(dest_path):
+                    self._set_status("Export failed: could not write CSV file")
+                    return
                 self._set_status(f"Session data exported to {dest_path}")
                 from main import center_window
                 import tkinter as tk
@@ -6330,11 +5846,8 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         return fpath
 
     def _update_csv_with_session(self, system: str, body: str, elapsed: str, total_tons: float, overall_tph: float, cargo_session_data: dict = None, comment: str = "", session_timestamp: str = None) -> None:
-        """Add new session data to the CSV index"""
+        """Add new session data to the session index (exported to sessions_index.csv)"""
         try:
-            import csv
-            csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
-            
             # Use provided timestamp or generate new one (normalize format for consistency)
             if session_timestamp:
                 # Convert filename format (2025-01-15_14-30-00) to CSV format (2025-01-15T14:30:00)
@@ -6479,38 +5992,8 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                 'comment': comment
             }
             
-            # Read existing data
-            sessions = []
-            if os.path.exists(csv_path):
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    sessions = list(reader)
-            
-            # Ensure old sessions have the engineering_materials and material_tph_breakdown fields (backward compatibility)
-            # Also REMOVE ship_name if it exists in old CSV files
-            for session in sessions:
-                if 'engineering_materials' not in session:
-                    session['engineering_materials'] = ''
-                if 'material_tph_breakdown' not in session:
-                    session['material_tph_breakdown'] = ''
-                # Remove ship_name from old data - it's no longer stored in CSV
-                if 'ship_name' in session:
-                    del session['ship_name']
-            
-            # Add new session
-            sessions.append(new_session)
-            
-            # Write back to CSV with enhanced fields including cargo data (ship_name is NOT in CSV - only in TXT/HTML reports)
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph',
-                            'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 
-                            'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for _r in sessions:
-                    if 'total_finds' in _r:
-                        _r.pop('total_finds', None)
-                writer.writerows(sessions)
+            # Single indexed insert - the CSV copy is rewritten in the background
+            self._get_session_index().add(new_session)
                 
         except Exception as e:
             print(f"Failed to update CSV: {e}")
@@ -6822,42 +6305,10 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             return ", ".join(formatted_parts)
 
     def _update_existing_csv_row(self, timestamp_local: str, updated_data: dict) -> bool:
-        """Update an existing CSV row with new data after manual materials are added"""
+        """Update an existing session index row with new data after manual materials are added"""
         try:
-            csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
-            
-            # If CSV doesn't exist, nothing to update
-            if not os.path.exists(csv_path):
-                return False
-                
-            # Read existing CSV data
-            sessions = []
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                sessions = list(reader)
-            
-            # Find and update the matching row by timestamp
-            updated = False
-            for session in sessions:
-                if session.get('timestamp_utc') == timestamp_local:
-                    # Update the session with new data
-                    session.update(updated_data)
-                    updated = True
-                    break
-            
-            if updated:
-                # Write back to CSV with updated data
-                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                    fieldnames = ['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph', 
-                                'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 
-                                'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'prospectors_used', 'comment']
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for _r in sessions:
-                        if 'total_finds' in _r:
-                            _r.pop('total_finds', None)
-                    writer.writerows(sessions)
-                
+            updated_data = {k: v for k, v in updated_data.items() if k != 'total_finds'}
+            if self._get_session_index().update(timestamp_local, updated_data):
                 print(f"Updated CSV row for session {timestamp_local}")
                 return True
             else:
@@ -7294,7 +6745,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                     self.reports_tree.delete(item)
                 
                 # Reload data from CSV
-                csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                csv_path = self._get_csv_path()
                 if os.path.exists(csv_path):
                     import csv
                     with open(csv_path, 'r', encoding='utf-8') as f:
@@ -7908,7 +7359,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         button_frame.grid(row=5, column=0, columnspan=2, pady=(8, 0), sticky="ew")
         
         # CSV file path for button commands
-        csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+        csv_path = self._get_csv_path()
         
         # Theme-aware button colors
         if _tab_theme == "elite_orange":
@@ -8347,23 +7798,8 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                         self._set_status(f"Deleting {system}-{body}")
                         
                         try:
-                            # Find and delete CSV entry by exact timestamp match
-                            csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
-                            if os.path.exists(csv_path):
-                                import csv
-                                rows_to_keep = []
-                                
-                                with open(csv_path, 'r', encoding='utf-8') as f:
-                                    reader = csv.reader(f)
-                                    for row in reader:
-                                        if len(row) > 0 and row[0] != timestamp_raw:
-                                            rows_to_keep.append(row)
-                                        # Skip the row with matching timestamp (delete it)
-                                
-                                # Write updated CSV
-                                with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                                    writer = csv.writer(f)
-                                    writer.writerows(rows_to_keep)
+                            # Delete the session index entry by exact timestamp match
+                            self._get_session_index().delete([timestamp_raw])
                             
                             # Find and delete the report file by timestamp
                             try:
@@ -8811,41 +8247,44 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         self._refresh_reports_tab()
 
     def _get_unique_systems_from_csv(self) -> list:
-        """Get sorted list of unique systems from session CSV"""
-        systems = set()
+        """Get sorted list of unique systems from the session index"""
         try:
-            import csv
-            csv_path = self._get_csv_path()
-            if os.path.exists(csv_path):
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        system = row.get('system', '').strip()
-                        if system and system != 'Unknown':
-                            systems.add(system)
+            return self._get_session_index().unique_systems()
         except Exception:
-            pass
-        return sorted(systems)
+            return []
+
+    def _resolve_session_ships(self, rows: list) -> None:
+        """Fill _ship_display/_ship_file_path on session index rows, reading session
+        text files only for rows whose ship isn't cached in the index yet"""
+        resolved = []
+        for row in rows:
+            file_path = row.get('_ship_file_path')
+            if file_path and os.path.exists(file_path):
+                continue
+            ship_name, file_path = self._get_ship_name_from_session(
+                row.get('system', ''), row.get('body', ''), row.get('timestamp_utc', ''))
+            row['_ship_display'] = ship_name or ''
+            row['_ship_file_path'] = file_path or ''
+            if file_path:
+                resolved.append((row.get('timestamp_utc', ''), ship_name or '', file_path))
+        if resolved:
+            self._get_session_index().set_ships(resolved)
 
     def _get_unique_ships_from_csv(self) -> list:
-        """Get sorted list of unique ships from session text files"""
+        """Get sorted list of unique ships from session text files (cached in the session index)"""
         ships = set()
         try:
-            import csv
-            csv_path = self._get_csv_path()
-            if os.path.exists(csv_path):
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        ship_name, _ = self._get_ship_name_from_session(
-                            row.get('system', ''), row.get('body', ''), row.get('timestamp_utc', ''))
-                        if ship_name and ship_name != 'Unknown Ship':
-                            # Extract just the ship type (after " - ") for cleaner filtering
-                            if ' - ' in ship_name:
-                                ship_type = ship_name.split(' - ', 1)[1].strip()
-                                ships.add(ship_type)
-                            else:
-                                ships.add(ship_name)
+            rows = self._get_session_index().rows()
+            self._resolve_session_ships(rows)
+            for row in rows:
+                ship_name = row.get('_ship_display', '')
+                if ship_name and ship_name != 'Unknown Ship':
+                    # Extract just the ship type (after " - ") for cleaner filtering
+                    if ' - ' in ship_name:
+                        ship_type = ship_name.split(' - ', 1)[1].strip()
+                        ships.add(ship_type)
+                    else:
+                        ships.add(ship_name)
         except Exception:
             pass
         return sorted(ships)
@@ -9030,6 +8469,28 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         except Exception:
             return ("", "")
 
+    def _get_reports_tab_rows(self) -> list:
+        """Session index rows for the Reports tab, narrowed by the time and system
+        filters through indexed queries (the exact filters still run afterwards)"""
+        index = self._get_session_index()
+        since = None
+        time_display = self._time_filter_var.get() if hasattr(self, '_time_filter_var') else ''
+        time_key = getattr(self, '_time_display_to_key', {}).get(time_display, 'all_time')
+        days = {'last_1_day': 1, 'last_2_days': 2, 'last_3_days': 3,
+                'last_7_days': 7, 'last_30_days': 30, 'last_90_days': 90}.get(time_key)
+        if days:
+            # A day of slack covers older UTC ('Z') timestamps in any time zone
+            since = (dt.datetime.now() - dt.timedelta(days=days + 1)).strftime("%Y-%m-%dT%H:%M:%S")
+        system = None
+        source_display = self._source_filter_var.get() if hasattr(self, '_source_filter_var') else ''
+        if getattr(self, '_source_display_to_key', {}).get(source_display) == 'by_system':
+            system = (self._sub_filter_var.get() if hasattr(self, '_sub_filter_var') else '').strip() or None
+        rows = index.rows(since=since, system=system)
+        if not rows and not os.path.exists(index.csv_path):
+            # Nothing indexed and no CSV - let the caller fall back to listing report files
+            raise FileNotFoundError(index.csv_path)
+        return rows
+
     def _refresh_reports_tab(self) -> None:
         """Refresh the reports tab data"""
         try:
@@ -9048,178 +8509,178 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             for item in self.reports_tree_tab.get_children():
                 self.reports_tree_tab.delete(item)
             
-            # Load data from CSV
-            csv_path = self._get_csv_path()
+            # Load data from the session index (narrowed by indexed time/system lookups)
             sessions_data = []
             
             try:
-                import csv
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Format the timestamp for display (compact format with year)
-                        try:
-                            # Try to parse as local time first, then fall back to UTC
-                            if row['timestamp_utc'].endswith('Z'):
-                                # UTC format - convert to local time for display
-                                timestamp = dt.datetime.fromisoformat(row['timestamp_utc'].replace('Z', '+00:00'))
-                                timestamp = timestamp.replace(tzinfo=dt.timezone.utc).astimezone()
-                            else:
-                                # Local time format
-                                timestamp = dt.datetime.fromisoformat(row['timestamp_utc'])
-                            date_str = timestamp.strftime("%m/%d/%y %H:%M")  # Compact format with year
-                        except:
-                            date_str = row['timestamp_utc']
-                        
-                        # Format TPH (same pattern as other numeric columns)
-                        try:
-                            tph_val = float(row['overall_tph']) if row['overall_tph'] and row['overall_tph'].strip() != '0' else 0
-                            tph_str = f"{tph_val:.1f}" if tph_val > 0 else "0.0"
-                        except:
-                            tph_str = "0.0"
-                        
-                        # Format tons (same pattern as other numeric columns) 
-                        try:
-                            tons_val = float(row['total_tons']) if row['total_tons'] and row['total_tons'].strip() != '0' else 0
-                            tons_str = f"{tons_val:.1f}" if tons_val > 0 else "0.0"
-                        except:
-                            tons_str = "0.0"
-                        # Compute total finds (hits) and Tons/Hit for this CSV row
-                        try:
-                            total_finds = int(str(row.get('total_finds', '')).strip() or 0)
-                        except Exception:
-                            total_finds = 0
+                for row in self._get_reports_tab_rows():
+                    # Format the timestamp for display (compact format with year)
+                    try:
+                        # Try to parse as local time first, then fall back to UTC
+                        if row['timestamp_utc'].endswith('Z'):
+                            # UTC format - convert to local time for display
+                            timestamp = dt.datetime.fromisoformat(row['timestamp_utc'].replace('Z', '+00:00'))
+                            timestamp = timestamp.replace(tzinfo=dt.timezone.utc).astimezone()
+                        else:
+                            # Local time format
+                            timestamp = dt.datetime.fromisoformat(row['timestamp_utc'])
+                        date_str = timestamp.strftime("%m/%d/%y %H:%M")  # Compact format with year
+                    except:
+                        date_str = row['timestamp_utc']
+                    
+                    # Format TPH (same pattern as other numeric columns)
+                    try:
+                        tph_val = float(row['overall_tph']) if row['overall_tph'] and row['overall_tph'].strip() != '0' else 0
+                        tph_str = f"{tph_val:.1f}" if tph_val > 0 else "0.0"
+                    except:
+                        tph_str = "0.0"
+                    
+                    # Format tons (same pattern as other numeric columns) 
+                    try:
+                        tons_val = float(row['total_tons']) if row['total_tons'] and row['total_tons'].strip() != '0' else 0
+                        tons_str = f"{tons_val:.1f}" if tons_val > 0 else "0.0"
+                    except:
+                        tons_str = "0.0"
+                    # Compute total finds (hits) and Tons/Hit for this CSV row
+                    try:
+                        total_finds = int(str(row.get('total_finds', '')).strip() or 0)
+                    except Exception:
+                        total_finds = 0
 
-                        try:
-                            asteroids_count = int(str(row.get('asteroids_prospected', '')).strip() or 0)
-                        except Exception:
-                            asteroids_count = 0
+                    try:
+                        asteroids_count = int(str(row.get('asteroids_prospected', '')).strip() or 0)
+                    except Exception:
+                        asteroids_count = 0
 
+                    try:
+                        total_tons_val = float(row.get('total_tons', 0.0) or 0.0)
+                    except Exception:
                         try:
-                            total_tons_val = float(row.get('total_tons', 0.0) or 0.0)
+                            total_tons_val = float(tons_str)
                         except Exception:
-                            try:
-                                total_tons_val = float(tons_str)
-                            except Exception:
-                                total_tons_val = 0.0
+                            total_tons_val = 0.0
 
-                        if total_finds > 0:
-                            try:
-                                tons_per_str = f"{total_tons_val / total_finds:.1f}"
-                            except Exception:
-                                tons_per_str = "—"
-                        elif asteroids_count > 0:
-                            try:
-                                tons_per_str = f"{total_tons_val / asteroids_count:.1f}"
-                            except Exception:
-                                tons_per_str = "—"
-                        else:
-                            tons_per_str = "—"
-                        
-                        # Format Material Analysis fields (with fallback for old data)
-                        asteroids = row.get('asteroids_prospected', '').strip() or '—'
-                        materials = row.get('materials_tracked', '').strip() or '—'
-                        hit_rate = row.get('hit_rate_percent', '').strip() or '—'
-                        avg_quality = row.get('avg_quality_percent', '').strip() or '—'
-                        
-                        # Get new cargo tracking fields
-                        materials_breakdown_raw = row.get('materials_breakdown', '').strip() or '—'
-                        material_tph_breakdown = row.get('material_tph_breakdown', '').strip() or ''
-                        prospectors_used = row.get('prospectors_used', '').strip() or '—'
-                        
-                        # Enhanced materials display with yield percentages and TPH
-                        materials_breakdown = self._enhance_materials_with_yields_and_tph(materials_breakdown_raw, avg_quality, material_tph_breakdown)
-                        
-                        # Format asteroids and materials columns
-                        try:
-                            asteroids_val = int(asteroids) if asteroids and asteroids != '0' else 0
-                            asteroids_str = str(asteroids_val) if asteroids_val > 0 else "—"
-                        except:
-                            asteroids_str = "—"
-                        
-                        try:
-                            materials_val = int(materials) if materials and materials != '0' else 0
-                            materials_str = str(materials_val) if materials_val > 0 else "—"
-                        except:
-                            materials_str = "—"
-                        
-                        # Format hit rate
-                        try:
-                            hit_rate_val = float(hit_rate) if hit_rate and hit_rate != '0' else 0
-                            hit_rate_str = f"{hit_rate_val:.1f}" if hit_rate_val > 0 else "—"
-                        except:
-                            hit_rate_str = "—"
-                        
-                        # Format quality (yield %) - convert to average yield instead of individual percentages for display
-                        # BUT keep the original detailed string for report generation
-                        quality_str = "—"
-                        quality_detailed = avg_quality  # Keep original for report generation
+                    if total_finds > 0:
                         try:
-                            # Check if it's already a formatted string with individual materials (contains letters and colons)
-                            if any(c.isalpha() for c in avg_quality) and ':' in avg_quality:
-                                # Parse individual material yields: "Pt: 59.0%, Pain: 29.1%" 
-                                individual_yields = []
-                                pairs = [pair.strip() for pair in avg_quality.split(',')]
-                                for pair in pairs:
-                                    if ':' in pair:
-                                        parts = pair.split(':')
-                                        if len(parts) >= 2:
-                                            percentage_str = parts[1].strip().replace('%', '')
-                                            try:
-                                                individual_yields.append(float(percentage_str))
-                                            except ValueError:
-                                                continue
-                                
-                                # Calculate simple average (same as HTML report logic) for display
-                                if individual_yields:
-                                    avg_yield = sum(individual_yields) / len(individual_yields)
-                                    quality_str = f"{avg_yield:.1f}%"
-                                else:
-                                    quality_str = "—"
-                            else:
-                                # Old numerical format - keep as is
-                                quality_val = float(avg_quality) if avg_quality and avg_quality != '0' else 0
-                                quality_str = f"{quality_val:.1f}%" if quality_val > 0 else "—"
-                                quality_detailed = quality_str  # No detailed data available
-                        except:
-                            quality_str = "—"
-                            quality_detailed = ""
-                        
-                        # Get comment data from CSV
-                        comment_from_csv = row.get('comment', '').strip()
-                        
-                        # Get engineering materials from CSV
-                        engineering_materials = row.get('engineering_materials', '').strip()
-                        
+                            tons_per_str = f"{total_tons_val / total_finds:.1f}"
+                        except Exception:
+                            tons_per_str = "—"
+                    elif asteroids_count > 0:
                         try:
-                            total_finds_val = int(str(row.get('total_finds', '')).strip() or 0)
+                            tons_per_str = f"{total_tons_val / asteroids_count:.1f}"
                         except Exception:
-                            total_finds_val = 0
-
-                        sessions_data.append({
-                            'date': date_str,
-                            'system': row['system'],
-                            'body': row['body'],
-                            'duration': row['elapsed'],
-                            'tons': tons_str,
-                            'tph': tph_str,
-                            'tons_per': tons_per_str,
-                            'asteroids': asteroids_str,
-                            'materials': materials_str,
-                            'hit_rate': hit_rate_str,
-                            'quality': quality_str,
-                            'quality_detailed': quality_detailed,  # Keep detailed breakdown for reports
-                            'avg_quality_percent': quality_detailed,  # Also store as avg_quality_percent for compatibility
-                            'cargo': materials_breakdown,
-                            'cargo_raw': materials_breakdown_raw,  # Store original for tooltip
-                            'prospects': prospectors_used,
-                            'engineering_materials': engineering_materials,  # Add engineering materials field
-                            'comment': comment_from_csv,
-                            'total_finds': total_finds_val,
-                            'total_hits': total_finds_val,
-                            'timestamp_raw': row['timestamp_utc']
-                        })
+                            tons_per_str = "—"
+                    else:
+                        tons_per_str = "—"
+                    
+                    # Format Material Analysis fields (with fallback for old data)
+                    asteroids = row.get('asteroids_prospected', '').strip() or '—'
+                    materials = row.get('materials_tracked', '').strip() or '—'
+                    hit_rate = row.get('hit_rate_percent', '').strip() or '—'
+                    avg_quality = row.get('avg_quality_percent', '').strip() or '—'
+                    
+                    # Get new cargo tracking fields
+                    materials_breakdown_raw = row.get('materials_breakdown', '').strip() or '—'
+                    material_tph_breakdown = row.get('material_tph_breakdown', '').strip() or ''
+                    prospectors_used = row.get('prospectors_used', '').strip() or '—'
+                    
+                    # Enhanced materials display with yield percentages and TPH
+                    materials_breakdown = self._enhance_materials_with_yields_and_tph(materials_breakdown_raw, avg_quality, material_tph_breakdown)
+                    
+                    # Format asteroids and materials columns
+                    try:
+                        asteroids_val = int(asteroids) if asteroids and asteroids != '0' else 0
+                        asteroids_str = str(asteroids_val) if asteroids_val > 0 else "—"
+                    except:
+                        asteroids_str = "—"
+                    
+                    try:
+                        materials_val = int(materials) if materials and materials != '0' else 0
+                        materials_str = str(materials_val) if materials_val > 0 else "—"
+                    except:
+                        materials_str = "—"
+                    
+                    # Format hit rate
+                    try:
+                        hit_rate_val = float(hit_rate) if hit_rate and hit_rate != '0' else 0
+                        hit_rate_str = f"{hit_rate_val:.1f}" if hit_rate_val > 0 else "—"
+                    except:
+                        hit_rate_str = "—"
+                    
+                    # Format quality (yield %) - convert to average yield instead of individual percentages for display
+                    # BUT keep the original detailed string for report generation
+                    quality_str = "—"
+                    quality_detailed = avg_quality  # Keep original for report generation
+                    try:
+                        # Check if it's already a formatted string with individual materials (contains letters and colons)
+                        if any(c.isalpha() for c in avg_quality) and ':' in avg_quality:
+                            # Parse individual material yields: "Pt: 59.0%, Pain: 29.1%" 
+                            individual_yields = []
+                            pairs = [pair.strip() for pair in avg_quality.split(',')]
+                            for pair in pairs:
+                                if ':' in pair:
+                                    parts = pair.split(':')
+                                    if len(parts) >= 2:
+                                        percentage_str = parts[1].strip().replace('%', '')
+                                        try:
+                                            individual_yields.append(float(percentage_str))
+                                        except ValueError:
+                                            continue
                             
+                            # Calculate simple average (same as HTML report logic) for display
+                            if individual_yields:
+                                avg_yield = sum(individual_yields) / len(individual_yields)
+                                quality_str = f"{avg_yield:.1f}%"
+                            else:
+                                quality_str = "—"
+                        else:
+                            # Old numerical format - keep as is
+                            quality_val = float(avg_quality) if avg_quality and avg_quality != '0' else 0
+                            quality_str = f"{quality_val:.1f}%" if quality_val > 0 else "—"
+                            quality_detailed = quality_str  # No detailed data available
+                    except:
+                        quality_str = "—"
+                        quality_detailed = ""
+                    
+                    # Get comment data from CSV
+                    comment_from_csv = row.get('comment', '').strip()
+                    
+                    # Get engineering materials from CSV
+                    engineering_materials = row.get('engineering_materials', '').strip()
+                    
+                    try:
+                        total_finds_val = int(str(row.get('total_finds', '')).strip() or 0)
+                    except Exception:
+                        total_finds_val = 0
+
+                    sessions_data.append({
+                        'date': date_str,
+                        'system': row['system'],
+                        'body': row['body'],
+                        'duration': row['elapsed'],
+                        'tons': tons_str,
+                        'tph': tph_str,
+                        'tons_per': tons_per_str,
+                        'asteroids': asteroids_str,
+                        'materials': materials_str,
+                        'hit_rate': hit_rate_str,
+                        'quality': quality_str,
+                        'quality_detailed': quality_detailed,  # Keep detailed breakdown for reports
+                        'avg_quality_percent': quality_detailed,  # Also store as avg_quality_percent for compatibility
+                        'cargo': materials_breakdown,
+                        'cargo_raw': materials_breakdown_raw,  # Store original for tooltip
+                        'prospects': prospectors_used,
+                        'engineering_materials': engineering_materials,  # Add engineering materials field
+                        'comment': comment_from_csv,
+                        'total_finds': total_finds_val,
+                        'total_hits': total_finds_val,
+                        'timestamp_raw': row['timestamp_utc']
+                    })
+                    if row.get('_ship_file_path') and os.path.exists(row['_ship_file_path']):
+                        # Ship parsed from the report on an earlier refresh
+                        sessions_data[-1]['_ship_display'] = row['_ship_display'] or ''
+                        sessions_data[-1]['_ship_file_path'] = row['_ship_file_path']
+                        
             except Exception as e:
                 print(f"Loading CSV failed: {e}")
                 # Fallback to old file listing method
@@ -9249,13 +8710,21 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             # Sort by timestamp (newest first) by default
             sessions_data.sort(key=lambda x: x['timestamp_raw'], reverse=True)
             
-            # Pre-resolve ship names for By Ship filtering
+            # Pre-resolve ship names for By Ship filtering (cached in the session index)
+            resolved_ships = []
             for session in sessions_data:
                 if '_ship_display' not in session:
                     ship_name, file_path = self._get_ship_name_from_session(
                         session.get('system', ''), session.get('body', ''), session.get('timestamp_raw', ''))
                     session['_ship_display'] = ship_name or ''
                     session['_ship_file_path'] = file_path or ''
+                    if file_path:
+                        resolved_ships.append((session['timestamp_raw'], ship_name or '', file_path))
+            if resolved_ships:
+                try:
+                    self._get_session_index().set_ships(resolved_ships)
+                except Exception as e:
+                    print(f"Caching ship names failed: {e}")
             
             # Apply 3 independent filters (Time, Performance, Source) — they stack
             from datetime import datetime, timedelta
@@ -9732,7 +9201,9 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         
     def _tick(self) -> None:
         try:
-            if self.journal_dir and os.path.isdir(self.journal_dir):
+            if self._journal_tail is not None:
+                self._journal_tail.poll()
+            elif self.journal_dir and os.path.isdir(self.journal_dir):
                 self._watch_once()
             if self.session_active and not self.session_paused:
                 self._update_elapsed()
@@ -9854,505 +9325,505 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         if not new_data:
             return
 
+        file_name = os.path.basename(self._jrnl_path)
         for line in new_data.splitlines():
-            line = line.strip()
-            if not line or '"event"' not in line:
-                continue
-            try:
-                evt = json.loads(line)
-            except Exception:
+            evt = self._journal_decoder.decode(line, file_name)
+            if evt is None:
                 continue
-
-            ev = evt.get("event")
+            self._handle_journal_event(evt)
+
+    def _handle_journal_event(self, evt: Dict[str, Any]) -> None:
+        """Handle one decoded journal event (from the shared journal tail or _watch_once)"""
+        ev = evt.get("event")
+        
+        # Auto-start session on first prospector limpet launch
+        if ev == "LaunchDrone" and evt.get("Type") == "Prospector":
+            if self.auto_start_on_prospector and not self.session_active:
+                # Auto-start session on first prospector
+                print(f"[AUTO-START] Prospector launched - auto-starting session")
+                self.after(100, self._session_start)  # Delay slightly to ensure UI is ready
+                
+                # Auto-switch to Mining Session tab when launching prospector (same as entering ring)
+                self._auto_switch_to_mining_tab()
+
+        if ev in ("Location", "FSDJump"):
+            # Update system from events that contain StarSystem data
+            if evt.get("StarSystem"):
+                self.last_system = evt.get("StarSystem")
+                self.session_system.set(self.last_system)
+                
+                # Get coordinates if available
+                coords = None
+                if "StarPos" in evt:
+                    coords = tuple(evt["StarPos"])
+                
+                # Notify main app - centralized system update
+                # Location is NOT a visit (game startup), FSDJump IS a visit
+                should_count = (ev == "FSDJump")
+                if self.main_app and hasattr(self.main_app, 'update_current_system'):
+                    self.main_app.update_current_system(self.last_system, coords, count_visit=should_count)
+                    # Update distances in background (non-blocking)
+                    if hasattr(self.main_app, '_update_home_fc_distances'):
+                        self.main_app.after(100, self.main_app._update_home_fc_distances)
+            
+                # Update location context
+                self.last_body_type = evt.get("BodyType", "")
+            
+                # Auto-switch to Hotspots Finder on FSD jump (not during startup)
+                if ev == "FSDJump" and not self.startup_processing:
+                    # Check if there's a pending switch from session end
+                    if getattr(self, '_pending_ring_finder_switch', False):
+                        self._pending_ring_finder_switch = False
+                        self._auto_switch_to_ring_finder_delayed()
+                    else:
+                        self._auto_switch_to_ring_finder_tab()
+        
+        # Track Fleet Carrier location changes
+        if ev == "CarrierLocation":
+            carrier_system = evt.get("StarSystem")
+            if carrier_system:
+                print(f"[FLEET CARRIER] CarrierLocation: system={carrier_system}")
+                
+                # Update fleet carrier system in distance calculator
+                if hasattr(self.app, 'distance_fc_system'):
+                    self.app.distance_fc_system.set(carrier_system)
+                
+                # ALSO UPDATE PLAYER'S CURRENT SYSTEM since CarrierLocation indicates where the player is
+                self.last_system = carrier_system
+                self.session_system.set(self.last_system)
+                
+                # Get coordinates if available
+                coords = None
+                if "StarPos" in evt:
+                    coords = tuple(evt["StarPos"])
+                
+                # Notify main app - centralized system update
+                # CarrierLocation is NOT a visit - it's position info, not arrival
+                # The actual arrival was recorded by CarrierJump event
+                if self.main_app and hasattr(self.main_app, 'update_current_system'):
+                    self.main_app.update_current_system(self.last_system, coords, count_visit=False)
+                
+                # Update distances in Distance Calculator (non-blocking)
+                if hasattr(self.app, '_update_home_fc_distances'):
+                    self.app.after(100, self.app._update_home_fc_distances)
+            
+            # Handle station/carrier context - use real-time Status.json for docked state
+            journal_docked_status = evt.get("Docked", False)
+            real_time_docked_status = self._get_current_docked_status()
+            # Debug removed
+            
+            # Use real-time docked status from Status.json, but get station info from journal
+            if real_time_docked_status and journal_docked_status:
+                # Both journal and Status.json agree we're docked - use station info from journal
+                station_name = evt.get("StationName", "")
+                station_type = evt.get("StationType", "")
+                
+                if station_type == "FleetCarrier":
+                    self.last_carrier_name = station_name
+                    self.last_station_name = ""
+                else:
+                    self.last_station_name = station_name
+                    self.last_carrier_name = ""
+            elif not real_time_docked_status:
+                # Status.json shows we're not docked - clear station/carrier context
+                self.last_station_name = ""
+                self.last_carrier_name = ""
+            # else: Journal/Status.json mismatch - trust Status.json
+                self.last_station_name = ""
+                self.last_carrier_name = ""
+            
+            # Update body from events that contain Body data  
+            body_name = evt.get("Body") or evt.get("BodyName")
+            body_type = evt.get("BodyType", "")
+            system_name = evt.get("StarSystem") or self.last_system or ""
+            
+            # Only set last_body if it's not just the system name (i.e., we're at a ring/planet, not a star)
+            # Stars have BodyType "Star" and their name often matches or is very similar to system name
+            if body_name:
+                # Skip if body is exactly the system name or body is a Star type
+                is_star = body_type == "Star" or body_name == system_name
+                if not is_star:
+                    self.last_body = body_name
+                    self.last_body_type = body_type
+                elif ev == "FSDJump":
+                    # Clear body when jumping to a new system (we're at the arrival star)
+                    self.last_body = ""
+                    self.last_body_type = ""
             
-            # Auto-start session on first prospector limpet launch
-            if ev == "LaunchDrone" and evt.get("Type") == "Prospector":
-                if self.auto_start_on_prospector and not self.session_active:
-                    # Auto-start session on first prospector
-                    print(f"[AUTO-START] Prospector launched - auto-starting session")
-                    self.after(100, self._session_start)  # Delay slightly to ensure UI is ready
+            # Check Status.json for real-time location after Location/FSDJump events
+            self._check_status_location_fields()
+            
+            # Only update location display if we have meaningful context
+            # Priority: Fleet Carrier > Station > Body (only if body is not empty)
+            if self.last_carrier_name or self.last_station_name or self.last_body:
+                body_display = _extract_location_display(
+                    self.last_body or "", 
+                    self.last_body_type, 
+                    self.last_station_name, 
+                    self.last_carrier_name,
+                    self.last_system or self.session_system.get() or ""
+                )
+                self.session_body.set(body_display)
+            else:
+                # No meaningful body context - clear the field
+                self.session_body.set("")
+                
+        elif ev in ("ApproachBody",):
+            # Body-only events - but don't override fleet carrier context while navigating
+            if not self.startup_processing:
+                body_name = evt.get("Body") or evt.get("BodyName")
+                if body_name:
+                    self.last_body = body_name
+                    self.last_body_type = evt.get("BodyType", "")
                     
-                    # Auto-switch to Mining Session tab when launching prospector (same as entering ring)
-                    self._auto_switch_to_mining_tab()
-
-            if ev in ("Location", "FSDJump"):
-                # Update system from events that contain StarSystem data
+                    # Only update display if we don't have carrier/station context (avoid overriding navigation targets)
+                    if not self.last_carrier_name and not self.last_station_name:
+                        body_display = _extract_location_display(
+                            body_name, 
+                            self.last_body_type, 
+                            self.last_station_name, 
+                            self.last_carrier_name,
+                            self.last_system or self.session_system.get() or ""
+                        )
+                        self.session_body.set(body_display)
+                
+        elif ev in ("SupercruiseEntry", "SupercruiseExit"):
+            # Update supercruise state on the main app for overlay suppression
+            if self.main_app:
+                self.main_app._in_supercruise = (ev == "SupercruiseEntry")
+            # Handle SupercruiseExit during startup to get accurate BodyType for rings
+            if ev == "SupercruiseExit":
+                self._sc_tab_switched = False  # Allow switch again on next entry
+                body_name = evt.get("Body") or evt.get("BodyName")
+                if body_name:
+                    self.last_body = body_name
+                    self.last_body_type = evt.get("BodyType", "")
+                    # During startup, just update the data without display changes
+                    if not self.startup_processing:
+                        # Clear carrier/station context since we've dropped into normal space
+                        self.last_carrier_name = ""
+                        self.last_station_name = ""
+                        # Update display immediately with the new body info
+                        body_display = _extract_location_display(
+                            self.last_body, 
+                            self.last_body_type, 
+                            self.last_station_name, 
+                            self.last_carrier_name,
+                            self.last_system or self.session_system.get() or ""
+                        )
+                        self.session_body.set(body_display)
+                        
+                        # Note: Auto-switch to Mining Session happens on prospector launch, not ring entry
+            
+            # Handle SupercruiseEntry - auto-switch to Hotspots Finder
+            if ev == "SupercruiseEntry" and not self.startup_processing:
+                # Check if there's a pending switch from session end
+                if getattr(self, '_pending_ring_finder_switch', False):
+                    self._pending_ring_finder_switch = False
+                    self._auto_switch_to_ring_finder_delayed()
+                else:
+                    self._auto_switch_to_ring_finder_tab()
+                        
+            # Real-time supercruise events (not during startup)
+            if not self.startup_processing:
+                # Real-time supercruise events - check Status.json first
+                self._check_status_location_fields()
+                
+                # Update system info if available
                 if evt.get("StarSystem"):
                     self.last_system = evt.get("StarSystem")
                     self.session_system.set(self.last_system)
-                    
-                    # Get coordinates if available
-                    coords = None
-                    if "StarPos" in evt:
-                        coords = tuple(evt["StarPos"])
-                    
-                    # Notify main app - centralized system update
-                    # Location is NOT a visit (game startup), FSDJump IS a visit
-                    should_count = (ev == "FSDJump")
-                    if self.main_app and hasattr(self.main_app, 'update_current_system'):
-                        self.main_app.update_current_system(self.last_system, coords, count_visit=should_count)
-                        # Update distances in background (non-blocking)
-                        if hasattr(self.main_app, '_update_home_fc_distances'):
-                            self.main_app.after(100, self.main_app._update_home_fc_distances)
                 
-                    # Update location context
-                    self.last_body_type = evt.get("BodyType", "")
+                # SupercruiseExit is already handled above (both startup and real-time)
                 
-                    # Auto-switch to Hotspots Finder on FSD jump (not during startup)
-                    if ev == "FSDJump" and not self.startup_processing:
-                        # Check if there's a pending switch from session end
-                        if getattr(self, '_pending_ring_finder_switch', False):
-                            self._pending_ring_finder_switch = False
-                            self._auto_switch_to_ring_finder_delayed()
-                        else:
-                            self._auto_switch_to_ring_finder_tab()
+                # For other supercruise events, clear docked context if Status.json doesn't show we're at a destination
+                elif not self.last_carrier_name and not self.last_station_name:
+                    # Update display with current location info
+                    body_display = _extract_location_display(
+                        self.last_body or "", 
+                        self.last_body_type, 
+                        self.last_station_name, 
+                        self.last_carrier_name,
+                        self.last_system or self.session_system.get() or ""
+                    )
+                    self.session_body.set(body_display)
+                
+        elif ev in ("Docked",):
+            # Check Status.json for real-time location when docking occurs
+            self._check_status_location_fields()
             
-            # Track Fleet Carrier location changes
-            if ev == "CarrierLocation":
-                carrier_system = evt.get("StarSystem")
-                if carrier_system:
-                    print(f"[FLEET CARRIER] CarrierLocation: system={carrier_system}")
-                    
-                    # Update fleet carrier system in distance calculator
-                    if hasattr(self.app, 'distance_fc_system'):
-                        self.app.distance_fc_system.set(carrier_system)
-                    
-                    # ALSO UPDATE PLAYER'S CURRENT SYSTEM since CarrierLocation indicates where the player is
-                    self.last_system = carrier_system
-                    self.session_system.set(self.last_system)
-                    
-                    # Get coordinates if available
-                    coords = None
-                    if "StarPos" in evt:
-                        coords = tuple(evt["StarPos"])
-                    
-                    # Notify main app - centralized system update
-                    # CarrierLocation is NOT a visit - it's position info, not arrival
-                    # The actual arrival was recorded by CarrierJump event
-                    if self.main_app and hasattr(self.main_app, 'update_current_system'):
-                        self.main_app.update_current_system(self.last_system, coords, count_visit=False)
-                    
-                    # Update distances in Distance Calculator (non-blocking)
-                    if hasattr(self.app, '_update_home_fc_distances'):
-                        self.app.after(100, self.app._update_home_fc_distances)
+            # Also check real-time docked status for consistency
+            real_time_docked_status = self._get_current_docked_status()
+            journal_station_name = evt.get("StationName", "")
+            journal_station_type = evt.get("StationType", "")
+            
+            # Debug removed
+            
+            # Status.json check should have already updated location, but validate with journal data
+            if real_time_docked_status:
+                if journal_station_type == "FleetCarrier":
+                    if not self.last_carrier_name:  # Only update if Status.json didn't already set it
+                        self.last_carrier_name = journal_station_name
+                        self.last_station_name = ""
+                else:
+                    if not self.last_station_name:  # Only update if Status.json didn't already set it
+                        self.last_station_name = journal_station_name
+                        self.last_carrier_name = ""
                 
-                # Handle station/carrier context - use real-time Status.json for docked state
-                journal_docked_status = evt.get("Docked", False)
-                real_time_docked_status = self._get_current_docked_status()
+                # Update display with docking context
+                body_display = _extract_location_display(
+                    self.last_body or "", 
+                    self.last_body_type, 
+                    self.last_station_name, 
+                    self.last_carrier_name,
+                    self.last_system or self.session_system.get() or ""
+                )
+                self.session_body.set(body_display)
                 # Debug removed
+            else:
+                # Debug removed - ignoring journal docking event when Status.json shows not docked
+                pass
                 
-                # Use real-time docked status from Status.json, but get station info from journal
-                if real_time_docked_status and journal_docked_status:
-                    # Both journal and Status.json agree we're docked - use station info from journal
-                    station_name = evt.get("StationName", "")
-                    station_type = evt.get("StationType", "")
-                    
-                    if station_type == "FleetCarrier":
-                        self.last_carrier_name = station_name
-                        self.last_station_name = ""
-                    else:
-                        self.last_station_name = station_name
-                        self.last_carrier_name = ""
-                elif not real_time_docked_status:
-                    # Status.json shows we're not docked - clear station/carrier context
-                    self.last_station_name = ""
-                    self.last_carrier_name = ""
-                # else: Journal/Status.json mismatch - trust Status.json
-                    self.last_station_name = ""
-                    self.last_carrier_name = ""
+        elif ev in ("CarrierJump", "CarrierLocation"):
+            # Fleet carrier jump - update carrier context
+            print(f"[DEBUG] Processing {ev} event: {evt.get('StarSystem', 'NO_SYSTEM')}")  # Debug
+            carrier_name = evt.get("StationName", "") or evt.get("CarrierName", "")
+            if carrier_name:
+                self.last_carrier_name = carrier_name
+                self.last_station_name = ""
                 
-                # Update body from events that contain Body data  
+                # Update body info from carrier event
                 body_name = evt.get("Body") or evt.get("BodyName")
-                body_type = evt.get("BodyType", "")
-                system_name = evt.get("StarSystem") or self.last_system or ""
-                
-                # Only set last_body if it's not just the system name (i.e., we're at a ring/planet, not a star)
-                # Stars have BodyType "Star" and their name often matches or is very similar to system name
                 if body_name:
-                    # Skip if body is exactly the system name or body is a Star type
-                    is_star = body_type == "Star" or body_name == system_name
-                    if not is_star:
-                        self.last_body = body_name
-                        self.last_body_type = body_type
-                    elif ev == "FSDJump":
-                        # Clear body when jumping to a new system (we're at the arrival star)
-                        self.last_body = ""
-                        self.last_body_type = ""
-                
-                # Check Status.json for real-time location after Location/FSDJump events
-                self._check_status_location_fields()
-                
-                # Only update location display if we have meaningful context
-                # Priority: Fleet Carrier > Station > Body (only if body is not empty)
-                if self.last_carrier_name or self.last_station_name or self.last_body:
+                    self.last_body = body_name
+                    self.last_body_type = evt.get("BodyType", "")
+                    
                     body_display = _extract_location_display(
-                        self.last_body or "", 
+                        body_name, 
                         self.last_body_type, 
                         self.last_station_name, 
                         self.last_carrier_name,
                         self.last_system or self.session_system.get() or ""
                     )
                     self.session_body.set(body_display)
-                else:
-                    # No meaningful body context - clear the field
-                    self.session_body.set("")
                     
-            elif ev in ("ApproachBody",):
-                # Body-only events - but don't override fleet carrier context while navigating
-                if not self.startup_processing:
-                    body_name = evt.get("Body") or evt.get("BodyName")
-                    if body_name:
-                        self.last_body = body_name
-                        self.last_body_type = evt.get("BodyType", "")
-                        
-                        # Only update display if we don't have carrier/station context (avoid overriding navigation targets)
-                        if not self.last_carrier_name and not self.last_station_name:
-                            body_display = _extract_location_display(
-                                body_name, 
-                                self.last_body_type, 
-                                self.last_station_name, 
-                                self.last_carrier_name,
-                                self.last_system or self.session_system.get() or ""
-                            )
-                            self.session_body.set(body_display)
-                    
-            elif ev in ("SupercruiseEntry", "SupercruiseExit"):
-                # Update supercruise state on the main app for overlay suppression
-                if self.main_app:
-                    self.main_app._in_supercruise = (ev == "SupercruiseEntry")
-                # Handle SupercruiseExit during startup to get accurate BodyType for rings
-                if ev == "SupercruiseExit":
-                    self._sc_tab_switched = False  # Allow switch again on next entry
-                    body_name = evt.get("Body") or evt.get("BodyName")
-                    if body_name:
-                        self.last_body = body_name
-                        self.last_body_type = evt.get("BodyType", "")
-                        # During startup, just update the data without display changes
-                        if not self.startup_processing:
-                            # Clear carrier/station context since we've dropped into normal space
-                            self.last_carrier_name = ""
-                            self.last_station_name = ""
-                            # Update display immediately with the new body info
-                            body_display = _extract_location_display(
-                                self.last_body, 
-                                self.last_body_type, 
-                                self.last_station_name, 
-                                self.last_carrier_name,
-                                self.last_system or self.session_system.get() or ""
-                            )
-                            self.session_body.set(body_display)
-                            
-                            # Note: Auto-switch to Mining Session happens on prospector launch, not ring entry
-                
-                # Handle SupercruiseEntry - auto-switch to Hotspots Finder
-                if ev == "SupercruiseEntry" and not self.startup_processing:
-                    # Check if there's a pending switch from session end
-                    if getattr(self, '_pending_ring_finder_switch', False):
-                        self._pending_ring_finder_switch = False
-                        self._auto_switch_to_ring_finder_delayed()
-                    else:
-                        self._auto_switch_to_ring_finder_tab()
-                            
-                # Real-time supercruise events (not during startup)
-                if not self.startup_processing:
-                    # Real-time supercruise events - check Status.json first
-                    self._check_status_location_fields()
-                    
-                    # Update system info if available
-                    if evt.get("StarSystem"):
-                        self.last_system = evt.get("StarSystem")
-                        self.session_system.set(self.last_system)
-                    
-                    # SupercruiseExit is already handled above (both startup and real-time)
-                    
-                    # For other supercruise events, clear docked context if Status.json doesn't show we're at a destination
-                    elif not self.last_carrier_name and not self.last_station_name:
-                        # Update display with current location info
-                        body_display = _extract_location_display(
-                            self.last_body or "", 
-                            self.last_body_type, 
-                            self.last_station_name, 
-                            self.last_carrier_name,
-                            self.last_system or self.session_system.get() or ""
-                        )
-                        self.session_body.set(body_display)
-                    
-            elif ev in ("Docked",):
-                # Check Status.json for real-time location when docking occurs
+        elif ev in ("Touchdown",):
+            # Planetary landing event - check Status.json for current state
+            if not self.startup_processing:
                 self._check_status_location_fields()
                 
-                # Also check real-time docked status for consistency
-                real_time_docked_status = self._get_current_docked_status()
-                journal_station_name = evt.get("StationName", "")
-                journal_station_type = evt.get("StationType", "")
-                
-                # Debug removed
-                
-                # Status.json check should have already updated location, but validate with journal data
-                if real_time_docked_status:
-                    if journal_station_type == "FleetCarrier":
-                        if not self.last_carrier_name:  # Only update if Status.json didn't already set it
-                            self.last_carrier_name = journal_station_name
-                            self.last_station_name = ""
-                    else:
-                        if not self.last_station_name:  # Only update if Status.json didn't already set it
-                            self.last_station_name = journal_station_name
-                            self.last_carrier_name = ""
-                    
-                    # Update display with docking context
+                # Update body info from the event
+                body_name = evt.get("Body") or evt.get("BodyName")
+                if body_name:
+                    self.last_body = body_name
+                    self.last_body_type = "Planet"
+                    # Debug removed - touchdown event
+                    self._update_location_display()
+                    
+        elif ev in ("Liftoff", "Undocked"):
+            # During startup, ignore historical undock events to preserve current state
+            if not self.startup_processing:
+                # Real-time undock events - clear station/carrier context
+                self.last_station_name = ""
+                self.last_carrier_name = ""
+                
+                # Update display with current body
+                if self.last_body:
                     body_display = _extract_location_display(
-                        self.last_body or "", 
+                        self.last_body, 
                         self.last_body_type, 
                         self.last_station_name, 
                         self.last_carrier_name,
                         self.last_system or self.session_system.get() or ""
                     )
                     self.session_body.set(body_display)
-                    # Debug removed
-                else:
-                    # Debug removed - ignoring journal docking event when Status.json shows not docked
-                    pass
-                    
-            elif ev in ("CarrierJump", "CarrierLocation"):
-                # Fleet carrier jump - update carrier context
-                print(f"[DEBUG] Processing {ev} event: {evt.get('StarSystem', 'NO_SYSTEM')}")  # Debug
-                carrier_name = evt.get("StationName", "") or evt.get("CarrierName", "")
-                if carrier_name:
-                    self.last_carrier_name = carrier_name
-                    self.last_station_name = ""
-                    
-                    # Update body info from carrier event
-                    body_name = evt.get("Body") or evt.get("BodyName")
-                    if body_name:
-                        self.last_body = body_name
-                        self.last_body_type = evt.get("BodyType", "")
-                        
-                        body_display = _extract_location_display(
-                            body_name, 
-                            self.last_body_type, 
-                            self.last_station_name, 
-                            self.last_carrier_name,
-                            self.last_system or self.session_system.get() or ""
-                        )
-                        self.session_body.set(body_display)
-                        
-            elif ev in ("Touchdown",):
-                # Planetary landing event - check Status.json for current state
-                if not self.startup_processing:
-                    self._check_status_location_fields()
-                    
-                    # Update body info from the event
-                    body_name = evt.get("Body") or evt.get("BodyName")
-                    if body_name:
-                        self.last_body = body_name
-                        self.last_body_type = "Planet"
-                        # Debug removed - touchdown event
-                        self._update_location_display()
-                        
-            elif ev in ("Liftoff", "Undocked"):
-                # During startup, ignore historical undock events to preserve current state
-                if not self.startup_processing:
-                    # Real-time undock events - clear station/carrier context
-                    self.last_station_name = ""
-                    self.last_carrier_name = ""
-                    
-                    # Update display with current body
-                    if self.last_body:
-                        body_display = _extract_location_display(
-                            self.last_body, 
-                            self.last_body_type, 
-                            self.last_station_name, 
-                            self.last_carrier_name,
-                            self.last_system or self.session_system.get() or ""
-                        )
-                        self.session_body.set(body_display)
 
-            if ev == "ProspectedAsteroid":
-                # Check if this is a startup skip (old event from before app started)
-                if self._startup_skip:
-                    self._startup_skip = False  # Clear flag immediately to process first event
-                    
-                    # Check timestamp - if event is more than 10 seconds old, skip it
-                    event_time = evt.get("timestamp", "")
-                    
-                    if event_time:
-                        try:
-                            from datetime import datetime, timezone
-                            event_dt = datetime.fromisoformat(event_time.replace('Z', '+00:00'))
-                            now_dt = datetime.now(timezone.utc)
-                            time_diff = (now_dt - event_dt).total_seconds()
-                            
-                            print(f"[STARTUP DEBUG] First ProspectedAsteroid - Age: {time_diff:.1f}s")
-                            
-                            if time_diff > 30:  # Event is older than 30 seconds (increased to handle app restart delays)
-                                print(f"[STARTUP DEBUG] Skipping old event (>{30}s old)")
-                                return  # Skip only old events
-                            else:
-                                print(f"[STARTUP DEBUG] Processing fresh event (<{30}s old)")
-                        except Exception as e:
-                            print(f"[STARTUP DEBUG] Timestamp parse error: {e}, processing anyway")
-                            pass  # If timestamp parsing fails, process the event
-                materials_txt, content_txt, time_txt, panel_summary, speak_summary, triggered = self._summaries_from_event(evt)
-                self.history.insert(0, (materials_txt, content_txt, time_txt))
+        if ev == "ProspectedAsteroid":
+            # Check if this is a startup skip (old event from before app started)
+            if self._startup_skip:
+                self._startup_skip = False  # Clear flag immediately to process first event
                 
-                # Track yield data and update statistics ONLY if session is active AND not paused
-                # This prevents counting prospector events when session is paused
-                if self.session_active and not self.session_paused:
-                    # Track yield data during session for later CSV calculation
-                    self._track_session_yield_data(materials_txt)
-                    
-                    # Update mining statistics with the prospector result
-                    self._update_mining_statistics(evt)
-                elif self.session_paused:
-                    print("[PROSPECTOR] Session paused - skipping statistics tracking")
+                # Check timestamp - if event is more than 10 seconds old, skip it
+                event_time = evt.get("timestamp", "")
+                
+                if event_time:
+                    try:
+                        from datetime import datetime, timezone
+                        event_dt = datetime.fromisoformat(event_time.replace('Z', '+00:00'))
+                        now_dt = datetime.now(timezone.utc)
+                        time_diff = (now_dt - event_dt).total_seconds()
+                        
+                        print(f"[STARTUP DEBUG] First ProspectedAsteroid - Age: {time_diff:.1f}s")
+                        
+                        if time_diff > 30:  # Event is older than 30 seconds (increased to handle app restart delays)
+                            print(f"[STARTUP DEBUG] Skipping old event (>{30}s old)")
+                            return  # Skip only old events
+                        else:
+                            print(f"[STARTUP DEBUG] Processing fresh event (<{30}s old)")
+                    except Exception as e:
+                        print(f"[STARTUP DEBUG] Timestamp parse error: {e}, processing anyway")
+                        pass  # If timestamp parsing fails, process the event
+            materials_txt, content_txt, time_txt, panel_summary, speak_summary, triggered = self._summaries_from_event(evt)
+            self.history.insert(0, (materials_txt, content_txt, time_txt))
+            
+            # Track yield data and update statistics ONLY if session is active AND not paused
+            # This prevents counting prospector events when session is paused
+            if self.session_active and not self.session_paused:
+                # Track yield data during session for later CSV calculation
+                self._track_session_yield_data(materials_txt)
                 
-                self._refresh_table()
-                # Remove old enabled check - announcements now controlled by core/non-core toggles
+                # Update mining statistics with the prospector result
+                self._update_mining_statistics(evt)
+            elif self.session_paused:
+                print("[PROSPECTOR] Session paused - skipping statistics tracking")
+            
+            self._refresh_table()
+            # Remove old enabled check - announcements now controlled by core/non-core toggles
 
-                # Always update the full on-screen readout
-                self._write_var_text("prospectReadout", panel_summary)
+            # Always update the full on-screen readout
+            self._write_var_text("prospectReadout", panel_summary)
 
-                # Only write a filtered, short line to the TTS file when rules are met
-                core_toggle = bool(self.announcement_vars["Core Asteroids"].get())
-                noncore_toggle = bool(self.announcement_vars["Non-Core Asteroids"].get())
-                
-                mother = evt.get("MotherlodeMaterial_Localised") or evt.get("MotherlodeMaterial")
-                mother = _clean_name(mother) if isinstance(mother, str) else ""
-                
-                # Track if any announcement was made
-                announcement_made = False
-                
-                # Prepare announcement components
-                core_msg = ""
-                noncore_msg = ""
-                
-                # Prepare core announcement if toggle is enabled and motherlode present
-                # Normalize motherlode name to English for lookup in announce_map
-                if mother:
-                    mother_for_lookup = JournalParser.normalize_material_name(mother)
-                    if core_toggle and self.announce_map.get(mother_for_lookup, True):
-                        if "Remaining Depleted" not in panel_summary:
-                            core_msg = f"Motherlode: {mother}"
-                
-                # Prepare non-core announcement if toggle is enabled
-                if noncore_toggle and triggered and speak_summary:
+            # Only write a filtered, short line to the TTS file when rules are met
+            core_toggle = bool(self.announcement_vars["Core Asteroids"].get())
+            noncore_toggle = bool(self.announcement_vars["Non-Core Asteroids"].get())
+            
+            mother = evt.get("MotherlodeMaterial_Localised") or evt.get("MotherlodeMaterial")
+            mother = _clean_name(mother) if isinstance(mother, str) else ""
+            
+            # Track if any announcement was made
+            announcement_made = False
+            
+            # Prepare announcement components
+            core_msg = ""
+            noncore_msg = ""
+            
+            # Prepare core announcement if toggle is enabled and motherlode present
+            # Normalize motherlode name to English for lookup in announce_map
+            if mother:
+                mother_for_lookup = JournalParser.normalize_material_name(mother)
+                if core_toggle and self.announce_map.get(mother_for_lookup, True):
                     if "Remaining Depleted" not in panel_summary:
-                        # Create a clean list of non-core materials only
-                        non_core_materials = []
+                        core_msg = f"Motherlode: {mother}"
+            
+            # Prepare non-core announcement if toggle is enabled
+            if noncore_toggle and triggered and speak_summary:
+                if "Remaining Depleted" not in panel_summary:
+                    # Create a clean list of non-core materials only
+                    non_core_materials = []
+                    
+                    # Split speak_summary and filter out motherlode (motherlode should never appear in non-core)
+                    for part in speak_summary.split(", "):
+                        part = part.strip()
+                        # Always filter out motherlode from non-core announcements
+                        if not (mother and part.startswith(f"Motherlode: {mother}")):
+                            non_core_materials.append(part)
+                    
+                    if non_core_materials:
+                        # Reorder the materials (percentage first, then material name)
+                        # Handle multi-word material names by splitting at the LAST space (percentage is always last word)
+                        reordered_materials = []
+                        for p in non_core_materials:
+                            if p.startswith("Motherlode:"):
+                                reordered_materials.append(p)
+                            else:
+                                parts = p.rsplit(' ', 1)  # Split at last space only
+                                if len(parts) == 2:
+                                    # Swap: "Material Name 18.7%" -> "18.7 percent Material Name"
+                                    # Remove % sign and add "percent" for better TTS pronunciation
+                                    pct_part = parts[1].replace('%', '').strip()
+                                    material_name = parts[0].strip()
+                                    # Format for TTS: "point nine eight percent" for better clarity
+                                    reordered_materials.append(f"{pct_part} percent {material_name}")
+                                else:
+                                    reordered_materials.append(p)
                         
-                        # Split speak_summary and filter out motherlode (motherlode should never appear in non-core)
-                        for part in speak_summary.split(", "):
-                            part = part.strip()
-                            # Always filter out motherlode from non-core announcements
-                            if not (mother and part.startswith(f"Motherlode: {mother}")):
-                                non_core_materials.append(part)
+                        # Join materials with "and" before the last item
+                        if len(reordered_materials) == 1:
+                            noncore_msg = reordered_materials[0]
+                        elif len(reordered_materials) == 2:
+                            noncore_msg = f"{reordered_materials[0]} and {reordered_materials[1]}"
+                        else:
+                            # Multiple materials: "A, B, C and D"
+                            noncore_msg = ", ".join(reordered_materials[:-1]) + f" and {reordered_materials[-1]}"
                         
-                        if non_core_materials:
-                            # Reorder the materials (percentage first, then material name)
-                            # Handle multi-word material names by splitting at the LAST space (percentage is always last word)
-                            reordered_materials = []
-                            for p in non_core_materials:
-                                if p.startswith("Motherlode:"):
-                                    reordered_materials.append(p)
-                                else:
-                                    parts = p.rsplit(' ', 1)  # Split at last space only
-                                    if len(parts) == 2:
-                                        # Swap: "Material Name 18.7%" -> "18.7 percent Material Name"
-                                        # Remove % sign and add "percent" for better TTS pronunciation
-                                        pct_part = parts[1].replace('%', '').strip()
-                                        material_name = parts[0].strip()
-                                        # Format for TTS: "point nine eight percent" for better clarity
-                                        reordered_materials.append(f"{pct_part} percent {material_name}")
-                                    else:
-                                        reordered_materials.append(p)
-                            
-                            # Join materials with "and" before the last item
-                            if len(reordered_materials) == 1:
-                                noncore_msg = reordered_materials[0]
-                            elif len(reordered_materials) == 2:
-                                noncore_msg = f"{reordered_materials[0]} and {reordered_materials[1]}"
-                            else:
-                                # Multiple materials: "A, B, C and D"
-                                noncore_msg = ", ".join(reordered_materials[:-1]) + f" and {reordered_materials[-1]}"
-                            
 
-                
-                # ALWAYS show overlay (even if below threshold)
-                # The overlay shows the full panel_summary data regardless of announcement settings
-                if self.text_overlay:
-                    # Determine what message to use for TTS (may be empty if nothing triggered)
-                    if core_msg and noncore_msg:
-                        tts_msg = f"Prospector Reports: {core_msg} and {noncore_msg}"
-                    elif core_msg:
-                        tts_msg = f"Prospector Reports: {core_msg}"
-                    elif noncore_msg:
-                        tts_msg = f"Prospector Reports: {noncore_msg}"
-                    else:
-                        tts_msg = ""  # No TTS, but still show overlay
-                    
-                    # Show overlay with both filtered and unfiltered data
-                    # Pass mother (core material) for enhanced overlay display
-                    self._show_prospector_overlay_or_standard(tts_msg, panel_summary, materials_txt, content_txt, mother)
-                
-                # TTS announcement (only if triggered)
+            
+            # ALWAYS show overlay (even if below threshold)
+            # The overlay shows the full panel_summary data regardless of announcement settings
+            if self.text_overlay:
+                # Determine what message to use for TTS (may be empty if nothing triggered)
                 if core_msg and noncore_msg:
-                    # Both core and non-core - combine with "and"
-                    msg = f"Prospector Reports: {core_msg} and {noncore_msg}"
-                    announcer.say(msg)
-                    announcement_made = True
-                    self._set_status("Combined core and non-core announcement triggered.")
+                    tts_msg = f"Prospector Reports: {core_msg} and {noncore_msg}"
                 elif core_msg:
-                    # Only core
-                    msg = f"Prospector Reports: {core_msg}"
-                    announcer.say(msg)
-                    announcement_made = True
-                    self._set_status("Core announcement triggered.")
+                    tts_msg = f"Prospector Reports: {core_msg}"
                 elif noncore_msg:
-                    # Only non-core
-                    msg = f"Prospector Reports: {noncore_msg}"
-                    announcer.say(msg)
-                    announcement_made = True
-                    self._set_status("Non-core announcement triggered.")
-
-            if self.session_active and ev == "MiningRefined":
-                name = _clean_name(evt.get("Type_Localised") or evt.get("Type") or "")
-                if name:
-                    self.session_totals[name] = self.session_totals.get(name, 0.0) + 1.0  # 1 ton per refine
-                    
-                    # Update session location from actual mining location (not carrier/station where session started)
-                    if not self.session_location_captured_from_mining:
-                        if self.last_system:
-                            self.session_system.set(self.last_system)
-                            print(f"[Session Location] Updated system from mining: {self.last_system}")
-                        if self.last_body:
-                            body_display = _extract_location_display(
-                                self.last_body, 
-                                self.last_body_type, 
-                                self.last_station_name, 
-                                self.last_carrier_name,
-                                self.last_system or self.session_system.get() or ""
-                            )
-                            self.session_body.set(body_display)
-                            # PRESERVE mining location for report (won't be overwritten by docking)
-                            self.session_mining_body = body_display
-                            print(f"[Session Location] Updated body from mining: {body_display}")
-                            print(f"[Session Location] PRESERVED mining body: {self.session_mining_body}")
-                        self.session_location_captured_from_mining = True
-
-            # Mining mission tracking
-            if MISSIONS_AVAILABLE:
-                mission_tracker = get_mission_tracker()
-                if mission_tracker:
-                    if ev == "MissionAccepted":
-                        mission_tracker.handle_mission_accepted(evt)
-                    elif ev == "MissionCompleted":
-                        mission_tracker.handle_mission_completed(evt)
-                    elif ev == "MissionAbandoned":
-                        mission_tracker.handle_mission_abandoned(evt)
-                    elif ev == "MissionFailed":
-                        mission_tracker.handle_mission_failed(evt)
-                    elif ev == "CargoDepot":
-                        mission_tracker.handle_cargo_depot(evt)
+                    tts_msg = f"Prospector Reports: {noncore_msg}"
+                else:
+                    tts_msg = ""  # No TTS, but still show overlay
+                
+                # Show overlay with both filtered and unfiltered data
+                # Pass mother (core material) for enhanced overlay display
+                self._show_prospector_overlay_or_standard(tts_msg, panel_summary, materials_txt, content_txt, mother)
+            
+            # TTS announcement (only if triggered)
+            if core_msg and noncore_msg:
+                # Both core and non-core - combine with "and"
+                msg = f"Prospector Reports: {core_msg} and {noncore_msg}"
+                announcer.say(msg)
+                announcement_made = True
+                self._set_status("Combined core and non-core announcement triggered.")
+            elif core_msg:
+                # Only core
+                msg = f"Prospector Reports: {core_msg}"
+                announcer.say(msg)
+                announcement_made = True
+                self._set_status("Core announcement triggered.")
+            elif noncore_msg:
+                # Only non-core
+                msg = f"Prospector Reports: {noncore_msg}"
+                announcer.say(msg)
+                announcement_made = True
+                self._set_status("Non-core announcement triggered.")
+
+        if self.session_active and ev == "MiningRefined":
+            name = _clean_name(evt.get("Type_Localised") or evt.get("Type") or "")
+            if name:
+                self.session_totals[name] = self.session_totals.get(name, 0.0) + 1.0  # 1 ton per refine
+                
+                # Update session location from actual mining location (not carrier/station where session started)
+                if not self.session_location_captured_from_mining:
+                    if self.last_system:
+                        self.session_system.set(self.last_system)
+                        print(f"[Session Location] Updated system from mining: {self.last_system}")
+                    if self.last_body:
+                        body_display = _extract_location_display(
+                            self.last_body, 
+                            self.last_body_type, 
+                            self.last_station_name, 
+                            self.last_carrier_name,
+                            self.last_system or self.session_system.get() or ""
+                        )
+                        self.session_body.set(body_display)
+                        # PRESERVE mining location for report (won't be overwritten by docking)
+                        self.session_mining_body = body_display
+                        print(f"[Session Location] Updated body from mining: {body_display}")
+                        print(f"[Session Location] PRESERVED mining body: {self.session_mining_body}")
+                    self.session_location_captured_from_mining = True
+
+        # Mining mission tracking
+        if MISSIONS_AVAILABLE:
+            mission_tracker = get_mission_tracker()
+            if mission_tracker:
+                if ev == "MissionAccepted":
+                    mission_tracker.handle_mission_accepted(evt)
+                elif ev == "MissionCompleted":
+                    mission_tracker.handle_mission_completed(evt)
+                elif ev == "MissionAbandoned":
+                    mission_tracker.handle_mission_abandoned(evt)
+                elif ev == "MissionFailed":
+                    mission_tracker.handle_mission_failed(evt)
+                elif ev == "CargoDepot":
+                    mission_tracker.handle_cargo_depot(evt)
 
     def _summaries_from_event(self, evt: Dict[str, Any]) -> Tuple[str, str, str, str, str, bool]:
         t = evt.get("timestamp")
@@ -11507,33 +10978,13 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                             pass
     
     def _get_comment_by_timestamp(self, timestamp):
-        """Get comment by timestamp from CSV file as fallback"""
+        """Get comment by timestamp (raw or "YYYY-MM-DD HH:MM" display format) from the session index"""
         try:
-            import csv
-            csv_path = self._get_csv_path()
-            if os.path.exists(csv_path):
-                with open(csv_path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        raw_timestamp = row['timestamp_utc']
-                        
-                        # Try direct match first
-                        if raw_timestamp == timestamp:
-                            return row.get('comment', '')
-                        
-                        # Try display format match
-                        try:
-                            if raw_timestamp.endswith('Z'):
-                                csv_dt = dt.datetime.fromisoformat(raw_timestamp.replace('Z', '+00:00'))
-                                csv_dt = csv_dt.replace(tzinfo=dt.timezone.utc).astimezone()
-                            else:
-                                csv_dt = dt.datetime.fromisoformat(raw_timestamp)
-                            
-                            display_time = csv_dt.strftime("%Y-%m-%d %H:%M")
-                            if display_time == timestamp:
-                                return row.get('comment', '')
-                        except:
-                            continue
+            index = self._get_session_index()
+            for raw_timestamp in index.match_timestamps(timestamp):
+                row = index.get(raw_timestamp)
+                if row:
+                    return row.get('comment', '')
         except Exception as e:
             log.warning(f"Error getting comment by timestamp: {e}")
         return ""
@@ -11603,62 +11054,11 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                     tree.item(item, values=new_values)
     
     def _update_comment_in_csv(self, timestamp, new_comment):
-        """Update comment in CSV file. Returns True if successful, False otherwise."""
-        import csv
-        csv_path = self._get_csv_path()
-        
-        if not os.path.exists(csv_path):
-            return False
-            
-        # Read all sessions
-        sessions = []
-        updated = False
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Find matching session by comparing timestamps
-                raw_timestamp = row['timestamp_utc']
-                
-                # Try direct match first (for raw ISO format timestamps)
-                if raw_timestamp == timestamp:
-                    row['comment'] = new_comment
-                    updated = True
-                    sessions.append(row)
-                    continue
-                
-                # If direct match fails, try parsing display format comparison
-                try:
-                    # Parse the CSV timestamp
-                    if raw_timestamp.endswith('Z'):
-                        csv_dt = dt.datetime.fromisoformat(raw_timestamp.replace('Z', '+00:00'))
-                        csv_dt = csv_dt.replace(tzinfo=dt.timezone.utc).astimezone()
-                    else:
-                        csv_dt = dt.datetime.fromisoformat(raw_timestamp)
-                    
-                    # Convert CSV timestamp to display format (YYYY-MM-DD HH:MM)
-                    display_time = csv_dt.strftime("%Y-%m-%d %H:%M")
-                    
-                    # Compare with the display timestamp (e.g., "2025-10-10 18:20")
-                    if display_time == timestamp:
-                        row['comment'] = new_comment
-                        updated = True
-                except Exception as e:
-                    pass  # Continue with next row if timestamp parsing fails
-                    
-                sessions.append(row)
-        
-        # Write back only if we found and updated a session
+        """Update comment in the session index (and its CSV export). Returns True if successful, False otherwise."""
+        index = self._get_session_index()
+        updated = sum(index.update(raw_timestamp, {'comment': new_comment})
+                      for raw_timestamp in index.match_timestamps(timestamp))
         if updated:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                fieldnames = ['timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph',
-                            'asteroids_prospected', 'materials_tracked', 'hit_rate_percent', 
-                            'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown', 'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for _r in sessions:
-                    if 'total_finds' in _r:
-                        _r.pop('total_finds', None)
-                writer.writerows(sessions)
             log.debug(f"Successfully updated comment in CSV for timestamp: {timestamp}")
             return True
         else:
@@ -11691,6 +11091,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                     ignored_items = [
                         'Detailed Reports', 'Screenshots', 'Cards', '.gitkeep',
                         'sessions_index.csv',  # Created by app on first run
+                        'sessions_index.db', 'sessions_index.db-wal', 'sessions_index.db-shm',
                         'detailed_report_mappings.json'  # Created by app on first run
                     ]
                     meaningful_contents = [c for c in contents if c not in ignored_items]
@@ -11839,56 +11240,11 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             return False
 
     def _update_body_in_csv(self, timestamp, new_body):
-        """Update body name in CSV file. Returns True if successful, False otherwise."""
-        import csv
-        csv_path = self._get_csv_path()
-        
-        if not os.path.exists(csv_path):
-            return False
-            
-        # Read all sessions
-        sessions = []
-        updated = False
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Find matching session by comparing timestamps
-                raw_timestamp = row['timestamp_utc']
-                
-                # Try direct match first (for raw ISO format timestamps)
-                if raw_timestamp == timestamp:
-                    row['body'] = new_body
-                    updated = True
-                else:
-                    # Try comparing display format timestamps
-                    try:
-                        if raw_timestamp.endswith('Z'):
-                            csv_dt = dt.datetime.fromisoformat(raw_timestamp.replace('Z', '+00:00'))
-                            csv_dt = csv_dt.replace(tzinfo=dt.timezone.utc).astimezone()
-                        else:
-                            csv_dt = dt.datetime.fromisoformat(raw_timestamp)
-                        
-                        display_time = csv_dt.strftime("%Y-%m-%d %H:%M")
-                        if display_time == timestamp:
-                            row['body'] = new_body
-                            updated = True
-                    except Exception:
-                        continue
-                        
-                sessions.append(row)
-        
-        if not updated:
-            return False
-            
-                # Write back updated sessions
+        """Update body name in the session index (and its CSV export). Returns True if successful, False otherwise."""
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-                if sessions:
-                    keys = list(sessions[0].keys())
-                    writer = csv.DictWriter(f, fieldnames=keys)
-                    writer.writeheader()
-                    writer.writerows(sessions)
-            return True
+            index = self._get_session_index()
+            return sum(index.update(raw_timestamp, {'body': new_body})
+                       for raw_timestamp in index.match_timestamps(timestamp)) > 0
         except Exception:
             return False
 
@@ -12327,7 +11683,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             self._update_csv_with_session(sysname, body, elapsed_txt, total_tons, overall_tph, cargo_session_data, session_comment, session_timestamp)
             
             # Rebuild CSV from files to ensure everything is properly synchronized
-            csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+            csv_path = self._get_csv_path()
             self._rebuild_csv_from_files_tab(csv_path, silent=True)
             
             # Refresh the Reports tab to show the new session
@@ -13941,7 +13297,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
     
     def _calculate_session_statistics(self) -> dict:
         """Calculate comprehensive statistics from all mining sessions"""
-        csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+        csv_path = self._get_csv_path()
         
         if not os.path.exists(csv_path):
             # Try to rebuild CSV from existing session files
@@ -13956,223 +13312,12 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                 return {}
         
         try:
-            import csv
-            from collections import defaultdict, Counter
-            from datetime import datetime
-            
-            sessions = []
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                sessions = list(reader)
-            
-            if not sessions:
-                return {}
-            
-            # Initialize statistics
-            stats = {
-                'total_sessions': len(sessions),
-                'total_time_hours': 0,
-                'total_tonnage': 0,
-                'systems_visited': set(),
-                'material_totals': defaultdict(float),
-                'system_stats': defaultdict(lambda: {'sessions': 0, 'tonnage': 0, 'time_hours': 0}),
-                'location_stats': defaultdict(lambda: {'sessions': 0, 'tonnage': 0, 'time_hours': 0}),
-                'best_session': {'tph': 0, 'tonnage': 0, 'session': None},
-                'avg_tph': 0,
-                'unique_systems': 0,
-                'most_mined_system': '',
-                'most_mined_location': '',
-                'most_collected_material': '',
-                'total_asteroids': 0,
-                'avg_hit_rate': 0
-            }
-            
-            # Process each session
-            total_tph_sum = 0
-            total_hit_rate_sum = 0
-            valid_tph_sessions = 0
-            valid_hit_rate_sessions = 0
-            
-            for session in sessions:
-                try:
-                    # Parse session data
-                    system = session.get('system', '')
-                    body = session.get('body', '')
-                    elapsed = session.get('elapsed', '0h 0m')
-                    tonnage = float(session.get('total_tons', 0) or 0)
-                    tph = float(session.get('overall_tph', 0) or 0)
-                    asteroids = int(session.get('asteroids_prospected', 0) or 0)
-                    hit_rate = float(session.get('hit_rate_percent', 0) or 0)
-                    materials_breakdown = session.get('materials_breakdown', '')
-                    
-                    # Convert elapsed time to hours
-                    time_hours = self._parse_elapsed_to_hours(elapsed)
-                    
-                    # Update totals
-                    stats['total_time_hours'] += time_hours
-                    stats['total_tonnage'] += tonnage
-                    stats['total_asteroids'] += asteroids
-                    stats['systems_visited'].add(system)
-                    
-                    # Track TPH for average
-                    if tph > 0:
-                        total_tph_sum += tph
-                        valid_tph_sessions += 1
-                    
-                    # Track hit rate for average
-                    if hit_rate > 0:
-                        total_hit_rate_sum += hit_rate
-                        valid_hit_rate_sessions += 1
-                    
-                    # System statistics
-                    stats['system_stats'][system]['sessions'] += 1
-                    stats['system_stats'][system]['tonnage'] += tonnage
-                    stats['system_stats'][system]['time_hours'] += time_hours
-                    
-                    # Location statistics (system + body)
-                    location = f"{system} - {body}"
-                    stats['location_stats'][location]['sessions'] += 1
-                    stats['location_stats'][location]['tonnage'] += tonnage
-                    stats['location_stats'][location]['time_hours'] += time_hours
-                    
-                    # Best session tracking
-                    if tph > stats['best_session']['tph']:
-                        stats['best_session']['tph'] = tph
-                        stats['best_session']['session'] = f"{system} - {body}"
-                    
-                    if tonnage > stats['best_session']['tonnage']:
-                        stats['best_session']['tonnage'] = tonnage
-                    
-                    # Parse materials breakdown - handle both formats
-                    if materials_breakdown:
-                        # Remove quotes if present
-                        materials_breakdown = materials_breakdown.strip('"')
-                        
-                        # Check if it's the new format (with 't' units) or old format (semicolon separated)
-                        if 't' in materials_breakdown:
-                            # New format: "Platinum:6t" or "Osmium:3t, Platinum:280t" or "Bromellite: 81.0t (40.5%)"
-                            materials = materials_breakdown.split(',') if ',' in materials_breakdown else [materials_breakdown]
-                            for material_entry in materials:
-                                if ':' in material_entry:
-                                    material_name, amount_str = material_entry.split(':', 1)
-                                    try:
-                                        # Remove 't' and handle optional yield percentage "(XX.X%)"
-                                        amount_str = amount_str.strip().replace('t', '')
-                                        # Remove anything in parentheses (yield percentage)
-                                        if '(' in amount_str:
-                                            amount_str = amount_str.split('(')[0].strip()
-                                        amount = float(amount_str)
-                                        stats['material_totals'][material_name.strip()] += amount
-                                    except ValueError:
-                                        continue
-                        else:
-                            # Old format: "Bertrandite: 10; Bauxite: 43; Painite: 6"
-                            materials = materials_breakdown.split(';')
-                            for material_entry in materials:
-                                if ':' in material_entry:
-                                    material_name, amount_str = material_entry.split(':', 1)
-                                    try:
-                                        amount = float(amount_str.strip())
-                                        stats['material_totals'][material_name.strip()] += amount
-                                    except ValueError:
-                                        continue
-                    
-                except (ValueError, TypeError) as e:
-                    continue  # Skip invalid sessions
-            
-            # Calculate derived statistics
-            stats['unique_systems'] = len(stats['systems_visited'])
-            stats['avg_tph'] = total_tph_sum / valid_tph_sessions if valid_tph_sessions > 0 else 0
-            stats['avg_hit_rate'] = total_hit_rate_sum / valid_hit_rate_sessions if valid_hit_rate_sessions > 0 else 0
-            
-            # Calculate average tons per asteroid from all sessions
-            total_tons_per = 0
-            valid_tpa_sessions = 0
-            for session in sessions:
-                try:
-                    total_tons = float(session.get('total_tons', 0) or 0)
-                    asteroids = int(session.get('asteroids_prospected', 0) or 0)
-                    if asteroids > 0 and total_tons > 0:
-                        tons_per = total_tons / asteroids
-                        total_tons_per += tons_per
-                        valid_tpa_sessions += 1
-                except (ValueError, TypeError):
-                    continue
-            stats['avg_tons_per_asteroid'] = total_tons_per / valid_tpa_sessions if valid_tpa_sessions > 0 else 0
-            
-            # Find most mined system (by tonnage)
-            if stats['system_stats']:
-                most_mined = max(stats['system_stats'].items(), key=lambda x: x[1]['tonnage'])
-                stats['most_mined_system'] = most_mined[0]
-                stats['most_mined_system_tonnage'] = most_mined[1]['tonnage']
-            
-            # Find most mined location (by tonnage)
-            if stats['location_stats']:
-                most_mined_location = max(stats['location_stats'].items(), key=lambda x: x[1]['tonnage'])
-                stats['most_mined_location'] = most_mined_location[0]
-                stats['most_mined_location_tonnage'] = most_mined_location[1]['tonnage']
-            
-            # Find most collected material
-            if stats['material_totals']:
-                # Filter out summary entries like "Total Cargo Collected"
-                actual_materials = {k: v for k, v in stats['material_totals'].items() 
-                                  if k.lower() not in ['total cargo collected', 'total', 'cargo collected']}
-                
-                if actual_materials:
-                    most_material = max(actual_materials.items(), key=lambda x: x[1])
-                    stats['most_collected_material'] = most_material[0]
-                    stats['most_collected_material_amount'] = most_material[1]
-                else:
-                    stats['most_collected_material'] = 'None'
-                    stats['most_collected_material_amount'] = 0
-                
-                # Add material count (only actual materials)
-                stats['material_count'] = len(actual_materials)
-            else:
-                stats['material_count'] = 0
-            
-            return stats
-            
+            # Running totals kept by the session index - no pass over every session
+            return self._get_session_index().get_statistics()
         except Exception as e:
             print(f"Error calculating session statistics: {e}")
             return {}
     
-    def _parse_elapsed_to_hours(self, elapsed_str: str) -> float:
-        """Convert elapsed time string to hours as float. Handles both formats:
-        - '2h 21m' (old format)
-        - '00:34:43' (new HH:MM:SS format)
-        """
-        try:
-            import re
-            
-            # Check if it's HH:MM:SS format
-            if ':' in elapsed_str and len(elapsed_str.split(':')) >= 2:
-                # New format: HH:MM:SS or HH:MM
-                time_parts = elapsed_str.split(':')
-                hours = int(time_parts[0])
-                minutes = int(time_parts[1])
-                seconds = int(time_parts[2]) if len(time_parts) > 2 else 0
-                
-                return hours + (minutes / 60.0) + (seconds / 3600.0)
-            else:
-                # Old format: 2h 21m
-                hours = 0
-                minutes = 0
-                
-                # Extract hours
-                hour_match = re.search(r'(\d+)h', elapsed_str)
-                if hour_match:
-                    hours = int(hour_match.group(1))
-                
-                # Extract minutes
-                min_match = re.search(r'(\d+)m', elapsed_str)
-                if min_match:
-                    minutes = int(min_match.group(1))
-                
-                return hours + (minutes / 60.0)
-        except:
-            return 0.0
-    
     def _calculate_ring_quality_rating(self, tph, tons_per_asteroid):
         """Calculate ring quality rating based on TPH and tons/asteroid.
         
@@ -14198,7 +13343,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             return ("No data", "#2b2b2b", "#888888")
     
     def _get_top_systems_from_csv(self, limit=5):
-        """Get top N unique systems by TPH from CSV, keeping the BEST session for each system/body.
+        """Get top N unique systems by TPH, keeping the BEST session for each system/body.
         
         T/Asteroid is calculated using HITS (asteroids with materials), not asteroids_prospected.
         Uses hit_rate_percent to derive hits: hits = asteroids_prospected * (hit_rate / 100)
@@ -14206,66 +13351,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
         Returns list of dicts with system, body, tons_per, tph, material
         """
         try:
-            import csv
-            csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
-            
-            if not os.path.exists(csv_path):
-                return []
-            
-            # Track best session for each system|body (by TPH)
-            best_sessions = {}  # key: system|body, value: session dict
-            
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    try:
-                        system = row.get('system', '')
-                        body = row.get('body', '')
-                        system_key = f"{system}|{body}"
-                        
-                        total_tons = float(row.get('total_tons', 0) or 0)
-                        asteroids = int(row.get('asteroids_prospected', 0) or 0)
-                        tph = float(row.get('overall_tph', 0) or 0)
-                        hit_rate = float(row.get('hit_rate_percent', 0) or 0)
-                        
-                        if total_tons <= 0:
-                            continue
-                        
-                        # Calculate T/Asteroid using HITS (not asteroids_prospected)
-                        # hits = asteroids that contained tracked materials
-                        if asteroids > 0 and hit_rate > 0:
-                            hits = int(round(asteroids * (hit_rate / 100.0)))
-                            hits = max(hits, 1)  # At least 1 hit if we have tons
-                            tons_per = total_tons / hits
-                        elif asteroids > 0:
-                            # Fallback: if no hit_rate, use asteroids_prospected
-                            tons_per = total_tons / asteroids
-                        else:
-                            tons_per = 0
-                        
-                        if tons_per > 0:
-                            best_material = row.get('best_material', 'Unknown')
-                            
-                            session_data = {
-                                'system': system,
-                                'body': body,
-                                'tons_per': tons_per,
-                                'tph': tph,
-                                'material': best_material
-                            }
-                            
-                            # Keep the BEST session for each system/body (by TPH)
-                            if system_key not in best_sessions or tph > best_sessions[system_key]['tph']:
-                                best_sessions[system_key] = session_data
-                                
-                    except (ValueError, TypeError):
-                        continue
-            
-            # Convert to list and sort by TPH descending
-            sessions = list(best_sessions.values())
-            sessions.sort(key=lambda x: x['tph'], reverse=True)
-            
-            return sessions[:limit]
+            return self._get_session_index().top_rings(limit)
         except Exception as e:
             print(f"Error getting top systems: {e}")
             return []
@@ -15263,7 +14349,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                 body = body_match.group(1).strip()
                 
                 # Try to match this with CSV data to get the exact date format
-                csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                csv_path = self._get_csv_path()
                 if os.path.exists(csv_path):
                     import csv
                     with open(csv_path, 'r', encoding='utf-8') as f:
@@ -15762,7 +14848,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                         f.write(content)
                     
                     # Rebuild CSV to reflect changes
-                    csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                    csv_path = self._get_csv_path()
                     self._rebuild_csv_from_files_tab(csv_path)
                     
                     # Refresh the reports tab to show updated session immediately
@@ -16065,7 +15151,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
                     
                     # Load detailed analytics from CSV if available (populate session_data)
                     try:
-                        csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                        csv_path = self._get_csv_path()
                         if os.path.exists(csv_path):
                             import csv
                             with open(csv_path, 'r', encoding='utf-8') as f:
@@ -16768,7 +15854,7 @@ class ProspectorPanel(ttk.Frame, ColumnVisibilityMixin):
             
             # Load session data from CSV
             try:
-                csv_path = os.path.join(self.reports_dir, "sessions_index.csv")
+                csv_path = self._get_csv_path()
                 if os.path.exists(csv_path):
                     with open(csv_path, 'r', encoding='utf-8') as f:
                         reader = csv.DictReader(f)
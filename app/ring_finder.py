@@ -10,7 +10,6 @@ import json
 import os
 import glob
 import threading
-import requests
 import time
 import zlib
 import datetime
@@ -20,7 +19,11 @@ import re
 from core.constants import MENU_COLORS
 from local_database import LocalSystemsDatabase
 from user_database import UserDatabase
-from edsm_integration import EDSMIntegration
+from spatial_index import VisitedSystemsIndex, get_galaxy_index
+from geometry import distance as coords_distance, within_radius
+from coords_resolver import get_coords_resolver
+from http_client import http_get, http_post
+from edsm_integration import EDSMIntegration, BACKFILL_INTERVAL_SECONDS
 from ui.dialogs import centered_info_dialog
 # Localization
 try:
@@ -171,6 +174,7 @@ class ToolTip:
 
 
 from column_visibility_helper import ColumnVisibilityMixin
+from virtual_treeview import VirtualTreeview
 
 
 class RingFinder(ColumnVisibilityMixin):
@@ -187,14 +191,12 @@ class RingFinder(ColumnVisibilityMixin):
         """Deselect all items when clicking on empty space in the results treeview"""
         item = self.results_tree.identify_row(event.y)
         if not item:
-            # Clicked on empty space - deselect all
-            self.results_tree.selection_remove(*self.results_tree.selection())
+            # Clicked on empty space - deselect all (including rows scrolled off screen)
+            self.results_rows.select(None)
     
     def _select_all_results(self, event=None) -> str:
         """Select all items in the results treeview (Ctrl+A)"""
-        all_items = self.results_tree.get_children()
-        if all_items:
-            self.results_tree.selection_set(all_items)
+        self.results_rows.select_all()
         return "break"  # Prevent default behavior
     
     def __init__(self, parent_frame: ttk.Frame, prospector_panel=None, app_dir: Optional[str] = None, tooltip_class=None, distance_calculator=None, user_db=None):
@@ -253,6 +255,13 @@ class RingFinder(ColumnVisibilityMixin):
         # Verify database is accessible
         self._verify_database_ready()
         
+        # Resident index over visited-system coordinates for range searches
+        self._visited_index = VisitedSystemsIndex(self.user_db)
+        threading.Thread(target=self._warm_spatial_indexes, daemon=True).start()
+
+        # Backfill ring metadata missing from earlier sessions (opt-in, at most daily)
+        self.start_edsm_backfill()
+
         # Always use local database since it's now bundled with the application
         self.use_local_db = True
         
@@ -1138,9 +1147,9 @@ class RingFinder(ColumnVisibilityMixin):
             self.results_tree.tag_configure('oddrow_spansh', background='#1e1e1e', foreground='#66ccff')  # Bright blue
             self.results_tree.tag_configure('evenrow_spansh', background='#282828', foreground='#66ccff')
         
-        # Vertical scrollbar
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.results_tree.yview)
-        self.results_tree.configure(yscrollcommand=v_scrollbar.set)
+        # Vertical scrollbar - driven by the row store, which only materializes the visible rows
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.results_rows = VirtualTreeview(self.results_tree, v_scrollbar)
         
         # Horizontal scrollbar
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.results_tree.xview)
@@ -1181,15 +1190,11 @@ class RingFinder(ColumnVisibilityMixin):
         # self.results_tree.bind("<Button-3>", self._show_context_menu)
     
     def _sort_column(self, col, reverse):
-        """Sort treeview column"""
-        # Get all rows
-        data = [(self.results_tree.set(child, col), child) for child in self.results_tree.get_children('')]
-        
-        # Sort data - handle numeric columns specially
+        """Sort treeview column (sorts the row store - only the visible rows are redrawn)"""
+        # Sort keys get the column text - handle numeric columns specially
         if col in ["Distance", "LS", "Sol Dist"]:
             # Numeric sort - handle N/A values
-            def sort_key(item):
-                val = item[0]
+            def sort_key(val):
                 if val == "No data" or val == "" or val == "-":
                     return float('inf') if not reverse else float('-inf')
                 # Remove commas and convert to float
@@ -1197,40 +1202,32 @@ class RingFinder(ColumnVisibilityMixin):
                     return float(val.replace(',', ''))
                 except:
                     return float('inf') if not reverse else float('-inf')
-            data.sort(key=sort_key, reverse=reverse)
         elif col == "Reserve":
             # Reserve level sort - custom order
             reserve_order = {"Pristine": 5, "Major": 4, "Common": 3, "Low": 2, "Depleted": 1, "-": 0, "No data": 0, "": 0}
-            def sort_key(item):
-                val = item[0]
+            def sort_key(val):
                 return reserve_order.get(val, 0)
-            data.sort(key=sort_key, reverse=reverse)
         elif col == "PowerPlay":
             # No data / not fetched should sort to the top in ascending order
             no_data_str = t('common.pp_no_data')
-            def sort_key(item):
-                val = item[0]
+            def sort_key(val):
                 if not val or val == no_data_str:
                     return (0, "")
                 return (1, val.lower())
-            data.sort(key=sort_key, reverse=reverse)
         elif col == "Last Mined":
             # Chronological sort on "mm/dd/yy HH:MM" display strings; blanks sort last
             import datetime as _dt
-            def sort_key(item):
-                val = item[0]
+            def sort_key(val):
                 if not val:
                     return _dt.datetime.min if not reverse else _dt.datetime.max
                 try:
                     return _dt.datetime.strptime(val, "%m/%d/%y %H:%M")
                 except Exception:
                     return _dt.datetime.min if not reverse else _dt.datetime.max
-            data.sort(key=sort_key, reverse=reverse)
         elif col == "Hotspots":
             # Hotspots column - extract number from formats like "Plat (2)" or "LTD (3), Plat (2)"
             import re
-            def sort_key(item):
-                val = item[0]
+            def sort_key(val):
                 if val == "No data" or val == "" or val == "-":
                     return float('inf') if not reverse else float('-inf')
                 # Try to extract first number in parentheses
@@ -1242,14 +1239,12 @@ class RingFinder(ColumnVisibilityMixin):
                     return float(val.replace(',', ''))
                 except:
                     return float('inf') if not reverse else float('-inf')
-            data.sort(key=sort_key, reverse=reverse)
         else:
             # String sort
-            data.sort(key=lambda x: x[0].lower(), reverse=reverse)
+            def sort_key(val):
+                return val.lower()
         
-        # Rearrange items in sorted order
-        for index, (val, child) in enumerate(data):
-            self.results_tree.move(child, '', index)
+        self.results_rows.sort(col, sort_key, reverse)
         
         # Update sort direction for next click
         self.sort_reverse[col] = not reverse
@@ -1591,11 +1586,10 @@ class RingFinder(ColumnVisibilityMixin):
         """Pre-establish connection to Spansh API to make first search faster"""
         def warmup():
             try:
-                import requests
-                # Make a minimal request to establish connection
+                # Make a minimal request to open a pooled connection
                 # Use system name search endpoint (lightweight)
                 url = 'https://spansh.co.uk/api/systems/field_values/system_names'
-                requests.get(url, params={'q': 'Sol'}, timeout=5)
+                http_get(url, params={'q': 'Sol'}, timeout=5, retries=0)
                 print("[SPANSH] Connection pre-warmed successfully")
             except Exception as e:
                 # Silently fail - this is just optimization
@@ -1715,21 +1709,11 @@ class RingFinder(ColumnVisibilityMixin):
                         self.systems_data[current_system.lower()] = coords
                         print(f"[AUTO-DETECT] Cached coords from journal StarPos: {star_pos}")
                 if not coords:
-                    # Try galaxy database
+                    # Try local sources (visited systems, galaxy DB, EDDN cache)
                     coords = self._get_system_coords_from_galaxy_db(current_system)
                     if coords:
                         self.systems_data[current_system.lower()] = coords
-                        print(f"[AUTO-DETECT] Cached coords from galaxy DB for '{current_system}'")
-                if not coords:
-                    # Try visited systems
-                    try:
-                        visited_coords = self.user_db._get_coordinates_from_visited_systems(current_system)
-                        if visited_coords:
-                            coords = {'x': visited_coords[0], 'y': visited_coords[1], 'z': visited_coords[2]}
-                            self.systems_data[current_system.lower()] = coords
-                            print(f"[AUTO-DETECT] Cached coords from visited systems for '{current_system}'")
-                    except Exception:
-                        pass
+                        print(f"[AUTO-DETECT] Cached coords from local databases for '{current_system}'")
                 if coords:
                     self.status_var.set(t('ring_finder.current_system').format(system=current_system))
                 else:
@@ -1748,19 +1732,10 @@ class RingFinder(ColumnVisibilityMixin):
                         self.current_system_var.set(system_name)
                         coords = self.systems_data.get(system_name.lower())
                         if not coords:
-                            # Try galaxy database
+                            # Try local sources (visited systems, galaxy DB, EDDN cache)
                             coords = self._get_system_coords_from_galaxy_db(system_name)
                             if coords:
                                 self.systems_data[system_name.lower()] = coords
-                        if not coords:
-                            # Try visited systems
-                            try:
-                                visited_coords = self.user_db._get_coordinates_from_visited_systems(system_name)
-                                if visited_coords:
-                                    coords = {'x': visited_coords[0], 'y': visited_coords[1], 'z': visited_coords[2]}
-                                    self.systems_data[system_name.lower()] = coords
-                            except Exception:
-                                pass
                         if coords:
                             self.status_var.set(t('ring_finder.current_system').format(system=system_name))
                         else:
@@ -2589,26 +2564,8 @@ class RingFinder(ColumnVisibilityMixin):
             
             # Perform coordinate lookup in background thread to prevent UI freeze
             if not reference_coords:
-                # Try galaxy database first
-                galaxy_coords = self._get_system_coords_from_galaxy_db(reference_system)
-                if galaxy_coords:
-                    reference_coords = galaxy_coords
-                    print(f" DEBUG: Using galaxy database coordinates for '{reference_system}'")
-                else:
-                    # Try visited_systems table in user database
-                    try:
-                        visited_coords = self.user_db._get_coordinates_from_visited_systems(reference_system)
-                        if visited_coords:
-                            # Convert tuple (x, y, z) to dict {'x': ..., 'y': ..., 'z': ...}
-                            reference_coords = {'x': visited_coords[0], 'y': visited_coords[1], 'z': visited_coords[2]}
-                    except Exception:
-                        pass
-                    
-                    if not reference_coords:
-                        # Use EDSM as final fallback
-                        edsm_coords = self._get_system_coords_from_edsm(reference_system)
-                        if edsm_coords:
-                            reference_coords = edsm_coords
+                # Visited systems, galaxy DB and EDDN cache first, EDSM as final fallback
+                reference_coords = self._get_system_coords_from_edsm(reference_system)
                 
                 if not reference_coords:
                     # Update UI with error message
@@ -3019,7 +2976,7 @@ class RingFinder(ColumnVisibilityMixin):
                 
                 self._last_spansh_call = time.time()
                 
-                response = requests.post(
+                response = http_post(
                     'https://spansh.co.uk/api/bodies/search',
                     json=payload,
                     headers=headers,
@@ -3259,7 +3216,7 @@ class RingFinder(ColumnVisibilityMixin):
             
             print(f"[SPANSH] Searching for {ring_type} rings within {max_distance}ly of {reference_system}")
             
-            response = requests.post(
+            response = http_post(
                 'https://spansh.co.uk/api/bodies/search',
                 json=payload,
                 headers=headers,
@@ -3813,7 +3770,7 @@ class RingFinder(ColumnVisibilityMixin):
                 pass
             
             print(f" DEBUG: Calling EDSM bodies API for '{system_name}': {url}")
-            response = requests.get(url, params=params, timeout=15, headers={"User-Agent": "EliteMining/5.1.3"})
+            response = http_get(url, params=params, timeout=15)
             print(f" DEBUG: EDSM bodies API status: {response.status_code}")
             
             if response.status_code == 200:
@@ -4078,7 +4035,7 @@ class RingFinder(ColumnVisibilityMixin):
             
             print(f" DEBUG: EDSM cube-systems API call: {url}")
 
-            response = requests.get(url, params=params, timeout=15, headers={"User-Agent": "EliteMining/5.1.3"})
+            response = http_get(url, params=params, timeout=15)
             response.raise_for_status()
             print(f" DEBUG: EDSM cube-systems Response status: {response.status_code}")
             
@@ -4166,7 +4123,7 @@ class RingFinder(ColumnVisibilityMixin):
                         if api_key:
                             params["apiKey"] = api_key
 
-                        response = requests.get(url, params=params, timeout=30, headers={"User-Agent": "EliteMining/5.1.3"})
+                        response = http_get(url, params=params, timeout=30)
                         if response.status_code == 200:
                             systems = response.json()
                             if isinstance(systems, list):
@@ -4819,57 +4776,64 @@ class RingFinder(ColumnVisibilityMixin):
         if not coord1 or not coord2:
             return 0.0
         
-        dx = coord1['x'] - coord2['x']
-        dy = coord1['y'] - coord2['y'] 
-        dz = coord1['z'] - coord2['z']
-        
-        return math.sqrt(dx*dx + dy*dy + dz*dz)
+        return coords_distance((coord1['x'], coord1['y'], coord1['z']),
+                               (coord2['x'], coord2['y'], coord2['z']))
     
     def _get_system_coords_from_galaxy_db(self, system_name: str) -> Optional[Dict]:
-        """Get system coordinates from galaxy_systems.db with retry logic"""
+        """Get system coordinates from local sources (user DB, galaxy DB, EDDN cache)"""
+        try:
+            coords = get_coords_resolver().resolve(system_name, remote=False)
+        except Exception as e:
+            print(f" DEBUG: Local coordinate lookup failed: {e}")
+            return None
+        if coords:
+            return {'x': coords[0], 'y': coords[1], 'z': coords[2]}
+        return None
+    
+    def _warm_spatial_indexes(self):
+        """Load the galaxy and visited-system spatial indexes in the background
+        so the first search doesn't pay for it"""
         try:
-            import sqlite3
             from pathlib import Path
-            import time
-            
-            # Use bundled galaxy database
             script_dir = Path(self.app_dir) if self.app_dir else Path(__file__).parent
             galaxy_db_path = script_dir / "data" / "galaxy_systems.db"
-            
-            if not galaxy_db_path.exists():
-                print(f" DEBUG: Galaxy database not found at {galaxy_db_path}")
-                return None
-            
-            # Retry logic for database access (may be locked after restart)
-            max_retries = 2
-            for attempt in range(max_retries):
-                try:
-                    with sqlite3.connect(str(galaxy_db_path), timeout=5.0) as conn:
-                        cursor = conn.cursor()
-                        cursor.execute("SELECT x, y, z FROM systems WHERE name = ? COLLATE NOCASE LIMIT 1", (system_name,))
-                        result = cursor.fetchone()
-                        
-                        if result:
-                            return {'x': result[0], 'y': result[1], 'z': result[2]}
-                        return None  # System not found
-                        
-                except sqlite3.OperationalError as e:
-                    if attempt < max_retries - 1:
-                        print(f" DEBUG: Galaxy DB locked, retrying... (attempt {attempt + 1})")
-                        time.sleep(0.3)
-                    else:
-                        print(f" DEBUG: Galaxy DB access failed after retries: {e}")
-                        return None
-                    
+            if galaxy_db_path.exists():
+                get_galaxy_index(galaxy_db_path)
+            self._visited_index.refresh()
         except Exception as e:
-            print(f" DEBUG: Error accessing galaxy database: {e}")
-            
-        return None
-    
+            print(f"[RING FINDER] Spatial index warm-up failed: {e}")
+
+    def start_edsm_backfill(self, force: bool = False) -> bool:
+        """Fill ring metadata missing from earlier sessions from EDSM in the background
+
+        Only runs when enabled in Settings, and (unless forced) not again within
+        BACKFILL_INTERVAL_SECONDS of the last completed run. Work is committed in
+        small batches, so a run stopped on shutdown resumes where it left off.
+
+        Returns:
+            True if a backfill was started
+        """
+        from config import load_edsm_backfill_enabled, load_edsm_backfill_last_run
+        if not load_edsm_backfill_enabled():
+            return False
+        if not force and time.time() - load_edsm_backfill_last_run() < BACKFILL_INTERVAL_SECONDS:
+            return False
+
+        def on_complete(stats):
+            if not self.edsm.background_fill_stopped:
+                # Config is written on the main thread
+                self.parent.after(0, self._record_edsm_backfill_run)
+
+        return self.edsm.start_background_fill(on_complete=on_complete)
+
+    def _record_edsm_backfill_run(self):
+        from config import save_edsm_backfill_last_run
+        save_edsm_backfill_last_run(time.time())
+
     def _find_systems_in_range(self, reference_coords: Dict, max_distance: float) -> List[str]:
-        """Find all systems within range using galaxy_systems.db spatial index"""
+        """Find all systems within range using resident spatial indexes over
+        galaxy_systems.db and visited systems (closest galaxy systems first)"""
         try:
-            import sqlite3
             from pathlib import Path
             
             # Use bundled galaxy database
@@ -4878,100 +4842,53 @@ class RingFinder(ColumnVisibilityMixin):
             
             if not galaxy_db_path.exists():
                 return []
-                
-            systems_in_range = []
             
-            with sqlite3.connect(str(galaxy_db_path)) as conn:
-                cursor = conn.cursor()
-                
-                # Use spatial index for efficient range queries
-                # Create bounding box for spatial search
-                x_min = reference_coords['x'] - max_distance
-                x_max = reference_coords['x'] + max_distance
-                y_min = reference_coords['y'] - max_distance
-                y_max = reference_coords['y'] + max_distance
-                z_min = reference_coords['z'] - max_distance
-                z_max = reference_coords['z'] + max_distance
-                
-                # Add LIMIT to prevent query timeout on large searches
-                cursor.execute("""
-                    SELECT name, x, y, z FROM systems 
-                    WHERE x BETWEEN ? AND ? 
-                    AND y BETWEEN ? AND ? 
-                    AND z BETWEEN ? AND ?
-                    LIMIT 50000
-                """, (x_min, x_max, y_min, y_max, z_min, z_max))
-                
-                results = cursor.fetchall()
-                
-                # Calculate actual distance and filter - store as (name, distance) tuples
-                systems_with_distances = []
-                for name, x, y, z in results:
-                    system_coords = {'x': x, 'y': y, 'z': z}
-                    distance = self._calculate_distance(reference_coords, system_coords)
+            galaxy_index = get_galaxy_index(galaxy_db_path)
+            if galaxy_index is None:
+                return []
+            
+            rx, ry, rz = reference_coords['x'], reference_coords['y'], reference_coords['z']
+            
+            # Radius query returns (name, distance) sorted closest first
+            systems_in_range = [name for name, dist in galaxy_index.query_radius(rx, ry, rz, max_distance)]
+            seen = set(systems_in_range)
+            
+            # Also check user database for visited systems within range
+            try:
+                self._visited_index.refresh()
+                for system_name, dist in self._visited_index.query_radius(rx, ry, rz, max_distance):
+                    if system_name not in seen:
+                        systems_in_range.append(system_name)
+                        seen.add(system_name)
+                
+                # ALSO check hotspot_data table for systems with hotspots
+                # This ensures newly scanned hotspots are found immediately
+                # Use bounding box filter for efficiency (like galaxy database query)
+                with self.user_db._connect() as user_conn:
+                    user_cursor = user_conn.cursor()
+                    user_cursor.execute("""
+                        SELECT DISTINCT system_name, x_coord, y_coord, z_coord 
+                        FROM hotspot_data
+                        WHERE x_coord IS NOT NULL
+                        AND x_coord BETWEEN ? AND ?
+                        AND y_coord BETWEEN ? AND ?
+                        AND z_coord BETWEEN ? AND ?
+                    """, (rx - max_distance, rx + max_distance,
+                          ry - max_distance, ry + max_distance,
+                          rz - max_distance, rz + max_distance))
                     
-                    if distance <= max_distance:
-                        systems_with_distances.append((name, distance))
-                
-                # Sort by distance (closest first) before converting to name-only list
-                systems_with_distances.sort(key=lambda x: x[1])
-                systems_in_range = [name for name, dist in systems_with_distances]
-                
-                # Also check user database for visited systems within range
-                try:
-                    with sqlite3.connect(self.user_db.db_path) as user_conn:
-                        user_cursor = user_conn.cursor()
-                        
-                        # Get all visited systems with coordinates
-                        user_cursor.execute("""
-                            SELECT system_name, x_coord, y_coord, z_coord 
-                            FROM visited_systems
-                            WHERE x_coord IS NOT NULL
-                        """)
-                        
-                        user_systems_in_range = 0
-                        for system_name, x, y, z in user_cursor.fetchall():
-                            system_coords = {'x': x, 'y': y, 'z': z}
-                            distance = self._calculate_distance(reference_coords, system_coords)
-                            
-                            if distance <= max_distance and system_name not in systems_in_range:
-                                systems_in_range.append(system_name)
-                                user_systems_in_range += 1
-                        
-                        # ALSO check hotspot_data table for systems with hotspots
-                        # This ensures newly scanned hotspots are found immediately
-                        # Use bounding box filter for efficiency (like galaxy database query)
-                        x_min = reference_coords['x'] - max_distance
-                        x_max = reference_coords['x'] + max_distance
-                        y_min = reference_coords['y'] - max_distance
-                        y_max = reference_coords['y'] + max_distance
-                        z_min = reference_coords['z'] - max_distance
-                        z_max = reference_coords['z'] + max_distance
-                        
-                        user_cursor.execute("""
-                            SELECT DISTINCT system_name, x_coord, y_coord, z_coord 
-                            FROM hotspot_data
-                            WHERE x_coord IS NOT NULL
-                            AND x_coord BETWEEN ? AND ?
-                            AND y_coord BETWEEN ? AND ?
-                            AND z_coord BETWEEN ? AND ?
-                        """, (x_min, x_max, y_min, y_max, z_min, z_max))
-                        
-                        hotspot_systems_added = 0
-                        for system_name, x, y, z in user_cursor.fetchall():
-                            if system_name in systems_in_range:
-                                continue
-                            system_coords = {'x': x, 'y': y, 'z': z}
-                            distance = self._calculate_distance(reference_coords, system_coords)
-                            
-                            if distance <= max_distance:
-                                systems_in_range.append(system_name)
-                                hotspot_systems_added += 1
-                        
-                except Exception:
-                    pass
-                
-                return systems_in_range
+                    hotspot_systems = [row for row in user_cursor.fetchall() if row[0] not in seen]
+                    
+                    for i, distance in within_radius((rx, ry, rz), [row[1:] for row in hotspot_systems], max_distance):
+                        system_name = hotspot_systems[i][0]
+                        if system_name not in seen:
+                            systems_in_range.append(system_name)
+                            seen.add(system_name)
+                    
+            except Exception:
+                pass
+            
+            return systems_in_range
                         
         except Exception:
             pass
@@ -4979,51 +4896,31 @@ class RingFinder(ColumnVisibilityMixin):
         return []
         
     def _get_system_coords_from_edsm(self, system_name: str) -> Optional[Dict]:
-        """Get system coordinates from EDSM API as fallback"""
+        """Get system coordinates from any source, falling back to EDSM"""
         try:
-            # Use ChatGPT's recommended endpoint - api-v1/systems (plural)
-            url = "https://www.edsm.net/api-v1/systems"
-            params = {
-                "systemName": system_name,
-                "showCoordinates": 1
-            }
-
-            response = requests.get(url, params=params, timeout=15, headers={"User-Agent": "EliteMining/5.1.3"})
-            
-            if response.status_code == 200:
-                data = response.json()
-                # EDSM returns a list, take the first match
-                if data and len(data) > 0:
-                    sys_info = data[0]
-                    if 'coords' in sys_info:
-                        coords = {
-                            'name': sys_info.get('name', system_name),
-                            'x': sys_info['coords']['x'],
-                            'y': sys_info['coords']['y'],
-                            'z': sys_info['coords']['z']
-                        }
-                        # Cache it in our local systems data for future use
-                        self.systems_data[system_name.lower()] = coords
-                        print(f" DEBUG: Successfully got coordinates from EDSM for '{system_name}': {coords}")
-                        return coords
-                    else:
-                        print(f" DEBUG: No coordinates in EDSM response for '{system_name}'")
-                else:
-                    print(f" DEBUG: System '{system_name}' not found in EDSM - may be incomplete name or not discovered yet")
-                    
+            coords = get_coords_resolver().resolve(system_name)
         except Exception as e:
             print(f" DEBUG: Failed to get coordinates from EDSM: {e}")
-            
-        return None
+            return None
+        if not coords:
+            print(f" DEBUG: System '{system_name}' not found in EDSM - may be incomplete name or not discovered yet")
+            return None
+        coords = {'name': system_name, 'x': coords[0], 'y': coords[1], 'z': coords[2]}
+        # Cache it in our local systems data for future use
+        self.systems_data[system_name.lower()] = coords
+        return coords
         
     def _update_results(self, hotspots: List[Dict]):
         """Update results treeview with hotspot data"""
         # Store results in cache for future use (e.g., refresh after save to database)
         self._search_cache = hotspots
 
-        # Bulk-prefetch visit counts for unvisited filter (avoids per-row DB connections)
+        # Bulk-prefetch visit counts, favourites, comments, overlap and RES tags in one
+        # query (avoids per-row DB connections). Filters below only drop rows, so this
+        # covers every system that ends up in the table.
         _all_systems_early = list({h.get('systemName', h.get('system', '')) for h in hotspots if h.get('systemName', h.get('system', ''))})
-        _early_visit_counts = self.user_db.bulk_get_visit_counts(_all_systems_early) if _all_systems_early else {}
+        _enrichment = self.user_db.get_ring_enrichment(_all_systems_early)
+        _early_visit_counts = _enrichment['visits']
 
         # Filter for unvisited systems if checkbox is enabled
         if self.unvisited_only_var.get():
@@ -5031,11 +4928,8 @@ class RingFinder(ColumnVisibilityMixin):
                         if _early_visit_counts.get(h.get('systemName', h.get('system', '')), 0) == 0]
             print(f"[FILTER] Unvisited Only: {len(hotspots)} systems with 0 visits")
 
-        # Bulk-prefetch favourite flags for favourite indicator/filter (avoids per-row DB connections)
-        _early_favourites = self.user_db.bulk_get_favourites_for_rings(_all_systems_early) if _all_systems_early else {}
-
-        # Bulk-prefetch ring comments (avoids per-row DB connections)
-        _early_comments = self.user_db.bulk_get_ring_comments_for_rings(_all_systems_early) if _all_systems_early else {}
+        _early_favourites = _enrichment['favourites']
+        _early_comments = _enrichment['comments']
 
         # Bulk-prefetch last-mined report dates (avoids per-row CSV scans)
         _last_mined_lookup = {}
@@ -5127,26 +5021,17 @@ class RingFinder(ColumnVisibilityMixin):
         self._current_top_entries = top_entries
         self._current_green_entries = green_entries
         
-        # Clear existing results completely
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
-        
-        # Force UI refresh
-        self.results_tree.update()
-
         # --- Bulk-prefetch DB data to avoid per-row DB connections ---
         all_system_names = list({h.get('system', h.get('systemName', '')) for h in hotspots if h.get('system', h.get('systemName', ''))})
-        _visit_counts = self.user_db.bulk_get_visit_counts(all_system_names) if all_system_names else {}
-        # Merge with early prefetch (may have already been fetched above)
-        _visit_counts.update(_early_visit_counts)
+        _visit_counts = _early_visit_counts
 
         # Batch-fetch PowerPlay data for all systems from EDDN cache
         from system_finder_api import SystemFinderAPI
         _pp_data = SystemFinderAPI._batch_get_powerplay(all_system_names)
 
-        # Batch-fetch overlap and RES tags — 2 queries total instead of 2×N
-        _overlap_bulk = self.user_db.bulk_get_overlaps_for_rings(all_system_names)
-        _res_bulk = self.user_db.bulk_get_res_for_rings(all_system_names)
+        # Overlap and RES tags came with the enrichment query above
+        _overlap_bulk = _enrichment['overlaps']
+        _res_bulk = _enrichment['res']
 
         # Collect (system, body) pairs for Spansh entries to check local DB existence
         spansh_pairs = []
@@ -5182,8 +5067,9 @@ class RingFinder(ColumnVisibilityMixin):
         except:
             pass
             
-        # Pre-compute all row display data (no treeview calls — avoids blocking the event loop)
+        # Pre-compute all row display data - the row store only creates items for visible rows
         _pending_row_data = []
+        first_green_row = None
         for row_index, hotspot in enumerate(hotspots):
             system_name = hotspot.get("systemName", hotspot.get("system", ""))
             body_name = hotspot.get("bodyName", hotspot.get("body", ""))
@@ -5436,8 +5322,10 @@ class RingFinder(ColumnVisibilityMixin):
             # Comment indicator (using pre-fetched bulk data, no per-row DB calls)
             comment_display = "💬" if _early_comments.get(_bulk_key) else ""
 
-            _pending_row_data.append({
-                'values': (
+            if is_green and first_green_row is None:
+                first_green_row = len(_pending_row_data)
+            _pending_row_data.append((
+                (
                     hotspot.get('distance', 'No data'),
                     ls_val,
                     system_name,
@@ -5455,33 +5343,16 @@ class RingFinder(ColumnVisibilityMixin):
                     last_mined_display,
                     comment_display,
                 ),
-                'tags': tags,
-                'is_green': is_green,
-            })
-
-        # Batch-insert rows so the event loop breathes between batches.
-        # This prevents the cargo overlay from losing transparency during long inserts.
-        count = len(hotspots)
-        search_term = self.system_var.get().strip()
-        material_filter = self.material_var.get()
-        self._insert_row_batch(_pending_row_data, 0, count, search_term, material_filter, green_entries)
-
-    def _insert_row_batch(self, row_data, start, count, search_term, material_filter, green_entries, batch_size=25):
-        """Insert a batch of rows into the results treeview, then yield to the event loop."""
-        if not self.parent.winfo_exists():
-            return
-        end = min(start + batch_size, len(row_data))
-        for entry in row_data[start:end]:
-            item_id = self.results_tree.insert("", "end", values=entry['values'], tags=entry['tags'])
-            if entry['is_green'] and not hasattr(self, '_first_new_item'):
-                self._first_new_item = item_id
-        if end < len(row_data):
-            self.parent.after(1, self._insert_row_batch, row_data, end, count, search_term, material_filter, green_entries, batch_size)
-        else:
-            self._finish_update_results(count, search_term, material_filter, green_entries)
+                tags,
+            ))
+
+        self.results_rows.set_rows(_pending_row_data)
+        if first_green_row is not None:
+            self.results_rows.see(first_green_row)
+        self._finish_update_results(len(hotspots), self.system_var.get().strip(), self.material_var.get(), green_entries)
 
     def _finish_update_results(self, count, search_term, material_filter, green_entries):
-        """Finalise results display after all rows are inserted."""
+        """Finalise results display (status message and highlight timer)."""
         if search_term:
             if material_filter != 'All':
                 if count > 0:
@@ -5507,10 +5378,6 @@ class RingFinder(ColumnVisibilityMixin):
 
         self.status_var.set(status_msg)
 
-        if hasattr(self, '_first_new_item'):
-            self.results_tree.see(self._first_new_item)
-            delattr(self, '_first_new_item')
-
         if green_entries:
             if self.highlight_timer:
                 self.parent.after_cancel(self.highlight_timer)
@@ -5521,23 +5388,20 @@ class RingFinder(ColumnVisibilityMixin):
         self.status_var.set(t('ring_finder.search_failed'))
         print(f"Hotspot search error: {error_msg}")
         # Clear results on error
-        self.results_tree.delete(*self.results_tree.get_children())
+        self.results_rows.clear()
     
     def _clear_highlights(self):
         """Remove green highlight from all items (rows stay at top until manual search)"""
         # Clear the green highlights set so they don't come back
         self._green_highlights = set()
         
-        for item in self.results_tree.get_children():
-            # Remove the 'new_entry' tag from all items
-            tags = list(self.results_tree.item(item, 'tags'))
-            if 'new_entry' in tags:
-                tags.remove('new_entry')
-                # Apply alternating row color instead
-                row_index = self.results_tree.index(item)
-                row_tag = 'evenrow' if row_index % 2 == 0 else 'oddrow'
-                tags.append(row_tag)
-                self.results_tree.item(item, tags=tuple(tags))
+        def clear_tag(tags, row_index):
+            # Remove the 'new_entry' tag and apply alternating row color instead
+            if 'new_entry' not in tags:
+                return tags
+            row_tag = 'evenrow' if row_index % 2 == 0 else 'oddrow'
+            return tuple(tag for tag in tags if tag != 'new_entry') + (row_tag,)
+        self.results_rows.retag(clear_tag)
         self.highlight_timer = None
         print("DEBUG: Highlights cleared")
     
@@ -5597,14 +5461,14 @@ class RingFinder(ColumnVisibilityMixin):
             item = self.results_tree.identify_row(event.y)
             if item:
                 # Check if item is already in selection (multi-select scenario)
-                current_selection = self.results_tree.selection()
-                if item not in current_selection:
+                row = int(item)
+                current_selection = self.results_rows.selected_rows()
+                if row not in current_selection:
                     # Single click on new item - select only this item
-                    self.results_tree.selection_set(item)
-                    self.results_tree.focus(item)
+                    self.results_rows.select(row)
                 
-                # Get current selection count
-                selected_items = self.results_tree.selection()
+                # Get current selection count (whole result set, not just rows on screen)
+                selected_items = self.results_rows.selected_rows()
                 selection_count = len(selected_items)
                 
                 # Check if any selected rows are from Spansh (check Source column)
@@ -5615,7 +5479,7 @@ class RingFinder(ColumnVisibilityMixin):
                 systems_with_missing_reserve = set()
 
                 for sel_item in selected_items:
-                    values = self.results_tree.item(sel_item, 'values')
+                    values = self.results_rows.row_values(sel_item)
                     if values and len(values) > 12:
                         source = values[12]  # Source column is index 12
                         reserve = values[7] if len(values) > 7 else ""  # Reserve column is index 7
@@ -5653,7 +5517,7 @@ class RingFinder(ColumnVisibilityMixin):
                     spansh_rows_with_hotspots = 0
 
                     for sel_item in selected_items:
-                        values = self.results_tree.item(sel_item, 'values')
+                        values = self.results_rows.row_values(sel_item)
                         if values and len(values) > 12:
                             source = values[12]
                             hotspots_col = values[8] if len(values) > 8 else ""
@@ -5698,7 +5562,7 @@ class RingFinder(ColumnVisibilityMixin):
                     is_ring_search_mode = self.ring_type_only_var.get()
                     has_hotspot_data = False
                     if has_spansh_rows and selected_items:
-                        values = self.results_tree.item(selected_items[0], 'values')
+                        values = self.results_rows.row_values(selected_items[0])
                         if values and len(values) > 8:
                             hotspots_col = values[8]  # Hotspots column is index 8
                             # Has data if not "-" or empty
@@ -5727,7 +5591,7 @@ class RingFinder(ColumnVisibilityMixin):
                     # Enable "Open Mining Report" only when a report exists for this row (Last Mined column)
                     has_mining_report = False
                     if selected_items:
-                        values = self.results_tree.item(selected_items[0], 'values')
+                        values = self.results_rows.row_values(selected_items[0])
                         if values and len(values) > 14:
                             has_mining_report = bool(values[14])
                     self.context_menu.entryconfig(21, state="normal" if has_mining_report else "disabled")
@@ -5736,7 +5600,7 @@ class RingFinder(ColumnVisibilityMixin):
                     has_local_row = False
                     is_favourite_row = False
                     if selected_items:
-                        values = self.results_tree.item(selected_items[0], 'values')
+                        values = self.results_rows.row_values(selected_items[0])
                         if values and len(values) > 12:
                             source = values[12]
                             if source and '🗄️' in str(source):
@@ -5756,10 +5620,10 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _copy_system_name(self):
         """Copy the selected system name to clipboard"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if selection:
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 2:
                 system_name = values[2]  # System is column index 2
                 self.parent.clipboard_clear()
@@ -5768,10 +5632,10 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _find_in_star_systems(self):
         """Switch to Star Systems tab and search for the selected system"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             return
-        values = self.results_tree.item(selection[0], 'values')
+        values = self.results_rows.row_values(selection[0])
         if not values or len(values) <= 2:
             return
         system_name = values[2]
@@ -5788,10 +5652,10 @@ class RingFinder(ColumnVisibilityMixin):
 
     def _set_as_reference_system(self):
         """Set the selected system as the reference system and re-run the search"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             return
-        values = self.results_tree.item(selection[0], 'values')
+        values = self.results_rows.row_values(selection[0])
         if not values or len(values) <= 2:
             return
         system_name = values[2]
@@ -5817,26 +5681,27 @@ class RingFinder(ColumnVisibilityMixin):
         except (ValueError, IndexError):
             return
 
-        values = self.results_tree.item(item, 'values')
+        row = int(item)
+        values = self.results_rows.row_values(row)
 
         if col_name == "PowerPlay":
             if not values or len(values) <= 11:
                 return
-            self.results_tree.selection_set(item)
+            self.results_rows.select(row)
             self._open_inara()
         elif col_name == "Last Mined":
-            self.results_tree.selection_set(item)
+            self.results_rows.select(row)
             self._open_mining_report_selected()
         elif col_name == "Comment":
-            self.results_tree.selection_set(item)
+            self.results_rows.select(row)
             self._show_comment_dialog()
 
     def _open_inara(self):
         """Open selected system(s) in Inara and fetch/refresh their PP data"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if selection:
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 2:
                 system_name = values[2]  # System is column index 2
                 import urllib.parse
@@ -5847,10 +5712,10 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _open_edsm(self):
         """Open selected system in EDSM"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if selection:
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 2:
                 system_name = values[2]  # System is column index 2
                 import urllib.parse
@@ -5860,10 +5725,10 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _open_spansh(self):
         """Open selected system in Spansh"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if selection:
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 2:
                 system_name = values[2]  # System is column index 2
                 import urllib.parse
@@ -5873,13 +5738,13 @@ class RingFinder(ColumnVisibilityMixin):
 
     def _find_sell_station(self):
         """Open Commodity Market with selected system and mineral to find sell stations"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             self.status_var.set(t('ring_finder.no_selection'))
             return
         
         item = selection[0]
-        values = self.results_tree.item(item, 'values')
+        values = self.results_rows.row_values(item)
         if not values or len(values) < 3:
             return
         
@@ -5888,12 +5753,12 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _find_sell_station_impl(self):
         """Implementation of find sell station - gets system name and calls Commodity Market"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             return None
         
         item = selection[0]
-        values = self.results_tree.item(item, 'values')
+        values = self.results_rows.row_values(item)
         if not values or len(values) < 3:
             return None
         
@@ -5981,7 +5846,7 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _save_to_database(self):
         """Save selected Spansh entries to local database - runs in background thread"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             return
         
@@ -5990,7 +5855,7 @@ class RingFinder(ColumnVisibilityMixin):
         local_items = []
         both_items = []  # Items that exist in both (🗄️ + 🌐)
         for item in selection:
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 10:
                 source = str(values[12])  # Source column is index 12
                 has_spansh = '🌐' in source
@@ -6031,7 +5896,7 @@ class RingFinder(ColumnVisibilityMixin):
         # Extract all data from treeview on main thread (Tkinter widgets can't be accessed from worker thread)
         items_data = []
         for item in items_to_process:
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) >= 11:
                 items_data.append(values)
         
@@ -6097,6 +5962,9 @@ class RingFinder(ColumnVisibilityMixin):
         total_materials = 0  # Count of individual material entries saved
         
         total = len(items_data)
+        hotspot_rows = []  # Written in one batch after all rows are checked
+        pending_rows = pending_new_rows = pending_updated_rows = 0  # Row counts, kept only if the batch is written
+        reserve_updates = {}  # system_name -> {body_name: reserve_level}
         
         for values in items_data:
             row_saved = False  # Track if this row was successfully saved
@@ -6140,11 +6008,7 @@ class RingFinder(ColumnVisibilityMixin):
                     if system_info and 'x' in system_info:
                         coordinates = (system_info['x'], system_info['y'], system_info['z'])
                     
-                    # If not in galaxy database, try visited systems
-                    if not coordinates:
-                        coordinates = self.user_db._get_coordinates_from_visited_systems(system_name)
-                    
-                    # If still no coordinates, try to fetch from EDSM
+                    # If not cached, resolve from visited systems, galaxy DB, EDDN cache, then EDSM
                     if not coordinates:
                         edsm_coords = self._get_system_coords_from_edsm(system_name)
                         if edsm_coords and 'x' in edsm_coords:
@@ -6235,21 +6099,21 @@ class RingFinder(ColumnVisibilityMixin):
                             needs_update = True
                         
                         if needs_update:
-                            self.user_db.add_hotspot_data(
-                                system_name=system_name,
-                                body_name=body_name,
-                                material_name=material_full,
-                                hotspot_count=hotspot_count,
-                                scan_date=datetime.datetime.utcnow().isoformat() + "Z",
-                                coordinates=coordinates,
-                                coord_source="galaxy_db",
-                                ring_type=ring_type_clean,
-                                ls_distance=ls_val
-                            )
+                            hotspot_rows.append({
+                                'system_name': system_name,
+                                'body_name': body_name,
+                                'material_name': material_full,
+                                'hotspot_count': hotspot_count,
+                                'scan_date': datetime.datetime.utcnow().isoformat() + "Z",
+                                'coordinates': coordinates,
+                                'coord_source': "galaxy_db",
+                                'ring_type': ring_type_clean,
+                                'ls_distance': ls_val
+                            })
                             
-                            # Update reserve level if available
+                            # Update reserve level if available (applied after the hotspots are written)
                             if reserve_clean:
-                                self.user_db.bulk_update_reserve_levels(system_name, {body_name: reserve_clean})
+                                reserve_updates.setdefault(system_name, {})[body_name] = reserve_clean
                             
                             total_materials += 1
                             row_saved = True  # Mark this row as successfully saved
@@ -6265,19 +6129,37 @@ class RingFinder(ColumnVisibilityMixin):
                         error_count += 1
                         errors.append(f"{system_name} {body_name} {material_name}: {str(e)[:50]}")
                 
-                # If at least one material from this row was saved, count the row as saved
+                # If at least one material from this row was queued, count the row once
+                # the batch below has been written
                 if row_saved:
-                    saved_rows += 1
+                    pending_rows += 1
                     # Prioritize "new" if row had any new materials
                     if row_had_new:
-                        new_rows += 1
+                        pending_new_rows += 1
                     elif row_had_updates:
-                        updated_rows += 1
+                        pending_updated_rows += 1
                 
             except Exception as e:
                 error_count += 1
                 errors.append(f"Row error: {str(e)[:50]}")
         
+        # Write all hotspots in one transaction, then their reserve levels
+        if hotspot_rows:
+            try:
+                with self.user_db.transaction():
+                    written_new, written_updated = self.user_db.bulk_add_hotspots(hotspot_rows)
+                    for system_name, reserve_levels in reserve_updates.items():
+                        self.user_db.bulk_update_reserve_levels(system_name, reserve_levels)
+                if written_new + written_updated > 0:
+                    saved_rows, new_rows, updated_rows = pending_rows, pending_new_rows, pending_updated_rows
+                else:
+                    error_count += 1
+                    errors.append("Database write error: no hotspots written")
+            except Exception as e:
+                # The transaction rolled back, so none of the queued rows were saved
+                error_count += 1
+                errors.append(f"Database write error: {str(e)[:50]}")
+        
         # Update UI on main thread
         self.parent.after(0, lambda: self._save_to_database_complete(saved_rows, new_rows, updated_rows, skipped_count, error_count, errors, wait_dialog, progress_bar))
     
@@ -6347,13 +6229,13 @@ class RingFinder(ColumnVisibilityMixin):
 
     def _fetch_pp_from_inara(self):
         """Fetch Inara powerplay for all uniquely-named selected systems (up to PP_FETCH_MAX_BATCH)."""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             return
         seen = set()
         systems = []
         for item in selection:
-            vals = self.results_tree.item(item, 'values')
+            vals = self.results_rows.row_values(item)
             if vals and len(vals) > 2:
                 sys_name = vals[2]
                 if sys_name and sys_name not in seen:
@@ -6405,11 +6287,8 @@ class RingFinder(ColumnVisibilityMixin):
                 pp_str = f"{pp_power} / {pp_state}"
             else:
                 pp_str = pp_power
-            for item in self.results_tree.get_children():
-                vals = list(self.results_tree.item(item, 'values'))
-                if vals and len(vals) > 11 and vals[2] == system_name:
-                    vals[11] = pp_str
-                    self.results_tree.item(item, values=vals)
+            self.results_rows.update_rows(lambda vals: len(vals) > 11 and vals[2] == system_name,
+                                          {"PowerPlay": pp_str})
             if not quiet:
                 if pp_power == '~none~':
                     self.status_var.set(t('ring_finder.pp_fetch_no_power').format(system=system_name))
@@ -6421,7 +6300,7 @@ class RingFinder(ColumnVisibilityMixin):
 
     def _update_reserve_from_spansh(self):
         """Update reserve levels for selected Local entries from Spansh - runs in background thread"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if not selection:
             return
         
@@ -6434,7 +6313,7 @@ class RingFinder(ColumnVisibilityMixin):
         # Collect unique systems from Local source with missing reserve
         systems_to_update = set()
         for item in selection:
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 12:
                 source = values[12]  # Source column is index 12
                 reserve = values[7] if len(values) > 7 else ""  # Reserve column is index 7
@@ -6511,7 +6390,7 @@ class RingFinder(ColumnVisibilityMixin):
                 "size": 50
             }
             
-            response = requests.post(
+            response = http_post(
                 'https://spansh.co.uk/api/bodies/search',
                 json=payload,
                 headers={'Content-Type': 'application/json'},
@@ -6574,10 +6453,10 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _copy_system_ring(self):
         """Copy the selected system + ring to clipboard"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if selection:
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values and len(values) > 4:
                 system_name = values[2]  # System is column index 2
                 ring_name = values[3]    # Ring is column index 3
@@ -6588,10 +6467,10 @@ class RingFinder(ColumnVisibilityMixin):
     
     def _copy_all_info(self):
         """Copy all information for the selected row to clipboard"""
-        selection = self.results_tree.selection()
+        selection = self.results_rows.selected_rows()
         if selection:
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if values:
                 # Create formatted string with all information
                 info_parts = []
@@ -6608,13 +6487,13 @@ class RingFinder(ColumnVisibilityMixin):
     def _bookmark_selected(self):
         """Bookmark the selected ring location"""
         try:
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set("No ring selected to bookmark")
                 return
 
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 5:
                 self.status_var.set("Invalid ring data for bookmarking")
                 return
@@ -6696,11 +6575,11 @@ class RingFinder(ColumnVisibilityMixin):
     def _open_mining_report_selected(self):
         """Open the most recent mining report for the selected ring (Last Mined column)."""
         try:
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 return
 
-            values = self.results_tree.item(selection[0], 'values')
+            values = self.results_rows.row_values(selection[0])
             if not values or len(values) < 5:
                 return
 
@@ -6731,19 +6610,19 @@ class RingFinder(ColumnVisibilityMixin):
                   first selected row's current state (single-select context menu).
         """
         try:
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set(t('context_menu.no_selection_favourite'))
                 return
 
             if mark is None:
-                first_values = self.results_tree.item(selection[0], 'values')
+                first_values = self.results_rows.row_values(selection[0])
                 is_currently_favourite = len(first_values) > 13 and first_values[13] == "⭐"
                 mark = not is_currently_favourite
 
             updated = 0
             for item in selection:
-                values = self.results_tree.item(item, 'values')
+                values = self.results_rows.row_values(item)
                 if not values or len(values) < 13:
                     continue
                 source = values[12]
@@ -6756,7 +6635,7 @@ class RingFinder(ColumnVisibilityMixin):
                     continue
 
                 if self.user_db.set_favourite(system_name, ring_name, mark):
-                    self.results_tree.set(item, "Favourite", "⭐" if mark else "")
+                    self.results_rows.set_value(item, "Favourite", "⭐" if mark else "")
                     updated += 1
 
             if updated:
@@ -6823,26 +6702,21 @@ class RingFinder(ColumnVisibilityMixin):
                 # Hook into the existing journal monitoring system via cargo monitor
                 if hasattr(self.prospector_panel, 'main_app') and self.prospector_panel.main_app:
                     cargo_monitor = getattr(self.prospector_panel.main_app, 'cargo_monitor', None)
-                    if cargo_monitor:
-                        # Add our callback to the journal monitoring
-                        original_process = cargo_monitor.process_journal_event
-                        def enhanced_process(line):
-                            # Call original processing first
-                            original_process(line)
-                            # Then check for auto-search triggers
-                            self._check_journal_event_for_auto_search(line)
-                        cargo_monitor.process_journal_event = enhanced_process
+                    journal_tail = getattr(cargo_monitor, 'journal_tail', None) if cargo_monitor else None
+                    if journal_tail:
+                        # Subscribe to jump events on the shared journal tail
+                        journal_tail.subscribe(self._check_journal_event_for_auto_search,
+                                               event_types=('FSDJump',),
+                                               dispatch=lambda fn, evt: self.parent.after(0, fn, evt))
         except Exception as e:
             pass
 
-    def _check_journal_event_for_auto_search(self, line: str):
+    def _check_journal_event_for_auto_search(self, event: dict):
         """Check journal events for FSD jumps and trigger auto-search"""
         if not self.auto_search_var.get():
             return
             
         try:
-            import json
-            event = json.loads(line.strip())
             event_type = event.get("event", "")
             
             # Log ALL events that contain StarSystem for debugging
@@ -7106,13 +6980,13 @@ class RingFinder(ColumnVisibilityMixin):
         """Show dialog to edit hotspot counts and reserve level for a ring"""
         try:
             from config import scaled_font
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set(t('ring_finder.no_selection'))
                 return
 
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 7:
                 self.status_var.set(t('ring_finder.invalid_selection'))
                 return
@@ -7273,23 +7147,23 @@ class RingFinder(ColumnVisibilityMixin):
         """Refresh the hotspots display for a specific row after editing"""
         try:
             hotspots_display = self._get_ring_hotspots_display(system_name, ring_name)
-            values = list(self.results_tree.item(item, 'values'))
+            values = list(self.results_rows.row_values(item))
             if len(values) > 8:
                 values[8] = hotspots_display  # Hotspots column
-                self.results_tree.item(item, values=values)
+                self.results_rows.set_row_values(item, values)
         except Exception as e:
             print(f"Error refreshing row hotspots: {e}")
 
     def _show_edit_visits_dialog(self):
         """Show dialog to edit visit count for selected system"""
         try:
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set("No system selected")
                 return
             
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 3:
                 return
             
@@ -7423,10 +7297,10 @@ class RingFinder(ColumnVisibilityMixin):
             visit_status = str(visit_count)
             
             # Update the row - Visit Status is column index 5
-            values = list(self.results_tree.item(item, 'values'))
+            values = list(self.results_rows.row_values(item))
             if len(values) > 5:
                 values[5] = visit_status
-                self.results_tree.item(item, values=values)
+                self.results_rows.set_row_values(item, values)
             
             # Also refresh the main app status bar if this is the current system
             main_app = self.parent.winfo_toplevel()
@@ -7451,13 +7325,13 @@ class RingFinder(ColumnVisibilityMixin):
         """Show dialog to add/edit a comment for the selected ring (applies to the whole ring, not per material)"""
         try:
             from config import scaled_font
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set("No ring selected")
                 return
 
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 4:
                 self.status_var.set("Invalid selection")
                 return
@@ -7503,7 +7377,7 @@ class RingFinder(ColumnVisibilityMixin):
             def save():
                 new_comment = comment_text.get("1.0", "end-1c").strip()
                 if self.user_db.set_ring_comment(system_name, ring_name, new_comment):
-                    self.results_tree.set(item, "Comment", "💬" if new_comment.strip() else "")
+                    self.results_rows.set_value(item, "Comment", "💬" if new_comment.strip() else "")
                     self.status_var.set(f"Comment updated for {system_name} - {ring_name}")
                 else:
                     self.status_var.set("Failed to save comment")
@@ -7550,13 +7424,13 @@ class RingFinder(ColumnVisibilityMixin):
         """Show dialog to tag overlap for selected hotspot"""
         try:
             from config import scaled_font
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set("No ring selected")
                 return
             
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 7:
                 self.status_var.set("Invalid selection")
                 return
@@ -7733,15 +7607,15 @@ class RingFinder(ColumnVisibilityMixin):
         
         return materials
 
-    def _refresh_row_overlap(self, item_id: str, system_name: str, ring_name: str):
+    def _refresh_row_overlap(self, item_id: int, system_name: str, ring_name: str):
         """Refresh the overlap column for a specific row"""
         try:
             overlap_display = self._get_overlap_display(system_name, ring_name)
             # Get current values and update overlap column (index 8)
-            values = list(self.results_tree.item(item_id, 'values'))
+            values = list(self.results_rows.row_values(item_id))
             if len(values) >= 10:
                 values[9] = overlap_display
-                self.results_tree.item(item_id, values=values)
+                self.results_rows.set_row_values(item_id, values)
         except Exception as e:
             print(f"Error refreshing row overlap: {e}")
 
@@ -7749,13 +7623,13 @@ class RingFinder(ColumnVisibilityMixin):
         """Show dialog to add RES site(s) for selected hotspot - supports multiple RES per material"""
         try:
             from config import scaled_font
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set("No ring selected")
                 return
             
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 7:
                 self.status_var.set("Invalid selection")
                 return
@@ -7941,19 +7815,19 @@ class RingFinder(ColumnVisibilityMixin):
             traceback.print_exc()
             self.status_var.set(f"Error: {e}")
     
-    def _refresh_row_res(self, item_id: str, system_name: str, ring_name: str):
+    def _refresh_row_res(self, item_id: int, system_name: str, ring_name: str):
         """Refresh the RES column for a specific row"""
         try:
             res_display = self._get_res_display(system_name, ring_name)
             # Get current values and update RES column (index 9)
-            values = list(self.results_tree.item(item_id, 'values'))
+            values = list(self.results_rows.row_values(item_id))
             if len(values) >= 11:
                 values[10] = res_display
-                self.results_tree.item(item_id, values=values)
+                self.results_rows.set_row_values(item_id, values)
         except Exception as e:
             print(f"Error refreshing row RES: {e}")
     
-    def _refresh_row_reserve(self, item_id: str, system_name: str, ring_name: str):
+    def _refresh_row_reserve(self, item_id: int, system_name: str, ring_name: str):
         """Refresh Reserve display for a specific row after setting reserve level"""
         try:
             # Get updated reserve level from database
@@ -7963,10 +7837,10 @@ class RingFinder(ColumnVisibilityMixin):
             reserve_display = reserve_level if reserve_level else "No data"
             
             # Get current values and update Reserve column (index 7)
-            values = list(self.results_tree.item(item_id, 'values'))
+            values = list(self.results_rows.row_values(item_id))
             if len(values) >= 8:
                 values[7] = reserve_display
-                self.results_tree.item(item_id, values=values)
+                self.results_rows.set_row_values(item_id, values)
         except Exception as e:
             print(f"Error refreshing reserve display: {e}")
 
@@ -7974,13 +7848,13 @@ class RingFinder(ColumnVisibilityMixin):
         """Show dialog to set/correct ring type for selected ring"""
         try:
             from config import scaled_font
-            selection = self.results_tree.selection()
+            selection = self.results_rows.selected_rows()
             if not selection:
                 self.status_var.set("No ring selected")
                 return
 
             item = selection[0]
-            values = self.results_tree.item(item, 'values')
+            values = self.results_rows.row_values(item)
             if not values or len(values) < 5:
                 self.status_var.set("Invalid selection")
                 return
@@ -8105,7 +7979,7 @@ class RingFinder(ColumnVisibilityMixin):
             traceback.print_exc()
             self.status_var.set(f"Error: {e}")
 
-    def _refresh_row_ring_type(self, item_id: str, system_name: str, ring_name: str):
+    def _refresh_row_ring_type(self, item_id: int, system_name: str, ring_name: str):
         """Refresh Ring Type display for a specific row after setting ring type"""
         try:
             ring_type = self.user_db.get_ring_type(system_name, ring_name)
@@ -8113,10 +7987,10 @@ class RingFinder(ColumnVisibilityMixin):
             ring_type_display = translate_ring_type(ring_type) if ring_type else "No data"
 
             # Get current values and update Ring Type column (index 6)
-            values = list(self.results_tree.item(item_id, 'values'))
+            values = list(self.results_rows.row_values(item_id))
             if len(values) >= 7:
                 values[6] = ring_type_display
-                self.results_tree.item(item_id, values=values)
+                self.results_rows.set_row_values(item_id, values)
         except Exception as e:
             print(f"Error refreshing ring type display: {e}")
 
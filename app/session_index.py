@@ -0,0 +1,885 @@
+"""
+Session Index for EliteMining
+SQLite table of mining sessions with indexed lookups, replacing repeated parsing
+of sessions_index.csv. The CSV is kept as a compatibility export: it is imported
+once (and again whenever something else rewrites it), and edits made here are
+written back to it shortly afterwards.
+
+Lifetime statistics are kept as running totals (overall, per system, ring, ship
+and material) that every insert, edit and delete adjusts by its delta, so the
+statistics tab doesn't have to loop over every session.
+"""
+
+import os
+import re
+import json
+import logging
+import threading
+import datetime as dt
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from db_connections import get_connection_manager
+
+log = logging.getLogger("EliteMining.SessionIndex")
+
+# Column order of sessions_index.csv written by current versions
+SESSION_FIELDS = (
+    'timestamp_utc', 'system', 'body', 'elapsed', 'total_tons', 'overall_tph',
+    'asteroids_prospected', 'materials_tracked', 'hit_rate_percent',
+    'avg_quality_percent', 'total_average_yield', 'best_material', 'materials_breakdown',
+    'material_tph_breakdown', 'prospectors_used', 'engineering_materials', 'comment',
+)
+
+# Ship name parsed from the session TXT report, cached per row (never exported to CSV)
+SHIP_COLUMNS = ('_ship_display', '_ship_file_path')
+
+# Numbers parsed from each row when it's written (NULL if the row doesn't parse),
+# indexed so best-session lookups don't scan the table
+STAT_COLUMNS = ('_tons', '_tph', '_tons_per_hit')
+
+# materials_breakdown entries that are summaries rather than materials
+SUMMARY_MATERIALS = ('total cargo collected', 'total', 'cargo collected')
+
+# Edits are written to the CSV this long after the last one, so a burst of
+# edits rewrites the file once
+EXPORT_DELAY_SECONDS = 2.0
+
+# Running totals per group: table -> key columns
+AGGREGATE_TABLES = {
+    'agg_systems': ('system',),
+    'agg_rings': ('system', 'body'),
+    'agg_materials': ('material',),
+}
+
+# Names per IN (...) lookup - stays under SQLite's 999 variable limit on older builds
+LOOKUP_CHUNK = 500
+
+# Timestamps in ISO date form; anything else never matches a time range
+_ISO_GLOB = '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*'
+
+
+def _column_ok(name: str) -> bool:
+    return bool(name) and name.replace('_', '').isalnum() and not name.startswith('_')
+
+
+def _to_text(value) -> str:
+    return '' if value is None else str(value)
+
+
+def parse_elapsed_hours(elapsed_str: str) -> float:
+    """Convert elapsed time string to hours as float. Handles both formats:
+    - '2h 21m' (old format)
+    - '00:34:43' (new HH:MM:SS format)
+    """
+    try:
+        # Check if it's HH:MM:SS format
+        if ':' in elapsed_str and len(elapsed_str.split(':')) >= 2:
+            time_parts = elapsed_str.split(':')
+            hours = int(time_parts[0])
+            minutes = int(time_parts[1])
+            seconds = int(time_parts[2]) if len(time_parts) > 2 else 0
+            return hours + (minutes / 60.0) + (seconds / 3600.0)
+        # Old format: 2h 21m
+        hour_match = re.search(r'(\d+)h', elapsed_str)
+        min_match = re.search(r'(\d+)m', elapsed_str)
+        hours = int(hour_match.group(1)) if hour_match else 0
+        minutes = int(min_match.group(1)) if min_match else 0
+        return hours + (minutes / 60.0)
+    except Exception:
+        return 0.0
+
+
+def parse_materials_breakdown(breakdown: str) -> Dict[str, float]:
+    """Tons per material from a materials_breakdown value. Handles both formats:
+    - 'Platinum: 280.0t (40.5%); Osmium: 3.0t' / 'Osmium:3t, Platinum:280t'
+    - 'Bertrandite: 10; Bauxite: 43' (old format, no units)
+    """
+    totals: Dict[str, float] = {}
+    breakdown = (breakdown or '').strip('"')
+    if not breakdown:
+        return totals
+    if 't' in breakdown:
+        entries = breakdown.split(',') if ',' in breakdown else [breakdown]
+    else:
+        entries = breakdown.split(';')
+    for entry in entries:
+        if ':' not in entry:
+            continue
+        name, amount_str = entry.split(':', 1)
+        # Drop the 't' unit and an optional "(XX.X%)" yield
+        amount_str = amount_str.strip().replace('t', '')
+        if '(' in amount_str:
+            amount_str = amount_str.split('(')[0].strip()
+        try:
+            amount = float(amount_str)
+        except ValueError:
+            continue
+        totals[name.strip()] = totals.get(name.strip(), 0.0) + amount
+    return totals
+
+
+def session_numbers(row: Dict) -> Optional[Dict]:
+    """Numbers a session contributes to the statistics, or None if it doesn't parse"""
+    try:
+        tonnage = float(row.get('total_tons', 0) or 0)
+        tph = float(row.get('overall_tph', 0) or 0)
+        asteroids = int(row.get('asteroids_prospected', 0) or 0)
+        hit_rate = float(row.get('hit_rate_percent', 0) or 0)
+    except (ValueError, TypeError):
+        return None
+    # T/Asteroid uses hits (asteroids with tracked materials) when the hit rate is known
+    tons_per_hit = None
+    if tonnage > 0:
+        if asteroids > 0 and hit_rate > 0:
+            tons_per_hit = tonnage / max(int(round(asteroids * (hit_rate / 100.0))), 1)
+        elif asteroids > 0:
+            tons_per_hit = tonnage / asteroids
+    return {
+        'tonnage': tonnage,
+        'tph': tph,
+        'asteroids': asteroids,
+        'hit_rate': hit_rate,
+        'hours': parse_elapsed_hours(row.get('elapsed') or '0h 0m'),
+        'tons_per_hit': tons_per_hit,
+    }
+
+
+class SessionIndex:
+    """Mining sessions in a `sessions` table next to sessions_index.csv
+
+    Rows come back as dicts keyed like csv.DictReader rows (all values are
+    strings, '' when missing), so existing parsing code works unchanged.
+    """
+
+    def __init__(self, csv_path: str, db_path: Optional[str] = None):
+        """Initialize the index
+
+        Args:
+            csv_path: sessions_index.csv to import from and export to
+            db_path: SQLite file (default: sessions_index.db beside the CSV)
+        """
+        self.csv_path = csv_path
+        self.db_path = db_path or os.path.splitext(csv_path)[0] + ".db"
+        self._connections = get_connection_manager(self.db_path)
+        self._lock = threading.RLock()
+        self._export_timer: Optional[threading.Timer] = None
+        stats_added = self._init_schema()
+        self._fieldnames = self._load_meta('fieldnames') or list(SESSION_FIELDS)
+        self._columns = self._table_columns()
+        if stats_added or not self._aggregates_consistent():
+            self.rebuild_aggregates()
+        if self._load_meta('dirty'):
+            # Edits from last run never reached the CSV
+            self.flush()
+
+    def _init_schema(self) -> bool:
+        """Create tables and indexes
+
+        Returns:
+            True if the statistics columns had to be added (aggregates need a rebuild)
+        """
+        with self._connections.connect() as conn:
+            columns = ', '.join(f'"{name}" TEXT' for name in SESSION_FIELDS + SHIP_COLUMNS)
+            conn.execute(f"CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, {columns})")
+            conn.execute("CREATE TABLE IF NOT EXISTS index_meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_timestamp ON sessions(timestamp_utc)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_system ON sessions(system COLLATE NOCASE)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_system_body ON sessions(system, body)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_ship ON sessions(_ship_display)")
+
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+            missing_stats = [name for name in STAT_COLUMNS if name not in existing]
+            for name in missing_stats:
+                conn.execute(f'ALTER TABLE sessions ADD COLUMN "{name}" REAL')
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_tph ON sessions(_tph DESC, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_tons ON sessions(_tons)")
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS agg_totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    sessions INTEGER NOT NULL DEFAULT 0,
+                    hours REAL NOT NULL DEFAULT 0,
+                    tonnage REAL NOT NULL DEFAULT 0,
+                    asteroids INTEGER NOT NULL DEFAULT 0,
+                    tph_sum REAL NOT NULL DEFAULT 0,
+                    tph_count INTEGER NOT NULL DEFAULT 0,
+                    hit_rate_sum REAL NOT NULL DEFAULT 0,
+                    hit_rate_count INTEGER NOT NULL DEFAULT 0,
+                    tons_per_asteroid_sum REAL NOT NULL DEFAULT 0,
+                    tons_per_asteroid_count INTEGER NOT NULL DEFAULT 0,
+                    systems INTEGER NOT NULL DEFAULT 0,
+                    materials INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("INSERT OR IGNORE INTO agg_totals (id) VALUES (1)")
+            conn.execute("DROP TABLE IF EXISTS agg_ships")  # Per-ship totals were never read
+            for table, keys in AGGREGATE_TABLES.items():
+                key_sql = ', '.join(f'{key} TEXT NOT NULL' for key in keys)
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        {key_sql},
+                        sessions INTEGER NOT NULL DEFAULT 0,
+                        tonnage REAL NOT NULL DEFAULT 0,
+                        hours REAL NOT NULL DEFAULT 0,
+                        PRIMARY KEY ({', '.join(keys)})
+                    )
+                """)
+                conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_tonnage ON {table}(tonnage)")
+            ring_columns = {row[1] for row in conn.execute("PRAGMA table_info(agg_rings)")}
+            for name, sql_type in (('best_tph', 'REAL'), ('best_tons_per_hit', 'REAL'), ('best_material', 'TEXT')):
+                if name not in ring_columns:
+                    conn.execute(f"ALTER TABLE agg_rings ADD COLUMN {name} {sql_type}")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_agg_rings_best ON agg_rings(best_tph)")
+        return bool(missing_stats)
+
+    def _table_columns(self) -> List[str]:
+        with self._connections.connect() as conn:
+            return [row[1] for row in conn.execute("PRAGMA table_info(sessions)")]
+
+    def _ensure_columns(self, conn, names: Iterable[str]):
+        """Add TEXT columns for CSV fields this table hasn't seen yet"""
+        for name in names:
+            if name not in self._columns and _column_ok(name):
+                conn.execute(f'ALTER TABLE sessions ADD COLUMN "{name}" TEXT')
+                self._columns.append(name)
+
+    def _load_meta(self, key: str):
+        with self._connections.connect() as conn:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @staticmethod
+    def _save_meta(conn, key: str, value):
+        conn.execute("INSERT OR REPLACE INTO index_meta VALUES (?, ?)", (key, json.dumps(value)))
+
+    def _csv_signature(self) -> Optional[List[int]]:
+        try:
+            st = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    @property
+    def fieldnames(self) -> List[str]:
+        """CSV column order"""
+        return list(self._fieldnames)
+
+    # ------------------------------------------------------------------
+    # CSV import / export
+    # ------------------------------------------------------------------
+
+    def sync(self) -> bool:
+        """Import the CSV if it was changed by something other than this index
+
+        Returns:
+            True if the table was reloaded
+        """
+        with self._lock:
+            if self._export_timer is not None:
+                # Edits waiting to be exported are newer than the file
+                return False
+            signature = self._csv_signature()
+            if signature == self._load_meta('csv_signature'):
+                return False
+            return self.import_csv()
+
+    def import_csv(self) -> bool:
+        """Replace the table with the CSV's rows (cached ship names are kept)
+
+        Returns:
+            True on success
+        """
+        import csv
+        with self._lock:
+            signature = self._csv_signature()
+            rows = []
+            fieldnames = list(SESSION_FIELDS)
+            if signature is not None:
+                try:
+                    with open(self.csv_path, 'r', encoding='utf-8') as f:
+                        reader = csv.DictReader(f)
+                        rows = list(reader)
+                        fieldnames = [name for name in (reader.fieldnames or []) if name] or fieldnames
+                except Exception as e:
+                    log.error(f"Could not read {self.csv_path}: {e}")
+                    return False
+            try:
+                with self._connections.transaction() as conn:
+                    self._load_rows(conn, rows, fieldnames)
+                    self._save_meta(conn, 'csv_signature', signature)
+            except Exception as e:
+                log.error(f"Session index import failed: {e}")
+                return False
+            log.info(f"Imported {len(rows)} sessions from {os.path.basename(self.csv_path)}")
+            return True
+
+    def replace_rows(self, rows: Sequence[Dict], fieldnames: Sequence[str] = SESSION_FIELDS) -> bool:
+        """Replace every session in one transaction (e.g. after a rebuild from
+        the report files) and write the CSV straight away
+
+        Returns:
+            True on success
+        """
+        with self._lock:
+            if self._export_timer is not None:
+                self._export_timer.cancel()
+                self._export_timer = None
+            try:
+                with self._connections.transaction() as conn:
+                    self._load_rows(conn, rows, list(fieldnames))
+            except Exception as e:
+                log.error(f"Session index replace failed: {e}")
+                return False
+            return self.export_csv()
+
+    def _load_rows(self, conn, rows: Sequence[Dict], fieldnames: List[str]):
+        """Swap the table's rows for these (cached ship names are kept) and rebuild the totals"""
+        self._ensure_columns(conn, fieldnames)
+        ships = {(ts, system, body): (ship, path) for ts, system, body, ship, path in conn.execute(
+            "SELECT timestamp_utc, system, body, _ship_display, _ship_file_path FROM sessions"
+            " WHERE _ship_file_path IS NOT NULL")}
+        conn.execute("DELETE FROM sessions")
+        columns = [name for name in fieldnames if name in self._columns]
+        placeholders = ', '.join('?' * (len(columns) + 2))
+        column_sql = ', '.join(f'"{name}"' for name in columns + list(SHIP_COLUMNS))
+        values = []
+        for row in rows:
+            ship = ships.get((_to_text(row.get('timestamp_utc')), _to_text(row.get('system')),
+                              _to_text(row.get('body'))), (None, None))
+            values.append([_to_text(row.get(name)) for name in columns] + list(ship))
+        conn.executemany(f"INSERT INTO sessions ({column_sql}) VALUES ({placeholders})", values)
+        self._rebuild_aggregates(conn)
+        self._fieldnames = fieldnames
+        self._save_meta(conn, 'fieldnames', fieldnames)
+
+    def export_csv(self, path: Optional[str] = None) -> bool:
+        """Write every session to a CSV file
+
+        Args:
+            path: Destination (default: the index's own sessions_index.csv)
+
+        Returns:
+            True on success
+        """
+        import csv
+        target = path or self.csv_path
+        with self._lock:
+            fieldnames = [name for name in self._fieldnames if name in self._columns]
+            column_sql = ', '.join(f'"{name}"' for name in fieldnames)
+            try:
+                with self._connections.connect() as conn:
+                    rows = conn.execute(f"SELECT {column_sql} FROM sessions ORDER BY id").fetchall()
+                tmp_path = target + ".tmp"
+                with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(fieldnames)
+                    writer.writerows([_to_text(value) for value in row] for row in rows)
+                os.replace(tmp_path, target)
+                if path is None:
+                    with self._connections.connect() as conn:
+                        self._save_meta(conn, 'csv_signature', self._csv_signature())
+                        self._save_meta(conn, 'dirty', False)
+            except Exception as e:
+                log.error(f"Session index export to {target} failed: {e}")
+                return False
+        return True
+
+    def flush(self) -> bool:
+        """Write pending edits to the CSV now instead of after EXPORT_DELAY_SECONDS"""
+        with self._lock:
+            if self._export_timer is not None:
+                self._export_timer.cancel()
+                self._export_timer = None
+            elif not self._load_meta('dirty'):
+                return True
+            return self.export_csv()
+
+    def _changed(self, conn):
+        """Mark the CSV stale and (re)start the export timer"""
+        self._save_meta(conn, 'dirty', True)
+        if self._export_timer is not None:
+            self._export_timer.cancel()
+        self._export_timer = threading.Timer(EXPORT_DELAY_SECONDS, self._export_later)
+        self._export_timer.daemon = True
+        self._export_timer.start()
+
+    def _export_later(self):
+        with self._lock:
+            if self._export_timer is None or threading.current_thread() is not self._export_timer:
+                return  # Cancelled or superseded
+            self._export_timer = None
+            self.export_csv()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _select(self, where: str = '', params: Sequence = (), order: str = 'timestamp_utc DESC') -> List[Dict[str, str]]:
+        self.sync()
+        columns = [name for name in self._columns if name != 'id' and name not in STAT_COLUMNS]
+        column_sql = ', '.join(f'"{name}"' for name in columns)
+        sql = f"SELECT {column_sql} FROM sessions"
+        if where:
+            sql += f" WHERE {where}"
+        if order:
+            sql += f" ORDER BY {order}"
+        with self._connections.connect() as conn:
+            rows = conn.execute(sql, tuple(params)).fetchall()
+        result = []
+        for row in rows:
+            item = {}
+            for name, value in zip(columns, row):
+                # Ship cache keeps NULL ("not resolved yet"); CSV fields read like DictReader
+                item[name] = value if name in SHIP_COLUMNS else _to_text(value)
+            result.append(item)
+        return result
+
+    def rows(self, since: Optional[str] = None, system: Optional[str] = None,
+             newest_first: bool = True) -> List[Dict[str, str]]:
+        """Sessions, newest first (or in CSV file order)
+
+        Args:
+            since: Only sessions at or after this ISO timestamp (rows whose
+                   timestamp isn't ISO are always included)
+            system: Only this system (case-insensitive)
+            newest_first: False for the order rows appear in sessions_index.csv
+        """
+        clauses = []
+        params = []
+        if since:
+            clauses.append(f"(timestamp_utc >= ? OR timestamp_utc NOT GLOB '{_ISO_GLOB}')")
+            params.append(since)
+        if system:
+            clauses.append("system = ? COLLATE NOCASE")
+            params.append(system)
+        return self._select(' AND '.join(clauses), params, order='timestamp_utc DESC' if newest_first else 'id')
+
+    def get(self, timestamp: str) -> Optional[Dict[str, str]]:
+        """Session with exactly this timestamp_utc"""
+        rows = self._select("timestamp_utc = ?", (timestamp,), order='id')
+        return rows[0] if rows else None
+
+    def match_timestamps(self, timestamp: str) -> List[str]:
+        """timestamp_utc values matching a raw timestamp or a "YYYY-MM-DD HH:MM" display time
+
+        Tries the exact value first; display times match local timestamps in
+        that minute and UTC ('Z') timestamps that convert to it.
+        """
+        self.sync()
+        with self._connections.connect() as conn:
+            exact = conn.execute("SELECT timestamp_utc FROM sessions WHERE timestamp_utc = ?",
+                                 (timestamp,)).fetchall()
+            if exact:
+                return [row[0] for row in exact]
+            if len(timestamp) != 16:
+                return []
+            # Local timestamps compare as text; UTC ones have to be converted first
+            prefix = timestamp.replace(' ', 'T', 1)
+            local = conn.execute("""
+                SELECT timestamp_utc FROM sessions
+                WHERE timestamp_utc >= ? AND timestamp_utc < ? AND timestamp_utc NOT LIKE '%Z'
+            """, (prefix, prefix + '\uffff')).fetchall()
+            utc = conn.execute("SELECT timestamp_utc FROM sessions WHERE timestamp_utc LIKE '%Z'").fetchall()
+        matches = [row[0] for row in local]
+        for (raw,) in utc:
+            try:
+                utc_time = dt.datetime.fromisoformat(raw.replace('Z', '+00:00'))
+                if utc_time.replace(tzinfo=dt.timezone.utc).astimezone().strftime("%Y-%m-%d %H:%M") == timestamp:
+                    matches.append(raw)
+            except ValueError:
+                continue
+        return matches
+
+    def last_mined(self, system_names: Iterable[str]) -> Dict[Tuple[str, str], str]:
+        """Latest timestamp_utc per (system, body) for the given systems (case-insensitive)"""
+        names = list(dict.fromkeys(name for name in system_names if name))
+        self.sync()
+        result = {}
+        with self._connections.connect() as conn:
+            for i in range(0, len(names), LOOKUP_CHUNK):
+                chunk = names[i:i + LOOKUP_CHUNK]
+                placeholders = ', '.join('?' * len(chunk))
+                for system, body, timestamp in conn.execute(f"""
+                    SELECT system, body, MAX(timestamp_utc) FROM sessions
+                    WHERE system COLLATE NOCASE IN ({placeholders}) AND timestamp_utc != ''
+                    GROUP BY system, body
+                """, chunk):
+                    result[(system, _to_text(body))] = timestamp
+        return result
+
+    def unique_systems(self) -> List[str]:
+        """Sorted distinct system names (blank and 'Unknown' left out)"""
+        self.sync()
+        with self._connections.connect() as conn:
+            systems = {row[0] for row in conn.execute(
+                "SELECT DISTINCT TRIM(system) FROM sessions WHERE TRIM(system) NOT IN ('', 'Unknown')")}
+        return sorted(systems)
+
+    def unique_ships(self) -> List[str]:
+        """Sorted distinct cached ship names (see set_ships)"""
+        self.sync()
+        with self._connections.connect() as conn:
+            return [row[0] for row in conn.execute(
+                "SELECT DISTINCT _ship_display FROM sessions WHERE _ship_display != '' ORDER BY _ship_display")]
+
+    def __len__(self) -> int:
+        self.sync()
+        with self._connections.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def get_statistics(self) -> Dict:
+        """Lifetime statistics read from the running totals ({} without sessions)"""
+        self.sync()
+        summary = ', '.join('?' * len(SUMMARY_MATERIALS))
+        with self._connections.connect() as conn:
+            totals = conn.execute("""
+                SELECT sessions, hours, tonnage, asteroids, tph_sum, tph_count, hit_rate_sum, hit_rate_count,
+                       tons_per_asteroid_sum, tons_per_asteroid_count, systems, materials
+                FROM agg_totals WHERE id = 1
+            """).fetchone()
+            if not totals or not totals[0]:
+                return {}
+            (sessions, hours, tonnage, asteroids, tph_sum, tph_count, hit_rate_sum, hit_rate_count,
+             tpa_sum, tpa_count, systems, materials) = totals
+            best_tph = conn.execute("SELECT system, body, _tph FROM sessions WHERE _tph > 0 "
+                                    "ORDER BY _tph DESC, id LIMIT 1").fetchone()
+            best_tonnage = conn.execute("SELECT MAX(_tons) FROM sessions").fetchone()[0]
+            top_system = conn.execute("SELECT system, tonnage FROM agg_systems "
+                                      "ORDER BY tonnage DESC LIMIT 1").fetchone()
+            top_ring = conn.execute("SELECT system, body, tonnage FROM agg_rings "
+                                    "ORDER BY tonnage DESC LIMIT 1").fetchone()
+            has_materials = conn.execute("SELECT 1 FROM agg_materials LIMIT 1").fetchone()
+            top_material = conn.execute(f"SELECT material, tonnage FROM agg_materials "
+                                        f"WHERE lower(material) NOT IN ({summary}) "
+                                        f"ORDER BY tonnage DESC LIMIT 1", SUMMARY_MATERIALS).fetchone()
+
+        stats = {
+            'total_sessions': sessions,
+            'total_time_hours': hours,
+            'total_tonnage': tonnage,
+            'total_asteroids': asteroids,
+            'unique_systems': systems,
+            'best_session': {
+                'tph': best_tph[2] if best_tph else 0,
+                'tonnage': max(best_tonnage or 0, 0),
+                'session': f"{best_tph[0]} - {best_tph[1]}" if best_tph else None,
+            },
+            'avg_tph': tph_sum / tph_count if tph_count else 0,
+            'avg_hit_rate': hit_rate_sum / hit_rate_count if hit_rate_count else 0,
+            'avg_tons_per_asteroid': tpa_sum / tpa_count if tpa_count else 0,
+            'most_mined_system': '',
+            'most_mined_location': '',
+            'most_collected_material': '',
+            'material_count': materials,
+        }
+        if top_system:
+            stats['most_mined_system'], stats['most_mined_system_tonnage'] = top_system
+        if top_ring:
+            stats['most_mined_location'] = f"{top_ring[0]} - {top_ring[1]}"
+            stats['most_mined_location_tonnage'] = top_ring[2]
+        if top_material:
+            stats['most_collected_material'], stats['most_collected_material_amount'] = top_material
+        elif has_materials:
+            stats['most_collected_material'], stats['most_collected_material_amount'] = 'None', 0
+        return stats
+
+    def top_rings(self, limit: int = 5) -> List[Dict]:
+        """Rings ranked by their best session's TPH
+
+        Returns:
+            Dicts with system, body, tons_per (tons per hit), tph and material of that session
+        """
+        self.sync()
+        with self._connections.connect() as conn:
+            rows = conn.execute("""
+                SELECT system, body, best_tons_per_hit, best_tph, best_material FROM agg_rings
+                WHERE best_tph IS NOT NULL ORDER BY best_tph DESC LIMIT ?
+            """, (limit,)).fetchall()
+        return [{'system': system, 'body': body, 'tons_per': tons_per, 'tph': tph, 'material': material}
+                for system, body, tons_per, tph, material in rows]
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, row: Dict) -> None:
+        """Append a session"""
+        with self._lock:
+            self.sync()
+            with self._connections.transaction() as conn:
+                names = [name for name in row if _column_ok(name)]
+                self._ensure_columns(conn, names)
+                new_fields = [name for name in names if name not in self._fieldnames]
+                if new_fields:
+                    self._fieldnames.extend(new_fields)
+                    self._save_meta(conn, 'fieldnames', self._fieldnames)
+                stored = {name: _to_text(row[name]) for name in names}
+                column_sql = ', '.join(f'"{name}"' for name in names + list(STAT_COLUMNS))
+                cursor = conn.execute(
+                    f"INSERT INTO sessions ({column_sql}) VALUES ({', '.join('?' * (len(names) + len(STAT_COLUMNS)))})",
+                    list(stored.values()) + list(self._stat_values(stored)))
+                stored['id'] = cursor.lastrowid
+                self._apply(conn, stored, 1)
+                self._changed(conn)
+
+    def update(self, timestamp: str, fields: Dict) -> int:
+        """Update fields of the session(s) with this timestamp_utc
+
+        Returns:
+            Number of rows updated
+        """
+        names = [name for name in fields if _column_ok(name)]
+        if not names:
+            return 0
+        with self._lock:
+            self.sync()
+            with self._connections.transaction() as conn:
+                self._ensure_columns(conn, names)
+                new_fields = [name for name in names if name not in self._fieldnames]
+                if new_fields:
+                    self._fieldnames.extend(new_fields)
+                    self._save_meta(conn, 'fieldnames', self._fieldnames)
+                changes = {name: _to_text(fields[name]) for name in names}
+                if 'system' in names or 'body' in names:
+                    # Report file names contain system and body - resolve the ship again
+                    changes.update(dict.fromkeys(SHIP_COLUMNS))
+                assignments = ', '.join(f'"{name}" = ?' for name in list(changes) + list(STAT_COLUMNS))
+                edits = []
+                for old in self._session_rows(conn, "timestamp_utc = ?", (timestamp,)):
+                    new = dict(old, **changes)
+                    conn.execute(f"UPDATE sessions SET {assignments} WHERE id = ?",
+                                 list(changes.values()) + list(self._stat_values(new)) + [old['id']])
+                    edits.append((old, new))
+                for old, new in edits:
+                    self._apply(conn, old, -1)
+                    self._apply(conn, new, 1)
+                if edits:
+                    self._changed(conn)
+        return len(edits)
+
+    def delete(self, timestamps: Iterable[str]) -> int:
+        """Delete the sessions with these timestamp_utc values
+
+        Returns:
+            Number of rows deleted
+        """
+        timestamps = list(timestamps)
+        deleted = 0
+        with self._lock:
+            self.sync()
+            with self._connections.transaction() as conn:
+                for i in range(0, len(timestamps), LOOKUP_CHUNK):
+                    chunk = timestamps[i:i + LOOKUP_CHUNK]
+                    rows = self._session_rows(conn, f"timestamp_utc IN ({', '.join('?' * len(chunk))})", chunk)
+                    conn.executemany("DELETE FROM sessions WHERE id = ?", [(row['id'],) for row in rows])
+                    for row in rows:
+                        self._apply(conn, row, -1)
+                    deleted += len(rows)
+                if deleted:
+                    self._changed(conn)
+        return deleted
+
+    def set_ships(self, ships: Iterable[Tuple[str, str, str]]) -> None:
+        """Cache ship names parsed from report files
+
+        Args:
+            ships: (timestamp_utc, ship name, report file path) per session
+        """
+        ships = list(ships)
+        if not ships:
+            return
+        with self._lock:
+            with self._connections.transaction() as conn:
+                conn.executemany("UPDATE sessions SET _ship_display = ?, _ship_file_path = ? WHERE timestamp_utc = ?",
+                                 [(ship, path, timestamp) for timestamp, ship, path in ships])
+
+    # ------------------------------------------------------------------
+    # Running totals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _session_rows(conn, where: str, params: Sequence) -> List[Dict]:
+        """Full rows (with id and ship cache) matching a WHERE clause, in file order"""
+        cursor = conn.execute(f"SELECT * FROM sessions WHERE {where} ORDER BY id", tuple(params))
+        names = [column[0] for column in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+
+    @staticmethod
+    def _stat_values(row: Dict) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """Values for STAT_COLUMNS"""
+        numbers = session_numbers(row)
+        if numbers is None:
+            return None, None, None
+        return numbers['tonnage'], numbers['tph'], numbers['tons_per_hit']
+
+    @staticmethod
+    def _contributions(row: Dict, numbers: Dict) -> Tuple[Dict[str, float], List[Tuple[str, Tuple[str, ...], float, float]]]:
+        """What one parsed session adds to agg_totals, and to which (table, key) groups
+
+        Returns:
+            (agg_totals column -> amount, [(table, key, tonnage, hours)])
+        """
+        tonnage, tph, asteroids, hit_rate = numbers['tonnage'], numbers['tph'], numbers['asteroids'], numbers['hit_rate']
+        tons_per_asteroid = asteroids > 0 and tonnage > 0
+        totals = {
+            'hours': numbers['hours'],
+            'tonnage': tonnage,
+            'asteroids': asteroids,
+            'tph_sum': tph if tph > 0 else 0.0,
+            'tph_count': 1 if tph > 0 else 0,
+            'hit_rate_sum': hit_rate if hit_rate > 0 else 0.0,
+            'hit_rate_count': 1 if hit_rate > 0 else 0,
+            'tons_per_asteroid_sum': tonnage / asteroids if tons_per_asteroid else 0.0,
+            'tons_per_asteroid_count': 1 if tons_per_asteroid else 0,
+        }
+        system, body = _to_text(row.get('system')), _to_text(row.get('body'))
+        groups = [
+            ('agg_systems', (system,), tonnage, numbers['hours']),
+            ('agg_rings', (system, body), tonnage, numbers['hours']),
+        ]
+        for material, tons in parse_materials_breakdown(row.get('materials_breakdown')).items():
+            groups.append(('agg_materials', (material,), tons, numbers['hours']))
+        return totals, groups
+
+    @staticmethod
+    def _bump(conn, table: str, key: Tuple[str, ...], sign: int, tonnage: float, hours: float) -> bool:
+        """Add or remove one session from a group
+
+        Returns:
+            True if the group was created or emptied (and deleted)
+        """
+        keys = AGGREGATE_TABLES[table]
+        where = ' AND '.join(f'{name} = ?' for name in keys)
+        row = conn.execute(f"SELECT sessions FROM {table} WHERE {where}", key).fetchone()
+        if row is None:
+            if sign < 0:
+                return False  # Out of step - rebuild_aggregates() repairs it
+            conn.execute(f"INSERT INTO {table} ({', '.join(keys)}, sessions, tonnage, hours) VALUES "
+                         f"({', '.join('?' * len(keys))}, 1, ?, ?)", (*key, tonnage, hours))
+            return True
+        if row[0] + sign <= 0:
+            conn.execute(f"DELETE FROM {table} WHERE {where}", key)
+            return True
+        conn.execute(f"UPDATE {table} SET sessions = sessions + ?, tonnage = tonnage + ?, hours = hours + ? "
+                     f"WHERE {where}", (sign, sign * tonnage, sign * hours, *key))
+        return False
+
+    def _apply(self, conn, row: Dict, sign: int):
+        """Add (sign=1) or remove (sign=-1) one session's share of every running total
+
+        Removals must run after the row has left (or changed in) the sessions table,
+        since a ring whose best session is removed looks up its new best there.
+        """
+        conn.execute("UPDATE agg_totals SET sessions = sessions + ? WHERE id = 1", (sign,))
+        numbers = session_numbers(row)
+        if numbers is None:
+            return  # Unparseable sessions only count towards the session total
+        totals, groups = self._contributions(row, numbers)
+        assignments = ', '.join(f'{name} = {name} + ?' for name in totals)
+        conn.execute(f"UPDATE agg_totals SET {assignments} WHERE id = 1", [sign * value for value in totals.values()])
+        for table, key, tonnage, hours in groups:
+            if self._bump(conn, table, key, sign, tonnage, hours):
+                if table == 'agg_systems':
+                    conn.execute("UPDATE agg_totals SET systems = systems + ? WHERE id = 1", (sign,))
+                elif table == 'agg_materials' and key[0].lower() not in SUMMARY_MATERIALS:
+                    conn.execute("UPDATE agg_totals SET materials = materials + ? WHERE id = 1", (sign,))
+        if numbers['tons_per_hit']:
+            system, body = _to_text(row.get('system')), _to_text(row.get('body'))
+            best = conn.execute("SELECT best_tph FROM agg_rings WHERE system = ? AND body = ?",
+                                (system, body)).fetchone()
+            # A new session can only take over as best if it's at least as good; on
+            # equal TPH the earliest session wins, so look that up in the table
+            if sign < 0 or (best and (best[0] is None or numbers['tph'] >= best[0])):
+                self._recompute_ring_best(conn, system, body)
+
+    def _recompute_ring_best(self, conn, system: str, body: str):
+        material = 'best_material' if 'best_material' in self._columns else "'Unknown'"
+        best = conn.execute(f"""
+            SELECT _tph, _tons_per_hit, {material} FROM sessions
+            WHERE system = ? AND body = ? AND _tons_per_hit > 0
+            ORDER BY _tph DESC, id LIMIT 1
+        """, (system, body)).fetchone()
+        conn.execute("UPDATE agg_rings SET best_tph = ?, best_tons_per_hit = ?, best_material = ? "
+                     "WHERE system = ? AND body = ?", (*(best or (None, None, None)), system, body))
+
+    def _rebuild_aggregates(self, conn):
+        """Recompute statistics columns and every running total from the sessions table"""
+        rows = self._session_rows(conn, "1", ())
+        conn.executemany(f"UPDATE sessions SET {', '.join(f'{name} = ?' for name in STAT_COLUMNS)} WHERE id = ?",
+                         [(*self._stat_values(row), row['id']) for row in rows])
+
+        totals: Dict[str, float] = {}
+        groups: Dict[str, Dict[Tuple[str, ...], List[float]]] = {table: {} for table in AGGREGATE_TABLES}
+        ring_best: Dict[Tuple[str, str], Tuple[float, float, str]] = {}
+        for row in rows:
+            numbers = session_numbers(row)
+            if numbers is None:
+                continue
+            row_totals, row_groups = self._contributions(row, numbers)
+            for name, value in row_totals.items():
+                totals[name] = totals.get(name, 0) + value
+            for table, key, tonnage, hours in row_groups:
+                group = groups[table].setdefault(key, [0, 0.0, 0.0])
+                group[0] += 1
+                group[1] += tonnage
+                group[2] += hours
+            ring = (_to_text(row.get('system')), _to_text(row.get('body')))
+            if numbers['tons_per_hit'] and (ring not in ring_best or numbers['tph'] > ring_best[ring][0]):
+                ring_best[ring] = (numbers['tph'], numbers['tons_per_hit'], _to_text(row.get('best_material', 'Unknown')))
+
+        totals['sessions'] = len(rows)
+        totals['systems'] = len(groups['agg_systems'])
+        totals['materials'] = sum(1 for (material,) in groups['agg_materials'] if material.lower() not in SUMMARY_MATERIALS)
+        conn.execute("DELETE FROM agg_totals")
+        conn.execute(f"INSERT INTO agg_totals (id, {', '.join(totals)}) VALUES (1, {', '.join('?' * len(totals))})",
+                     list(totals.values()))
+        for table, keys in AGGREGATE_TABLES.items():
+            conn.execute(f"DELETE FROM {table}")
+            conn.executemany(f"INSERT INTO {table} ({', '.join(keys)}, sessions, tonnage, hours) "
+                             f"VALUES ({', '.join('?' * (len(keys) + 3))})",
+                             [(*key, *values) for key, values in groups[table].items()])
+        conn.executemany("UPDATE agg_rings SET best_tph = ?, best_tons_per_hit = ?, best_material = ? "
+                         "WHERE system = ? AND body = ?", [(*best, *ring) for ring, best in ring_best.items()])
+
+    def rebuild_aggregates(self) -> bool:
+        """Recompute every running total from scratch (repair command)
+
+        Returns:
+            True on success
+        """
+        with self._lock:
+            try:
+                with self._connections.transaction() as conn:
+                    self._rebuild_aggregates(conn)
+            except Exception as e:
+                log.error(f"Session statistics rebuild failed: {e}")
+                return False
+        log.info("Rebuilt session statistics")
+        return True
+
+    def _aggregates_consistent(self) -> bool:
+        """Cheap check that the totals cover every session (e.g. after a crash or older version)"""
+        with self._connections.connect() as conn:
+            counted = conn.execute("SELECT sessions FROM agg_totals WHERE id = 1").fetchone()
+            actual = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+        return bool(counted) and counted[0] == actual
+
+    def close(self) -> None:
+        """Export pending edits and release this thread's connection"""
+        self.flush()
+        self._connections.close()
+
+
+_indexes: Dict[str, SessionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_session_index(csv_path: str) -> SessionIndex:
+    """Get the shared index for a sessions_index.csv"""
+    key = os.path.normcase(os.path.abspath(csv_path))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SessionIndex(csv_path)
+            _indexes[key] = index
+        return index
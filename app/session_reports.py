@@ -0,0 +1,307 @@
+"""
+Session Report Parser for EliteMining
+Parses the Session_*.txt reports that rebuilding sessions_index.csv works from.
+Results are cached per file (name, mtime, size) in the session index database,
+so a rebuild only re-parses reports that changed; those are parsed in a
+process pool when there are enough of them.
+"""
+
+import os
+import re
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from db_connections import get_connection_manager
+
+log = logging.getLogger("EliteMining.SessionReports")
+
+# Bump when parse_session_report changes what it extracts - cached results
+# from older versions are parsed again
+PARSER_VERSION = 1
+
+# Reports parse in well under a millisecond each, so below this many changed
+# ones the process pool start-up costs more than it saves
+PARALLEL_PARSE_MIN_FILES = 500
+
+SUMMARY_ENTRIES = ('total cargo collected', 'total', 'cargo collected', 'total refined')
+
+_FILENAME_TIMESTAMP = re.compile(r'Session_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2}-\d{2})')
+
+
+def is_report_file(filename: str) -> bool:
+    return filename.lower().endswith(".txt") and filename.startswith("Session")
+
+
+def is_summary_entry(material_name: str) -> bool:
+    """Whether a material line is a total rather than a material"""
+    return material_name.lower() in SUMMARY_ENTRIES
+
+
+def normalize_material_key(material_name: str) -> str:
+    """Collapse known name variants (e.g. "Low Temp. Diamonds") to their canonical
+    form so CSV rebuild doesn't split the same material into two entries."""
+    if material_name.lower() in ('low temp. diamonds', 'low temp diamonds'):
+        return 'Low Temperature Diamonds'
+    return material_name
+
+
+def parse_session_report(file_path: str) -> Optional[Dict]:
+    """Parse one session report
+
+    Runs inside a ProcessPoolExecutor worker, so it must stay a module-level
+    function with picklable arguments and results.
+
+    Returns:
+        Dict keyed like sessions_index.csv columns (plus total_finds), or None
+        if the file isn't a session report
+    """
+    # Extract timestamp from filename: Session_YYYY-MM-DD_HH-MM-SS_...
+    timestamp_match = _FILENAME_TIMESTAMP.search(os.path.basename(file_path))
+    if not timestamp_match:
+        return None
+    timestamp_local = f"{timestamp_match.group(1)}T{timestamp_match.group(2).replace('-', ':')}"
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+
+    # Parse header line: "Session: System — Body — Duration — Total XYt"
+    first_line = content.split('\n')[0]
+    if not first_line.startswith("Session:"):
+        return None
+    parts = first_line.split("—")
+    if len(parts) < 4:
+        return None
+
+    system = parts[0].replace("Session:", "").strip()
+    body = parts[1].strip()
+    duration = parts[2].strip()
+    total_match = re.search(r'Total (\d+(?:\.\d+)?)t', parts[3].strip())
+    total_tons = float(total_match.group(1)) if total_match else 0.0
+
+    # Calculate TPH from duration HH:MM:SS (manual entries have zero duration and 0 TPH)
+    duration_seconds = 0
+    try:
+        time_parts = duration.split(':')
+        if len(time_parts) == 3:
+            duration_seconds = int(time_parts[0]) * 3600 + int(time_parts[1]) * 60 + int(time_parts[2])
+    except ValueError:
+        duration_seconds = 0
+    overall_tph = total_tons / (duration_seconds / 3600.0) if duration_seconds else 0.0
+
+    def first_group(pattern: str) -> str:
+        match = re.search(pattern, content)
+        return match.group(1).strip() if match else ''
+
+    def section(title: str) -> Optional[str]:
+        match = re.search(rf'=== {title} ===(.*?)(?:===|\Z)', content, re.DOTALL)
+        return match.group(1) if match else None
+
+    # Materials breakdown AND TPH - merged from multiple sections for complete data
+    materials_dict: Dict[str, float] = {}
+    material_tph_breakdown = ""
+    cargo_text = section('CARGO MATERIAL BREAKDOWN')
+    if cargo_text is not None:
+        # Try to parse WITH TPH: "Platinum: 1.0t (80.3 t/hr)"
+        material_lines_with_tph = re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*\(([\d.]+)\s*t/hr\)', cargo_text, re.MULTILINE)
+        if material_lines_with_tph:
+            tph_pairs = []
+            for mat, tons, tph in material_lines_with_tph:
+                mat_clean = normalize_material_key(mat.strip())
+                if not is_summary_entry(mat_clean):
+                    if mat_clean not in materials_dict:
+                        tph_pairs.append(f"{mat_clean}: {tph}")
+                    materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
+            material_tph_breakdown = ", ".join(tph_pairs)
+        else:
+            for mat, tons in re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*$', cargo_text, re.MULTILINE):
+                mat_clean = normalize_material_key(mat.strip())
+                if not is_summary_entry(mat_clean):
+                    materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
+
+    # Then, merge with REFINED CARGO TRACKING (manually added materials during session)
+    refined_cargo_text = section('REFINED CARGO TRACKING')
+    if refined_cargo_text is not None:
+        for mat, tons in re.findall(r'^([A-Za-z.\s]+):\s*([\d.]+)t\s*$', refined_cargo_text, re.MULTILINE):
+            mat_clean = normalize_material_key(mat.strip())
+            if not is_summary_entry(mat_clean):
+                materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
+
+    # Fallback to REFINED MINERALS section if no cargo data found
+    if not materials_dict:
+        refined_text = section('REFINED MINERALS')
+        if refined_text is not None:
+            for mat, tons in re.findall(r'- ([A-Za-z.\s]+) ([\d.]+)t', refined_text):
+                mat_clean = normalize_material_key(mat.strip())
+                if not is_summary_entry(mat_clean):
+                    materials_dict[mat_clean] = materials_dict.get(mat_clean, 0.0) + float(tons)
+
+    materials_breakdown = ', '.join(f"{mat}: {tons:.1f}t" for mat, tons in materials_dict.items())
+
+    # If Minerals Tracked is missing, count the materials in the breakdown
+    materials_tracked = first_group(r'Minerals Tracked:\s*(\d+)')
+    if not materials_tracked and materials_breakdown:
+        material_count = len([m.strip() for m in materials_breakdown.split(',') if m.strip()])
+        materials_tracked = str(material_count) if material_count > 0 else ''
+
+    comment_match = re.search(r'=== SESSION COMMENT ===\s*\n(.+?)(?:\n===|$)', content, re.DOTALL)
+    session_comment = comment_match.group(1).strip() if comment_match else ""
+
+    # Engineering materials like "Iron: 45" become "Iron:45,..."
+    engineering_materials = ""
+    eng_text = section('ENGINEERING MATERIALS COLLECTED')
+    if eng_text is not None:
+        material_lines = re.findall(r'^\s+([A-Za-z]+):\s*(\d+)\s*$', eng_text, re.MULTILINE)
+        engineering_materials = ",".join(f"{mat}:{qty}" for mat, qty in material_lines)
+
+    # Total hits ('Total Material Hits', legacy 'Total Material Finds', or summed per-material lines)
+    tf_match = re.search(r'Total Material Hits:\s*(\d+)', content) or re.search(r'Total Material Finds:\s*(\d+)', content)
+    if tf_match:
+        total_finds = int(tf_match.group(1))
+    else:
+        total_finds = sum(int(x) for x in re.findall(r'•\s*(?:Hits|Finds):\s*(\d+)', content))
+
+    return {
+        'timestamp_utc': timestamp_local,
+        'system': system,
+        'body': body,
+        'elapsed': duration,
+        'total_tons': total_tons,
+        'overall_tph': overall_tph,
+        'asteroids_prospected': first_group(r'Asteroids Prospected:\s*(\d+)'),
+        'materials_tracked': materials_tracked,
+        'hit_rate_percent': first_group(r'Hit Rate:\s*([\d.]+)%'),
+        'avg_quality_percent': first_group(r'Overall Quality:\s*([\d.]+)%'),
+        'best_material': first_group(r'Best Performer:\s*([^\(]+)'),
+        'materials_breakdown': materials_breakdown,
+        'material_tph_breakdown': material_tph_breakdown,
+        'prospectors_used': first_group(r'Prospector Limpets Used:\s*(\d+)'),
+        'engineering_materials': engineering_materials,
+        'comment': session_comment,
+        'total_finds': total_finds,
+    }
+
+
+def _parse_for_pool(file_path: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """parse_session_report that returns errors instead of raising them across the pool"""
+    try:
+        return parse_session_report(file_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+class ReportParseCache:
+    """Parsed reports keyed by (filename, mtime, size) in a `report_cache` table"""
+
+    def __init__(self, db_path: str):
+        self._connections = get_connection_manager(db_path)
+        with self._connections.connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS report_cache (
+                    filename TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    version INTEGER NOT NULL,
+                    parsed TEXT
+                )
+            """)
+
+    def load(self) -> Dict[str, Tuple[int, int, Optional[Dict]]]:
+        """filename -> (mtime_ns, size, parsed result) for the current parser version"""
+        with self._connections.connect() as conn:
+            rows = conn.execute("SELECT filename, mtime_ns, size, parsed FROM report_cache WHERE version = ?",
+                                (PARSER_VERSION,)).fetchall()
+        return {name: (mtime_ns, size, json.loads(parsed) if parsed else None)
+                for name, mtime_ns, size, parsed in rows}
+
+    def store(self, entries: List[Tuple[str, int, int, Optional[Dict]]], keep: List[str]) -> None:
+        """Save new parse results and forget reports that no longer exist
+
+        Args:
+            entries: (filename, mtime_ns, size, parsed result) per parsed report
+            keep: Every report filename currently in the reports folder
+        """
+        with self._connections.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO report_cache (filename, mtime_ns, size, version, parsed) VALUES (?, ?, ?, ?, ?)",
+                [(name, mtime_ns, size, PARSER_VERSION, json.dumps(parsed) if parsed is not None else None)
+                 for name, mtime_ns, size, parsed in entries])
+            cached = {row[0] for row in conn.execute("SELECT filename FROM report_cache")}
+            conn.executemany("DELETE FROM report_cache WHERE filename = ?",
+                             [(name,) for name in cached.difference(keep)])
+
+
+def parse_reports(reports_dir: str, cache_db_path: Optional[str] = None,
+                  workers: Optional[int] = None) -> List[Dict]:
+    """Parse every session report in a folder, re-using cached results for unchanged files
+
+    Args:
+        reports_dir: Folder with Session_*.txt reports
+        cache_db_path: SQLite file for the parse cache (None = no cache)
+        workers: Process count. None = one per core, 1 = parse on this thread.
+
+    Returns:
+        parse_session_report results sorted by timestamp_utc
+    """
+    files = {}
+    for fn in os.listdir(reports_dir):
+        if not is_report_file(fn):
+            continue
+        try:
+            st = os.stat(os.path.join(reports_dir, fn))
+        except OSError:
+            continue
+        files[fn] = (st.st_mtime_ns, st.st_size)
+
+    cache = None
+    cached = {}
+    if cache_db_path:
+        try:
+            cache = ReportParseCache(cache_db_path)
+            cached = cache.load()
+        except Exception as e:
+            log.warning(f"Report parse cache unavailable: {e}")
+            cache = None
+
+    results = {}
+    changed = []
+    for fn, (mtime_ns, size) in files.items():
+        entry = cached.get(fn)
+        if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+            results[fn] = entry[2]
+        else:
+            changed.append(fn)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    paths = [os.path.join(reports_dir, fn) for fn in changed]
+    parsed = None
+    if workers > 1 and len(paths) >= PARALLEL_PARSE_MIN_FILES:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_parse_for_pool, paths, chunksize=max(1, len(paths) // (workers * 4))))
+        except Exception as e:
+            log.warning(f"Process pool unavailable, parsing reports on one core: {e}")
+    if parsed is None:
+        parsed = [_parse_for_pool(path) for path in paths]
+
+    new_entries = []
+    for fn, (result, error) in zip(changed, parsed):
+        if error is not None:
+            # Not cached - the file may be mid-write or locked
+            print(f"Error parsing {fn}: {error}")
+            continue
+        results[fn] = result
+        new_entries.append((fn, files[fn][0], files[fn][1], result))
+
+    if cache is not None:
+        try:
+            cache.store(new_entries, list(files))
+        except Exception as e:
+            log.warning(f"Could not update report parse cache: {e}")
+
+    log.info(f"Parsed {len(changed)} of {len(files)} session reports ({len(files) - len(changed)} cached)")
+    reports = [result for result in results.values() if result is not None]
+    reports.sort(key=lambda r: r['timestamp_utc'])
+    return reports
@@ -0,0 +1,178 @@
+"""
+Spatial Index for EliteMining
+Resident uniform-grid index over system coordinates so Ring Finder radius
+searches don't re-read and re-measure every system on each query
+"""
+
+import math
+import sqlite3
+import logging
+import threading
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger("EliteMining.SpatialIndex")
+
+# Grid cell edge in light years. Ring Finder searches are 20-500 LY, so a
+# 500 LY query touches at most 11^3 cells.
+DEFAULT_CELL_SIZE = 100.0
+
+
+class GridSpatialIndex:
+    """Uniform 3D grid of named points answering radius queries
+
+    Points are bucketed by floor(coord / cell_size); a query only measures
+    points in cells overlapping the query cube. Thread-safe.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int, int], List[Tuple[str, float, float, float]]] = {}
+        self._points: Dict[str, Tuple[float, float, float]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._points
+
+    def _cell(self, x: float, y: float, z: float) -> Tuple[int, int, int]:
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size), math.floor(z / size))
+
+    def add(self, name: str, x: float, y: float, z: float) -> None:
+        """Add a point, replacing any previous point with the same name"""
+        with self._lock:
+            if name in self._points:
+                self.remove(name)
+            self._points[name] = (x, y, z)
+            self._cells.setdefault(self._cell(x, y, z), []).append((name, x, y, z))
+
+    def add_many(self, points: Iterable[Tuple[str, float, float, float]]) -> int:
+        """Add (name, x, y, z) points, skipping rows without coordinates
+
+        Returns:
+            Number of points added
+        """
+        added = 0
+        with self._lock:
+            for name, x, y, z in points:
+                if x is None or y is None or z is None:
+                    continue
+                self.add(name, x, y, z)
+                added += 1
+        return added
+
+    def remove(self, name: str) -> bool:
+        """Remove a point by name"""
+        with self._lock:
+            coords = self._points.pop(name, None)
+            if coords is None:
+                return False
+            key = self._cell(*coords)
+            bucket = self._cells.get(key, [])
+            bucket[:] = [point for point in bucket if point[0] != name]
+            if not bucket:
+                self._cells.pop(key, None)
+            return True
+
+    def get(self, name: str) -> Optional[Tuple[float, float, float]]:
+        """Coordinates of a point, or None"""
+        return self._points.get(name)
+
+    def query_radius(self, x: float, y: float, z: float, radius: float) -> List[Tuple[str, float]]:
+        """Find all points within radius of (x, y, z)
+
+        Returns:
+            List of (name, distance) sorted by distance, closest first
+        """
+        size = self.cell_size
+        x0, x1 = math.floor((x - radius) / size), math.floor((x + radius) / size)
+        y0, y1 = math.floor((y - radius) / size), math.floor((y + radius) / size)
+        z0, z1 = math.floor((z - radius) / size), math.floor((z + radius) / size)
+        radius_sq = radius * radius
+        results = []
+
+        with self._lock:
+            span = (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1)
+            if span > len(self._cells):
+                # Query cube covers more cells than exist - walk the occupied ones
+                buckets = [bucket for (i, j, k), bucket in self._cells.items()
+                           if x0 <= i <= x1 and y0 <= j <= y1 and z0 <= k <= z1]
+            else:
+                get = self._cells.get
+                buckets = [get((i, j, k)) for i in range(x0, x1 + 1)
+                           for j in range(y0, y1 + 1) for k in range(z0, z1 + 1)]
+
+            for bucket in buckets:
+                if not bucket:
+                    continue
+                for name, px, py, pz in bucket:
+                    dx = px - x
+                    dy = py - y
+                    dz = pz - z
+                    dist_sq = dx * dx + dy * dy + dz * dz
+                    if dist_sq <= radius_sq:
+                        results.append((name, math.sqrt(dist_sq)))
+
+        results.sort(key=itemgetter(1))
+        return results
+
+
+class VisitedSystemsIndex(GridSpatialIndex):
+    """Grid index over user_data.db visited_systems, refreshed incrementally
+
+    Coordinates are only written when a system is first visited, so a refresh
+    just reads rows with an id above the last one seen.
+    """
+
+    def __init__(self, user_db, cell_size: float = DEFAULT_CELL_SIZE):
+        super().__init__(cell_size)
+        self.user_db = user_db
+        self.last_id = 0
+
+    def refresh(self) -> int:
+        """Load visited systems added since the last refresh
+
+        Returns:
+            Number of systems added
+        """
+        with self._lock:
+            rows = self.user_db.get_visited_system_coords(after_id=self.last_id)
+            if not rows:
+                return 0
+            self.last_id = max(row[0] for row in rows)
+            return self.add_many(row[1:] for row in rows)
+
+
+_galaxy_indexes: Dict[str, GridSpatialIndex] = {}
+_galaxy_lock = threading.Lock()
+
+
+def get_galaxy_index(galaxy_db_path: str) -> Optional[GridSpatialIndex]:
+    """Get the resident index over galaxy_systems.db, loading it on first use
+
+    The bundled galaxy database is read-only, so it is loaded once per process.
+
+    Returns:
+        The index, or None if the database can't be read
+    """
+    key = str(galaxy_db_path)
+    with _galaxy_lock:
+        index = _galaxy_indexes.get(key)
+        if index is not None:
+            return index
+        try:
+            index = GridSpatialIndex()
+            conn = sqlite3.connect(f"file:{key}?mode=ro", uri=True)
+            try:
+                count = index.add_many(conn.execute("SELECT name, x, y, z FROM systems"))
+            finally:
+                conn.close()
+            log.info(f"Loaded {count} galaxy systems into spatial index")
+        except sqlite3.Error as e:
+            log.error(f"Could not load galaxy spatial index: {e}")
+            return None
+        _galaxy_indexes[key] = index
+        return index
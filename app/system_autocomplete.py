@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 """
 Reusable system name autocomplete for tkinter Entry widgets.
-Queries Spansh API for system name suggestions.
+Suggests names from the local system name index as you type, falling back to
+the Spansh API when the index has few matches.
 """
 
 import tkinter as tk
-import threading
-import requests
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from http_client import http_get
+from system_name_index import get_system_name_index
+
+MAX_SUGGESTIONS = 20
+
+# Ask Spansh only when the local index has fewer matches than this, and only
+# once typing pauses for REMOTE_DEBOUNCE_MS
+REMOTE_MIN_RESULTS = 5
+REMOTE_DEBOUNCE_MS = 500
+
+# One worker shared by every autocomplete - stale requests are skipped, not sent
+_remote_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SystemAutocomplete")
 
 
 class SystemAutocomplete:
@@ -33,6 +46,7 @@ class SystemAutocomplete:
         self._mouse_over = False
         self._active_index = -1
         self._typed_text = ""
+        self._index = get_system_name_index()
 
         # Bind entry events
         self._entry.bind('<KeyRelease>', self._on_key, add='+')
@@ -82,7 +96,14 @@ class SystemAutocomplete:
             return
         if self._timer is not None:
             self._root.after_cancel(self._timer)
-        self._timer = self._root.after(300, lambda: self._query(text))
+            self._timer = None
+        self._index.load_async()  # Picks up newly visited systems every few minutes
+
+        self._request_id += 1
+        local = self._index.complete(text, MAX_SUGGESTIONS)
+        self._show(local, self._request_id)
+        if len(local) < REMOTE_MIN_RESULTS:
+            self._timer = self._root.after(REMOTE_DEBOUNCE_MS, lambda: self._query(text, local))
 
     def _on_focusout(self, event):
         self._root.after(150, self._delayed_hide)
@@ -100,19 +121,23 @@ class SystemAutocomplete:
             return
         self.hide()
 
-    def _query(self, text: str):
+    def _query(self, text: str, local: list):
+        self._timer = None
         self._request_id += 1
-        rid = self._request_id
-        threading.Thread(target=self._fetch, args=(text, rid), daemon=True).start()
+        _remote_pool.submit(self._fetch, text, self._request_id, local)
 
-    def _fetch(self, text: str, rid: int):
+    def _fetch(self, text: str, rid: int, local: list):
+        if rid != self._request_id:
+            return  # Superseded while queued
         try:
             url = f"https://spansh.co.uk/api/systems/field_values/system_names?q={urllib.parse.quote(text)}"
-            resp = requests.get(url, timeout=5)
+            resp = http_get(url, timeout=5, retries=0)
             if resp.status_code != 200:
                 return
             data = resp.json()
-            names = [e["name"] for e in data.get("min_max", data.get("values", [])) if "name" in e]
+            remote = [e["name"] for e in data.get("min_max", data.get("values", [])) if "name" in e]
+            seen = {name.lower() for name in local}
+            names = local + [name for name in remote if name.lower() not in seen]
             if rid == self._request_id:
                 self._root.after(0, lambda: self._show(names, rid))
         except Exception:
@@ -141,14 +166,14 @@ class SystemAutocomplete:
             self._lb.bind('<Leave>', lambda e: setattr(self, '_mouse_over', False))
 
         self._lb.delete(0, tk.END)
-        for n in names[:20]:
+        for n in names[:MAX_SUGGESTIONS]:
             self._lb.insert(tk.END, n)
 
         self._entry.update_idletasks()
         x = self._entry.winfo_rootx()
         y = self._entry.winfo_rooty() + self._entry.winfo_height()
         w = max(self._entry.winfo_width(), 300)
-        h = min(len(names), 20) * 20 + 4
+        h = min(len(names), MAX_SUGGESTIONS) * 20 + 4
         self._listbox_toplevel.geometry(f"{w}x{h}+{x}+{y}")
         self._listbox_toplevel.deiconify()
 
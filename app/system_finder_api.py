@@ -10,6 +10,8 @@ import re
 import datetime
 from typing import List, Dict, Optional, Any
 
+from http_client import http_get, http_post
+
 log = logging.getLogger(__name__)
 
 
@@ -108,9 +110,8 @@ class SystemFinderAPI:
         try:
             import urllib.parse, random
             url = f"https://inara.cz/elite/starsystem/?search={urllib.parse.quote(system_name)}"
-            session = requests.Session()
-            session.headers.update(cls._INARA_HEADERS)
-            resp = session.get(url, timeout=10)
+            # The shared inara.cz session keeps the challenge cookie for later lookups
+            resp = http_get(url, headers=cls._INARA_HEADERS, timeout=10)
             html = resp.text
             # Inara bot challenge: 503 page with a base64-encoded /validatechallenge.php endpoint
             if resp.status_code == 503 or 'challenge-container' in html:
@@ -119,13 +120,13 @@ class SystemFinderAPI:
                     token = cm.group(1)
                     ts = int(datetime.datetime.utcnow().timestamp() * 1000)
                     cf = random.randint(0, 9999)
-                    session.post(
+                    http_post(
                         'https://inara.cz/validatechallenge.php',
                         data=f'challenge={urllib.parse.quote(token)}&ts={ts}&cf={cf}',
-                        headers={'Content-Type': 'application/x-www-form-urlencoded'},
+                        headers={**cls._INARA_HEADERS, 'Content-Type': 'application/x-www-form-urlencoded'},
                         timeout=10
                     )
-                    resp = session.get(url, timeout=10)
+                    resp = http_get(url, headers=cls._INARA_HEADERS, timeout=10)
                     resp.raise_for_status()
                     html = resp.text
             m = cls._INARA_PP_PATTERN.search(html)
@@ -215,7 +216,7 @@ class SystemFinderAPI:
             if progress_callback:
                 progress_callback(20, 100, "Searching Spansh galaxy database...")
             
-            response = requests.post(cls.SPANSH_URL, json=payload, timeout=cls.TIMEOUT)
+            response = http_post(cls.SPANSH_URL, json=payload, timeout=cls.TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -462,7 +463,7 @@ class SystemFinderAPI:
             if progress_callback:
                 progress_callback(20, 100, "Searching Spansh station database...")
 
-            response = requests.post(cls.SPANSH_STATIONS_URL, json=payload, timeout=cls.TIMEOUT)
+            response = http_post(cls.SPANSH_STATIONS_URL, json=payload, timeout=cls.TIMEOUT)
             response.raise_for_status()
             data = response.json()
 
@@ -546,7 +547,7 @@ class SystemFinderAPI:
                 'sort': [{'distance': {'direction': 'asc'}}]
             }
             
-            response = requests.post(cls.SPANSH_URL, json=payload, timeout=cls.TIMEOUT)
+            response = http_post(cls.SPANSH_URL, json=payload, timeout=cls.TIMEOUT)
             response.raise_for_status()
             data = response.json()
             
@@ -0,0 +1,200 @@
+"""
+System Name Index for EliteMining
+Offline prefix index over galaxy_systems.db, visited systems and hotspot
+systems, so system name autocomplete doesn't need a web request per keystroke
+"""
+
+import math
+import time
+import heapq
+import sqlite3
+import logging
+import threading
+from bisect import bisect_left
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+log = logging.getLogger("EliteMining.SystemNameIndex")
+
+# Visited/hotspot systems change while playing; reload them at most this often
+USER_REFRESH_SECONDS = 120
+
+# Galaxy prefix matches ranked per lookup. Short prefixes like "col" match thousands
+# of sector names - beyond this only the first ones alphabetically are considered.
+# Visited and hotspot systems are kept in their own array and always considered.
+MAX_RANKED_CANDIDATES = 3000
+
+Coords = Tuple[float, float, float]
+
+
+class SystemNameIndex:
+    """Sorted array of lower-cased system names searched with bisect
+
+    Completions are ranked visited first, then systems with hotspots, then by
+    distance from the most recently visited system. Loading runs in a
+    background thread; until it finishes complete() returns nothing.
+    """
+
+    def __init__(self, galaxy_db_path: Optional[str] = None, user_db=None):
+        """Initialize the index
+
+        Args:
+            galaxy_db_path: galaxy_systems.db (default: bundled app/data copy)
+            user_db: UserDatabase for visited systems and hotspots (default: opened on load)
+        """
+        self.galaxy_db_path = galaxy_db_path or str(Path(__file__).parent / "data" / "galaxy_systems.db")
+        self.user_db = user_db
+        self._galaxy: Dict[str, Tuple[str, Optional[Coords]]] = {}
+        self._keys: List[str] = []
+        # (name, coords, rank) - rank is precomputed against origin at load time
+        self._entries: List[Tuple[str, Optional[Coords], Tuple[bool, bool, float]]] = []
+        # Same layout, visited and hotspot systems only
+        self._priority_keys: List[str] = []
+        self._priority_entries: List[Tuple[str, Optional[Coords], Tuple[bool, bool, float]]] = []
+        self.origin: Optional[Coords] = None
+        self._loaded_at = 0.0
+        self._loading = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at > 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def load_async(self) -> None:
+        """Load (or refresh stale user data) in a background thread"""
+        with self._lock:
+            if self._loading or (self._loaded_at and time.time() - self._loaded_at < USER_REFRESH_SECONDS):
+                return
+            self._loading = True
+        threading.Thread(target=self.load, daemon=True, name="SystemNameIndex").start()
+
+    def load(self) -> int:
+        """Build the index (galaxy names are read once, user data every call)
+
+        Returns:
+            Number of names indexed
+        """
+        try:
+            if not self._galaxy:
+                self._galaxy = self._read_galaxy()
+            visited, hotspots, origin = self._read_user_systems()
+
+            merged = dict(self._galaxy)
+            for key, entry in hotspots.items():
+                if key not in merged or merged[key][1] is None:
+                    merged[key] = entry
+            merged.update(visited)
+
+            origin = origin or self.origin
+            keys = sorted(merged)
+            entries = [(merged[key][0], merged[key][1],
+                        self._rank(key in visited, key in hotspots, merged[key][1], origin))
+                       for key in keys]
+            priority = [(key, entry) for key, entry in zip(keys, entries)
+                        if key in visited or key in hotspots]
+            priority_keys = [key for key, _ in priority]
+            priority_entries = [entry for _, entry in priority]
+            with self._lock:
+                # Swap all arrays at once so lookups never see a half-built index
+                self._keys, self._entries = keys, entries
+                self._priority_keys, self._priority_entries = priority_keys, priority_entries
+                self.origin = origin
+                self._loaded_at = time.time()
+            log.info(f"Indexed {len(keys)} system names ({len(visited)} visited, {len(hotspots)} with hotspots)")
+            return len(keys)
+        except Exception as e:
+            log.error(f"System name index load failed: {e}")
+            return 0
+        finally:
+            with self._lock:
+                self._loading = False
+
+    def _read_galaxy(self) -> Dict[str, Tuple[str, Optional[Coords]]]:
+        if not Path(self.galaxy_db_path).exists():
+            return {}
+        conn = sqlite3.connect(f"file:{self.galaxy_db_path}?mode=ro", uri=True)
+        try:
+            return {name.lower(): (name, (x, y, z) if x is not None else None)
+                    for name, x, y, z in conn.execute("SELECT name, x, y, z FROM systems")}
+        finally:
+            conn.close()
+
+    def _read_user_systems(self):
+        if self.user_db is None:
+            from user_database import UserDatabase
+            self.user_db = UserDatabase()
+        visited = {}
+        hotspots = {}
+        origin = None
+        with self.user_db._connect() as conn:
+            for name, x, y, z in conn.execute('''
+                SELECT system_name, x_coord, y_coord, z_coord FROM visited_systems
+                ORDER BY last_visit_date
+            '''):
+                coords = (x, y, z) if x is not None else None
+                visited[name.lower()] = (name, coords)
+                if coords:
+                    origin = coords  # Ordered by visit, so this ends on the latest system
+            for name, x, y, z in conn.execute('''
+                SELECT system_name, MAX(x_coord), MAX(y_coord), MAX(z_coord) FROM hotspot_data
+                GROUP BY system_name
+            '''):
+                if name:
+                    hotspots[name.lower()] = (name, (x, y, z) if x is not None else None)
+        return visited, hotspots, origin
+
+    @staticmethod
+    def _rank(visited: bool, hotspot: bool, coords: Optional[Coords],
+              origin: Optional[Sequence[float]]) -> Tuple[bool, bool, float]:
+        """Sort key: visited first, then hotspots, then closest (False sorts first)"""
+        distance = math.dist(origin, coords) if origin and coords else math.inf
+        return (not visited, not hotspot, distance)
+
+    def complete(self, prefix: str, limit: int = 20, origin: Optional[Sequence[float]] = None) -> List[str]:
+        """System names starting with prefix (case-insensitive), best first
+
+        Args:
+            prefix: Typed text
+            limit: Maximum names returned
+            origin: Rank by distance from here instead of the last visited system
+                    (slower - ranks are recomputed for every match)
+        """
+        key = prefix.strip().lower()
+        if not key:
+            return []
+        with self._lock:
+            keys, entries = self._keys, self._entries
+            priority_keys, priority_entries = self._priority_keys, self._priority_entries
+        # '\uffff' sorts after every character a name can continue with
+        stop = key + '\uffff'
+        # Every visited/hotspot match, however far down the alphabet it sorts...
+        start = bisect_left(priority_keys, key)
+        candidates = priority_entries[start:bisect_left(priority_keys, stop, start)]
+        # ...plus the first galaxy matches (priority systems are already in)
+        start = bisect_left(keys, key)
+        end = bisect_left(keys, stop, start, min(len(keys), start + MAX_RANKED_CANDIDATES))
+        candidates.extend(entry for entry in entries[start:end] if entry[2][0] and entry[2][1])
+        if origin is None:
+            best = heapq.nsmallest(limit, candidates, key=itemgetter(2))
+        else:
+            rank = self._rank
+            best = heapq.nsmallest(limit, candidates, key=lambda e: rank(not e[2][0], not e[2][1], e[1], origin))
+        return [entry[0] for entry in best]
+
+
+_index: Optional[SystemNameIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_system_name_index() -> SystemNameIndex:
+    """Get the shared index, starting a background (re)load when needed"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SystemNameIndex()
+    _index.load_async()
+    return _index
@@ -4,7 +4,6 @@ Checks GitHub releases for new versions
 """
 
 import logging
-import requests
 import threading
 import time
 import json
@@ -17,6 +16,8 @@ import tkinter as tk
 from tkinter import messagebox
 import webbrowser
 
+from http_client import http_get
+
 log = logging.getLogger("EliteMining.UpdateChecker")
 
 class UpdateChecker:
@@ -84,7 +85,7 @@ class UpdateChecker:
         try:
             log.info(f"Checking for updates... Current version: {self.current_version}")
             
-            response = requests.get(self.check_url, timeout=10)
+            response = http_get(self.check_url, timeout=10, conditional=True)
             if response.status_code != 200:
                 log.warning(f"Update check failed: HTTP {response.status_code}")
                 return
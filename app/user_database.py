@@ -12,6 +12,8 @@ import math
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from app_utils import get_app_data_dir
+from db_connections import get_connection_manager
+from geometry import within_radius
 
 log = logging.getLogger("EliteMining.UserDatabase")
 
@@ -84,29 +86,64 @@ class UserDatabase:
             db_path = os.path.join(data_dir, "user_data.db")
             
         self.db_path = db_path
+        self._connections = get_connection_manager(db_path)
         self._enable_wal_mode()
         self._create_tables()
         self._run_migrations()
 
+    def _connect(self):
+        """Get this thread's pooled connection to the database.
+
+        Used as `with self._connect() as conn:` exactly like sqlite3.connect():
+        leaving the block commits, but the connection stays open for the next
+        call on the same thread so pragmas and prepared statements are reused.
+        """
+        return self._connections.connect()
+
+    def transaction(self):
+        """Context manager that groups many writes into one transaction.
+
+        Example:
+            with user_db.transaction():
+                for row in rows:
+                    user_db.add_hotspot_data(...)
+        """
+        return self._connections.transaction()
+
+    def in_transaction(self) -> bool:
+        """Whether the calling thread is inside transaction()"""
+        return self._connections.in_transaction()
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Get connection pool counters (connections opened, statements, time spent)"""
+        return self._connections.get_stats()
+
+    def close_connections(self) -> bool:
+        """Retire all pooled connections to this database (e.g. before restoring a backup)
+
+        Returns:
+            False if another thread's transaction didn't finish in time
+        """
+        return self._connections.close_all()
+
     def _enable_wal_mode(self) -> None:
         """Switch the db file to WAL journal mode (persists in the file header).
 
         Rollback-journal mode (the sqlite3 default) locks the whole file during
         writes, so a search-worker query can block a main-thread connection to
         the same file (or vice versa). WAL lets readers and a writer proceed
-        concurrently, which is what search worker threads need since every
-        method here opens its own short-lived connection.
+        concurrently. The pooled connection applies the pragma when it opens;
+        this just opens the first one.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute('PRAGMA journal_mode=WAL')
+            self._connect()
         except Exception as e:
             print(f"[DB] Could not enable WAL mode: {e}")
     
     def _get_migration_version(self, migration_name: str) -> int:
         """Get the version number for a specific migration"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 # Create migration tracking table if it doesn't exist
                 cursor.execute('''
@@ -126,7 +163,7 @@ class UserDatabase:
         """Set the version number for a specific migration"""
         try:
             from datetime import datetime
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT OR REPLACE INTO migration_history (migration_name, version, applied_at)
@@ -242,7 +279,7 @@ class UserDatabase:
         any user-set tags onto the surviving row) so the index can be created.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 try:
                     cursor.execute('''
@@ -352,7 +389,7 @@ class UserDatabase:
             return name.strip().title()
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Check if migration needed by looking for non-English material names
@@ -451,7 +488,7 @@ class UserDatabase:
         # Detection: Find system names ending with " X" (space + single letter) where body
         # starts with a number, and a matching correct entry exists.
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Find potentially incorrect entries:
@@ -561,7 +598,7 @@ class UserDatabase:
             with open(csv_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 
-                with sqlite3.connect(self.db_path) as conn:
+                with self._connect() as conn:
                     cursor = conn.cursor()
                     
                     for row in reader:
@@ -674,7 +711,7 @@ class UserDatabase:
             with open(csv_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 
-                with sqlite3.connect(self.db_path) as conn:
+                with self._connect() as conn:
                     cursor = conn.cursor()
                     
                     for row in reader:
@@ -810,7 +847,7 @@ class UserDatabase:
             log.info(f"[Migration] Found {len(bundled_hotspots)} hotspots in bundled database")
             print(f"[MIGRATION] Processing {len(bundled_hotspots)} hotspots...")
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute("SELECT COUNT(*) FROM hotspot_data")
@@ -899,7 +936,7 @@ class UserDatabase:
         import re
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Find entries where body_name contains a system-like prefix that doesn't match system_name
@@ -1005,7 +1042,7 @@ class UserDatabase:
         import re
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Find entries where system_name ends with a star designation (A, B, AB, BC, etc.)
@@ -1171,7 +1208,7 @@ class UserDatabase:
         the column to better reflect its purpose. All existing data is preserved.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Check if reserve_level column already exists
@@ -1217,7 +1254,7 @@ class UserDatabase:
         2. Update remaining count=0 entries to count=1 (a hotspot exists, so count >= 1)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Count entries before migration
@@ -1266,7 +1303,7 @@ class UserDatabase:
     def _create_tables(self) -> None:
         """Create database tables if they don't exist"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute('''
                     CREATE TABLE IF NOT EXISTS hotspot_data (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -1385,6 +1422,21 @@ class UserDatabase:
                     )
                 ''')
                 
+                # Per-file journal ingestion checkpoints - lets a rescan resume each
+                # Journal*.log from the last complete line instead of byte 0
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS journal_checkpoints (
+                        file_path TEXT PRIMARY KEY,
+                        file_size INTEGER NOT NULL,
+                        mtime REAL NOT NULL,
+                        byte_offset INTEGER NOT NULL,
+                        last_event_timestamp TEXT,
+                        last_system TEXT,
+                        tail_hash TEXT,
+                        updated_at TEXT
+                    )
+                ''')
+                
                 # Create indexes for better query performance
                 conn.execute('''
                     CREATE INDEX IF NOT EXISTS idx_hotspot_system 
@@ -1468,7 +1520,7 @@ class UserDatabase:
         updated_count = 0
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get all hotspots for this system
@@ -1542,7 +1594,7 @@ class UserDatabase:
             # Normalize body name to match stored format
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT COUNT(*) FROM hotspot_data 
@@ -1561,7 +1613,7 @@ class UserDatabase:
         if not system_body_pairs:
             return set()
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 found = set()
                 # SQLite has a limit on parameters; process in chunks of 500 pairs
@@ -1587,7 +1639,7 @@ class UserDatabase:
         if not system_names:
             return {}
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 result = {name: 0 for name in system_names}
                 chunk_size = 500
@@ -1618,7 +1670,7 @@ class UserDatabase:
             # Normalize body name to match stored format
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT COUNT(*) FROM hotspot_data 
@@ -1646,7 +1698,7 @@ class UserDatabase:
             # Normalize body name to match stored format
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT hotspot_count, x_coord, y_coord, z_coord, ring_type, ls_distance
@@ -1683,7 +1735,7 @@ class UserDatabase:
             # Normalize body name to match stored format
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Query reserve_level column in hotspot_data
@@ -1721,7 +1773,7 @@ class UserDatabase:
             
             log.info(f"[SET RESERVE] Setting reserve for {system_name} - {body_name} to {reserve_level}")
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Check if entries exist for this ring
@@ -1770,7 +1822,7 @@ class UserDatabase:
         try:
             body_name = self._normalize_body_name(body_name, system_name)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT ring_type FROM hotspot_data
@@ -1805,7 +1857,7 @@ class UserDatabase:
 
             log.info(f"[SET RING TYPE] Setting ring type for {system_name} - {body_name} to {ring_type}")
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
 
                 cursor.execute('''
@@ -1837,6 +1889,73 @@ class UserDatabase:
             traceback.print_exc()
             return False
 
+    def _hotspot_update_reason(self, existing: Dict[str, Any], hotspot_count: int, scan_date: str,
+                               coord_source: str, ls_distance: Optional[float], ring_type: Optional[str],
+                               inner_radius: Optional[float], outer_radius: Optional[float],
+                               ring_mass: Optional[float]) -> Optional[str]:
+        """Decide whether new hotspot data should overwrite an existing row
+        
+        Args:
+            existing: Existing row values (coord_source, ls_distance, ring_type, scan_date,
+                      hotspot_count, ring_mass, inner_radius, outer_radius)
+            hotspot_count..ring_mass: Incoming values, as passed to add_hotspot_data
+            
+        Returns:
+            Reason for the update, or None if the existing row should be kept
+        """
+        existing_count = existing['hotspot_count'] or 0
+        existing_date = existing['scan_date'] or ''
+        scan_date = scan_date or ''
+        
+        # Count completeness of new vs existing data
+        new_data_fields = [
+            ls_distance is not None,
+            ring_type is not None,
+            inner_radius is not None,
+            outer_radius is not None,
+            ring_mass is not None
+        ]
+        existing_data_fields = [
+            existing['ls_distance'] is not None,
+            existing['ring_type'] is not None,
+            existing['inner_radius'] is not None,
+            existing['outer_radius'] is not None,
+            existing['ring_mass'] is not None
+        ]
+        new_data_count = sum(new_data_fields)
+        existing_data_count = sum(existing_data_fields)
+        
+        # Journal scans with actual hotspot counts always override database entries with count=0
+        # This handles cases where old imports have count=0 but journal has real scan data
+        if hotspot_count > 0 and existing_count == 0:
+            return "journal scan data overrides empty count"
+        # Always update if hotspot count is higher (regardless of coord_source)
+        if hotspot_count > existing_count:
+            return "higher hotspot count"
+        # Always update if it's a newer scan with new data (regardless of coord_source)
+        if scan_date > existing_date and new_data_count > 0:
+            return "newer scan with data"
+        # Update if journal has more complete information
+        if coord_source == "visited_systems":
+            # Check for ring mass updates
+            if ring_mass and not existing['ring_mass']:
+                return "adding ring mass data"
+            # Update journal data with newer journal data
+            if ls_distance and not existing['ls_distance']:
+                return "adding LS distance"
+            if ring_type and not existing['ring_type']:
+                return "adding ring type"
+            if scan_date > existing_date and new_data_count >= existing_data_count:
+                # Only update if newer AND at least as complete
+                return f"newer scan date with equal/better data ({new_data_count}/{len(new_data_fields)} fields vs {existing_data_count}/{len(existing_data_fields)} fields)"
+            if scan_date > existing_date and new_data_count < existing_data_count:
+                # Newer but less complete - don't overwrite good data
+                return None
+            # Allow journal data to update entries with no coord_source (unknown origin)
+            if existing['coord_source'] in (None, "", "unknown") and new_data_count > 0:
+                return "updating unknown-source data with journal data"
+        return None
+
     def add_hotspot_data(self, system_name: str, body_name: str, material_name: str,
                         hotspot_count: int, scan_date: str, system_address: Optional[int] = None,
                         body_id: Optional[int] = None, coordinates: Optional[Tuple[float, float, float]] = None,
@@ -1875,7 +1994,7 @@ class UserDatabase:
             
             x_coord, y_coord, z_coord = coordinates or (None, None, None)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Check if this hotspot already exists
@@ -1894,76 +2013,20 @@ class UserDatabase:
                     log.debug(f"Found existing hotspot: {system_name} - {body_name} - {material_name} | coord_source={existing_coord_source} | ls={existing_ls} | type={existing_ring_type}")
                     log.debug(f"New data: coord_source={coord_source} | ls={ls_distance} | type={ring_type}")
                     
-                    # Determine if we should update
-                    should_update = False
-                    update_reason = None
-                    
                     # Check if we have ring_mass to add
                     cursor.execute('SELECT ring_mass, inner_radius, outer_radius FROM hotspot_data WHERE id = ?', (existing_id,))
                     extra_data_check = cursor.fetchone()
                     existing_mass, existing_inner, existing_outer = extra_data_check if extra_data_check else (None, None, None)
                     
-                    # Count completeness of new vs existing data
-                    new_data_fields = [
-                        ls_distance is not None,
-                        ring_type is not None,
-                        inner_radius is not None,
-                        outer_radius is not None,
-                        ring_mass is not None
-                    ]
-                    existing_data_fields = [
-                        existing_ls is not None,
-                        existing_ring_type is not None,
-                        existing_inner is not None,
-                        existing_outer is not None,
-                        existing_mass is not None
-                    ]
-                    
-                    new_data_count = sum(new_data_fields)
-                    existing_data_count = sum(existing_data_fields)
-                    
-                    # Journal scans with actual hotspot counts always override database entries with count=0
-                    # This handles cases where old imports have count=0 but journal has real scan data
-                    if hotspot_count > 0 and existing_count == 0:
-                        should_update = True
-                        update_reason = "journal scan data overrides empty count"
-                    # Always update if hotspot count is higher (regardless of coord_source)
-                    elif hotspot_count > existing_count:
-                        should_update = True
-                        update_reason = "higher hotspot count"
-                    # Always update if it's a newer scan with new data (regardless of coord_source)
-                    elif scan_date > existing_date and new_data_count > 0:
-                        should_update = True
-                        update_reason = "newer scan with data"
-                    # Update if journal has more complete information
-                    elif coord_source == "visited_systems":
-                        # Check for ring mass updates
-                        if ring_mass and not existing_mass:
-                            should_update = True
-                            update_reason = "adding ring mass data"
-                        # Update journal data with newer journal data
-                        elif ls_distance and not existing_ls:
-                            should_update = True
-                            update_reason = "adding LS distance"
-                        elif ring_type and not existing_ring_type:
-                            should_update = True
-                            update_reason = "adding ring type"
-                        elif scan_date > existing_date and new_data_count >= existing_data_count:
-                            # Only update if newer AND at least as complete
-                            should_update = True
-                            update_reason = f"newer scan date with equal/better data ({new_data_count}/{len(new_data_fields)} fields vs {existing_data_count}/{len(existing_data_fields)} fields)"
-                        elif scan_date > existing_date and new_data_count < existing_data_count:
-                            # Newer but less complete - don't overwrite good data
-                            log.debug(f"Skipping update for {system_name} - {body_name} - {material_name}: newer scan but less complete ({new_data_count} vs {existing_data_count} fields)")
-                            return
-                        # Allow journal data to update entries with no coord_source (unknown origin)
-                        elif existing_coord_source in (None, "", "unknown") and new_data_count > 0:
-                            should_update = True
-                            update_reason = "updating unknown-source data with journal data"
-                        else:
-                            log.debug(f"No update needed for {system_name} - {body_name} - {material_name}: existing_coord_source={existing_coord_source}, new_data_count={new_data_count}")
+                    update_reason = self._hotspot_update_reason(
+                        {'coord_source': existing_coord_source, 'ls_distance': existing_ls,
+                         'ring_type': existing_ring_type, 'scan_date': existing_date,
+                         'hotspot_count': existing_count, 'ring_mass': existing_mass,
+                         'inner_radius': existing_inner, 'outer_radius': existing_outer},
+                        hotspot_count, scan_date, coord_source, ls_distance, ring_type,
+                        inner_radius, outer_radius, ring_mass)
                     
-                    if should_update:
+                    if update_reason:
                         log.debug(f"Updating hotspot ({update_reason}): {system_name} - {body_name} - {material_name}")
                         # COALESCE the ring-metadata fields: journal SAASignalsFound doesn't carry
                         # ring_type / ls_distance / radii / mass (those come from the planet Scan
@@ -2024,6 +2087,166 @@ class UserDatabase:
         except Exception as e:
             log.error(f"Error adding hotspot data: {e}")
 
+    def bulk_add_hotspots(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Add or update many hotspots in one transaction
+        
+        Applies the same update rules as add_hotspot_data, but normalizes names and
+        looks up existing rows and visited-system coordinates once for the whole
+        batch, then writes with executemany.
+        
+        Args:
+            rows: Dicts with add_hotspot_data's keyword arguments. system_name, body_name,
+                  material_name, hotspot_count and scan_date are required.
+            
+        Returns:
+            Tuple of (new_count, updated_count); (0, 0) if the write failed. Inside
+            transaction() a failure raises instead, so the caller's block rolls back.
+        """
+        if not rows:
+            return 0, 0
+        
+        metadata_fields = ('ring_type', 'ls_distance', 'inner_radius', 'outer_radius', 'ring_mass')
+        chunk_size = 500
+        
+        try:
+            # Normalize each (body, system) pair once
+            body_names: Dict[Tuple[str, str], str] = {}
+            for row in rows:
+                key = (row['body_name'], row['system_name'])
+                if key not in body_names:
+                    body_names[key] = self._normalize_body_name(*key)
+            
+            system_names = list({row['system_name'] for row in rows})
+            missing_coords = list({row['system_name'] for row in rows if row.get('coordinates') is None})
+            
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                
+                # Coordinates from visited_systems for rows that don't carry their own
+                visited_coords: Dict[str, Tuple[float, float, float]] = {}
+                for i in range(0, len(missing_coords), chunk_size):
+                    chunk = missing_coords[i:i + chunk_size]
+                    placeholders = ','.join('?' for _ in chunk)
+                    cursor.execute(f'''
+                        SELECT system_name, x_coord, y_coord, z_coord FROM visited_systems
+                        WHERE system_name IN ({placeholders}) AND x_coord IS NOT NULL
+                    ''', chunk)
+                    for name, x, y, z in cursor.fetchall():
+                        visited_coords.setdefault(name, (x, y, z))
+                
+                # Current state of every hotspot in the affected systems
+                state: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+                for i in range(0, len(system_names), chunk_size):
+                    chunk = system_names[i:i + chunk_size]
+                    placeholders = ','.join('?' for _ in chunk)
+                    cursor.execute(f'''
+                        SELECT system_name, body_name, material_name, coord_source, ls_distance,
+                               ring_type, scan_date, hotspot_count, ring_mass, inner_radius, outer_radius
+                        FROM hotspot_data WHERE system_name IN ({placeholders})
+                    ''', chunk)
+                    for row in cursor.fetchall():
+                        state[(row[0], row[1], row[2])] = {
+                            'coord_source': row[3], 'ls_distance': row[4], 'ring_type': row[5],
+                            'scan_date': row[6], 'hotspot_count': row[7], 'ring_mass': row[8],
+                            'inner_radius': row[9], 'outer_radius': row[10],
+                            'is_new': False, 'changed': False,
+                        }
+                
+                # Resolve every row against the current state (and earlier rows in this batch)
+                backfill = []
+                for row in rows:
+                    system_name = row['system_name']
+                    body_name = body_names[(row['body_name'], system_name)]
+                    material_name = row['material_name']
+                    
+                    coordinates = row.get('coordinates')
+                    coord_source = row.get('coord_source', 'journal')
+                    if coordinates is None:
+                        coordinates = visited_coords.get(system_name)
+                        coord_source = "visited_systems" if coordinates else "unknown"
+                    
+                    values = {
+                        'hotspot_count': row['hotspot_count'],
+                        'scan_date': row['scan_date'],
+                        'system_address': row.get('system_address'),
+                        'body_id': row.get('body_id'),
+                        'coordinates': coordinates,
+                        'coord_source': coord_source,
+                    }
+                    metadata = {field: row.get(field) for field in metadata_fields}
+                    
+                    key = (system_name, body_name, material_name)
+                    current = state.get(key)
+                    if current is None:
+                        state[key] = dict(values, **metadata, is_new=True, changed=True)
+                    else:
+                        if not self._hotspot_update_reason(current, values['hotspot_count'], values['scan_date'],
+                                                           coord_source, **metadata):
+                            continue
+                        # Same as add_hotspot_data's UPDATE: NULL metadata never wipes stored values
+                        current.update(values)
+                        current.update({field: value for field, value in metadata.items() if value is not None})
+                        current['changed'] = True
+                    
+                    # Back-fill ring metadata to other materials in the same ring
+                    if any(metadata.values()):
+                        backfill.append((metadata['ls_distance'], metadata['ring_type'], metadata['inner_radius'],
+                                         metadata['outer_radius'], metadata['ring_mass'],
+                                         system_name, body_name, material_name))
+                
+                inserts = []
+                updates = []
+                for (system_name, body_name, material_name), entry in state.items():
+                    if not entry['changed']:
+                        continue
+                    x_coord, y_coord, z_coord = entry['coordinates'] or (None, None, None)
+                    params = (entry['hotspot_count'], entry['scan_date'], entry['system_address'], entry['body_id'],
+                              x_coord, y_coord, z_coord, entry['coord_source'],
+                              entry['ring_type'], entry['ls_distance'], entry['inner_radius'],
+                              entry['outer_radius'], entry['ring_mass'],
+                              system_name, body_name, material_name)
+                    (inserts if entry['is_new'] else updates).append(params)
+                
+                if inserts:
+                    cursor.executemany('''
+                        INSERT INTO hotspot_data 
+                        (hotspot_count, scan_date, system_address, body_id, x_coord, y_coord, z_coord, coord_source,
+                         ring_type, ls_distance, inner_radius, outer_radius, ring_mass,
+                         system_name, body_name, material_name)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', inserts)
+                if updates:
+                    cursor.executemany('''
+                        UPDATE hotspot_data
+                        SET hotspot_count = ?, scan_date = ?, system_address = ?, body_id = ?,
+                            x_coord = ?, y_coord = ?, z_coord = ?, coord_source = ?,
+                            ring_type = ?, ls_distance = ?, inner_radius = ?, outer_radius = ?, ring_mass = ?
+                        WHERE system_name = ? AND body_name = ? AND material_name = ?
+                    ''', updates)
+                if backfill:
+                    cursor.executemany('''
+                        UPDATE hotspot_data
+                        SET ls_distance = COALESCE(ls_distance, ?),
+                            ring_type = COALESCE(ring_type, ?),
+                            inner_radius = COALESCE(inner_radius, ?),
+                            outer_radius = COALESCE(outer_radius, ?),
+                            ring_mass = COALESCE(ring_mass, ?)
+                        WHERE system_name = ? 
+                          AND body_name = ? 
+                          AND material_name != ?
+                          AND (ls_distance IS NULL OR ring_type IS NULL)
+                    ''', backfill)
+            
+            log.debug(f"Bulk hotspot save: {len(inserts)} new, {len(updates)} updated from {len(rows)} rows")
+            return len(inserts), len(updates)
+            
+        except Exception as e:
+            log.error(f"Error bulk adding hotspot data: {e}")
+            if self.in_transaction():
+                # Let the caller's transaction roll back instead of committing a partial batch
+                raise
+            return 0, 0
+
     def update_ring_metadata(self, system_name: str, body_name: str, ring_type: str = None,
                             ls_distance: float = None, inner_radius: float = None,
                             outer_radius: float = None, ring_mass: float = None,
@@ -2047,7 +2270,7 @@ class UserDatabase:
             Number of records updated
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Check existing reserve_level
@@ -2144,7 +2367,7 @@ class UserDatabase:
     def _get_coordinates_from_visited_systems(self, system_name: str) -> Optional[Tuple[float, float, float]]:
         """Get coordinates for a system from visited_systems table"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT x_coord, y_coord, z_coord 
@@ -2171,7 +2394,7 @@ class UserDatabase:
             List of dictionaries containing hotspot data
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -2198,7 +2421,7 @@ class UserDatabase:
             List of dictionaries containing hotspot data (deduplicated and summed)
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -2241,7 +2464,7 @@ class UserDatabase:
             LS distance in light-seconds if available, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT ls_distance 
@@ -2272,7 +2495,7 @@ class UserDatabase:
             Dictionary with ring_type, ls_distance, reserve_level, etc. if available, None otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT ring_type, ls_distance, reserve_level, inner_radius, outer_radius, ring_mass
@@ -2339,7 +2562,7 @@ class UserDatabase:
             coordinates: (x, y, z) coordinates if available
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 # Check if system already exists
                 cursor = conn.cursor()
                 cursor.execute('''
@@ -2383,6 +2606,29 @@ class UserDatabase:
         except Exception as e:
             log.error(f"Error adding visited system: {e}")
     
+    def get_visited_system_coords(self, after_id: int = 0) -> List[Tuple[int, str, float, float, float]]:
+        """Get visited systems that have coordinates
+        
+        Args:
+            after_id: Only return rows with an id greater than this (for incremental refresh)
+            
+        Returns:
+            List of (id, system_name, x, y, z) ordered by id
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT id, system_name, x_coord, y_coord, z_coord
+                    FROM visited_systems
+                    WHERE id > ? AND x_coord IS NOT NULL
+                    ORDER BY id
+                ''', (after_id,))
+                return cursor.fetchall()
+        except Exception as e:
+            log.error(f"Error getting visited system coordinates: {e}")
+            return []
+    
     def get_total_visits_count(self) -> int:
         """Get total count of visited systems (used to detect first install)
         
@@ -2390,7 +2636,7 @@ class UserDatabase:
             Number of unique systems visited
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT COUNT(*) FROM visited_systems')
                 result = cursor.fetchone()
@@ -2409,7 +2655,7 @@ class UserDatabase:
             Dictionary with visit data or None if never visited
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.cursor()
                 
@@ -2469,7 +2715,7 @@ class UserDatabase:
             Name of the most recently visited system, or None if no visits recorded
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT system_name FROM visited_systems 
@@ -2505,7 +2751,7 @@ class UserDatabase:
             True if update was successful
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 if new_count <= 0:
@@ -2563,7 +2809,7 @@ class UserDatabase:
             # Normalize body name
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Try UPDATE first
@@ -2603,7 +2849,7 @@ class UserDatabase:
         try:
             body_name = self._normalize_body_name(body_name, system_name)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     UPDATE hotspot_data
@@ -2630,7 +2876,7 @@ class UserDatabase:
         try:
             body_name = self._normalize_body_name(body_name, system_name)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT favourite FROM hotspot_data
@@ -2652,7 +2898,7 @@ class UserDatabase:
         unique_systems = list(set(system_names))
         placeholders = ','.join('?' * len(unique_systems))
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     f'SELECT DISTINCT system_name, body_name '
                     f'FROM hotspot_data WHERE favourite = 1 '
@@ -2678,7 +2924,7 @@ class UserDatabase:
         try:
             body_name = self._normalize_body_name(body_name, system_name)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 if comment and comment.strip():
                     conn.execute('''
                         INSERT INTO ring_comments (system_name, body_name, comment, updated_at)
@@ -2710,7 +2956,7 @@ class UserDatabase:
         try:
             body_name = self._normalize_body_name(body_name, system_name)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT comment FROM ring_comments
@@ -2732,7 +2978,7 @@ class UserDatabase:
         unique_systems = list(set(system_names))
         placeholders = ','.join('?' * len(unique_systems))
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     f'SELECT system_name, body_name, comment '
                     f'FROM ring_comments WHERE system_name IN ({placeholders})',
@@ -2758,7 +3004,7 @@ class UserDatabase:
             # Normalize body name
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT overlap_tag FROM hotspot_data 
@@ -2786,7 +3032,7 @@ class UserDatabase:
             # Normalize body name
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Try UPDATE first
@@ -2827,7 +3073,7 @@ class UserDatabase:
             # Normalize body name
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT res_tag FROM hotspot_data 
@@ -2853,7 +3099,7 @@ class UserDatabase:
             # Normalize body name
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT material_name, overlap_tag FROM hotspot_data 
@@ -2880,7 +3126,7 @@ class UserDatabase:
             # Normalize body name
             body_name = self._normalize_body_name(body_name, system_name)
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT material_name, res_tag FROM hotspot_data 
@@ -2903,7 +3149,7 @@ class UserDatabase:
         unique_systems = list(set(system_names))
         placeholders = ','.join('?' * len(unique_systems))
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     f'SELECT system_name, body_name, material_name, overlap_tag '
                     f'FROM hotspot_data WHERE overlap_tag IS NOT NULL '
@@ -2929,7 +3175,7 @@ class UserDatabase:
         unique_systems = list(set(system_names))
         placeholders = ','.join('?' * len(unique_systems))
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 rows = conn.execute(
                     f'SELECT system_name, body_name, material_name, res_tag '
                     f'FROM hotspot_data WHERE res_tag IS NOT NULL '
@@ -2945,6 +3191,158 @@ class UserDatabase:
             log.error(f"Error bulk getting RES: {e}")
             return {}
 
+    def get_ring_enrichment(self, system_names: list) -> Dict[str, dict]:
+        """Fetch every per-ring annotation Ring Finder shows, in one query.
+
+        The system names are staged into a temp table on this thread's pooled
+        connection and joined against visited_systems, hotspot_data and
+        ring_comments, so a whole result list costs one connection and one
+        pass instead of one IN-list query per annotation.
+
+        Returns:
+            {'visits': {system_name: visit_count},        (0 if not visited)
+             'favourites': {(system_name, body_name): True},
+             'comments': {(system_name, body_name): comment},
+             'overlaps': {(system_name, body_name): [{'material_name', 'overlap_tag'}]},
+             'res': {(system_name, body_name): [{'material_name', 'res_tag'}]}}
+            Same shapes as the bulk_get_* methods.
+        """
+        unique_systems = list(set(name for name in system_names if name))
+        result = {
+            'visits': {name: 0 for name in unique_systems},
+            'favourites': {},
+            'comments': {},
+            'overlaps': {},
+            'res': {},
+        }
+        if not unique_systems:
+            return result
+        try:
+            with self._connect() as conn:
+                conn.execute('CREATE TEMP TABLE IF NOT EXISTS enrichment_systems (system_name TEXT PRIMARY KEY)')
+                conn.execute('DELETE FROM enrichment_systems')
+                conn.executemany('INSERT INTO enrichment_systems (system_name) VALUES (?)',
+                                 [(name,) for name in unique_systems])
+                rows = conn.execute('''
+                    SELECT 'visit', v.system_name, NULL, NULL, v.visit_count, NULL, NULL
+                    FROM enrichment_systems s
+                    JOIN visited_systems v ON v.system_name = s.system_name
+                    UNION ALL
+                    SELECT 'hotspot', h.system_name, h.body_name, h.material_name,
+                           h.favourite, h.overlap_tag, h.res_tag
+                    FROM enrichment_systems s
+                    JOIN hotspot_data h ON h.system_name = s.system_name
+                    WHERE h.favourite = 1 OR h.overlap_tag IS NOT NULL OR h.res_tag IS NOT NULL
+                    UNION ALL
+                    SELECT 'comment', c.system_name, c.body_name, NULL, c.comment, NULL, NULL
+                    FROM enrichment_systems s
+                    JOIN ring_comments c ON c.system_name = s.system_name
+                    ORDER BY 2, 3, 4
+                ''').fetchall()
+                conn.execute('DELETE FROM enrichment_systems')
+
+            for kind, sys_name, body_name, mat_name, value, overlap_tag, res_tag in rows:
+                if kind == 'visit':
+                    result['visits'][sys_name] = value
+                    continue
+                key = (sys_name, body_name)
+                if kind == 'comment':
+                    result['comments'][key] = value
+                    continue
+                if value == 1:
+                    result['favourites'][key] = True
+                if overlap_tag is not None:
+                    result['overlaps'].setdefault(key, []).append(
+                        {'material_name': mat_name, 'overlap_tag': overlap_tag})
+                if res_tag is not None:
+                    result['res'].setdefault(key, []).append(
+                        {'material_name': mat_name, 'res_tag': res_tag})
+            return result
+        except Exception as e:
+            log.error(f"Error getting ring enrichment: {e}")
+            return result
+
+    def get_journal_checkpoints(self) -> Dict[str, Dict[str, Any]]:
+        """Get all persisted journal ingestion checkpoints
+        
+        Returns:
+            Dictionary mapping journal file path -> checkpoint dict with file_size,
+            mtime, byte_offset, last_event_timestamp, last_system and tail_hash
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT file_path, file_size, mtime, byte_offset, last_event_timestamp,
+                           last_system, tail_hash
+                    FROM journal_checkpoints
+                ''')
+                return {
+                    row[0]: {
+                        'file_size': row[1],
+                        'mtime': row[2],
+                        'byte_offset': row[3],
+                        'last_event_timestamp': row[4],
+                        'last_system': row[5],
+                        'tail_hash': row[6]
+                    }
+                    for row in cursor.fetchall()
+                }
+        except Exception as e:
+            log.error(f"Error getting journal checkpoints: {e}")
+            return {}
+    
+    def save_journal_checkpoints(self, checkpoints: List[Dict[str, Any]]) -> int:
+        """Insert or replace journal ingestion checkpoints in one transaction
+        
+        Args:
+            checkpoints: List of dicts with file_path, file_size, mtime, byte_offset,
+                         last_event_timestamp, last_system and tail_hash keys
+            
+        Returns:
+            Number of checkpoints written
+        """
+        if not checkpoints:
+            return 0
+        try:
+            now = datetime.now().isoformat()
+            with self._connect() as conn:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO journal_checkpoints
+                    (file_path, file_size, mtime, byte_offset, last_event_timestamp,
+                     last_system, tail_hash, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (cp['file_path'], cp['file_size'], cp['mtime'], cp['byte_offset'],
+                     cp.get('last_event_timestamp'), cp.get('last_system'), cp.get('tail_hash'), now)
+                    for cp in checkpoints
+                ])
+                conn.commit()
+            return len(checkpoints)
+        except Exception as e:
+            log.error(f"Error saving journal checkpoints: {e}")
+            return 0
+    
+    def has_journal_checkpoints(self) -> bool:
+        """Check if any journal file has been ingested (replaces last_full_scan.json)"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT 1 FROM journal_checkpoints LIMIT 1')
+                return cursor.fetchone() is not None
+        except Exception as e:
+            log.error(f"Error checking journal checkpoints: {e}")
+            return False
+    
+    def clear_journal_checkpoints(self) -> None:
+        """Delete all journal checkpoints so the next scan re-reads every file from byte 0"""
+        try:
+            with self._connect() as conn:
+                conn.execute('DELETE FROM journal_checkpoints')
+                conn.commit()
+        except Exception as e:
+            log.error(f"Error clearing journal checkpoints: {e}")
+    
     def get_database_stats(self) -> Dict[str, int]:
         """Get statistics about the database contents
         
@@ -2952,7 +3350,7 @@ class UserDatabase:
             Dictionary with counts of hotspots and visited systems
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute('SELECT COUNT(*) FROM hotspot_data')
@@ -2987,7 +3385,7 @@ class UserDatabase:
             List of systems with name, distance, and coordinates
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Query visited systems with coordinates
@@ -3001,29 +3399,14 @@ class UserDatabase:
                 cursor.execute(query, (exclude_system,))
                 results = cursor.fetchall()
                 
-                nearby_systems = []
-                max_distance_squared = max_distance * max_distance
-                
-                for row in results:
-                    system_name, x, y, z = row
-                    
-                    # Calculate 3D distance
-                    dx = center_x - x
-                    dy = center_y - y  
-                    dz = center_z - z
-                    dist_squared = dx*dx + dy*dy + dz*dz
-                    
-                    if dist_squared <= max_distance_squared:
-                        distance = dist_squared ** 0.5
-                        nearby_systems.append({
-                            'name': system_name,
-                            'distance': distance,
-                            'coordinates': {'x': x, 'y': y, 'z': z}
-                        })
-                
-                # Sort by distance
-                nearby_systems.sort(key=lambda s: s['distance'])
-                return nearby_systems
+                # Filter and sort by 3D distance in one batch
+                nearby = within_radius((center_x, center_y, center_z),
+                                       [row[1:] for row in results], max_distance, sort=True)
+                return [{
+                    'name': results[i][0],
+                    'distance': distance,
+                    'coordinates': {'x': results[i][1], 'y': results[i][2], 'z': results[i][3]}
+                } for i, distance in nearby]
                 
         except Exception as e:
             log.error(f"Error searching nearby visited systems: {e}")
@@ -0,0 +1,337 @@
+"""
+Virtual Treeview for EliteMining
+Keeps a ttk.Treeview's rows in a plain list and only creates items for the rows
+on screen, so result lists with thousands of rows display, scroll and sort
+without inserting or moving thousands of widget items
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Rows materialized until the widget has been measured
+DEFAULT_VISIBLE_ROWS = 30
+
+# Rows scrolled per mouse wheel notch
+WHEEL_ROWS = 3
+
+# Event state bits for Shift / Control
+_SHIFT = 0x0001
+_CONTROL = 0x0004
+
+
+class VirtualTreeview:
+    """Row store plus visible window for a ttk.Treeview
+
+    The store is three flat lists (values, tags, display order); sorting and
+    filtering only reorder the display order list. Item ids are the row's
+    index in the store, so code that reads or edits rows through the widget
+    (selection(), item(), set()) keeps working for rows on screen - edits made
+    that way are copied back to the store before the item leaves the window.
+    Selection is remembered for rows scrolled out of view.
+    """
+
+    def __init__(self, tree, scrollbar=None):
+        """Take over vertical scrolling of a treeview
+
+        Args:
+            tree: ttk.Treeview to fill (its columns define the row layout)
+            scrollbar: Vertical ttk.Scrollbar for the whole store (optional)
+        """
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.columns = tuple(tree['columns'])
+        self._values: List[tuple] = []
+        self._tags: List[tuple] = []
+        self._order: List[int] = []
+        self._position: Dict[int, int] = {}
+        self._window: List[int] = []
+        self._selected = set()
+        self._offset = 0
+        self._visible = DEFAULT_VISIBLE_ROWS
+        self._sort: Optional[Tuple[int, Callable, bool]] = None
+        self._filter: Optional[Callable[[tuple], bool]] = None
+
+        if scrollbar is not None:
+            scrollbar.configure(command=self.yview)
+        tree.configure(yscrollcommand=self._tree_scrolled)
+        tree.bind('<Configure>', self._measure, add='+')
+        tree.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        tree.bind('<ButtonPress-1>', self._on_click, add='+')
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', lambda e: self._scroll_rows(-WHEEL_ROWS))
+        tree.bind('<Button-5>', lambda e: self._scroll_rows(WHEEL_ROWS))
+        for key in ('<Up>', '<Down>', '<Prior>', '<Next>', '<Home>', '<End>',
+                    '<Shift-Up>', '<Shift-Down>'):
+            tree.bind(key, self._on_key)
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Rows shown (after filtering)"""
+        return len(self._order)
+
+    def set_rows(self, rows: Sequence[Tuple[Sequence, Sequence[str]]]) -> None:
+        """Replace every row
+
+        Args:
+            rows: (values, tags) per row, in display order
+        """
+        if self._window:
+            self.tree.delete(*[str(row) for row in self._window if self.tree.exists(str(row))])
+            self._window = []
+        self._values = [tuple(values) for values, _ in rows]
+        self._tags = [tuple(tags) for _, tags in rows]
+        self._selected = set()
+        self._offset = 0
+        self._sort = None
+        self._filter = None
+        self._reorder()
+
+    def clear(self) -> None:
+        self.set_rows([])
+
+    def row_values(self, row: int) -> tuple:
+        """Current values of a store row, on screen or not"""
+        iid = str(row)
+        if row in self._window and self.tree.exists(iid):
+            return tuple(self.tree.item(iid, 'values'))
+        return self._values[row]
+
+    def set_row_values(self, row: int, values: Sequence) -> None:
+        """Replace a store row's values (like Treeview.item(iid, values=...))"""
+        self._values[row] = tuple(values)
+        iid = str(row)
+        if row in self._window and self.tree.exists(iid):
+            self.tree.item(iid, values=self._values[row])
+
+    def set_value(self, row: int, column: str, value) -> None:
+        """Change one column of a store row (like Treeview.set(iid, column, value))"""
+        values = list(self.row_values(row))
+        values[self.columns.index(column)] = value
+        self.set_row_values(row, values)
+
+    def sort(self, column: str, key: Callable[[str], object], reverse: bool = False) -> None:
+        """Sort the rows by a column
+
+        Args:
+            column: Column identifier
+            key: Sort key for the column's text (as Treeview.set() returns it)
+            reverse: Descending
+        """
+        self._sort = (self.columns.index(column), key, reverse)
+        self._window_to_store()
+        # Stable sort of the current order, so ties keep the previous column's order
+        self._order.sort(key=self._sort_key(), reverse=reverse)
+        self._index_positions()
+        self._render(keep_store=True)
+
+    def filter(self, predicate: Optional[Callable[[tuple], bool]] = None) -> None:
+        """Show only rows whose values match (None shows every row)"""
+        self._filter = predicate
+        self._window_to_store()
+        self._reorder()
+
+    def update_rows(self, match: Callable[[tuple], bool], changes: Dict[str, object]) -> int:
+        """Change column values of every row that matches, on screen or not
+
+        Returns:
+            Number of rows changed
+        """
+        self._window_to_store()
+        indexes = [(self.columns.index(column), value) for column, value in changes.items()]
+        changed = 0
+        for row, values in enumerate(self._values):
+            if match(values):
+                values = list(values)
+                for index, value in indexes:
+                    values[index] = value
+                self._values[row] = tuple(values)
+                changed += 1
+        if changed:
+            self._render(keep_store=True)
+        return changed
+
+    def retag(self, change: Callable[[tuple, int], tuple]) -> None:
+        """Replace every row's tags with change(tags, display position)"""
+        self._window_to_store()
+        for position, row in enumerate(self._order):
+            self._tags[row] = tuple(change(self._tags[row], position))
+        self._render(keep_store=True)
+
+    def _reorder(self):
+        rows = range(len(self._values))
+        if self._filter is not None:
+            rows = [row for row in rows if self._filter(self._values[row])]
+        self._order = list(rows)
+        if self._sort is not None:
+            self._order.sort(key=self._sort_key(), reverse=self._sort[2])
+        self._index_positions()
+        self._render(keep_store=True)
+
+    def _sort_key(self) -> Callable[[int], object]:
+        index, key, _ = self._sort
+        values = self._values
+        return lambda row: key(str(values[row][index]))
+
+    def _index_positions(self):
+        self._position = {row: position for position, row in enumerate(self._order)}
+
+    # ------------------------------------------------------------------
+    # Window
+    # ------------------------------------------------------------------
+
+    def _window_to_store(self):
+        """Copy edits made through the widget back to the store"""
+        tree = self.tree
+        for row in self._window:
+            iid = str(row)
+            if tree.exists(iid):
+                item = tree.item(iid)
+                self._values[row] = tuple(item['values'])
+                self._tags[row] = tuple(item['tags'] or ())
+
+    def _render(self, keep_store: bool = False):
+        if not keep_store:
+            self._window_to_store()
+        tree = self.tree
+        total = len(self._order)
+        self._offset = max(0, min(self._offset, total - self._visible))
+        window = self._order[self._offset:self._offset + self._visible]
+        focus = tree.focus()
+        if self._window:
+            tree.delete(*[str(row) for row in self._window if tree.exists(str(row))])
+        for row in window:
+            tree.insert('', 'end', iid=str(row), values=self._values[row], tags=self._tags[row])
+        self._window = window
+        selected = [str(row) for row in window if row in self._selected]
+        tree.selection_set(selected)
+        if focus and focus.isdigit() and int(focus) in self._position and tree.exists(focus):
+            tree.focus(focus)
+        if total:
+            self._set_scrollbar(self._offset / total, min(1.0, (self._offset + len(window)) / total))
+        else:
+            self._set_scrollbar(0.0, 1.0)
+        if window:
+            tree.after_idle(self._measure)
+
+    def _set_scrollbar(self, first: float, last: float):
+        if self.scrollbar is not None:
+            self.scrollbar.set(first, last)
+
+    def _measure(self, event=None):
+        """Fit the window to the widget height"""
+        if not self._window:
+            return
+        try:
+            box = self.tree.bbox(str(self._window[0]))
+        except Exception:
+            return
+        if not box:
+            return  # Not mapped yet
+        _, top, _, row_height = box
+        visible = max(1, (self.tree.winfo_height() - top) // max(1, row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
+
+    def _tree_scrolled(self, first, last):
+        # The window always fits, so the widget itself never needs to scroll
+        if float(first) > 0:
+            self.tree.yview_moveto(0)
+
+    def yview(self, *args):
+        """Scrollbar command ('moveto', fraction / 'scroll', n, 'units'|'pages')"""
+        total = len(self._order)
+        if not args:
+            return (self._offset / total, (self._offset + len(self._window)) / total) if total else (0.0, 1.0)
+        if args[0] == 'moveto':
+            self._offset = int(round(float(args[1]) * total))
+        elif args[0] == 'scroll':
+            step = self._visible if args[2] == 'pages' else 1
+            self._offset += int(args[1]) * step
+        self._render()
+
+    def _scroll_rows(self, rows: int):
+        self._offset += rows
+        self._render()
+        return 'break'
+
+    def _on_mousewheel(self, event):
+        return self._scroll_rows(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def see(self, row: int) -> None:
+        """Scroll so a store row is on screen"""
+        position = self._position.get(row)
+        if position is None:
+            return
+        if position < self._offset:
+            self._offset = position
+        elif position >= self._offset + self._visible:
+            self._offset = position - self._visible + 1
+        else:
+            return
+        self._render()
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def _on_click(self, event):
+        if not event.state & (_SHIFT | _CONTROL):
+            # A plain click replaces the selection, including rows scrolled away
+            self._selected.clear()
+
+    def _on_select(self, event=None):
+        on_screen = set(self._window)
+        self._selected -= on_screen
+        self._selected.update(int(iid) for iid in self.tree.selection() if iid.isdigit())
+
+    def selected_rows(self) -> List[int]:
+        """Selected store rows in display order, including rows scrolled off screen
+
+        Treeview.selection() only knows about the rows on screen; use this for
+        anything that acts on the whole selection.
+        """
+        self._on_select()
+        position = self._position
+        return sorted((row for row in self._selected if row in position), key=position.__getitem__)
+
+    def selected_values(self) -> List[tuple]:
+        """Values of the selected rows in display order"""
+        return [self.row_values(row) for row in self.selected_rows()]
+
+    def select(self, row: Optional[int]) -> None:
+        """Select just one store row and focus it (None clears the selection)"""
+        self._selected = set() if row is None else {row}
+        if row is not None:
+            self.see(row)
+        self.tree.selection_set([str(r) for r in self._window if r in self._selected])
+        if row is not None and self.tree.exists(str(row)):
+            self.tree.focus(str(row))
+
+    def select_all(self) -> None:
+        self._selected = set(self._order)
+        self.tree.selection_set([str(row) for row in self._window])
+
+    def _on_key(self, event):
+        if not self._order:
+            return 'break'
+        focus = self.tree.focus()
+        position = self._position.get(int(focus), self._offset) if focus.isdigit() else self._offset
+        moves = {'Up': -1, 'Down': 1, 'Prior': -self._visible, 'Next': self._visible}
+        if event.keysym == 'Home':
+            position = 0
+        elif event.keysym == 'End':
+            position = len(self._order) - 1
+        else:
+            position += moves.get(event.keysym, 0)
+        position = max(0, min(position, len(self._order) - 1))
+        row = self._order[position]
+        if not event.state & _SHIFT:
+            self._selected = set()
+        self._selected.add(row)
+        self.see(row)
+        self.tree.selection_set([str(r) for r in self._window if r in self._selected])
+        self.tree.focus(str(row))
+        return 'break'